@@ -0,0 +1,98 @@
+"""Add normalized_name columns for matching.
+
+This migration adds:
+- normalized_name column to products and supplier_items
+- Trigger that clears normalized_name when name changes without it
+  (e.g. product renames from the admin API), so matchers fall back to
+  normalizing the new name instead of using a stale value
+- Backfill of normalized_name for existing rows
+
+normalized_name is TEXT, not VARCHAR(500) like name: transliteration makes
+Cyrillic names longer ("щ" -> "shch").
+
+The backfill uses the runtime normalize_name(), not a frozen copy of the
+rules, so running this migration after the rules changed (see
+NORMALIZATION_VERSION) stores the new normalization. That is intended:
+stored values must match what the matchers compute for new rows.
+
+Revision ID: 003_add_normalized_names
+Revises: 002_add_matching_pipeline
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.services.matching.normalization import normalize_name
+
+# revision identifiers, used by Alembic.
+revision: str = '003_add_normalized_names'
+down_revision: Union[str, None] = '002_add_matching_pipeline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('products', 'supplier_items')
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill(table: str) -> None:
+    """Compute normalized_name for all rows of a table in keyset batches."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = f"SELECT id, name FROM {table}"
+        params = {"limit": BACKFILL_BATCH_SIZE}
+        if last_id is not None:
+            query += " WHERE id > :last_id"
+            params["last_id"] = last_id
+        rows = bind.execute(sa.text(query + " ORDER BY id LIMIT :limit"), params).fetchall()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(f"UPDATE {table} SET normalized_name = :normalized_name WHERE id = :id"),
+            [{"id": row.id, "normalized_name": normalize_name(row.name)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    # ===== Add columns =====
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('normalized_name', sa.Text(), nullable=True)
+        )
+
+    # ===== Clear stale normalized names on rename =====
+    op.execute("""
+        CREATE OR REPLACE FUNCTION clear_stale_normalized_name() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.name IS DISTINCT FROM OLD.name
+               AND NEW.normalized_name IS NOT DISTINCT FROM OLD.normalized_name THEN
+                NEW.normalized_name := NULL;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER trg_{table}_clear_stale_normalized_name
+            BEFORE UPDATE OF name ON {table}
+            FOR EACH ROW EXECUTE FUNCTION clear_stale_normalized_name()
+        """)
+
+    # ===== Backfill =====
+    for table in TABLES:
+        _backfill(table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_clear_stale_normalized_name ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS clear_stale_normalized_name()")
+
+    for table in TABLES:
+        op.drop_column(table, 'normalized_name')
@@ -0,0 +1,75 @@
+"""Add identifiers column for exact-key matching.
+
+This migration adds:
+- identifiers TEXT[] column to supplier_items (gtin:/mpn: keys)
+- GIN index used to look up linked items sharing an identifier
+- Backfill of identifiers from existing names and characteristics
+
+Revision ID: 004_add_supplier_item_identifiers
+Revises: 003_add_normalized_names
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from src.services.matching.identifiers import extract_identifiers
+
+# revision identifiers, used by Alembic.
+revision: str = '004_add_supplier_item_identifiers'
+down_revision: Union[str, None] = '003_add_normalized_names'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill() -> None:
+    """Compute identifiers for all supplier items in keyset batches."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = "SELECT id, name, characteristics FROM supplier_items"
+        params = {"limit": BACKFILL_BATCH_SIZE}
+        if last_id is not None:
+            query += " WHERE id > :last_id"
+            params["last_id"] = last_id
+        rows = bind.execute(sa.text(query + " ORDER BY id LIMIT :limit"), params).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            identifiers = extract_identifiers(row.name, row.characteristics)
+            if identifiers:
+                updates.append({"id": row.id, "identifiers": identifiers})
+        if updates:
+            bind.execute(
+                sa.text("UPDATE supplier_items SET identifiers = :identifiers WHERE id = :id")
+                .bindparams(sa.bindparam("identifiers", type_=postgresql.ARRAY(sa.String()))),
+                updates,
+            )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.add_column(
+        'supplier_items',
+        sa.Column('identifiers', postgresql.ARRAY(sa.String(length=64)), nullable=True)
+    )
+    op.create_index(
+        'idx_supplier_items_identifiers',
+        'supplier_items',
+        ['identifiers'],
+        postgresql_using='gin',
+        postgresql_where=sa.text('identifiers IS NOT NULL')
+    )
+
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index('idx_supplier_items_identifiers', table_name='supplier_items')
+    op.drop_column('supplier_items', 'identifiers')
@@ -0,0 +1,98 @@
+"""Add match_affinity table.
+
+This migration adds:
+- match_affinity table memoizing normalized name -> product link decisions
+- Backfill from supplier items already auto-matched or verified
+
+Revision ID: 005_add_match_affinity
+Revises: 004_add_supplier_item_identifiers
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_match_affinity'
+down_revision: Union[str, None] = '004_add_supplier_item_identifiers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'match_affinity',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text('gen_random_uuid()')
+        ),
+        sa.Column('name_hash', sa.String(length=64), nullable=False, unique=True),
+        sa.Column(
+            'product_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('products.id', ondelete='CASCADE'),
+            nullable=False
+        ),
+        sa.Column('confidence', sa.Numeric(precision=5, scale=2), nullable=False),
+        sa.Column(
+            'source',
+            postgresql.ENUM(
+                'unmatched',
+                'auto_matched',
+                'potential_match',
+                'verified_match',
+                name='match_status',
+                create_type=False
+            ),
+            nullable=False
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()')
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()')
+        ),
+        sa.CheckConstraint(
+            'confidence >= 0 AND confidence <= 100',
+            name='check_affinity_confidence'
+        ),
+    )
+    op.create_index('idx_match_affinity_product', 'match_affinity', ['product_id'])
+
+    # Backfill: one entry per normalized name, verified decisions first,
+    # then the most recent. Hash must match normalization.name_hash().
+    op.execute("""
+        INSERT INTO match_affinity (name_hash, product_id, confidence, source)
+        SELECT DISTINCT ON (name_hash)
+            name_hash, product_id, confidence, match_status
+        FROM (
+            SELECT
+                encode(sha256(convert_to(normalized_name, 'UTF8')), 'hex') AS name_hash,
+                product_id,
+                COALESCE(match_score, 100) AS confidence,
+                match_status,
+                updated_at
+            FROM supplier_items
+            WHERE product_id IS NOT NULL
+              AND match_status IN ('auto_matched', 'verified_match')
+              AND normalized_name IS NOT NULL
+              AND normalized_name <> ''
+        ) decisions
+        ORDER BY name_hash, (match_status = 'verified_match') DESC, updated_at DESC
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_match_affinity_product', table_name='match_affinity')
+    op.drop_table('match_affinity')
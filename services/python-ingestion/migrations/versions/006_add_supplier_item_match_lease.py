@@ -0,0 +1,46 @@
+"""Add matching claim lease to supplier_items.
+
+This migration adds:
+- match_lease_owner / match_lease_expires_at columns used by match_items_task
+  to claim a batch in a short transaction instead of holding row locks
+  while scoring
+- Partial index over claimable unmatched items in claim order
+
+Revision ID: 006_add_supplier_item_match_lease
+Revises: 005_add_match_affinity
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_supplier_item_match_lease'
+down_revision: Union[str, None] = '005_add_match_affinity'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'supplier_items',
+        sa.Column('match_lease_owner', sa.String(length=255), nullable=True)
+    )
+    op.add_column(
+        'supplier_items',
+        sa.Column('match_lease_expires_at', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index(
+        'idx_supplier_items_unmatched_claim',
+        'supplier_items',
+        ['created_at'],
+        postgresql_where=sa.text("product_id IS NULL AND match_status = 'unmatched'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_supplier_items_unmatched_claim', table_name='supplier_items')
+    op.drop_column('supplier_items', 'match_lease_expires_at')
+    op.drop_column('supplier_items', 'match_lease_owner')
@@ -0,0 +1,29 @@
+"""Add sequence for internal SKU allocation.
+
+This migration adds:
+- product_sku_seq, incremented by 1000 so each nextval() reserves a block
+  of SKU numbers for one worker (see services/sku_allocator.py)
+
+Revision ID: 007_add_product_sku_sequence
+Revises: 006_add_supplier_item_match_lease
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_product_sku_sequence'
+down_revision: Union[str, None] = '006_add_supplier_item_match_lease'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # INCREMENT must match SKU_BLOCK_SIZE in src/services/sku_allocator.py
+    op.execute("CREATE SEQUENCE IF NOT EXISTS product_sku_seq START WITH 1 INCREMENT BY 1000")
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE IF EXISTS product_sku_seq")
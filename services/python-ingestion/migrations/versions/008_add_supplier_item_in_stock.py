@@ -0,0 +1,55 @@
+"""Add generated in_stock column to supplier_items.
+
+This migration adds:
+- in_stock: boolean generated from characteristics->>'in_stock'
+  (true/True/yes/1), stored and filled for existing rows by the table rewrite
+- Partial index over in-stock linked items, so product availability is an
+  index-only EXISTS instead of a JSONB text probe per linked row
+
+Revision ID: 008_add_supplier_item_in_stock
+Revises: 007_add_product_sku_sequence
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008_add_supplier_item_in_stock'
+down_revision: Union[str, None] = '007_add_product_sku_sequence'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expression as src/db/models/supplier_item.py IN_STOCK_EXPRESSION
+IN_STOCK_EXPRESSION = (
+    "COALESCE((characteristics ->> 'in_stock') IN ('true', 'True') "
+    "OR lower(characteristics ->> 'in_stock') IN ('yes', '1'), false)"
+)
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table, which backfills it
+    op.add_column(
+        'supplier_items',
+        sa.Column(
+            'in_stock',
+            sa.Boolean(),
+            sa.Computed(IN_STOCK_EXPRESSION, persisted=True),
+            nullable=False,
+        )
+    )
+    op.create_index(
+        'idx_supplier_items_in_stock_linked',
+        'supplier_items',
+        ['product_id'],
+        postgresql_where=sa.text(
+            "in_stock AND match_status IN ('auto_matched', 'verified_match')"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_supplier_items_in_stock_linked', table_name='supplier_items')
+    op.drop_column('supplier_items', 'in_stock')
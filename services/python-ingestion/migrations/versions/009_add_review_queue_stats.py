@@ -0,0 +1,114 @@
+"""Add review_queue_stats table and review queue listing columns.
+
+This migration adds:
+- match_review_queue.match_score: best candidate score, backfilled from
+  supplier_items.match_score
+- match_review_queue.category_id: category of the item's product,
+  backfilled from products.category_id
+- Indexes for keyset listing by (match_score DESC, id), per status
+- review_queue_stats table: entry counts per (supplier_id, category_id,
+  status), filled from the queue
+
+Revision ID: 009_add_review_queue_stats
+Revises: 008_add_supplier_item_in_stock
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '009_add_review_queue_stats'
+down_revision: Union[str, None] = '008_add_supplier_item_in_stock'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'match_review_queue',
+        sa.Column(
+            'match_score',
+            sa.Numeric(precision=5, scale=2),
+            nullable=False,
+            server_default='0'
+        )
+    )
+    op.add_column(
+        'match_review_queue',
+        sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=True)
+    )
+    op.execute("""
+        UPDATE match_review_queue q
+        SET match_score = COALESCE(si.match_score, 0),
+            category_id = p.category_id
+        FROM supplier_items si
+        LEFT JOIN products p ON p.id = si.product_id
+        WHERE si.id = q.supplier_item_id
+    """)
+    op.create_index(
+        'idx_review_queue_status_score',
+        'match_review_queue',
+        ['status', sa.text('match_score DESC'), 'id']
+    )
+
+    op.create_table(
+        'review_queue_stats',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text('gen_random_uuid()')
+        ),
+        sa.Column(
+            'supplier_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('suppliers.id', ondelete='CASCADE'),
+            nullable=False
+        ),
+        sa.Column('category_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'pending',
+                'approved',
+                'rejected',
+                'expired',
+                'needs_category',
+                name='review_status',
+                create_type=False
+            ),
+            nullable=False
+        ),
+        sa.Column('count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text('now()')
+        ),
+        sa.UniqueConstraint(
+            'supplier_id', 'category_id', 'status',
+            name='unique_review_queue_stats_key',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    # Same query as services.review_queue.rebuild_review_queue_stats()
+    op.execute("""
+        INSERT INTO review_queue_stats (supplier_id, category_id, status, count)
+        SELECT si.supplier_id, q.category_id, q.status, count(*)
+        FROM match_review_queue q
+        JOIN supplier_items si ON si.id = q.supplier_item_id
+        GROUP BY si.supplier_id, q.category_id, q.status
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('review_queue_stats')
+    op.drop_index('idx_review_queue_status_score', table_name='match_review_queue')
+    op.drop_column('match_review_queue', 'category_id')
+    op.drop_column('match_review_queue', 'match_score')
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of per-item feature extraction cost.
+
+Compares, per item name:
+    - per-call extractors: create_extractor() for every item (the old
+      extract_all_features behaviour: patterns compiled per call)
+    - shared extractors: extract_all_features() with get_extractor()
+    - batch: extract_characteristics_batch() over all names at once
+    - cached: extract_characteristics() with names repeating as in a
+      re-ingested catalog (every name seen before)
+
+No database or Redis is used.
+
+Usage:
+    python scripts/benchmark_extraction.py
+    python scripts/benchmark_extraction.py --items 50000 --repeat 5
+    python scripts/benchmark_extraction.py --names names.txt  # one name per line
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# Add src to path
+script_dir = Path(__file__).parent
+project_root = script_dir.parent
+sys.path.insert(0, str(project_root))
+
+# Settings are loaded on import but not used: placeholders are enough
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://benchmark@localhost/benchmark")
+os.environ.setdefault("REDIS_PASSWORD", "benchmark")
+
+from src.models.extraction import ExtractedFeatures  # noqa: E402
+from src.services.extraction import (  # noqa: E402
+    EXTRACTOR_REGISTRY,
+    create_extractor,
+    extract_all_features,
+    extract_characteristics,
+    extract_characteristics_batch,
+    get_extraction_cache,
+    warm_extractors,
+)
+
+SAMPLE_WORDS = [
+    "Дрель", "ударная", "Makita", "Bosch", "Samsung", "Galaxy", "A54", "Pro",
+    "профессиональная", "черный", "комплект", "Smartphone", "Heater", "Box",
+]
+SAMPLE_SPECS = [
+    "220V", "750W", "1.5kW", "128GB", "8GB RAM", "SSD 512GB", "2.5kg", "500 г",
+    "30x20x10cm", "L30 W20 H10", "220-240V", "1500Вт", "",
+]
+
+
+def generate_names(count: int, seed: int = 43) -> List[str]:
+    """Generate product-like names with 0-3 specifications each."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choices(SAMPLE_WORDS, k=rng.randint(2, 6)) + rng.choices(SAMPLE_SPECS, k=rng.randint(0, 3)))
+        for _ in range(count)
+    ]
+
+
+def extract_with_new_extractors(text: str) -> ExtractedFeatures:
+    """Extraction with extractors created per call."""
+    merged = ExtractedFeatures()
+    for name in EXTRACTOR_REGISTRY:
+        result = create_extractor(name).extract(text)
+        for field, value in result:
+            if value is not None and getattr(merged, field) is None:
+                setattr(merged, field, value)
+    return merged
+
+
+def measure(label: str, run: Callable[[], None], items: int, repeat: int) -> None:
+    """Print the best per-item time of `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<24} {best / items * 1e6:>9.2f} µs/item   {items / best:>12,.0f} items/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark feature extraction per item")
+    parser.add_argument("--items", type=int, default=20000, help="Generated names (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant, best is kept (default: 3)")
+    parser.add_argument("--names", type=Path, help="File with one name per line instead of generated names")
+    args = parser.parse_args()
+
+    if args.names:
+        names = [line.strip() for line in args.names.read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        names = generate_names(args.items)
+    extractors = list(EXTRACTOR_REGISTRY)
+
+    start = time.perf_counter()
+    warm_extractors()
+    print(f"Warm-up (compile extractors): {(time.perf_counter() - start) * 1e3:.2f} ms")
+    print(f"Items: {len(names):,}\n")
+
+    measure("per-call extractors", lambda: [extract_with_new_extractors(n) for n in names], len(names), args.repeat)
+    measure("shared extractors", lambda: [extract_all_features(n) for n in names], len(names), args.repeat)
+    measure("batch", lambda: extract_characteristics_batch(names, extractors), len(names), args.repeat)
+
+    cache = get_extraction_cache()
+    cache.maxsize = max(cache.maxsize, len(names))
+    for name in names:
+        extract_characteristics(name, extractors)
+    measure("cached (re-ingestion)", lambda: [extract_characteristics(n, extractors) for n in names], len(names), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,145 @@ class MatchingSettings(BaseSettings):
         description="Maximum candidate matches to store for review"
     )
     
+    # Strategy Configuration
+    strategy: str = Field(
+        default="rapidfuzz",
+        description="Matching strategy used by match_items_task (rapidfuzz, hybrid, embedding)"
+    )
+    hybrid_prefilter_scorer: str = Field(
+        default="ratio",
+        description="Stage-one scorer for the hybrid strategy (ratio, token_sort_ratio, jaro_winkler)"
+    )
+    hybrid_prefilter_top_n: int = Field(
+        default=25,
+        ge=1,
+        le=1000,
+        description="Stage-one candidates re-scored with WRatio by the hybrid strategy"
+    )
+    hybrid_prefilter_cutoff: float = Field(
+        default=40.0,
+        ge=0,
+        le=100,
+        description="Minimum stage-one score for the hybrid strategy"
+    )
+    embedding_dimensions: int = Field(
+        default=256,
+        ge=32,
+        le=4096,
+        description="Embedding size (hash buckets) for the embedding strategy"
+    )
+    embedding_shortlist_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Nearest neighbours re-ranked with WRatio by the embedding strategy"
+    )
+    embedding_n_probe: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="IVF clusters scored per query by the embedding strategy"
+    )
+    embedding_index_path: Optional[str] = Field(
+        default=None,
+        description="Memory-map the embedding matrix to this file (in memory if unset)"
+    )
+    identifier_fast_path: bool = Field(
+        default=True,
+        description="Auto-link items whose GTIN/MPN is known for a linked item before fuzzy matching"
+    )
+    affinity_cache: bool = Field(
+        default=True,
+        description="Reuse prior link decisions for identical normalized names before fuzzy matching"
+    )
+    
+    batch_clustering: bool = Field(
+        default=True,
+        description="Link near-duplicates within a batch to the single draft their group creates"
+    )
+    cluster_threshold: float = Field(
+        default=90.0,
+        ge=0,
+        le=100,
+        description="Minimum WRatio similarity for two batch items to be near-duplicates"
+    )
+    blocking_attributes: str = Field(
+        default="storage_gb,memory_gb,power_watts",
+        description="Comma-separated extracted attributes that must not differ between an "
+                    "item and its candidate products (empty disables attribute blocking)"
+    )
+    
+    # Claim lease: claimed items are reclaimable by other workers after this
+    lease_seconds: int = Field(
+        default=600,
+        ge=30,
+        le=86400,
+        description="Seconds a claimed matching batch stays leased to its worker"
+    )
+    
+    # Drain Mode Configuration
+    drain_enabled: bool = Field(
+        default=True,
+        description="Keep matching after ingestion until no unmatched items remain"
+    )
+    drain_max_parallel: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum parallel match jobs fanned out by a drain run"
+    )
+    
+    # Aggregate Recalculation Configuration
+    recalc_debounce_seconds: float = Field(
+        default=5.0,
+        ge=0.5,
+        le=300,
+        description="Window in which dirty products are coalesced into one recalculation job"
+    )
+    recalc_chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        le=10000,
+        description="Dirty products recalculated per UPDATE statement"
+    )
+    
+    # Batch Enrichment Configuration
+    enrich_page_size: int = Field(
+        default=500,
+        ge=1,
+        le=10000,
+        description="Supplier items read, extracted and written per page by batch enrichment"
+    )
+    enrich_processes: int = Field(
+        default=2,
+        ge=0,
+        le=64,
+        description="Processes extracting features for batch enrichment (0 = in the worker)"
+    )
+    
+    # Extraction Cache Configuration
+    extraction_cache_size: int = Field(
+        default=100000,
+        ge=0,
+        le=10000000,
+        description="Names whose extraction results are kept in the worker's LRU (0 = disabled)"
+    )
+    extraction_cache_redis: bool = Field(
+        default=False,
+        description="Share extraction results across workers through Redis"
+    )
+    extraction_cache_ttl_seconds: int = Field(
+        default=604800,
+        ge=60,
+        le=2592000,
+        description="Lifetime of extraction results cached in Redis"
+    )
+    inline_enrichment: bool = Field(
+        default=False,
+        description="Extract features during ingestion, before items are written "
+                    "(per supplier: source_config 'inline_enrichment')"
+    )
+    
     # Review Queue Configuration
     review_expiration_days: int = Field(
         default=30,
@@ -46,6 +185,18 @@ class MatchingSettings(BaseSettings):
         le=365,
         description="Days until pending review items expire"
     )
+    review_expire_chunk_size: int = Field(
+        default=1000,
+        ge=1,
+        le=10000,
+        description="Review items expired per transaction by expire_review_queue_task"
+    )
+    review_expire_pause_seconds: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=10.0,
+        description="Pause between expiration chunks"
+    )
     
     model_config = SettingsConfigDict(
         env_prefix="MATCH_",
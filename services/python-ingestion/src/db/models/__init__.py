@@ -6,6 +6,8 @@ from src.db.models.supplier_item import SupplierItem, MatchStatus
 from src.db.models.price_history import PriceHistory
 from src.db.models.parsing_log import ParsingLog
 from src.db.models.match_review_queue import MatchReviewQueue, ReviewStatus
+from src.db.models.match_affinity import MatchAffinity
+from src.db.models.review_queue_stats import ReviewQueueStats
 
 __all__ = [
     # Core models
@@ -20,4 +22,6 @@ __all__ = [
     "MatchReviewQueue",
     "MatchStatus",
     "ReviewStatus",
+    "MatchAffinity",
+    "ReviewQueueStats",
 ]
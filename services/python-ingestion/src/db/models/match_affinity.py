@@ -0,0 +1,64 @@
+"""MatchAffinity ORM model memoizing link decisions per normalized name."""
+from sqlalchemy import String, ForeignKey, Numeric, CheckConstraint
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from src.db.base import Base, UUIDMixin, TimestampMixin
+from src.db.models.supplier_item import MatchStatus
+from decimal import Decimal
+import uuid
+
+
+class MatchAffinity(Base, UUIDMixin, TimestampMixin):
+    """Memo of the product a normalized item name was linked to.
+
+    Populated from auto_matched and verified_match decisions so an identical
+    normalized name (from any supplier) is linked with one lookup instead of
+    being scored against the whole catalog. Verified decisions are never
+    overwritten by automatic ones.
+
+    Attributes:
+        name_hash: SHA-256 hex of the supplier item's normalized_name (unique)
+        product_id: Product the name was linked to
+        confidence: Match score of the decision (0-100)
+        source: Decision that produced the entry (auto_matched or verified_match)
+    """
+
+    __tablename__ = "match_affinity"
+    __table_args__ = (
+        CheckConstraint(
+            'confidence >= 0 AND confidence <= 100',
+            name='check_affinity_confidence'
+        ),
+    )
+
+    name_hash: Mapped[str] = mapped_column(
+        String(64),
+        unique=True,
+        nullable=False,
+        doc="SHA-256 hex of normalized_name (see normalization.name_hash)"
+    )
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    confidence: Mapped[Decimal] = mapped_column(
+        Numeric(5, 2),
+        nullable=False,
+        doc="Match score of the decision (0-100)"
+    )
+    # Reuses the match_status enum type: the source is the status the
+    # decision gave the supplier item
+    source: Mapped[MatchStatus] = mapped_column(
+        SQLEnum(
+            MatchStatus,
+            name="match_status",
+            create_constraint=False,
+            values_callable=lambda x: [e.value for e in x]
+        ),
+        nullable=False,
+        doc="auto_matched or verified_match"
+    )
+
+    def __repr__(self) -> str:
+        return f"<MatchAffinity(name_hash='{self.name_hash[:12]}', product_id={self.product_id}, source='{self.source.value}')>"
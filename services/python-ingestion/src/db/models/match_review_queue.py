@@ -1,10 +1,11 @@
 """MatchReviewQueue ORM model for pending match reviews."""
-from sqlalchemy import String, ForeignKey, func, DateTime, Text
+from sqlalchemy import String, ForeignKey, Numeric, func, DateTime, Text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.db.base import Base, UUIDMixin
 from datetime import datetime
+from decimal import Decimal
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from enum import Enum as PyEnum
 import uuid
@@ -40,6 +41,9 @@ class MatchReviewQueue(Base, UUIDMixin):
     Attributes:
         supplier_item_id: Reference to the supplier item (unique - one review per item)
         candidate_products: JSONB array of potential matches [{product_id, score, name}]
+        match_score: Best candidate score (denormalized for index-ordered listing)
+        category_id: Category of the item's product when the entry was last
+            written (denormalized stats key, see ReviewQueueStats)
         status: Current review status
         reviewed_by: User who actioned the review (if completed)
         reviewed_at: Timestamp when review was completed
@@ -66,6 +70,17 @@ class MatchReviewQueue(Base, UUIDMixin):
         server_default='[]',
         doc="Array of potential matches [{product_id, score, name}]"
     )
+    match_score: Mapped[Decimal] = mapped_column(
+        Numeric(5, 2),
+        nullable=False,
+        server_default='0',
+        doc="Best candidate score (listing order: match_score DESC, id)"
+    )
+    category_id: Mapped[uuid.UUID | None] = mapped_column(
+        postgresql.UUID(as_uuid=True),
+        nullable=True,
+        doc="Category of the item's product when the entry was last written"
+    )
     # Note: values_callable ensures SQLAlchemy uses enum VALUES (lowercase strings)
     # instead of enum NAMES (uppercase) to match PostgreSQL enum values
     status: Mapped[ReviewStatus] = mapped_column(
@@ -1,5 +1,5 @@
 """Product ORM model with status enum and aggregate fields."""
-from sqlalchemy import String, ForeignKey, Enum as SQLEnum, Numeric, Boolean
+from sqlalchemy import String, ForeignKey, Enum as SQLEnum, Numeric, Boolean, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.db.base import Base, UUIDMixin, TimestampMixin
 from enum import Enum as PyEnum
@@ -25,6 +25,7 @@ class Product(Base, UUIDMixin, TimestampMixin):
     Attributes:
         internal_sku: Unique internal SKU for the product
         name: Product display name
+        normalized_name: Canonical form of name used for matching
         category_id: Reference to category (optional)
         status: Product lifecycle status (draft, active, archived)
         min_price: Lowest price among linked active supplier items (Phase 4)
@@ -45,6 +46,12 @@ class Product(Base, UUIDMixin, TimestampMixin):
         index=True
     )
     name: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    # Text: transliteration can make it longer than name (щ -> shch)
+    normalized_name: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Canonical form of name (see services.matching.normalization)"
+    )
     category_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("categories.id", ondelete="SET NULL"),
         nullable=True,
@@ -0,0 +1,71 @@
+"""ReviewQueueStats ORM model with materialized review queue counts."""
+from sqlalchemy import BigInteger, ForeignKey, UniqueConstraint, func, DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+from src.db.base import Base, UUIDMixin
+from src.db.models.match_review_queue import ReviewStatus
+from datetime import datetime
+import uuid
+
+
+class ReviewQueueStats(Base, UUIDMixin):
+    """Number of review queue entries per supplier, category and status.
+
+    Maintained incrementally, in the same transaction, by every writer of
+    match_review_queue (see services.review_queue), so the review dashboard
+    reads a handful of rows instead of grouping the whole queue.
+
+    Attributes:
+        supplier_id: Supplier of the entries' supplier items
+        category_id: Entries' category_id (NULL = no category)
+        status: Review status
+        count: Number of entries
+        updated_at: Last change of the count
+    """
+
+    __tablename__ = "review_queue_stats"
+    __table_args__ = (
+        # NULL category_id is one key, not a distinct one per row
+        UniqueConstraint(
+            'supplier_id', 'category_id', 'status',
+            name='unique_review_queue_stats_key',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    supplier_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("suppliers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # No foreign key: counts of a deleted category stay until the next rebuild
+    category_id: Mapped[uuid.UUID | None] = mapped_column(
+        postgresql.UUID(as_uuid=True),
+        nullable=True,
+    )
+    status: Mapped[ReviewStatus] = mapped_column(
+        SQLEnum(
+            ReviewStatus,
+            name="review_status",
+            create_constraint=False,
+            values_callable=lambda x: [e.value for e in x]
+        ),
+        nullable=False,
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default='0',
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReviewQueueStats(supplier_id={self.supplier_id}, category_id={self.category_id}, "
+            f"status='{self.status.value}', count={self.count})>"
+        )
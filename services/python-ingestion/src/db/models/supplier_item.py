@@ -1,5 +1,6 @@
 """SupplierItem ORM model with JSONB characteristics and matching fields."""
 from sqlalchemy import String, ForeignKey, Numeric, CheckConstraint, UniqueConstraint, func, DateTime, Text
+from sqlalchemy import Boolean, Computed
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -36,6 +37,13 @@ class MatchStatus(PyEnum):
     VERIFIED_MATCH = "verified_match"
 
 
+# characteristics->>'in_stock' normalized to a boolean
+IN_STOCK_EXPRESSION = (
+    "COALESCE((characteristics ->> 'in_stock') IN ('true', 'True') "
+    "OR lower(characteristics ->> 'in_stock') IN ('yes', '1'), false)"
+)
+
+
 class SupplierItem(Base, UUIDMixin, TimestampMixin):
     """SupplierItem model representing raw product data from suppliers.
     
@@ -44,12 +52,17 @@ class SupplierItem(Base, UUIDMixin, TimestampMixin):
         product_id: Reference to matched product (nullable)
         supplier_sku: Supplier's SKU for this item
         name: Product name from supplier
+        normalized_name: Canonical form of name used for matching
+        identifiers: Exact identifier keys (gtin:/mpn:) for the matching fast path
         current_price: Current price from supplier
         characteristics: JSONB field for flexible attributes
+        in_stock: Normalized characteristics['in_stock'] (generated column)
         last_ingested_at: Timestamp of last data ingestion
         match_status: Current matching state (Phase 4)
         match_score: Confidence score of last match 0-100 (Phase 4)
         match_candidates: Array of potential matches for review (Phase 4)
+        match_lease_owner: Worker holding the item for matching (claim lease)
+        match_lease_expires_at: When the claim lease expires (then reclaimable)
     
     Relationships:
         supplier: Reference to Supplier
@@ -80,6 +93,17 @@ class SupplierItem(Base, UUIDMixin, TimestampMixin):
     )
     supplier_sku: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
+    # Text: transliteration can make it longer than name (щ -> shch)
+    normalized_name: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Canonical form of name (see services.matching.normalization)"
+    )
+    identifiers: Mapped[List[str] | None] = mapped_column(
+        postgresql.ARRAY(String(64)),
+        nullable=True,
+        doc="Identifier keys, e.g. gtin:04006381333931 (see services.matching.identifiers)"
+    )
     current_price: Mapped[Decimal] = mapped_column(
         Numeric(10, 2),
         nullable=False,
@@ -90,6 +114,15 @@ class SupplierItem(Base, UUIDMixin, TimestampMixin):
         nullable=False,
         server_default="{}"
     )
+    # Generated from characteristics on every write, so availability can use
+    # a partial index instead of probing JSONB text per row. Keep in sync with
+    # services.aggregation.is_in_stock (migration 008).
+    in_stock: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed(IN_STOCK_EXPRESSION, persisted=True),
+        nullable=False,
+        doc="True if characteristics['in_stock'] is true/True/yes/1"
+    )
     last_ingested_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -122,6 +155,18 @@ class SupplierItem(Base, UUIDMixin, TimestampMixin):
         nullable=True,
         doc="Array of potential matches [{product_id, product_name, score}]"
     )
+    # Claim lease: match_items_task marks claimed items in a short transaction
+    # instead of holding row locks while scoring. Expired leases are reclaimed.
+    match_lease_owner: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        doc="Worker/task holding the item for matching"
+    )
+    match_lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="When the matching lease expires"
+    )
     
     # Relationships
     supplier: Mapped["Supplier"] = relationship(back_populates="supplier_items")
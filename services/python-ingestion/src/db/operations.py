@@ -15,6 +15,9 @@ from src.db.models.supplier_item import SupplierItem
 from src.db.models.price_history import PriceHistory
 from src.db.models.parsing_log import ParsingLog
 from src.models.parsed_item import ParsedSupplierItem
+from src.services.matching.normalization import normalize_name
+from src.services.matching.identifiers import extract_identifiers
+from src.services.aggregation.service import AggregateDelta, LINKED_STATUSES, is_in_stock
 from src.errors.exceptions import DatabaseError, ValidationError
 
 logger = structlog.get_logger(__name__)
@@ -100,18 +103,22 @@ async def upsert_supplier_item(
     session: AsyncSession,
     supplier_id: uuid.UUID,
     parsed_item: ParsedSupplierItem,
-    product_id: Optional[uuid.UUID] = None
+    product_id: Optional[uuid.UUID] = None,
+    aggregate_deltas: Optional[List[AggregateDelta]] = None,
 ) -> tuple[SupplierItem, bool, bool]:
     """Upsert supplier item with conflict resolution.
     
     Uses PostgreSQL INSERT ... ON CONFLICT to handle duplicates.
     Detects price changes and returns flags indicating if price changed and if item is new.
+    An existing item keeps its product link unless product_id is given.
     
     Args:
         session: Async database session
         supplier_id: UUID of the supplier
         parsed_item: Validated parsed item from parser
         product_id: Optional UUID of linked product
+        aggregate_deltas: If given, receives an AggregateDelta when a linked
+            item's price or stock changed (to keep product aggregates current)
     
     Returns:
         Tuple of (SupplierItem instance, price_changed: bool, is_new_item: bool)
@@ -131,9 +138,25 @@ async def upsert_supplier_item(
         is_new_item = existing_item is None
         price_changed = False
         old_price: Optional[Decimal] = None
+        delta: Optional[AggregateDelta] = None
         
         if existing_item:
             old_price = existing_item.current_price
+            # Capture before the upsert: refresh() updates this same object
+            if (
+                existing_item.product_id is not None
+                and existing_item.match_status in LINKED_STATUSES
+            ):
+                was_in_stock = is_in_stock(existing_item.characteristics)
+                delta = AggregateDelta.update(
+                    product_id=existing_item.product_id,
+                    old_price=old_price,
+                    new_price=parsed_item.price,
+                    was_in_stock=was_in_stock,
+                    characteristics=parsed_item.characteristics,
+                )
+                if old_price == delta.new_price and was_in_stock == delta.in_stock:
+                    delta = None
             # Check if price changed (compare with 2 decimal precision)
             if old_price != parsed_item.price:
                 price_changed = True
@@ -150,6 +173,8 @@ async def upsert_supplier_item(
             supplier_id=supplier_id,
             supplier_sku=parsed_item.supplier_sku,
             name=parsed_item.name,
+            normalized_name=normalize_name(parsed_item.name),
+            identifiers=extract_identifiers(parsed_item.name, parsed_item.characteristics) or None,
             current_price=parsed_item.price,
             characteristics=parsed_item.characteristics,
             product_id=product_id,
@@ -166,9 +191,12 @@ async def upsert_supplier_item(
             index_elements=['supplier_id', 'supplier_sku'],
             set_={
                 'name': excluded.name,
+                'normalized_name': excluded.normalized_name,
+                'identifiers': excluded.identifiers,
                 'current_price': excluded.current_price,
                 'characteristics': excluded.characteristics,
-                'product_id': excluded.product_id,
+                # Keep the existing link: a re-parse must not unlink matched items
+                'product_id': func.coalesce(excluded.product_id, SupplierItem.__table__.c.product_id),
                 'last_ingested_at': excluded.last_ingested_at,
                 'updated_at': excluded.updated_at
             }
@@ -183,6 +211,9 @@ async def upsert_supplier_item(
         # object might be cached
         await session.refresh(supplier_item)
         
+        if delta is not None and aggregate_deltas is not None:
+            aggregate_deltas.append(delta)
+        
         logger.debug(
             "supplier_item_upserted",
             supplier_item_id=str(supplier_item.id),
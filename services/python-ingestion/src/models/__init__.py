@@ -32,6 +32,7 @@ from src.models.matching import (
     EnrichItemTaskMessage,
     RecalcAggregatesTaskMessage,
     ManualMatchEventMessage,
+    MatchDrainProgress,
 )
 from src.models.review_queue import (
     ReviewStatusEnum,
@@ -74,6 +75,7 @@ __all__ = [
     "EnrichItemTaskMessage",
     "RecalcAggregatesTaskMessage",
     "ManualMatchEventMessage",
+    "MatchDrainProgress",
     # Review queue models
     "ReviewStatusEnum",
     "CandidateProduct",
@@ -4,7 +4,7 @@ This module defines the data transfer objects and validation models
 for the product matching workflow.
 """
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 from datetime import datetime
 from enum import Enum
@@ -109,6 +109,10 @@ class MatchItemsTaskMessage(BaseModel):
         batch_size: Number of items to process (1-1000)
         retry_count: Current retry attempt (0-indexed)
         max_retries: Maximum retry attempts before DLQ
+        drain: Keep matching (re-enqueue / fan out) until no unmatched items remain
+        drain_id: Drain run the job belongs to (set on fanned-out jobs)
+        drain_lane: Lane index of a fanned-out job within its drain run
+        drain_step: Number of batches the lane has processed before this job
         enqueued_at: Timestamp when task was enqueued
     """
     
@@ -119,6 +123,10 @@ class MatchItemsTaskMessage(BaseModel):
     )
     batch_size: int = Field(default=100, ge=1, le=1000)
     retry_count: int = Field(default=0, ge=0)
+    drain: bool = Field(default=False, description="Process the backlog to completion")
+    drain_id: Optional[str] = Field(default=None, description="Drain run identifier")
+    drain_lane: int = Field(default=0, ge=0)
+    drain_step: int = Field(default=0, ge=0)
     max_retries: int = Field(default=3, ge=1, le=10)
     enqueued_at: datetime = Field(default_factory=lambda: datetime.utcnow())
     
@@ -275,3 +283,57 @@ class ManualMatchEventMessage(BaseModel):
         }
     }
 
+
+
+class MatchDrainProgress(BaseModel):
+    """Progress of a match drain run, stored in Redis by the coordinator.
+    
+    A drain run starts when a match_items_task in drain mode finds a full
+    batch: it fans out parallel lanes that re-enqueue themselves until no
+    unmatched items remain.
+    
+    Attributes:
+        drain_id: Drain run identifier (task_id of the job that started it)
+        state: running or completed
+        started_at: ISO 8601 timestamp when the run started
+        finished_at: ISO 8601 timestamp when the last lane finished
+        backlog_total: Unmatched items counted when the run started
+        lanes: Number of parallel lanes fanned out
+        active_lanes: Lanes still re-enqueueing themselves
+        batches: Batches committed so far
+        items_processed: Items processed so far
+        auto_matched: Items auto-linked so far
+        potential_matches: Items sent to the review queue so far
+        new_products_created: Draft products created so far
+        errors: Items that failed so far
+        elapsed_seconds: Seconds between start and finish (or now)
+    """
+    
+    drain_id: str
+    state: Literal["running", "completed"] = "running"
+    started_at: str
+    finished_at: Optional[str] = None
+    backlog_total: int = Field(default=0, ge=0)
+    lanes: int = Field(default=0, ge=0)
+    active_lanes: int = Field(default=0, ge=0)
+    batches: int = Field(default=0, ge=0)
+    items_processed: int = Field(default=0, ge=0)
+    auto_matched: int = Field(default=0, ge=0)
+    potential_matches: int = Field(default=0, ge=0)
+    new_products_created: int = Field(default=0, ge=0)
+    errors: int = Field(default=0, ge=0)
+    elapsed_seconds: float = Field(default=0.0, ge=0)
+    
+    @property
+    def items_per_second(self) -> float:
+        """Throughput of the run (processed items per second)."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return round(self.items_processed / self.elapsed_seconds, 2)
+    
+    @property
+    def progress_percentage(self) -> float:
+        """Processed share of the initial backlog (capped at 100)."""
+        if self.backlog_total == 0:
+            return 100.0 if self.state == "completed" else 0.0
+        return round(min(self.items_processed / self.backlog_total, 1.0) * 100, 1)
@@ -1,7 +1,7 @@
 """Pydantic models for queue messages."""
 from pydantic import BaseModel, Field, field_validator, model_validator
 from typing_extensions import Self
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Literal, Optional
 from datetime import datetime, timezone
 
 
@@ -49,7 +49,12 @@ class ParseTaskMessage(BaseModel):
     )
     priority: Literal["low", "normal", "high"] = Field(
         default="normal",
-        description="Task priority for queue processing"
+        description="Task priority for queue processing (dequeue order)"
+    )
+    sync_task_id: Optional[str] = Field(
+        default=None,
+        max_length=255,
+        description="Master sync task that enqueued this task (progress tracking)"
     )
     
     @field_validator('task_id')
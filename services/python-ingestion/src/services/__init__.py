@@ -5,6 +5,11 @@ Available Services:
     - aggregation: Product aggregate calculations (min_price, availability)
     - master_sheet_ingestor: Master Sheet parsing and supplier sync
     - sync_state: Redis sync state management
+    - match_drain: Redis progress tracking for match drain runs
+    - sku_allocator: Block-reserved internal SKUs from a Postgres sequence
+    - recalc_buffer: Debounced Redis buffer of products awaiting recalculation
+    - review_queue: Materialized review queue stats and keyset listing
+    - job_priority: Priority-ordered dequeue of arq jobs
 """
 from src.services.matching import (
     RapidFuzzMatcher,
@@ -16,6 +21,8 @@ from src.services.matching import (
     search_match_candidates,
 )
 from src.services.aggregation import (
+    AggregateDelta,
+    apply_aggregate_deltas,
     calculate_product_aggregates,
     calculate_product_aggregates_batch,
     get_review_queue_stats,
@@ -34,6 +41,30 @@ from src.services.sync_state import (
     get_last_sync_at,
     check_sync_lock,
 )
+from src.services.sku_allocator import allocate_skus
+from src.services.recalc_buffer import mark_products_dirty
+from src.services.review_queue import (
+    ReviewResolution,
+    ReviewStatsDelta,
+    apply_review_stats_delta,
+    rebuild_review_queue_stats,
+    list_review_queue,
+    resolve_reviews,
+    get_review_expiration_progress,
+)
+from src.services.job_priority import (
+    PRIORITY_LEVELS,
+    enqueue_jobs,
+    promote_aged_jobs,
+    get_queue_depth_by_priority,
+    get_oldest_job_age_by_priority,
+)
+from src.services.match_drain import (
+    start_match_drain,
+    record_match_drain_batch,
+    finish_match_drain_lane,
+    get_match_drain_progress,
+)
 
 __all__: list[str] = [
     # Matching
@@ -45,6 +76,8 @@ __all__: list[str] = [
     "create_matcher",
     "search_match_candidates",
     # Aggregation
+    "AggregateDelta",
+    "apply_aggregate_deltas",
     "calculate_product_aggregates",
     "calculate_product_aggregates_batch",
     "get_review_queue_stats",
@@ -62,5 +95,28 @@ __all__: list[str] = [
     "record_sync_completion",
     "get_last_sync_at",
     "check_sync_lock",
+    # SKU Allocation
+    "allocate_skus",
+    # Aggregate Recalculation Buffer
+    "mark_products_dirty",
+    # Review Queue
+    "ReviewResolution",
+    "ReviewStatsDelta",
+    "apply_review_stats_delta",
+    "rebuild_review_queue_stats",
+    "list_review_queue",
+    "resolve_reviews",
+    "get_review_expiration_progress",
+    # Job Priority
+    "PRIORITY_LEVELS",
+    "enqueue_jobs",
+    "promote_aged_jobs",
+    "get_queue_depth_by_priority",
+    "get_oldest_job_age_by_priority",
+    # Match Drain
+    "start_match_drain",
+    "record_match_drain_batch",
+    "finish_match_drain_lane",
+    "get_match_drain_progress",
 ]
 
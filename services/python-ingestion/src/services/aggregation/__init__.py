@@ -7,15 +7,20 @@ aggregate fields on products from linked supplier items:
 
 Key Components:
     - calculate_product_aggregates: Core aggregation function
+    - apply_aggregate_deltas: Incremental maintenance from item-level deltas
     - get_review_queue_stats: Statistics for review queue dashboard
 """
 from src.services.aggregation.service import (
+    AggregateDelta,
+    apply_aggregate_deltas,
     calculate_product_aggregates,
     calculate_product_aggregates_batch,
     get_review_queue_stats,
 )
 
 __all__ = [
+    "AggregateDelta",
+    "apply_aggregate_deltas",
     "calculate_product_aggregates",
     "calculate_product_aggregates_batch",
     "get_review_queue_stats",
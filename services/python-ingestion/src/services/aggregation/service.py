@@ -6,32 +6,144 @@ their linked supplier items.
 
 Key Functions:
     - calculate_product_aggregates: Calculate min_price and availability for a single product
-    - calculate_product_aggregates_batch: Calculate aggregates for multiple products
+    - calculate_product_aggregates_batch: Calculate aggregates for multiple products in one statement
+    - apply_aggregate_deltas: Maintain aggregates incrementally from item-level deltas
     - get_review_queue_stats: Get statistics for the review queue dashboard
 
 SOLID Compliance:
     - Single Responsibility: Only handles aggregate calculations
     - Dependency Inversion: Depends on SQLAlchemy session abstraction
 """
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from uuid import UUID
 import structlog
 
-from sqlalchemy import select, update, func, and_, or_, case
+from sqlalchemy import BigInteger, select, update, func, and_, or_, case, cast, any_, bindparam, column, exists, values
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
 from src.db.models import (
     Product,
     SupplierItem,
     MatchStatus,
-    MatchReviewQueue,
+    ReviewQueueStats,
     ReviewStatus,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Link statuses that count towards product aggregates
+LINKED_STATUSES = [MatchStatus.AUTO_MATCHED, MatchStatus.VERIFIED_MATCH]
+
+
+def is_in_stock(characteristics: Optional[Dict[str, Any]]) -> bool:
+    """Python counterpart of the supplier_items.in_stock generated column.
+    
+    Used for items whose change has not been written yet (the column is
+    only computed by the database).
+    """
+    value = (characteristics or {}).get("in_stock")
+    if value is None:
+        return False
+    text = "true" if value is True else str(value)
+    return text in ("true", "True") or text.lower() in ("yes", "1")
+
+
+@dataclass
+class AggregateDelta:
+    """Change of one supplier item's contribution to a product's aggregates.
+    
+    Attributes:
+        product_id: Product the item is (or was) linked to
+        new_price: Item price after the change (None if unknown)
+        old_price: Item price before the change (None if the item was not
+            contributing, e.g. a new link)
+        in_stock: Item in stock after the change
+        was_in_stock: Item in stock before the change
+        unlinked: Item no longer contributes to the product
+    """
+    product_id: UUID
+    new_price: Optional[Decimal] = None
+    old_price: Optional[Decimal] = None
+    in_stock: bool = False
+    was_in_stock: bool = False
+    unlinked: bool = False
+    
+    @classmethod
+    def link(
+        cls,
+        product_id: UUID,
+        price: Optional[Decimal],
+        characteristics: Optional[Dict[str, Any]] = None,
+    ) -> "AggregateDelta":
+        """Delta of an item that became linked to a product."""
+        return cls(product_id=product_id, new_price=price, in_stock=is_in_stock(characteristics))
+    
+    @classmethod
+    def unlink(cls, product_id: UUID) -> "AggregateDelta":
+        """Delta of an item that is no longer linked to a product."""
+        return cls(product_id=product_id, unlinked=True)
+    
+    @classmethod
+    def update(
+        cls,
+        product_id: UUID,
+        old_price: Optional[Decimal],
+        new_price: Optional[Decimal],
+        was_in_stock: bool,
+        characteristics: Optional[Dict[str, Any]] = None,
+    ) -> "AggregateDelta":
+        """Delta of a linked item whose price or stock changed (e.g. re-parsed)."""
+        return cls(
+            product_id=product_id,
+            new_price=new_price,
+            old_price=old_price,
+            in_stock=is_in_stock(characteristics),
+            was_in_stock=was_in_stock,
+        )
+    
+    @property
+    def needs_recompute(self) -> bool:
+        """Whether the change can lower the product's aggregates.
+        
+        Unlinks and lost stock always need a full recompute. Price rises
+        need one only if the item held the minimum (checked against the
+        product in apply_aggregate_deltas).
+        """
+        return self.unlinked or (self.was_in_stock and not self.in_stock)
+    
+    @property
+    def price_rose(self) -> bool:
+        """Whether a contributing item's price went up (or became unknown)."""
+        return self.old_price is not None and (
+            self.new_price is None or self.new_price > self.old_price
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (for task messages)."""
+        return {
+            "product_id": str(self.product_id),
+            "new_price": str(self.new_price) if self.new_price is not None else None,
+            "old_price": str(self.old_price) if self.old_price is not None else None,
+            "in_stock": self.in_stock,
+            "was_in_stock": self.was_in_stock,
+            "unlinked": self.unlinked,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AggregateDelta":
+        """Build from to_dict() output."""
+        return cls(
+            product_id=UUID(data["product_id"]),
+            new_price=Decimal(data["new_price"]) if data.get("new_price") is not None else None,
+            old_price=Decimal(data["old_price"]) if data.get("old_price") is not None else None,
+            in_stock=bool(data.get("in_stock")),
+            was_in_stock=bool(data.get("was_in_stock")),
+            unlinked=bool(data.get("unlinked")),
+        )
+
 
 async def calculate_product_aggregates(
     session: AsyncSession,
@@ -70,10 +182,7 @@ async def calculate_product_aggregates(
         .where(
             and_(
                 SupplierItem.product_id == product_id,
-                SupplierItem.match_status.in_([
-                    MatchStatus.AUTO_MATCHED,
-                    MatchStatus.VERIFIED_MATCH,
-                ])
+                SupplierItem.match_status.in_(LINKED_STATUSES)
             )
         )
         .correlate(Product)
@@ -81,29 +190,17 @@ async def calculate_product_aggregates(
     )
     
     # Subquery for availability: EXISTS any linked item with in_stock=true
-    # Check for various representations of "true" in JSONB: true, 'true', 'yes', '1'
+    # (index-only scan of idx_supplier_items_in_stock_linked)
     availability_subq = (
-        select(func.count(SupplierItem.id) > 0)
+        exists()
         .where(
             and_(
                 SupplierItem.product_id == product_id,
-                SupplierItem.match_status.in_([
-                    MatchStatus.AUTO_MATCHED,
-                    MatchStatus.VERIFIED_MATCH,
-                ]),
-                or_(
-                    # Boolean true in JSONB
-                    SupplierItem.characteristics["in_stock"].astext == "true",
-                    # String variations
-                    func.lower(SupplierItem.characteristics["in_stock"].astext) == "yes",
-                    func.lower(SupplierItem.characteristics["in_stock"].astext) == "1",
-                    # Handle JSON boolean true (cast to text)
-                    SupplierItem.characteristics["in_stock"].astext == "True",
-                )
+                SupplierItem.match_status.in_(LINKED_STATUSES),
+                SupplierItem.in_stock,
             )
         )
         .correlate(Product)
-        .scalar_subquery()
     )
     
     # Count linked items for metadata
@@ -112,10 +209,7 @@ async def calculate_product_aggregates(
         .where(
             and_(
                 SupplierItem.product_id == product_id,
-                SupplierItem.match_status.in_([
-                    MatchStatus.AUTO_MATCHED,
-                    MatchStatus.VERIFIED_MATCH,
-                ])
+                SupplierItem.match_status.in_(LINKED_STATUSES)
             )
         )
     )
@@ -128,7 +222,7 @@ async def calculate_product_aggregates(
         .where(Product.id == product_id)
         .values(
             min_price=min_price_subq,
-            availability=func.coalesce(availability_subq, False),
+            availability=availability_subq,
         )
         .returning(Product.min_price, Product.availability)
     )
@@ -170,8 +264,17 @@ async def calculate_product_aggregates_batch(
 ) -> List[Dict[str, Any]]:
     """Calculate and update aggregate fields for multiple products.
     
-    Processes products in batch for efficiency, using individual
-    UPDATE statements within a single transaction.
+    Recomputes all products with a single set-based statement:
+    
+        UPDATE products SET min_price = linked.min_price, ...
+        FROM (SELECT products.id, min(...), bool_or(...), count(...)
+              FROM products LEFT JOIN supplier_items ON <linked item>
+              WHERE products.id = ANY($1) GROUP BY products.id) AS linked
+        WHERE products.id = linked.product_id
+        RETURNING ...
+    
+    The LEFT JOIN keeps products that lost all their links, so they are
+    reset to min_price=NULL, availability=FALSE.
     
     Args:
         session: AsyncSession for database operations
@@ -179,50 +282,223 @@ async def calculate_product_aggregates_batch(
         trigger: What triggered the recalculation
         
     Returns:
-        List of result dictionaries, one per product
+        List of result dictionaries, one per distinct product id (in input
+        order), with the same keys as calculate_product_aggregates().
+        Products that do not exist get an "error" entry.
         
     Note:
-        All updates happen in a single transaction.
-        Failed updates are logged but don't stop other updates.
+        Runs in the caller's transaction. A database error fails the whole
+        batch (the transaction is aborted either way).
     """
     log = logger.bind(product_count=len(product_ids), trigger=trigger)
     log.info("calculating_product_aggregates_batch")
     
+    unique_ids = list(dict.fromkeys(product_ids))
+    if not unique_ids:
+        return []
+    
+    ids_param = bindparam(
+        "product_ids",
+        unique_ids,
+        type_=ARRAY(Product.__table__.c.id.type),
+    )
+    linked = (
+        select(
+            Product.id.label("product_id"),
+            func.min(SupplierItem.current_price).label("min_price"),
+            func.coalesce(func.bool_or(SupplierItem.in_stock), False).label("availability"),
+            func.count(SupplierItem.id).label("linked_items_count"),
+        )
+        .select_from(Product)
+        .outerjoin(
+            SupplierItem,
+            and_(
+                SupplierItem.product_id == Product.id,
+                SupplierItem.match_status.in_(LINKED_STATUSES),
+            ),
+        )
+        .where(Product.id == any_(ids_param))
+        .group_by(Product.id)
+        .subquery("linked")
+    )
+    
+    update_stmt = (
+        update(Product)
+        .where(Product.id == linked.c.product_id)
+        .values(
+            min_price=linked.c.min_price,
+            availability=linked.c.availability,
+        )
+        .returning(
+            Product.id,
+            Product.min_price,
+            Product.availability,
+            linked.c.linked_items_count,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    
+    result = await session.execute(update_stmt)
+    updated = {
+        row[0]: {
+            "product_id": row[0],
+            "min_price": row[1],
+            "availability": row[2],
+            "linked_items_count": row[3],
+            "trigger": trigger,
+        }
+        for row in result.all()
+    }
+    
     results = []
-    for product_id in product_ids:
-        try:
-            result = await calculate_product_aggregates(
-                session=session,
-                product_id=product_id,
-                trigger=trigger,
-            )
-            results.append(result)
-        except Exception as e:
-            log.error(
-                "product_aggregate_calculation_failed",
-                product_id=str(product_id),
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            results.append({
+    for product_id in unique_ids:
+        entry = updated.get(product_id)
+        if entry is None:
+            log.warning("product_not_found_for_aggregate_update", product_id=str(product_id))
+            entry = {
                 "product_id": product_id,
-                "error": str(e),
+                "min_price": None,
+                "availability": False,
+                "linked_items_count": 0,
                 "trigger": trigger,
-            })
-    
-    # Summary log
-    success_count = sum(1 for r in results if "error" not in r)
-    error_count = len(results) - success_count
+                "error": "Product not found",
+            }
+        results.append(entry)
     
     log.info(
         "product_aggregates_batch_completed",
-        success_count=success_count,
-        error_count=error_count,
+        success_count=len(updated),
+        error_count=len(results) - len(updated),
+        unlinked_count=sum(1 for r in updated.values() if r["linked_items_count"] == 0),
     )
     
     return results
 
 
+async def _held_minimum(
+    session: AsyncSession,
+    rises: Dict[UUID, Decimal],
+) -> Set[UUID]:
+    """Products whose minimum may have been held by an item whose price rose.
+    
+    Args:
+        session: AsyncSession for database operations
+        rises: Lowest old price of a risen item per product
+        
+    Returns:
+        Products with min_price unset or >= the old price
+    """
+    risen = values(
+        column("product_id", Product.__table__.c.id.type),
+        column("old_price", Product.__table__.c.min_price.type),
+        name="risen",
+    ).data(list(rises.items()))
+    result = await session.execute(
+        select(Product.id)
+        .join(risen, Product.id == risen.c.product_id)
+        .where(or_(Product.min_price.is_(None), Product.min_price >= risen.c.old_price))
+    )
+    return set(result.scalars().all())
+
+
+async def apply_aggregate_deltas(
+    session: AsyncSession,
+    deltas: List[AggregateDelta],
+    trigger: str = "delta",
+) -> List[Dict[str, Any]]:
+    """Maintain product aggregates from item-level deltas.
+    
+    Most changes can only lower min_price or turn availability on (a new
+    link, a price drop, stock coming back). Those are applied directly with
+    one statement for all products:
+    
+        UPDATE products SET min_price = LEAST(products.min_price, d.min_price),
+                            availability = products.availability OR d.in_stock
+        FROM (VALUES ...) AS d WHERE products.id = d.product_id
+    
+    Products need a full recompute (calculate_product_aggregates_batch) only
+    when an item unlinks, loses stock, or its price rises while it may hold
+    the product's minimum.
+    
+    Args:
+        session: AsyncSession for database operations
+        deltas: Item-level deltas (several per product allowed)
+        trigger: What triggered the recalculation
+        
+    Returns:
+        List of result dictionaries, one per product, with the keys of
+        calculate_product_aggregates() (incremental results have no
+        linked_items_count)
+    """
+    log = logger.bind(delta_count=len(deltas), trigger=trigger)
+    
+    recompute: Set[UUID] = set()
+    rises: Dict[UUID, Decimal] = {}
+    lowest: Dict[UUID, Optional[Decimal]] = {}
+    in_stock: Dict[UUID, bool] = {}
+    for delta in deltas:
+        pid = delta.product_id
+        if delta.needs_recompute:
+            recompute.add(pid)
+            continue
+        if delta.price_rose and delta.old_price is not None:
+            rises[pid] = min(rises.get(pid, delta.old_price), delta.old_price)
+        prices = [p for p in (lowest.get(pid), delta.new_price) if p is not None]
+        lowest[pid] = min(prices) if prices else None
+        in_stock[pid] = in_stock.get(pid, False) or delta.in_stock
+    
+    rises = {pid: price for pid, price in rises.items() if pid not in recompute}
+    if rises:
+        recompute |= await _held_minimum(session, rises)
+    
+    results: List[Dict[str, Any]] = []
+    incremental = [pid for pid in lowest if pid not in recompute]
+    if incremental:
+        table = Product.__table__
+        changes = values(
+            column("product_id", table.c.id.type),
+            column("min_price", table.c.min_price.type),
+            column("in_stock", table.c.availability.type),
+            name="changes",
+        ).data([(pid, lowest[pid], in_stock[pid]) for pid in incremental])
+        
+        # LEAST ignores NULLs: an unset min_price takes the new price
+        stmt = (
+            update(Product)
+            .where(Product.id == changes.c.product_id)
+            .values(
+                min_price=func.least(Product.min_price, changes.c.min_price),
+                availability=or_(Product.availability, changes.c.in_stock),
+            )
+            .returning(Product.id, Product.min_price, Product.availability)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        results.extend(
+            {
+                "product_id": row[0],
+                "min_price": row[1],
+                "availability": row[2],
+                "trigger": trigger,
+            }
+            for row in result.all()
+        )
+    
+    if recompute:
+        results.extend(await calculate_product_aggregates_batch(
+            session=session,
+            product_ids=sorted(recompute),
+            trigger=trigger,
+        ))
+    
+    log.info(
+        "product_aggregate_deltas_applied",
+        incremental_count=len(incremental),
+        recompute_count=len(recompute),
+    )
+    return results
+
+
 async def get_review_queue_stats(
     session: AsyncSession,
     supplier_id: Optional[UUID] = None,
@@ -231,12 +507,14 @@ async def get_review_queue_stats(
     """Get statistics for the match review queue.
     
     Returns counts of review queue items grouped by status,
-    optionally filtered by supplier or category.
+    optionally filtered by supplier or category. Counts are read from
+    review_queue_stats (maintained by the queue writers, see
+    services.review_queue), so no query touches match_review_queue.
     
     Args:
         session: AsyncSession for database operations
         supplier_id: Optional filter by supplier
-        category_id: Optional filter by category (via supplier_item)
+        category_id: Optional filter by category (of the entry's product)
         
     Returns:
         Dictionary with stats:
@@ -259,30 +537,18 @@ async def get_review_queue_stats(
     base_conditions = []
     
     if supplier_id:
-        # Join through supplier_item to filter by supplier
-        base_conditions.append(
-            MatchReviewQueue.supplier_item_id.in_(
-                select(SupplierItem.id).where(SupplierItem.supplier_id == supplier_id)
-            )
-        )
+        base_conditions.append(ReviewQueueStats.supplier_id == supplier_id)
     
     if category_id:
-        # Join through supplier_item -> product to filter by category
-        base_conditions.append(
-            MatchReviewQueue.supplier_item_id.in_(
-                select(SupplierItem.id)
-                .join(Product, SupplierItem.product_id == Product.id)
-                .where(Product.category_id == category_id)
-            )
-        )
+        base_conditions.append(ReviewQueueStats.category_id == category_id)
+    
+    # SUM(bigint) is numeric in Postgres; keep counts integers
+    count = cast(func.sum(ReviewQueueStats.count), BigInteger).label("count")
     
     # Count by status
     status_query = (
-        select(
-            MatchReviewQueue.status,
-            func.count(MatchReviewQueue.id).label("count"),
-        )
-        .group_by(MatchReviewQueue.status)
+        select(ReviewQueueStats.status, count)
+        .group_by(ReviewQueueStats.status)
     )
     
     if base_conditions:
@@ -303,50 +569,35 @@ async def get_review_queue_stats(
         "needs_category": status_counts.get(ReviewStatus.NEEDS_CATEGORY.value, 0),
     }
     
+    pending_conditions = base_conditions + [ReviewQueueStats.status == ReviewStatus.PENDING]
+    
     # Add breakdowns if not filtered
     if not supplier_id:
         # Group by supplier
         supplier_query = (
-            select(
-                SupplierItem.supplier_id,
-                func.count(MatchReviewQueue.id).label("count"),
-            )
-            .join(SupplierItem, MatchReviewQueue.supplier_item_id == SupplierItem.id)
-            .where(MatchReviewQueue.status == ReviewStatus.PENDING)
-            .group_by(SupplierItem.supplier_id)
+            select(ReviewQueueStats.supplier_id, count)
+            .where(and_(*pending_conditions))
+            .group_by(ReviewQueueStats.supplier_id)
         )
         
-        if category_id:
-            supplier_query = supplier_query.join(
-                Product, SupplierItem.product_id == Product.id
-            ).where(Product.category_id == category_id)
-        
         supplier_result = await session.execute(supplier_query)
         stats["by_supplier"] = {
             str(row.supplier_id): row.count for row in supplier_result
         }
     
     if not category_id:
-        # Group by category (through product)
+        # Group by category
         category_query = (
-            select(
-                Product.category_id,
-                func.count(MatchReviewQueue.id).label("count"),
-            )
-            .join(SupplierItem, MatchReviewQueue.supplier_item_id == SupplierItem.id)
-            .join(Product, SupplierItem.product_id == Product.id)
+            select(ReviewQueueStats.category_id, count)
             .where(
                 and_(
-                    MatchReviewQueue.status == ReviewStatus.PENDING,
-                    Product.category_id.isnot(None),
+                    *pending_conditions,
+                    ReviewQueueStats.category_id.isnot(None),
                 )
             )
-            .group_by(Product.category_id)
+            .group_by(ReviewQueueStats.category_id)
         )
         
-        if supplier_id:
-            category_query = category_query.where(SupplierItem.supplier_id == supplier_id)
-        
         category_result = await session.execute(category_query)
         stats["by_category"] = {
             str(row.category_id): row.count for row in category_result
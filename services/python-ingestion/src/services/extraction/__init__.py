@@ -9,23 +9,57 @@ Key Components:
     - DimensionsExtractor: Extracts weight, dimensions
     - EXTRACTOR_REGISTRY: Dictionary of available extractors
     - create_extractor: Factory function for extractor creation
+    - get_extractor: Process-wide shared extractor instances
+    - warm_extractors: Create and compile extractors ahead of the first item
     - extract_all_features: Run multiple extractors and merge results
+    - extract_characteristics_batch: Extract many texts at once (process pool friendly)
+    - PatternScanner: Single-pass matching of an extractor's patterns
+    - EXTRACTOR_VERSION: Version of the extraction logic (cache invalidation)
+    - extract_characteristics: Cached extraction of one name
+    - extract_characteristics_many: Cached extraction of many names (LRU, Redis)
+    - merge_characteristics: Merge extracted features into characteristics
+    - enrich_parsed_items: Merge extraction results into parsed items (inline enrichment)
 """
 from src.services.extraction.extractors import (
     FeatureExtractor,
     ElectronicsExtractor,
     DimensionsExtractor,
     EXTRACTOR_REGISTRY,
+    EXTRACTOR_VERSION,
     create_extractor,
+    get_extractor,
+    warm_extractors,
     extract_all_features,
+    extract_characteristics_batch,
 )
+from src.services.extraction.scanner import PatternScanner
+from src.services.extraction.cache import (
+    ExtractionCache,
+    extract_characteristics,
+    extract_characteristics_many,
+    extractor_fingerprint,
+    get_extraction_cache,
+)
+from src.services.extraction.enrichment import enrich_parsed_items, merge_characteristics
 
 __all__: list[str] = [
     "FeatureExtractor",
     "ElectronicsExtractor",
     "DimensionsExtractor",
     "EXTRACTOR_REGISTRY",
+    "EXTRACTOR_VERSION",
     "create_extractor",
+    "get_extractor",
+    "warm_extractors",
     "extract_all_features",
+    "extract_characteristics_batch",
+    "PatternScanner",
+    "ExtractionCache",
+    "extract_characteristics",
+    "extract_characteristics_many",
+    "extractor_fingerprint",
+    "get_extraction_cache",
+    "merge_characteristics",
+    "enrich_parsed_items",
 ]
 
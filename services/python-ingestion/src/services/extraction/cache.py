@@ -0,0 +1,254 @@
+"""Memoized feature extraction.
+
+Supplier catalogs repeat the same item names across suppliers and across
+every re-ingestion, and extraction is a pure function of the name and the
+extractors applied. Results (characteristics and the extractor that found
+each of them) are cached per name:
+
+    1. In-process LRU (ExtractionCache), shared by all tasks of a worker
+    2. Optionally Redis (MATCH_EXTRACTION_CACHE_REDIS), shared by all workers
+
+Keys are the exact name rather than its normalized form, which drops
+punctuation the patterns depend on (e.g. the "-" of "220-240V" and the
+"*" of "30*20*10"). Redis keys also carry extractor_fingerprint(), a hash
+of EXTRACTOR_VERSION and the patterns of every registered extractor, so a
+pattern change invalidates the cache.
+
+Cached characteristics are shared between callers and must not be mutated.
+
+Key Components:
+    - extractor_fingerprint: Hash of the extraction logic and patterns
+    - ExtractionCache: Bounded LRU of name -> extraction result
+    - get_extraction_cache: Worker-wide cache (MATCH_EXTRACTION_CACHE_SIZE)
+    - extract_characteristics: Cached extraction of one name (LRU only)
+    - extract_characteristics_many: Cached extraction of many names (LRU, Redis)
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config import matching_settings
+from src.services.extraction.extractors import (
+    EXTRACTOR_REGISTRY,
+    EXTRACTOR_VERSION,
+    extract_characteristics_batch,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Redis key prefix: extraction:{fingerprint}:{sha256 of extractors and name}
+EXTRACTION_CACHE_KEY_PREFIX = "extraction:"
+
+# (characteristics, extractor name per characteristic key)
+Extraction = Tuple[Dict[str, Any], Dict[str, str]]
+
+
+@lru_cache(maxsize=1)
+def extractor_fingerprint() -> str:
+    """Get the fingerprint of the extraction logic.
+
+    Hashes EXTRACTOR_VERSION and the patterns (and anchors) of every
+    registered extractor.
+
+    Returns:
+        16-character hex digest
+    """
+    digest = hashlib.sha256(EXTRACTOR_VERSION.encode("utf-8"))
+    for name, extractor_class in sorted(EXTRACTOR_REGISTRY.items()):
+        digest.update(name.encode("utf-8"))
+        for attr, value in sorted(vars(extractor_class).items()):
+            if attr.endswith(("_PATTERNS", "_ANCHORS")):
+                digest.update(f"{attr}={value!r}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def extraction_key(extractors: Sequence[str], text: str) -> str:
+    """Get the Redis key of a name's extraction result."""
+    digest = hashlib.sha256("\0".join([*extractors, text]).encode("utf-8")).hexdigest()
+    return f"{EXTRACTION_CACHE_KEY_PREFIX}{extractor_fingerprint()}:{digest}"
+
+
+class ExtractionCache:
+    """Bounded LRU of (extractors, name) -> extraction result.
+
+    Attributes:
+        maxsize: Maximum number of entries (0 disables the cache)
+        hits: Lookups answered from the cache
+        misses: Lookups not in the cache
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Tuple[str, ...], str], Extraction]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, extractors: Sequence[str], text: str) -> Optional[Extraction]:
+        """Get a cached result (None if not cached)."""
+        key = (tuple(extractors), text)
+        extraction = self._entries.get(key)
+        if extraction is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return extraction
+
+    def put(self, extractors: Sequence[str], text: str, extraction: Extraction) -> None:
+        """Cache a result, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        key = (tuple(extractors), text)
+        self._entries[key] = extraction
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Get the worker-wide extraction cache (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = ExtractionCache(matching_settings.extraction_cache_size)
+    return _cache
+
+
+def extract_characteristics(
+    text: str,
+    extractors: Optional[List[str]] = None,
+) -> Extraction:
+    """Extract characteristics from one name, using the worker-wide cache.
+
+    Args:
+        text: Input text (supplier item name)
+        extractors: List of extractor names to apply (default: all)
+
+    Returns:
+        (characteristics, extractor name per characteristic key)
+    """
+    if extractors is None:
+        extractors = list(EXTRACTOR_REGISTRY.keys())
+
+    cache = get_extraction_cache()
+    extraction = cache.get(extractors, text)
+    if extraction is None:
+        extraction, = extract_characteristics_batch([text], extractors)
+        cache.put(extractors, text, extraction)
+    return extraction
+
+
+async def _load_from_redis(
+    redis: Redis,
+    extractors: Sequence[str],
+    texts: List[str],
+) -> Dict[str, Extraction]:
+    """Load cached results of names from Redis (missing names are left out)."""
+    try:
+        values = await redis.mget([extraction_key(extractors, text) for text in texts])
+    except RedisError as e:
+        logger.warning("extraction_cache_load_failed", error=str(e))
+        return {}
+
+    found: Dict[str, Extraction] = {}
+    for text, value in zip(texts, values):
+        if value is None:
+            continue
+        try:
+            characteristics, sources = json.loads(value)
+            found[text] = (characteristics, sources)
+        except (ValueError, TypeError):
+            logger.warning("invalid_extraction_cache_entry", key=extraction_key(extractors, text))
+    return found
+
+
+async def _store_in_redis(
+    redis: Redis,
+    extractors: Sequence[str],
+    extractions: Dict[str, Extraction],
+) -> None:
+    """Store results of names in Redis with the configured TTL."""
+    try:
+        pipe = redis.pipeline(transaction=False)
+        for text, extraction in extractions.items():
+            pipe.set(
+                extraction_key(extractors, text),
+                json.dumps(extraction, ensure_ascii=False),
+                ex=matching_settings.extraction_cache_ttl_seconds,
+            )
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning("extraction_cache_store_failed", count=len(extractions), error=str(e))
+
+
+async def extract_characteristics_many(
+    texts: Sequence[str],
+    extractors: List[str],
+    extract: Callable[[List[str]], Awaitable[List[Extraction]]],
+    redis: Optional[Redis] = None,
+) -> List[Extraction]:
+    """Extract characteristics from many names, extracting each distinct name once.
+
+    Names are looked up in the worker-wide LRU, then (if enabled and a
+    connection is given) in Redis; the remaining distinct names are passed
+    to `extract` in one call and their results cached in both.
+
+    Args:
+        texts: Input texts (supplier item names)
+        extractors: List of extractor names to apply
+        extract: Extracts a list of names (e.g. in a process pool)
+        redis: Redis connection for the shared cache
+
+    Returns:
+        For each text, (characteristics, extractor name per characteristic key)
+    """
+    cache = get_extraction_cache()
+    resolved: Dict[str, Extraction] = {}
+    missing: List[str] = []
+    for text in dict.fromkeys(texts):
+        extraction = cache.get(extractors, text)
+        if extraction is None:
+            missing.append(text)
+        else:
+            resolved[text] = extraction
+
+    shared = redis if matching_settings.extraction_cache_redis else None
+    from_redis: Dict[str, Extraction] = {}
+    if missing and shared is not None:
+        from_redis = await _load_from_redis(shared, extractors, missing)
+        missing = [text for text in missing if text not in from_redis]
+
+    extracted: Dict[str, Extraction] = {}
+    if missing:
+        extracted = dict(zip(missing, await extract(missing)))
+        if shared is not None:
+            await _store_in_redis(shared, extractors, extracted)
+
+    for text, extraction in {**from_redis, **extracted}.items():
+        cache.put(extractors, text, extraction)
+        resolved[text] = extraction
+
+    logger.debug(
+        "extraction_cache_lookup",
+        texts=len(texts),
+        distinct=len(resolved),
+        from_redis=len(from_redis),
+        extracted=len(extracted),
+    )
+    return [resolved[text] for text in texts]
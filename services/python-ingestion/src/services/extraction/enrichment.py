@@ -0,0 +1,73 @@
+"""Merging extracted features into supplier item characteristics.
+
+Shared by every enrichment path so they follow the same rules:
+    - enrich_item_task: one stored item
+    - enrich_items_batch_task: pages of stored items
+    - parse_task (inline enrichment): parsed items before they are written
+
+Key Functions:
+    - merge_characteristics: Merge extracted features into characteristics
+    - enrich_parsed_items: Merge extraction results into parsed items in memory
+"""
+from typing import Any, Dict, List, Sequence, Tuple
+
+from src.models.parsed_item import ParsedSupplierItem
+from src.services.extraction.cache import Extraction
+
+
+def merge_characteristics(
+    current: Dict[str, Any],
+    extracted: Dict[str, Any],
+    preserve_existing: bool,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Merge extracted features into existing characteristics.
+
+    Args:
+        current: Existing characteristics
+        extracted: Extracted characteristics
+        preserve_existing: If True, only add keys that are missing or None
+
+    Returns:
+        Tuple of (merged characteristics, keys taken from extracted)
+    """
+    if not preserve_existing:
+        # New values overwrite existing
+        return {**current, **extracted}, list(extracted)
+
+    # Only add new keys, don't overwrite existing
+    merged = {**current}
+    added = []
+    for key, value in extracted.items():
+        if key not in merged or merged[key] is None:
+            merged[key] = value
+            added.append(key)
+    return merged, added
+
+
+def enrich_parsed_items(
+    items: Sequence[ParsedSupplierItem],
+    extracted: Sequence[Extraction],
+    preserve_existing: bool = True,
+) -> int:
+    """Merge extraction results into parsed items' characteristics.
+
+    Characteristics read from the source win over extracted ones unless
+    preserve_existing is False.
+
+    Args:
+        items: Parsed items (updated in place)
+        extracted: Extraction result per item (same order)
+        preserve_existing: If True, only add keys that are missing or None
+
+    Returns:
+        Number of characteristics added
+    """
+    added_total = 0
+    for item, (characteristics, _) in zip(items, extracted):
+        if not characteristics:
+            continue
+        item.characteristics, added = merge_characteristics(
+            item.characteristics, characteristics, preserve_existing
+        )
+        added_total += len(added)
+    return added_total
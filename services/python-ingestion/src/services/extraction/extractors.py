@@ -9,6 +9,10 @@ Key Components:
     - ElectronicsExtractor: Extracts voltage, power, storage, memory
     - DimensionsExtractor: Extracts weight, dimensions (L x W x H)
     - EXTRACTOR_REGISTRY: Dictionary of available extractors by name
+    - EXTRACTOR_VERSION: Version of the extraction logic (cache invalidation)
+    - get_extractor: Process-wide shared extractor instances
+    - warm_extractors: Create and compile extractors ahead of the first item
+    - extract_characteristics_batch: Extract many texts at once (process pool friendly)
 
 SOLID Compliance:
     - Open/Closed: New extractors can be added without modifying existing code
@@ -19,14 +23,18 @@ Pattern Matching Strategy (KISS):
     - Use regex patterns hardcoded in Python classes (no database complexity)
     - Patterns are case-insensitive
     - Multiple patterns per feature type for flexibility
+    - All patterns of an extractor are matched in one scan (PatternScanner);
+      each pattern declares its anchors (the unit or keyword it hangs on)
     - Invalid/ambiguous values are filtered by Pydantic validators
 """
 import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Type
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Type
 import structlog
 
 from src.models.extraction import ExtractedFeatures, DimensionsCm
+from src.services.extraction.scanner import PatternScanner
 
 logger = structlog.get_logger(__name__)
 
@@ -42,6 +50,8 @@ class FeatureExtractor(ABC):
         - get_extractor_name() returns unique extractor identifier
         - Patterns are case-insensitive
         - Invalid values are filtered (handled by Pydantic validators)
+        - extract() keeps no state between calls (instances are shared
+          across tasks and threads, see get_extractor)
     """
     
     @abstractmethod
@@ -92,6 +102,7 @@ class ElectronicsExtractor(FeatureExtractor):
         # "AC 220V", "AC220"
         r'AC\s*(\d{2,4})\s*[vVвВ]?',
     ]
+    VOLTAGE_ANCHORS = [("v", "ve"), ("v", "ve"), ("dash",), ("ac",)]
     
     # Power patterns (case-insensitive)
     POWER_PATTERNS = [
@@ -102,6 +113,7 @@ class ElectronicsExtractor(FeatureExtractor):
         # "HP 1.5" (horsepower - convert to watts approx 746W/HP)
         r'(\d+(?:[.,]\d+)?)\s*HP',
     ]
+    POWER_ANCHORS = [("w", "ve"), ("k",), ("h",)]
     
     # Storage patterns
     STORAGE_PATTERNS = [
@@ -114,6 +126,7 @@ class ElectronicsExtractor(FeatureExtractor):
         # SSD/HDD with space: "SSD 512GB"
         r'(?:SSD|HDD|NVMe)\s*(\d{1,4})\s*[gGгГ][bBбБ]',
     ]
+    STORAGE_ANCHORS = [("g",), ("t",), ("g",), ("disk",)]
     
     # Memory patterns (RAM)
     MEMORY_PATTERNS = [
@@ -122,13 +135,16 @@ class ElectronicsExtractor(FeatureExtractor):
         # "RAM 8GB", "DDR4 16GB"
         r'(?:RAM|DDR\d?|memory|ОЗУ)\s*(\d{1,3})\s*[gGгГ][bBбБ]',
     ]
+    MEMORY_ANCHORS = [("g",), ("ram",)]
     
     def __init__(self):
         """Initialize the electronics extractor with compiled patterns."""
-        self._voltage_re = [re.compile(p, re.IGNORECASE) for p in self.VOLTAGE_PATTERNS]
-        self._power_re = [re.compile(p, re.IGNORECASE) for p in self.POWER_PATTERNS]
-        self._storage_re = [re.compile(p, re.IGNORECASE) for p in self.STORAGE_PATTERNS]
-        self._memory_re = [re.compile(p, re.IGNORECASE) for p in self.MEMORY_PATTERNS]
+        self._scanner = PatternScanner({
+            "voltage": list(zip(self.VOLTAGE_PATTERNS, self.VOLTAGE_ANCHORS)),
+            "power": list(zip(self.POWER_PATTERNS, self.POWER_ANCHORS)),
+            "storage": list(zip(self.STORAGE_PATTERNS, self.STORAGE_ANCHORS)),
+            "memory": list(zip(self.MEMORY_PATTERNS, self.MEMORY_ANCHORS)),
+        })
         self._log = logger.bind(extractor="ElectronicsExtractor")
     
     def get_extractor_name(self) -> str:
@@ -144,10 +160,11 @@ class ElectronicsExtractor(FeatureExtractor):
         Returns:
             ExtractedFeatures with voltage, power, storage, memory
         """
-        voltage = self._extract_voltage(text)
-        power_watts = self._extract_power(text)
-        storage_gb = self._extract_storage(text)
-        memory_gb = self._extract_memory(text)
+        matches = self._scanner.scan(text)
+        voltage = self._extract_voltage(matches["voltage"])
+        power_watts = self._extract_power(matches["power"])
+        storage_gb = self._extract_storage(matches["storage"])
+        memory_gb = self._extract_memory(matches["memory"])
         
         result = ExtractedFeatures(
             voltage=voltage,
@@ -168,10 +185,9 @@ class ElectronicsExtractor(FeatureExtractor):
         
         return result
     
-    def _extract_voltage(self, text: str) -> Optional[int]:
-        """Extract voltage value from text."""
-        for pattern in self._voltage_re:
-            match = pattern.search(text)
+    def _extract_voltage(self, matches: List[Optional[re.Match]]) -> Optional[int]:
+        """Extract voltage value from the voltage patterns' matches."""
+        for match in matches:
             if match:
                 try:
                     value = int(match.group(1))
@@ -182,10 +198,9 @@ class ElectronicsExtractor(FeatureExtractor):
                     continue
         return None
     
-    def _extract_power(self, text: str) -> Optional[int]:
-        """Extract power value from text (in watts)."""
-        for i, pattern in enumerate(self._power_re):
-            match = pattern.search(text)
+    def _extract_power(self, matches: List[Optional[re.Match]]) -> Optional[int]:
+        """Extract power value from the power patterns' matches (in watts)."""
+        for i, match in enumerate(matches):
             if match:
                 try:
                     raw_value = match.group(1).replace(',', '.')
@@ -207,10 +222,9 @@ class ElectronicsExtractor(FeatureExtractor):
                     continue
         return None
     
-    def _extract_storage(self, text: str) -> Optional[int]:
-        """Extract storage capacity from text (in GB)."""
-        for i, pattern in enumerate(self._storage_re):
-            match = pattern.search(text)
+    def _extract_storage(self, matches: List[Optional[re.Match]]) -> Optional[int]:
+        """Extract storage capacity from the storage patterns' matches (in GB)."""
+        for i, match in enumerate(matches):
             if match:
                 try:
                     value = int(match.group(1))
@@ -226,10 +240,9 @@ class ElectronicsExtractor(FeatureExtractor):
                     continue
         return None
     
-    def _extract_memory(self, text: str) -> Optional[int]:
-        """Extract memory/RAM from text (in GB)."""
-        for pattern in self._memory_re:
-            match = pattern.search(text)
+    def _extract_memory(self, matches: List[Optional[re.Match]]) -> Optional[int]:
+        """Extract memory/RAM from the memory patterns' matches (in GB)."""
+        for match in matches:
             if match:
                 try:
                     value = int(match.group(1))
@@ -265,6 +278,7 @@ class DimensionsExtractor(FeatureExtractor):
         # "weight: 2.5kg"
         r'(?:weight|вес|масса)[:\s]+(\d+(?:[.,]\d+)?)\s*[kкКK]?[gгГG]?',
     ]
+    WEIGHT_ANCHORS = [("k",), ("g",), ("lb",), ("weight",)]
     
     # Dimension patterns (L x W x H format)
     DIMENSION_PATTERNS = [
@@ -279,11 +293,14 @@ class DimensionsExtractor(FeatureExtractor):
         # "12x8x4 in" (inches)
         r'(\d+(?:[.,]\d+)?)\s*[x×*]\s*(\d+(?:[.,]\d+)?)\s*[x×*]\s*(\d+(?:[.,]\d+)?)\s*(?:in|inch|дюйм)',
     ]
+    DIMENSION_ANCHORS = [("x",), ("x",), ("x",), ("dim",), ("x",)]
     
     def __init__(self):
         """Initialize the dimensions extractor with compiled patterns."""
-        self._weight_re = [re.compile(p, re.IGNORECASE) for p in self.WEIGHT_PATTERNS]
-        self._dimension_re = [re.compile(p, re.IGNORECASE) for p in self.DIMENSION_PATTERNS]
+        self._scanner = PatternScanner({
+            "weight": list(zip(self.WEIGHT_PATTERNS, self.WEIGHT_ANCHORS)),
+            "dimensions": list(zip(self.DIMENSION_PATTERNS, self.DIMENSION_ANCHORS)),
+        })
         self._log = logger.bind(extractor="DimensionsExtractor")
     
     def get_extractor_name(self) -> str:
@@ -299,8 +316,9 @@ class DimensionsExtractor(FeatureExtractor):
         Returns:
             ExtractedFeatures with weight_kg, dimensions_cm
         """
-        weight_kg = self._extract_weight(text)
-        dimensions_cm = self._extract_dimensions(text)
+        matches = self._scanner.scan(text)
+        weight_kg = self._extract_weight(matches["weight"])
+        dimensions_cm = self._extract_dimensions(matches["dimensions"])
         
         result = ExtractedFeatures(
             weight_kg=weight_kg,
@@ -317,10 +335,9 @@ class DimensionsExtractor(FeatureExtractor):
         
         return result
     
-    def _extract_weight(self, text: str) -> Optional[float]:
-        """Extract weight value from text (in kg)."""
-        for i, pattern in enumerate(self._weight_re):
-            match = pattern.search(text)
+    def _extract_weight(self, matches: List[Optional[re.Match]]) -> Optional[float]:
+        """Extract weight value from the weight patterns' matches (in kg)."""
+        for i, match in enumerate(matches):
             if match:
                 try:
                     raw_value = match.group(1).replace(',', '.')
@@ -340,10 +357,9 @@ class DimensionsExtractor(FeatureExtractor):
                     continue
         return None
     
-    def _extract_dimensions(self, text: str) -> Optional[DimensionsCm]:
-        """Extract dimensions from text (L x W x H in cm)."""
-        for i, pattern in enumerate(self._dimension_re):
-            match = pattern.search(text)
+    def _extract_dimensions(self, matches: List[Optional[re.Match]]) -> Optional[DimensionsCm]:
+        """Extract dimensions from the dimension patterns' matches (L x W x H in cm)."""
+        for i, match in enumerate(matches):
             if match:
                 try:
                     l = float(match.group(1).replace(',', '.'))
@@ -369,6 +385,12 @@ class DimensionsExtractor(FeatureExtractor):
         return None
 
 
+# Version of the extraction logic. Cached extraction results are keyed by a
+# fingerprint of this version and the patterns of all registered extractors:
+# pattern changes invalidate the cache by themselves, bump the version when
+# changing how values are parsed or validated.
+EXTRACTOR_VERSION = "1"
+
 # Registry of available extractors by name
 EXTRACTOR_REGISTRY: Dict[str, Type[FeatureExtractor]] = {
     "electronics": ElectronicsExtractor,
@@ -397,6 +419,57 @@ def create_extractor(name: str) -> FeatureExtractor:
     return EXTRACTOR_REGISTRY[name]()
 
 
+# Process-wide extractor instances (patterns are compiled once per process)
+_instances: Dict[str, FeatureExtractor] = {}
+_instances_lock = threading.Lock()
+
+
+def get_extractor(name: str) -> FeatureExtractor:
+    """Get the shared instance of an extractor, creating it on first use.
+    
+    Extractors are stateless once constructed, so one instance per process
+    serves all tasks and threads. Creation is locked so concurrent first
+    calls build a single instance.
+    
+    Args:
+        name: Extractor name from EXTRACTOR_REGISTRY
+        
+    Returns:
+        Shared FeatureExtractor instance
+        
+    Raises:
+        ValueError: If unknown extractor name
+    """
+    extractor = _instances.get(name)
+    if extractor is None:
+        with _instances_lock:
+            extractor = _instances.get(name)
+            if extractor is None:
+                extractor = create_extractor(name)
+                _instances[name] = extractor
+    return extractor
+
+
+def warm_extractors(names: Optional[List[str]] = None) -> List[str]:
+    """Create the shared extractors (compiling their patterns) ahead of use.
+    
+    Called at worker startup and in each extraction pool process so the
+    first item does not pay for pattern compilation.
+    
+    Args:
+        names: Extractor names to create (default: all)
+        
+    Returns:
+        Names of the extractors created
+    """
+    if names is None:
+        names = list(EXTRACTOR_REGISTRY.keys())
+    for name in names:
+        get_extractor(name)
+    logger.debug("extractors_warmed", extractors=names)
+    return names
+
+
 def extract_all_features(
     text: str,
     extractors: Optional[List[str]] = None,
@@ -422,7 +495,7 @@ def extract_all_features(
     
     for name in extractors:
         try:
-            extractor = create_extractor(name)
+            extractor = get_extractor(name)
             result = extractor.extract(text)
             
             # Merge results (first non-None value wins)
@@ -454,3 +527,43 @@ def extract_all_features(
     
     return merged
 
+
+def extract_characteristics_batch(
+    texts: Sequence[str],
+    extractors: Optional[List[str]] = None,
+) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """Extract characteristics from many texts.
+    
+    Module-level so it can run in a process pool (each pool process uses
+    its own shared extractors, see get_extractor).
+    Merging matches extract_all_features (first non-None value wins).
+    
+    Args:
+        texts: Input texts (supplier item names)
+        extractors: List of extractor names to apply (default: all)
+        
+    Returns:
+        For each text, (characteristics, extractor name per characteristic key)
+    """
+    if extractors is None:
+        extractors = list(EXTRACTOR_REGISTRY.keys())
+    
+    instances = []
+    for name in extractors:
+        try:
+            instances.append((name, get_extractor(name)))
+        except ValueError as e:
+            logger.warning("extractor_not_found", name=name, error=str(e))
+    
+    results = []
+    for text in texts:
+        characteristics: Dict[str, Any] = {}
+        sources: Dict[str, str] = {}
+        for name, extractor in instances:
+            for key, value in extractor.extract(text).to_characteristics().items():
+                if key not in characteristics:
+                    characteristics[key] = value
+                    sources[key] = name
+        results.append((characteristics, sources))
+    
+    return results
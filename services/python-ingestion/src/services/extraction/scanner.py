@@ -0,0 +1,155 @@
+"""Single-pass pattern scanner for feature extraction.
+
+Extractors hold several ordered lists of patterns per feature and used to
+run pattern.search for each of them, scanning a product name once per
+pattern. PatternScanner scans a name once with a single tokenizer regex
+and only tries the patterns that can start at each token.
+
+Every pattern starts either with a number followed by a unit (e.g.
+"750W", "30x20x10cm") or with a keyword (e.g. "SSD 512GB", "weight: 2kg").
+Each pattern declares its anchors: the unit classes that can follow its
+number or the keyword class it starts with. The tokenizer finds numbers
+(noting the unit that follows them) and keywords, and the patterns
+anchored there are tried with pattern.match at the token's positions.
+The first match found for a pattern is its leftmost match, i.e. exactly
+what pattern.search would return.
+
+Anchor classes of each kind are disjoint (a position belongs to at most
+one of them), so a pattern whose unit can be spelled in several ways
+declares each class (e.g. voltage: "v" and "ve" for "V" and "В").
+
+Key Components:
+    - UNIT_ANCHORS: Unit classes that can follow a number
+    - KEYWORD_ANCHORS: Keyword classes a pattern can start with
+    - PatternScanner: Finds the leftmost match of many patterns in one scan
+"""
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Unit classes (first non-space character after a number)
+UNIT_ANCHORS: Dict[str, str] = {
+    "v": r"v",
+    "ve": r"в",
+    "w": r"w",
+    "k": r"[kк]",
+    "h": r"h",
+    "g": r"[gг]",
+    "t": r"[tт]",
+    "lb": r"[lp]",
+    "dash": r"[-–]",
+    "x": r"[x×*]",
+}
+
+# Keyword classes (keyword a pattern starts with, followed by its number)
+KEYWORD_ANCHORS: Dict[str, str] = {
+    "ac": r"ac\s*\d",
+    "disk": r"(?:ssd|hdd|nvme)\s*\d",
+    "ram": r"(?:ram|ddr\d?|memory|озу)\s*\d",
+    "weight": r"(?:weight|вес|масса)[:\s]+\d",
+    "dim": r"[lд][:.\s]*\d",
+}
+
+_NUMBER_GROUP = "_num"
+
+# (pattern, anchors) in the order the patterns are tried
+ScanPattern = Tuple[str, Sequence[str]]
+
+
+class PatternScanner:
+    """Finds the leftmost match of ordered pattern lists in a single scan.
+
+    scan() returns, for every slot, the same matches as calling search()
+    on each of the slot's patterns (compiled with IGNORECASE).
+
+    Numbers are tokenized as digit runs. A pattern's number may start
+    inside a run ("12345V" matches \\d{2,4}V at "2345V") or span a decimal
+    separator ("1.5kg"), so the patterns anchored at a run are tried at
+    every position of the run and of the runs chained to it by "." or ",".
+    """
+
+    def __init__(self, slots: Dict[str, Sequence[ScanPattern]]):
+        """Compile the slots' patterns and the tokenizer for their anchors.
+
+        Args:
+            slots: Feature slot name -> (pattern, anchors) in priority order
+
+        Raises:
+            ValueError: If a pattern declares an unknown anchor
+        """
+        self._slots: Dict[str, range] = {}
+        self._patterns: List[re.Pattern] = []
+        self._dispatch: Dict[str, List[int]] = {}
+
+        for slot, patterns in slots.items():
+            first = len(self._patterns)
+            for pattern, anchors in patterns:
+                index = len(self._patterns)
+                self._patterns.append(re.compile(pattern, re.IGNORECASE))
+                for anchor in anchors:
+                    if anchor not in UNIT_ANCHORS and anchor not in KEYWORD_ANCHORS:
+                        raise ValueError(f"Unknown anchor {anchor!r} for pattern {pattern!r}")
+                    self._dispatch.setdefault(anchor, []).append(index)
+            self._slots[slot] = range(first, len(self._patterns))
+
+        units = "|".join(
+            f"(?P<{name}>{regex})" for name, regex in UNIT_ANCHORS.items()
+            if name in self._dispatch
+        )
+        keywords = "|".join(
+            f"(?P<{name}>{regex})" for name, regex in KEYWORD_ANCHORS.items()
+            if name in self._dispatch
+        )
+        # Numbers followed by a unit, or by a decimal part the unit may follow
+        # (lookaheads: a unit may itself start a keyword, as in "512 HDD")
+        tokenizer = rf"(?P<{_NUMBER_GROUP}>\d+)(?:(?=[.,]\d)"
+        if units:
+            tokenizer += rf"|\s*(?=(?:{units}))"
+        tokenizer += ")"
+        if keywords:
+            tokenizer += rf"|(?=(?:{keywords}))"
+        self._tokenizer = re.compile(tokenizer, re.IGNORECASE)
+
+    def scan(self, text: str) -> Dict[str, List[Optional[re.Match]]]:
+        """Scan text once and collect each pattern's leftmost match.
+
+        Args:
+            text: Input text (e.g. product name)
+
+        Returns:
+            Slot name -> match (or None) per pattern, in priority order
+        """
+        matches: List[Optional[re.Match]] = [None] * len(self._patterns)
+        pending = len(self._patterns)
+        chain_start = 0
+        previous_end = -2
+
+        for token in self._tokenizer.finditer(text):
+            start = token.start()
+            # Every tokenizer alternative is a named group
+            anchor = token.lastgroup or ""
+
+            if token.group(_NUMBER_GROUP) is not None:
+                number_end = token.end(_NUMBER_GROUP)
+                # "1.5kg": the unit follows the last run of the chain
+                if not (start == previous_end + 1 and text[previous_end] in ".,"):
+                    chain_start = start
+                previous_end = number_end
+                positions = range(chain_start, number_end)
+            else:
+                positions = range(start, start + 1)
+
+            for index in self._dispatch.get(anchor, ()):
+                if matches[index] is not None:
+                    continue
+                pattern = self._patterns[index]
+                for position in positions:
+                    match = pattern.match(text, position)
+                    if match:
+                        matches[index] = match
+                        pending -= 1
+                        break
+
+            if not pending:
+                break
+
+        return {slot: matches[r.start:r.stop] for slot, r in self._slots.items()}
@@ -0,0 +1,231 @@
+"""Priority-ordered dequeue of arq jobs.
+
+arq keeps each queue in one Redis sorted set, scored by the time a job
+may start (its enqueue time, or the time it is deferred to), and workers
+take the lowest scores first. Jobs enqueued here have their score moved
+back by PRIORITY_SCORE_OFFSET_MS per priority level above "low", so every
+queued high job is taken before any normal one, and every normal job
+before any low one. Within a level, jobs keep their enqueue order.
+
+Jobs enqueued through ArqRedis.enqueue_job (matching, recalculation,
+manual match events) keep arq's own score and rank with "low". So do
+retries: arq reschedules a retried job at its retry time.
+
+The offset is far larger than any wait in the queue, so the levels never
+interleave and the depth of each level is a count of a score range.
+
+Strict levels trade fairness for latency: while higher-priority jobs keep
+arriving, lower ones would never run (a long upload burst would starve a
+scheduled sync and all matching jobs). promote_aged_jobs (a worker cron)
+bounds that wait: a job queued for PRIORITY_MAX_WAIT_MS moves up one
+level, keeping its enqueue time, so a low job competes as normal after
+one wait and as high after two, behind older jobs only. The oldest job
+age per level is reported for alerting (get_oldest_job_age_by_priority).
+
+Key Functions:
+    - priority_score: Queue score of a job enqueued at a priority
+    - enqueue_jobs: Enqueue jobs of one function in one Redis transaction
+    - promote_aged_jobs: Move jobs that waited too long up one level
+    - get_queue_depth_by_priority: Number of queued jobs per priority
+    - get_oldest_job_age_by_priority: Wait of the oldest queued job per priority
+"""
+from typing import Any, Dict, List, Tuple, Union
+from uuid import uuid4
+import structlog
+from arq.connections import ArqRedis
+from arq.constants import job_key_prefix
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms
+
+logger = structlog.get_logger(__name__)
+
+# Highest first (dequeue order)
+PRIORITY_LEVELS: Tuple[str, ...] = ("high", "normal", "low")
+
+# ~317 years: keeps shifted scores negative (arq skips a score of 0) and
+# far apart from the unshifted ones
+PRIORITY_SCORE_OFFSET_MS = 10**13
+
+_PRIORITY_SHIFTS = {"high": 2, "normal": 1, "low": 0}
+
+# Longest a job waits at its level before it is promoted (15 minutes)
+PRIORITY_MAX_WAIT_MS = 15 * 60 * 1000
+
+# Moves every job in the score ranges ARGV[2..] (min/max pairs) up one
+# level (score - ARGV[1]) in one atomic step, so a job cannot be re-scored
+# after a concurrent retry moved it. Returns the number moved per range.
+PROMOTE_AGED_JOBS_SCRIPT = """
+local offset = tonumber(ARGV[1])
+local promoted = {}
+for i = 2, #ARGV, 2 do
+    local jobs = redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[i], ARGV[i + 1], 'WITHSCORES')
+    for j = 1, #jobs, 2 do
+        local score = string.format('%.0f', tonumber(jobs[j + 1]) - offset)
+        redis.call('ZADD', KEYS[1], 'XX', score, jobs[j])
+    end
+    promoted[#promoted + 1] = #jobs / 2
+end
+return promoted
+"""
+
+ScoreBound = Union[int, str]
+
+
+def priority_score(priority: str, enqueue_time_ms: int) -> int:
+    """Queue score of a job enqueued at a priority.
+
+    Args:
+        priority: "high", "normal" or "low"
+        enqueue_time_ms: Enqueue time (Unix ms)
+
+    Returns:
+        Sorted set score of the job
+
+    Raises:
+        ValueError: If the priority is unknown
+    """
+    if priority not in _PRIORITY_SHIFTS:
+        raise ValueError(f"Unknown priority: {priority}")
+    return enqueue_time_ms - _PRIORITY_SHIFTS[priority] * PRIORITY_SCORE_OFFSET_MS
+
+
+async def enqueue_jobs(
+    redis: ArqRedis,
+    function: str,
+    jobs: List[Dict[str, Any]],
+    priority: str = "normal",
+) -> List[str]:
+    """Enqueue jobs of one function at a priority in one MULTI/EXEC round trip.
+
+    Writes the same job keys and queue entries as ArqRedis.enqueue_job,
+    except for the score, without its per-job WATCH/EXISTS round trips
+    (job ids are fresh, so there is nothing to deduplicate).
+
+    Args:
+        redis: ArqRedis connection
+        function: Name of the worker function
+        jobs: Keyword arguments of the function, one dict per job
+        priority: "high", "normal" or "low"
+
+    Returns:
+        arq job IDs, in order
+
+    Raises:
+        ValueError: If the priority is unknown
+    """
+    enqueue_time_ms = timestamp_ms()
+    score = priority_score(priority, enqueue_time_ms)
+    job_ids = [uuid4().hex for _ in jobs]
+
+    async with redis.pipeline(transaction=True) as pipe:
+        for job_id, kwargs in zip(job_ids, jobs):
+            job = serialize_job(
+                function, (), kwargs, None, enqueue_time_ms,
+                serializer=redis.job_serializer,
+            )
+            pipe.psetex(job_key_prefix + job_id, redis.expires_extra_ms, job)
+            pipe.zadd(redis.default_queue_name, {job_id: score})
+        await pipe.execute()
+
+    logger.debug("jobs_enqueued", function=function, priority=priority, count=len(job_ids))
+    return job_ids
+
+
+def _level_ranges(now: int) -> List[Tuple[ScoreBound, ScoreBound]]:
+    """Score range (min, max) of each level's jobs, in PRIORITY_LEVELS order."""
+    half = PRIORITY_SCORE_OFFSET_MS // 2
+    high_max = now - 3 * half
+    normal_max = now - half
+    return [("-inf", high_max), (f"({high_max}", normal_max), (f"({normal_max}", "+inf")]
+
+
+def _aged_ranges(now: int, max_wait_ms: int) -> List[Tuple[ScoreBound, ScoreBound]]:
+    """Score ranges of normal and low jobs that have waited max_wait_ms or longer."""
+    aged: List[Tuple[ScoreBound, ScoreBound]] = []
+    for priority, (lower, _) in zip(PRIORITY_LEVELS[1:], _level_ranges(now)[1:]):
+        aged.append((lower, priority_score(priority, now - max_wait_ms)))
+    return aged
+
+
+async def promote_aged_jobs(
+    redis: ArqRedis,
+    queue_name: str,
+    max_wait_ms: int = PRIORITY_MAX_WAIT_MS,
+) -> Dict[str, int]:
+    """Move queued jobs that waited max_wait_ms or longer up one level.
+
+    Normal jobs are promoted before low ones, so a job moves at most one
+    level per call. Deferred jobs count from the time they may start.
+
+    Args:
+        redis: ArqRedis connection
+        queue_name: arq queue (sorted set) name
+        max_wait_ms: Wait after which a job is promoted
+
+    Returns:
+        Priority -> number of jobs promoted from it ("normal" and "low")
+    """
+    args: List[ScoreBound] = [PRIORITY_SCORE_OFFSET_MS]
+    for lower, upper in _aged_ranges(timestamp_ms(), max_wait_ms):
+        args.extend((lower, upper))
+    counts = await redis.eval(PROMOTE_AGED_JOBS_SCRIPT, 1, queue_name, *[str(a) for a in args])
+
+    promoted = {priority: int(count) for priority, count in zip(PRIORITY_LEVELS[1:], counts)}
+    if any(promoted.values()):
+        logger.info("aged_jobs_promoted", queue_name=queue_name, promoted=promoted)
+    return promoted
+
+
+async def get_queue_depth_by_priority(
+    redis: ArqRedis,
+    queue_name: str,
+) -> Dict[str, int]:
+    """Number of queued jobs per priority.
+
+    Deferred jobs and jobs enqueued without a priority count as "low".
+
+    Args:
+        redis: ArqRedis connection
+        queue_name: arq queue (sorted set) name
+
+    Returns:
+        Priority -> number of queued jobs, for every level
+    """
+    async with redis.pipeline(transaction=False) as pipe:
+        for lower, upper in _level_ranges(timestamp_ms()):
+            pipe.zcount(queue_name, lower, upper)
+        counts = await pipe.execute()
+
+    return {priority: int(count) for priority, count in zip(PRIORITY_LEVELS, counts)}
+
+
+async def get_oldest_job_age_by_priority(
+    redis: ArqRedis,
+    queue_name: str,
+) -> Dict[str, float]:
+    """Wait of the oldest queued job per priority.
+
+    A promoted job counts at its new level with its original enqueue time,
+    so a "low" age above PRIORITY_MAX_WAIT_MS means promotion is not running.
+
+    Args:
+        redis: ArqRedis connection
+        queue_name: arq queue (sorted set) name
+
+    Returns:
+        Priority -> seconds since the oldest job could start (0 if none)
+    """
+    now = timestamp_ms()
+    async with redis.pipeline(transaction=False) as pipe:
+        for lower, upper in _level_ranges(now):
+            pipe.zrangebyscore(queue_name, lower, upper, start=0, num=1, withscores=True)
+        oldest = await pipe.execute()
+
+    ages: Dict[str, float] = {}
+    for priority, jobs in zip(PRIORITY_LEVELS, oldest):
+        if not jobs:
+            ages[priority] = 0.0
+            continue
+        start_ms = jobs[0][1] + _PRIORITY_SHIFTS[priority] * PRIORITY_SCORE_OFFSET_MS
+        ages[priority] = max(0.0, (now - start_ms) / 1000)
+    return ages
@@ -0,0 +1,271 @@
+"""Match drain coordinator using Redis.
+
+A match_items_task in drain mode that claims a full batch starts a drain
+run: it counts the unmatched backlog and fans out parallel lanes, each of
+which re-enqueues itself after every full batch until nothing is left.
+This module keeps the shared run state in a Redis hash so that lanes on
+different workers update it atomically (HINCRBY), and exposes the overall
+progress and throughput of the run. Only one run is active at a time:
+the first job claims an active-run key (SET NX EX) before fanning out,
+and the last lane of the run clears it.
+
+Key Functions:
+    - claim_match_drain: Claim the active run before fanning out
+    - start_match_drain: Create the run state when fanning out
+    - record_match_drain_batch: Add a committed batch to the run counters
+    - finish_match_drain_lane: Mark a lane as done (run completes with the last)
+    - get_match_drain_progress: Read run progress and throughput
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.models.matching import MatchDrainProgress
+
+logger = structlog.get_logger(__name__)
+
+# Redis key constants
+MATCH_DRAIN_KEY_PREFIX = "match:drain:"
+MATCH_DRAIN_LATEST_KEY = "match:drain:latest"
+MATCH_DRAIN_ACTIVE_KEY = "match:drain:active"
+
+# Run state is kept for a day after the last update
+MATCH_DRAIN_TTL_SECONDS = 86400
+
+# The active-run claim is refreshed by every batch of the run, so a run
+# whose lanes died without finishing stops blocking new runs after this
+MATCH_DRAIN_ACTIVE_TTL_SECONDS = 1800
+
+# Clear the active-run claim only if it still belongs to this run
+RELEASE_ACTIVE_DRAIN_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Batch metrics accumulated into the run counters
+DRAIN_COUNTERS = (
+    "items_processed",
+    "auto_matched",
+    "potential_matches",
+    "new_products_created",
+    "errors",
+)
+
+
+def _drain_key(drain_id: str) -> str:
+    return f"{MATCH_DRAIN_KEY_PREFIX}{drain_id}"
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def _parse_progress(drain_id: str, raw: Dict[Any, Any]) -> MatchDrainProgress:
+    """Build a MatchDrainProgress from a Redis hash."""
+    data = {_decode(k): _decode(v) for k, v in raw.items()}
+    finished_at = data.get("finished_at") or None
+    started = datetime.fromisoformat(data["started_at"])
+    end = datetime.fromisoformat(finished_at) if finished_at else datetime.now(timezone.utc)
+
+    return MatchDrainProgress(
+        drain_id=drain_id,
+        state="completed" if finished_at else "running",
+        started_at=data["started_at"],
+        finished_at=finished_at,
+        backlog_total=int(data.get("backlog_total", 0)),
+        lanes=int(data.get("lanes", 0)),
+        active_lanes=max(int(data.get("active_lanes", 0)), 0),
+        batches=int(data.get("batches", 0)),
+        elapsed_seconds=max((end - started).total_seconds(), 0.0),
+        **{name: int(data.get(name, 0)) for name in DRAIN_COUNTERS},
+    )
+
+
+async def claim_match_drain(
+    redis: Redis,
+    drain_id: str,
+) -> Optional[str]:
+    """Claim the active drain run for a new run (atomic SET NX EX).
+
+    Args:
+        redis: Redis connection
+        drain_id: Drain run identifier of the new run
+
+    Returns:
+        drain_id if the claim succeeded, the drain_id of the run already
+        active otherwise, or None if Redis is unavailable
+    """
+    log = logger.bind(drain_id=drain_id)
+
+    try:
+        claimed = await redis.set(
+            MATCH_DRAIN_ACTIVE_KEY,
+            drain_id,
+            nx=True,
+            ex=MATCH_DRAIN_ACTIVE_TTL_SECONDS,
+        )
+        if claimed:
+            return drain_id
+
+        active = await redis.get(MATCH_DRAIN_ACTIVE_KEY)
+        if not active:
+            # Cleared between SET and GET: the other run just finished
+            return await claim_match_drain(redis, drain_id)
+        return _decode(active)
+
+    except RedisError as e:
+        log.error("claim_match_drain_failed", error=str(e))
+        return None
+
+
+async def start_match_drain(
+    redis: Redis,
+    drain_id: str,
+    backlog_total: int,
+    lanes: int,
+) -> bool:
+    """Create the state of a drain run and make it the latest run.
+
+    Args:
+        redis: Redis connection
+        drain_id: Drain run identifier
+        backlog_total: Unmatched items counted when the run started
+        lanes: Number of parallel lanes fanned out
+
+    Returns:
+        True if the state was stored successfully
+    """
+    log = logger.bind(drain_id=drain_id)
+    key = _drain_key(drain_id)
+
+    try:
+        pipe = redis.pipeline(transaction=True)
+        pipe.hset(key, mapping={
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "backlog_total": backlog_total,
+            "lanes": lanes,
+            "active_lanes": lanes,
+            "batches": 0,
+            **{name: 0 for name in DRAIN_COUNTERS},
+        })
+        pipe.expire(key, MATCH_DRAIN_TTL_SECONDS)
+        pipe.set(MATCH_DRAIN_LATEST_KEY, drain_id, ex=MATCH_DRAIN_TTL_SECONDS)
+        await pipe.execute()
+
+        log.info("match_drain_started", backlog_total=backlog_total, lanes=lanes)
+        return True
+
+    except RedisError as e:
+        log.error("start_match_drain_failed", error=str(e))
+        return False
+
+
+async def record_match_drain_batch(
+    redis: Redis,
+    drain_id: str,
+    batch_metrics: Dict[str, Any],
+) -> bool:
+    """Add the metrics of a committed batch to the run counters.
+
+    Args:
+        redis: Redis connection
+        drain_id: Drain run identifier
+        batch_metrics: MatchingMetrics.to_dict() of the batch
+
+    Returns:
+        True if the counters were updated successfully
+    """
+    key = _drain_key(drain_id)
+
+    try:
+        pipe = redis.pipeline(transaction=True)
+        pipe.hincrby(key, "batches", 1)
+        for name in DRAIN_COUNTERS:
+            value = int(batch_metrics.get(name, 0))
+            if value:
+                pipe.hincrby(key, name, value)
+        pipe.expire(key, MATCH_DRAIN_TTL_SECONDS)
+        pipe.expire(MATCH_DRAIN_ACTIVE_KEY, MATCH_DRAIN_ACTIVE_TTL_SECONDS)
+        await pipe.execute()
+        return True
+
+    except RedisError as e:
+        logger.warning("record_match_drain_batch_failed", drain_id=drain_id, error=str(e))
+        return False
+
+
+async def finish_match_drain_lane(
+    redis: Redis,
+    drain_id: str,
+) -> Optional[MatchDrainProgress]:
+    """Mark a lane as finished; the last lane completes the run.
+
+    Completing the run also clears its active-run claim.
+
+    Args:
+        redis: Redis connection
+        drain_id: Drain run identifier
+
+    Returns:
+        Run progress after the update, or None if unavailable
+    """
+    log = logger.bind(drain_id=drain_id)
+    key = _drain_key(drain_id)
+
+    try:
+        active_lanes = await redis.hincrby(key, "active_lanes", -1)
+        if active_lanes <= 0:
+            # HSETNX: only the first lane to see zero stamps the finish time
+            await redis.hsetnx(key, "finished_at", datetime.now(timezone.utc).isoformat())
+            await redis.eval(RELEASE_ACTIVE_DRAIN_SCRIPT, 1, MATCH_DRAIN_ACTIVE_KEY, drain_id)
+
+        progress = await get_match_drain_progress(redis, drain_id)
+        if progress and progress.state == "completed":
+            log.info(
+                "match_drain_completed",
+                backlog_total=progress.backlog_total,
+                items_processed=progress.items_processed,
+                batches=progress.batches,
+                errors=progress.errors,
+                elapsed_seconds=round(progress.elapsed_seconds, 3),
+                items_per_second=progress.items_per_second,
+            )
+        return progress
+
+    except RedisError as e:
+        log.warning("finish_match_drain_lane_failed", error=str(e))
+        return None
+
+
+async def get_match_drain_progress(
+    redis: Redis,
+    drain_id: Optional[str] = None,
+) -> Optional[MatchDrainProgress]:
+    """Get progress and throughput of a drain run.
+
+    Args:
+        redis: Redis connection
+        drain_id: Drain run identifier (latest run if omitted)
+
+    Returns:
+        MatchDrainProgress, or None if the run is unknown or expired
+    """
+    try:
+        if drain_id is None:
+            latest = await redis.get(MATCH_DRAIN_LATEST_KEY)
+            if not latest:
+                return None
+            drain_id = _decode(latest)
+
+        raw = await redis.hgetall(_drain_key(drain_id))
+        if not raw:
+            return None
+        return _parse_progress(drain_id, raw)
+
+    except (RedisError, KeyError, ValueError) as e:
+        logger.error("get_match_drain_progress_failed", drain_id=drain_id, error=str(e))
+        return None
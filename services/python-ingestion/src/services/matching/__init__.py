@@ -6,8 +6,16 @@ using RapidFuzz-based fuzzy string matching algorithms.
 Key Components:
     - MatcherStrategy: Abstract base class for matching algorithms
     - RapidFuzzMatcher: Default implementation using RapidFuzz WRatio
+    - TwoStageMatcher: Cheap prefilter scorer + WRatio re-rank of the top-N
+    - EmbeddingMatcher: ANN shortlist (hashed n-gram embeddings) + WRatio re-rank
     - MatchCandidate: Data transfer object for match candidates
     - MatchResult: Result container for matching operations
+    - normalize_name: Canonical name form stored as normalized_name
+    - extract_identifiers / IdentifierIndex: Exact GTIN/MPN matching fast path
+    - load_affinities / record_affinities: Reuse prior link decisions per name
+    - MatchWriteBack: Bulk persistence of a batch's match decisions
+    - ProductIndex / cluster_names: Incremental batch catalog, near-duplicate clustering
+    - name_attributes / BlockedProducts: Extraction-derived attribute blocking
 """
 from src.services.matching.matcher import (
     MatcherStrategy,
@@ -15,17 +23,85 @@ from src.services.matching.matcher import (
     MatchCandidate,
     MatchResult,
     MatchStatusEnum,
+    ProductData,
     create_matcher,
     search_match_candidates,
 )
+from src.services.matching.catalog import (
+    BlockedProducts,
+    ProductIndex,
+    cluster_names,
+)
+from src.services.matching.attributes import (
+    ATTRIBUTE_EXTRACTORS,
+    attributes_conflict,
+    name_attributes,
+    parse_blocking_attributes,
+)
+from src.services.matching.normalization import (
+    normalize_name,
+    NORMALIZATION_VERSION,
+)
+from src.services.matching.identifiers import (
+    extract_identifiers,
+    is_valid_gtin,
+    IdentifierIndex,
+)
+from src.services.matching.affinity import (
+    Affinity,
+    affinity_key,
+    load_affinities,
+    record_affinities,
+    invalidate_affinity,
+)
+from src.services.matching.writeback import (
+    ItemDecision,
+    ReviewDecision,
+    MatchWriteBack,
+)
+from src.services.matching.hybrid import (
+    TwoStageMatcher,
+    PREFILTER_SCORERS,
+)
+from src.services.matching.embedding import (
+    EmbeddingMatcher,
+    HashedNgramVectorizer,
+    IVFIndex,
+)
 
 __all__ = [
     "MatcherStrategy",
     "RapidFuzzMatcher",
+    "TwoStageMatcher",
+    "PREFILTER_SCORERS",
+    "EmbeddingMatcher",
+    "HashedNgramVectorizer",
+    "IVFIndex",
     "MatchCandidate",
     "MatchResult",
     "MatchStatusEnum",
+    "ProductData",
     "create_matcher",
     "search_match_candidates",
+    "normalize_name",
+    "NORMALIZATION_VERSION",
+    "extract_identifiers",
+    "is_valid_gtin",
+    "IdentifierIndex",
+    "Affinity",
+    "affinity_key",
+    "load_affinities",
+    "record_affinities",
+    "invalidate_affinity",
+    "ProductIndex",
+    "BlockedProducts",
+    "cluster_names",
+    "ATTRIBUTE_EXTRACTORS",
+    "attributes_conflict",
+    "name_attributes",
+    "parse_blocking_attributes",
+    "ItemDecision",
+    "ReviewDecision",
+    "MatchWriteBack",
 ]
 
@@ -0,0 +1,160 @@
+"""Affinity cache: reuse prior link decisions for identical normalized names.
+
+When an item with a given normalized name has been linked to a product
+(automatically with a score ≥ auto threshold, or verified by a user), an
+identical normalized name from any supplier is linked to the same product
+with one lookup instead of being scored against the catalog again.
+
+Entries live in the match_affinity table keyed by name_hash. Verified
+decisions take precedence: automatic decisions never overwrite them.
+Unlinking or resetting an item invalidates the entry for its name.
+
+Key Functions:
+    - load_affinities: Batch lookup of entries by name hash
+    - record_affinities: Bulk upsert of new decisions
+    - invalidate_affinity: Drop the entry of a name/product pair
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+from uuid import UUID, uuid4
+import structlog
+
+from sqlalchemy import select, delete, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import MatchAffinity, MatchStatus
+from src.services.matching.normalization import name_hash
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class Affinity:
+    """A remembered link decision for one normalized name.
+
+    Attributes:
+        product_id: Product the name was linked to
+        confidence: Match score of the decision (0-100)
+        source: auto_matched or verified_match
+    """
+    product_id: UUID
+    confidence: Decimal
+    source: MatchStatus
+
+
+def affinity_key(normalized_name: Optional[str]) -> Optional[str]:
+    """Get the affinity key of a normalized name (None for empty names)."""
+    if not normalized_name:
+        return None
+    return name_hash(normalized_name)
+
+
+async def load_affinities(
+    session: AsyncSession,
+    keys: Iterable[Optional[str]],
+) -> Dict[str, Affinity]:
+    """Load affinity entries for a batch of name hashes in one query.
+
+    Args:
+        session: Database session
+        keys: Name hashes (None entries are ignored)
+
+    Returns:
+        Dictionary of name_hash -> Affinity for the hashes that have an entry
+    """
+    unique_keys = sorted({k for k in keys if k})
+    if not unique_keys:
+        return {}
+
+    result = await session.execute(
+        select(
+            MatchAffinity.name_hash,
+            MatchAffinity.product_id,
+            MatchAffinity.confidence,
+            MatchAffinity.source,
+        ).where(MatchAffinity.name_hash.in_(unique_keys))
+    )
+    return {
+        row.name_hash: Affinity(
+            product_id=row.product_id,
+            confidence=row.confidence,
+            source=row.source,
+        )
+        for row in result.all()
+    }
+
+
+async def record_affinities(
+    session: AsyncSession,
+    decisions: Dict[str, Affinity],
+) -> int:
+    """Upsert link decisions into the affinity table.
+
+    An existing verified_match entry is only replaced by another
+    verified_match decision.
+
+    Args:
+        session: Database session
+        decisions: name_hash -> Affinity
+
+    Returns:
+        Number of decisions submitted
+    """
+    if not decisions:
+        return 0
+
+    stmt = insert(MatchAffinity).values([
+        {
+            "id": uuid4(),
+            "name_hash": key,
+            "product_id": affinity.product_id,
+            "confidence": affinity.confidence,
+            "source": affinity.source,
+        }
+        for key, affinity in decisions.items()
+    ])
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name_hash"],
+        set_={
+            "product_id": excluded.product_id,
+            "confidence": excluded.confidence,
+            "source": excluded.source,
+            "updated_at": func.now(),
+        },
+        where=or_(
+            MatchAffinity.source != MatchStatus.VERIFIED_MATCH,
+            excluded.source == MatchStatus.VERIFIED_MATCH,
+        ),
+    )
+    await session.execute(stmt)
+
+    logger.debug("affinities_recorded", count=len(decisions))
+    return len(decisions)
+
+
+async def invalidate_affinity(
+    session: AsyncSession,
+    normalized_name: Optional[str],
+    product_id: Optional[UUID],
+) -> None:
+    """Drop the affinity entry linking a normalized name to a product.
+
+    Args:
+        session: Database session
+        normalized_name: Normalized name of the unlinked/reset item
+        product_id: Product the item was linked to
+    """
+    key = affinity_key(normalized_name)
+    if not key or not product_id:
+        return
+
+    await session.execute(
+        delete(MatchAffinity).where(
+            MatchAffinity.name_hash == key,
+            MatchAffinity.product_id == product_id,
+        )
+    )
+    logger.debug("affinity_invalidated", name_hash=key, product_id=str(product_id))
@@ -0,0 +1,201 @@
+"""Extraction-derived attributes for blocking candidate products.
+
+Names that differ only in a specification ("Galaxy A54 128GB" and "Galaxy
+A54 256GB") score high with WRatio, so scoring names alone auto-links items
+to, or queues them for review against, a different variant. The feature
+extractors read those specifications from names; blocking keeps a product
+out of an item's candidates when both carry a blocking attribute with
+different values. An attribute missing on either side never blocks.
+
+Item and product attributes are both extracted from names (through the
+extraction cache), so both sides are read by the same rules. Product
+attributes are also kept per product id for the life of the process, so
+a catalog larger than the extraction cache is not re-extracted by every
+match batch.
+
+Key Components:
+    - ATTRIBUTE_EXTRACTORS: Blocking attribute -> extractor that reads it
+    - parse_blocking_attributes: Parse MATCH_BLOCKING_ATTRIBUTES
+    - name_attributes: Blocking attributes of a name
+    - attributes_conflict: Whether two attribute sets rule each other out
+    - product_attributes: Blocking attributes of a product (cached by id)
+    - AttributeBlocker: Catalog positions blocked for an item's attributes
+    - BlockedPositions: Blocked positions of one item, checked on demand
+"""
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from src.services.extraction import extract_characteristics
+
+# Attributes usable for blocking (scalar extracted features)
+ATTRIBUTE_EXTRACTORS: Dict[str, str] = {
+    "storage_gb": "electronics",
+    "memory_gb": "electronics",
+    "power_watts": "electronics",
+    "voltage": "electronics",
+    "weight_kg": "dimensions",
+}
+
+Attributes = Dict[str, Any]
+
+# Blocking keys -> product id -> (name the attributes were read from, attributes)
+_product_attributes: Dict[Tuple[str, ...], Dict[UUID, Tuple[Optional[str], Attributes]]] = {}
+
+_NO_POSITIONS: Set[int] = set()
+
+
+def parse_blocking_attributes(value: str) -> Tuple[str, ...]:
+    """Parse a comma-separated list of blocking attributes.
+
+    Args:
+        value: e.g. "storage_gb,memory_gb" (empty disables blocking)
+
+    Returns:
+        Attribute names in the given order
+
+    Raises:
+        ValueError: If an attribute is not in ATTRIBUTE_EXTRACTORS
+    """
+    keys = tuple(key.strip() for key in value.split(",") if key.strip())
+    unknown = [key for key in keys if key not in ATTRIBUTE_EXTRACTORS]
+    if unknown:
+        raise ValueError(
+            f"Unknown blocking attributes: {unknown}. "
+            f"Available: {list(ATTRIBUTE_EXTRACTORS.keys())}"
+        )
+    return keys
+
+
+def name_attributes(name: Optional[str], keys: Sequence[str]) -> Attributes:
+    """Get the blocking attributes found in a name.
+
+    Args:
+        name: Item or product name (raw, not normalized: units and
+            separators are part of the patterns)
+        keys: Blocking attributes to read
+
+    Returns:
+        Attribute -> value for the attributes found
+    """
+    if not name or not keys:
+        return {}
+    extractors = sorted({ATTRIBUTE_EXTRACTORS[key] for key in keys})
+    characteristics, _ = extract_characteristics(name, extractors)
+    return {
+        key: characteristics[key]
+        for key in keys
+        if characteristics.get(key) is not None
+    }
+
+
+def product_attributes(product_id: UUID, name: Optional[str], keys: Sequence[str]) -> Attributes:
+    """Get a product's blocking attributes, extracting them once per process.
+
+    Entries are keyed by product id and re-read when the product's name
+    changes.
+
+    Args:
+        product_id: Product id
+        name: Product name
+        keys: Blocking attributes to read
+
+    Returns:
+        Attribute -> value for the attributes found
+    """
+    cache = _product_attributes.setdefault(tuple(keys), {})
+    cached = cache.get(product_id)
+    if cached is not None and cached[0] == name:
+        return cached[1]
+    attributes = name_attributes(name, keys)
+    cache[product_id] = (name, attributes)
+    return attributes
+
+
+def attributes_conflict(left: Mapping[str, Any], right: Mapping[str, Any]) -> bool:
+    """Check whether two attribute sets have a shared attribute with different values."""
+    return any(key in right and right[key] != value for key, value in left.items())
+
+
+class BlockedPositions:
+    """Catalog positions blocked for one item's attributes.
+
+    Holds, per conflicting attribute, the positions of products having the
+    attribute and those allowed (same value), so building it is O(number
+    of attributes) and a position is checked on demand.
+    """
+
+    def __init__(self, checks: Sequence[Tuple[Set[int], Set[int]]] = ()):
+        self._checks = list(checks)
+
+    def __contains__(self, position: object) -> bool:
+        return any(
+            position in having and position not in allowed
+            for having, allowed in self._checks
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self._checks)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate the blocked positions (O(products having the attributes))."""
+        blocked: Set[int] = set()
+        for having, allowed in self._checks:
+            blocked |= having - allowed
+        return iter(sorted(blocked))
+
+
+class AttributeBlocker:
+    """Positions of catalog products by blocking attribute value.
+
+    Products are registered in catalog order; blocked() returns the
+    positions of products that conflict with an item's attributes.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self.keys = tuple(keys)
+        self._attributes: List[Attributes] = []
+        self._having: Dict[str, Set[int]] = {key: set() for key in self.keys}
+        self._by_value: Dict[str, Dict[Any, Set[int]]] = {key: {} for key in self.keys}
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def add(self, name: Optional[str], product_id: Optional[UUID] = None) -> Attributes:
+        """Register the next product by name; returns its attributes.
+
+        With a product_id, the attributes come from product_attributes()
+        (extracted once per process).
+        """
+        position = len(self._attributes)
+        if product_id is not None:
+            attributes = product_attributes(product_id, name, self.keys)
+        else:
+            attributes = name_attributes(name, self.keys)
+        self._attributes.append(attributes)
+        for key, value in attributes.items():
+            self._having[key].add(position)
+            self._by_value[key].setdefault(value, set()).add(position)
+        return attributes
+
+    def attributes(self, position: int) -> Attributes:
+        """Get the attributes of the product at a position."""
+        return self._attributes[position]
+
+    def blocked(self, attributes: Mapping[str, Any]) -> BlockedPositions:
+        """Get positions of products with a different value for an attribute.
+
+        Args:
+            attributes: The item's blocking attributes
+
+        Returns:
+            Positions to leave out of the item's candidates (empty if none)
+        """
+        checks: List[Tuple[Set[int], Set[int]]] = []
+        for key, value in attributes.items():
+            having = self._having.get(key)
+            if not having:
+                continue
+            allowed = self._by_value[key].get(value, _NO_POSITIONS)
+            if len(allowed) < len(having):
+                checks.append((having, allowed))
+        return BlockedPositions(checks)
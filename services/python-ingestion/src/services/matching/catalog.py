@@ -0,0 +1,218 @@
+"""In-memory product catalog and near-duplicate clustering for matching batches.
+
+match_items_task matches a batch of items against the catalog and adds the
+draft products it creates along the way, so later items of the same batch
+can match them. ProductIndex keeps each product's scored name next to it:
+adding a product is O(1) and matchers read the cached names instead of
+rebuilding the list of names on every find_matches() call.
+
+With blocking attributes (see attributes.py), ProductIndex.blocked()
+narrows the catalog for one item to the products whose attributes do not
+conflict with the item's, as a BlockedProducts sequence. Matchers reuse
+the index's cached names for it (select_names) and the embedding matcher
+searches the index built for the full catalog (source and excluded).
+
+cluster_names() groups the batch's near-duplicate names before matching,
+so a group of near-duplicates that creates a draft product creates only
+one (the rest are linked to it).
+
+Key Components:
+    - ProductIndex: Product sequence with cached scored names and id lookup
+    - BlockedProducts: Sequence of the products of a ProductIndex that are not blocked
+    - cluster_names: Greedy leader clustering of names by WRatio similarity
+"""
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from rapidfuzz import fuzz, process
+
+from src.services.matching.attributes import AttributeBlocker, BlockedPositions
+from src.services.matching.normalization import normalize_name
+
+if TYPE_CHECKING:
+    from src.services.matching.matcher import ProductData
+
+
+def scored_name(product: "ProductData", use_preprocessing: bool = True) -> str:
+    """Get the form of a product's name that matchers score.
+
+    Uses the stored `normalized_name` when the product has one and falls
+    back to normalizing (LRU cached) otherwise.
+    """
+    if not use_preprocessing:
+        return product.name
+    return getattr(product, "normalized_name", None) or normalize_name(product.name)
+
+
+class ProductIndex(Sequence):
+    """Products to match against, with their scored names cached.
+
+    Behaves as a read-only sequence of products (so it can be passed to any
+    MatcherStrategy.find_matches) and supports O(1) insertion of products
+    created during a batch.
+
+    Attributes:
+        use_preprocessing: Whether cached names are normalized (must match
+            the matcher's use_preprocessing for the cache to be used)
+        blocking_attributes: Attributes used by blocked()
+    """
+
+    def __init__(
+        self,
+        products: Iterable["ProductData"] = (),
+        use_preprocessing: bool = True,
+        blocking_attributes: Sequence[str] = (),
+    ):
+        """Initialize the index.
+
+        Args:
+            products: Initial products (objects with id, name, category_id)
+            use_preprocessing: Cache normalized names instead of raw names
+            blocking_attributes: Attributes used by blocked() (empty disables it)
+        """
+        self.use_preprocessing = use_preprocessing
+        self.blocking_attributes = tuple(blocking_attributes)
+        self._products: List["ProductData"] = []
+        self._names: List[str] = []
+        self._by_id: Dict[UUID, "ProductData"] = {}
+        # Built on the first blocked() call: most batches never need it
+        self._blocker: Optional[AttributeBlocker] = None
+        for product in products:
+            self.add(product)
+
+    def add(self, product: "ProductData") -> None:
+        """Add a product, computing its scored name once."""
+        self._products.append(product)
+        self._names.append(scored_name(product, self.use_preprocessing))
+        self._by_id[product.id] = product
+        if self._blocker is not None:
+            self._blocker.add(product.name, product.id)
+
+    def blocked(self, attributes: Mapping[str, Any]) -> Sequence["ProductData"]:
+        """Get the products an item with these attributes may match.
+
+        Args:
+            attributes: The item's blocking attributes (see name_attributes)
+
+        Returns:
+            This index if no product is blocked, otherwise a BlockedProducts
+        """
+        if not attributes or not self.blocking_attributes:
+            return self
+        if self._blocker is None:
+            self._blocker = AttributeBlocker(self.blocking_attributes)
+            for product in self._products:
+                self._blocker.add(product.name, product.id)
+        excluded = self._blocker.blocked(attributes)
+        if not excluded:
+            return self
+        return BlockedProducts(self, excluded)
+
+    def get(self, product_id: Optional[UUID]) -> Optional["ProductData"]:
+        """Get a product by id (None if not in the index)."""
+        if product_id is None:
+            return None
+        return self._by_id.get(product_id)
+
+    @property
+    def names(self) -> List[str]:
+        """Scored names, aligned with the product positions."""
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __getitem__(self, index):
+        return self._products[index]
+
+    def __iter__(self) -> Iterator["ProductData"]:
+        return iter(self._products)
+
+
+class BlockedProducts(Sequence):
+    """Read-only sequence of the products of a ProductIndex that are not blocked.
+
+    Position i of the sequence is the i-th product of the source that is
+    not excluded; len(), indexing and iteration all use these positions.
+    The sequence is a snapshot: products added to the source later are not
+    part of it. Its positions are listed on first use (O(catalog)), so a
+    matcher that only checks `excluded` membership (EmbeddingMatcher)
+    never pays for them.
+
+    Attributes:
+        source: The full index
+        excluded: Source positions of blocked products (membership checks)
+    """
+
+    def __init__(self, source: ProductIndex, excluded: BlockedPositions):
+        self.source = source
+        self.excluded = excluded
+        self._size = len(source)
+        self._positions: Optional[List[int]] = None
+
+    @property
+    def positions(self) -> List[int]:
+        """Source positions of the products, in order."""
+        if self._positions is None:
+            blocked = set(self.excluded)
+            self._positions = [p for p in range(self._size) if p not in blocked]
+        return self._positions
+
+    def select_names(self, names: Sequence[str]) -> List[str]:
+        """Pick the names of this sequence's products from names aligned with the source."""
+        return [names[position] for position in self.positions]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.source[position] for position in self.positions[index]]
+        return self.source[self.positions[index]]
+
+    def __iter__(self) -> Iterator["ProductData"]:
+        return (self.source[position] for position in self.positions)
+
+
+def cluster_names(
+    names: Sequence[Optional[str]],
+    threshold: float,
+) -> List[Tuple[int, float]]:
+    """Greedily cluster near-duplicate names.
+
+    Names are visited in order; a name joins the most similar existing
+    leader if it scores at least `threshold` against it (WRatio) and
+    otherwise becomes a new leader. Empty names are always their own leader.
+
+    Args:
+        names: Names to cluster (normalized forms)
+        threshold: Minimum WRatio score (0-100) to join a cluster
+
+    Returns:
+        For each name, (index of its leader, similarity to the leader);
+        leaders point to themselves with similarity 100
+    """
+    leader_names: List[str] = []
+    leader_positions: List[int] = []
+    clusters: List[Tuple[int, float]] = []
+
+    for position, name in enumerate(names):
+        match = None
+        if name and leader_names:
+            match = process.extractOne(
+                name,
+                leader_names,
+                scorer=fuzz.WRatio,
+                processor=None,
+                score_cutoff=threshold,
+            )
+        if match:
+            _, score, leader = match
+            clusters.append((leader_positions[leader], float(score)))
+        else:
+            if name:
+                leader_names.append(name)
+                leader_positions.append(position)
+            clusters.append((position, 100.0))
+
+    return clusters
@@ -0,0 +1,478 @@
+"""Embedding-based product matching with a local ANN index.
+
+This module implements the "embedding" matching strategy. Product names
+are turned into dense vectors with a CPU-only hashed character n-gram
+TF-IDF model, stored in a float32 matrix (optionally memory-mapped to disk)
+and searched through an in-process IVF (inverted file) index. WRatio then
+re-ranks only the shortlist returned by the index, so the expensive fuzzy
+scoring no longer grows linearly with the catalog.
+
+Key Components:
+    - HashedNgramVectorizer: Character n-gram TF-IDF vectors via the hashing trick
+    - IVFIndex: Inverted-file approximate nearest neighbour index (inner product)
+    - EmbeddingMatcher: MatcherStrategy that shortlists with the index, then WRatio
+"""
+import math
+import zlib
+from typing import Container, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+import structlog
+from rapidfuzz import utils
+
+from src.services.matching.catalog import BlockedProducts
+from src.services.matching.matcher import (
+    MatchCandidate,
+    ProductData,
+    RapidFuzzMatcher,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class HashedNgramVectorizer:
+    """Character n-gram TF-IDF vectorizer using the hashing trick.
+
+    Names are preprocessed with rapidfuzz's default_process, padded with
+    spaces and split into character n-grams. Each n-gram is hashed into one
+    of `dimensions` signed buckets, so no vocabulary has to be stored and
+    vectors for new products can be computed independently of the catalog.
+
+    Attributes:
+        dimensions: Vector dimensionality (number of hash buckets)
+        ngram_range: Inclusive (min, max) n-gram lengths
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 256,
+        ngram_range: Tuple[int, int] = (2, 4),
+    ):
+        """Initialize the vectorizer.
+
+        Args:
+            dimensions: Number of hash buckets (vector size)
+            ngram_range: Inclusive (min, max) character n-gram lengths
+        """
+        self.dimensions = dimensions
+        self.ngram_range = ngram_range
+        self._idf: Optional[np.ndarray] = None
+        # n-gram -> (bucket, sign); n-grams repeat heavily across a catalog
+        self._bucket_cache: Dict[str, Tuple[int, float]] = {}
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether IDF weights have been learned."""
+        return self._idf is not None
+
+    def _bucket(self, gram: str) -> Tuple[int, float]:
+        """Hash an n-gram to a (bucket, sign) pair."""
+        cached = self._bucket_cache.get(gram)
+        if cached is None:
+            h = zlib.crc32(gram.encode("utf-8"))
+            cached = (h % self.dimensions, -1.0 if h & 0x80000000 else 1.0)
+            self._bucket_cache[gram] = cached
+        return cached
+
+    def _term_frequencies(self, names: Sequence[str]) -> np.ndarray:
+        """Build the signed, sublinear term-frequency matrix for names."""
+        matrix = np.zeros((len(names), self.dimensions), dtype=np.float32)
+        min_n, max_n = self.ngram_range
+
+        for row, name in enumerate(names):
+            text = f" {utils.default_process(name or '')} "
+            vector = matrix[row]
+            for n in range(min_n, max_n + 1):
+                for start in range(len(text) - n + 1):
+                    bucket, sign = self._bucket(text[start:start + n])
+                    vector[bucket] += sign
+
+        # Sublinear TF keeps long names from dominating
+        return np.sign(matrix) * np.log1p(np.abs(matrix))
+
+    def fit(self, names: Sequence[str]) -> "HashedNgramVectorizer":
+        """Learn IDF weights from a corpus of names.
+
+        Args:
+            names: Product names to learn document frequencies from
+
+        Returns:
+            self (for chaining)
+        """
+        tf = self._term_frequencies(names)
+        doc_freq = np.count_nonzero(tf, axis=0).astype(np.float32)
+        n_docs = float(len(names))
+        self._idf = (np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+        return self
+
+    def transform(self, names: Sequence[str]) -> np.ndarray:
+        """Vectorize names into L2-normalized float32 rows.
+
+        Args:
+            names: Names to vectorize
+
+        Returns:
+            Array of shape (len(names), dimensions)
+        """
+        matrix = self._term_frequencies(names)
+        if self._idf is not None:
+            matrix *= self._idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def fit_transform(self, names: Sequence[str]) -> np.ndarray:
+        """Learn IDF weights and vectorize names in one call."""
+        return self.fit(names).transform(names)
+
+
+class IVFIndex:
+    """Inverted-file ANN index over L2-normalized float32 vectors.
+
+    Vectors are partitioned into `n_lists` clusters with spherical k-means.
+    A query only scores the vectors of its `n_probe` nearest clusters, which
+    keeps search cost roughly O(sqrt(n)) instead of O(n). Small collections
+    (below `brute_force_below`) are searched exhaustively.
+
+    Vectors added after build() are kept in an in-memory overflow buffer
+    that is always searched exhaustively, so incremental inserts are O(1).
+
+    Attributes:
+        n_probe: Number of clusters scored per query
+        storage_path: Optional file backing the base matrix (numpy memmap)
+    """
+
+    KMEANS_ITERATIONS = 8
+    KMEANS_SAMPLE_PER_LIST = 64
+
+    def __init__(
+        self,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        brute_force_below: int = 2048,
+        storage_path: Optional[str] = None,
+        seed: int = 0,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            n_lists: Number of clusters (default: sqrt(n) at build time)
+            n_probe: Number of clusters scored per query
+            brute_force_below: Collections smaller than this are not clustered
+            storage_path: Memory-map the base matrix to this file if given
+            seed: Random seed for k-means initialization
+        """
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.brute_force_below = brute_force_below
+        self.storage_path = storage_path
+        self._rng = np.random.default_rng(seed)
+
+        self._base: Optional[np.ndarray] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._list_offsets: Optional[np.ndarray] = None
+        self._list_rows: Optional[np.ndarray] = None
+        self._overflow: List[np.ndarray] = []
+        self._overflow_matrix: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        base = 0 if self._base is None else len(self._base)
+        return base + len(self._overflow)
+
+    @property
+    def centroids(self) -> Optional[np.ndarray]:
+        """Trained cluster centroids (None for brute-force indexes)."""
+        return self._centroids
+
+    def _store(self, vectors: np.ndarray) -> np.ndarray:
+        """Place the base matrix in memory or in a memory-mapped file."""
+        if not self.storage_path or len(vectors) == 0:
+            return np.ascontiguousarray(vectors, dtype=np.float32)
+        stored = np.memmap(
+            self.storage_path,
+            dtype=np.float32,
+            mode="w+",
+            shape=vectors.shape,
+        )
+        stored[:] = vectors
+        stored.flush()
+        return stored
+
+    def _train_centroids(self, vectors: np.ndarray, n_lists: int) -> np.ndarray:
+        """Spherical k-means on a sample of the vectors."""
+        sample_size = min(len(vectors), n_lists * self.KMEANS_SAMPLE_PER_LIST)
+        sample = vectors[self._rng.choice(len(vectors), sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, n_lists, replace=False)].copy()
+
+        for _ in range(self.KMEANS_ITERATIONS):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(n_lists):
+                members = sample[assignments == list_id]
+                if len(members):
+                    centroids[list_id] = members.sum(axis=0)
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids /= norms
+
+        return centroids.astype(np.float32)
+
+    def _assign(
+        self,
+        vectors: np.ndarray,
+        centroids: np.ndarray,
+        chunk_size: int = 65536,
+    ) -> np.ndarray:
+        """Assign each vector to its nearest centroid (chunked to bound memory)."""
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk_size):
+            chunk = np.asarray(vectors[start:start + chunk_size])
+            assignments[start:start + chunk_size] = np.argmax(chunk @ centroids.T, axis=1)
+        return assignments
+
+    def build(
+        self,
+        vectors: np.ndarray,
+        centroids: Optional[np.ndarray] = None,
+    ) -> None:
+        """(Re)build the index from a matrix of vectors.
+
+        Args:
+            vectors: Array of shape (n, dimensions), rows L2-normalized
+            centroids: Reuse previously trained centroids instead of k-means
+        """
+        self._base = self._store(vectors)
+        self._overflow = []
+        self._overflow_matrix = None
+
+        n = len(vectors)
+        if n < self.brute_force_below:
+            self._centroids = None
+            self._list_offsets = None
+            self._list_rows = None
+            return
+
+        if centroids is None:
+            n_lists = self.n_lists or max(1, int(math.sqrt(n)))
+            centroids = self._train_centroids(self._base, min(n_lists, n))
+        self._centroids = centroids
+
+        assignments = self._assign(self._base, centroids)
+        self._list_rows = np.argsort(assignments, kind="stable").astype(np.int64)
+        counts = np.bincount(assignments, minlength=len(centroids))
+        self._list_offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def add(self, vectors: np.ndarray) -> None:
+        """Append vectors without rebuilding (searched exhaustively)."""
+        self._overflow.extend(np.asarray(vectors, dtype=np.float32))
+        self._overflow_matrix = None
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        excluded: Optional[Container[int]] = None,
+    ) -> np.ndarray:
+        """Return row numbers of the (approximate) top-k vectors by inner product.
+
+        Row numbers cover the base matrix first, then overflow rows in
+        insertion order.
+
+        Args:
+            query: L2-normalized query vector
+            k: Number of neighbours to return
+            excluded: Row numbers to leave out; dropped before ranking so
+                they never take a top-k slot
+
+        Returns:
+            Array of row numbers, best first
+        """
+        row_ids: List[np.ndarray] = []
+        scores: List[np.ndarray] = []
+
+        centroids, list_rows, list_offsets = self._centroids, self._list_rows, self._list_offsets
+        if self._base is not None and len(self._base):
+            if centroids is None or list_rows is None or list_offsets is None:
+                row_ids.append(np.arange(len(self._base)))
+                scores.append(np.asarray(self._base @ query))
+            else:
+                n_probe = min(self.n_probe, len(centroids))
+                probe = np.argpartition(-(centroids @ query), n_probe - 1)[:n_probe]
+                probed = np.concatenate([
+                    list_rows[list_offsets[c]:list_offsets[c + 1]]
+                    for c in probe
+                ])
+                probed.sort()  # sequential access pattern for memmap reads
+                row_ids.append(probed)
+                scores.append(np.asarray(self._base[probed] @ query))
+
+        if self._overflow:
+            if self._overflow_matrix is None:
+                self._overflow_matrix = np.vstack(self._overflow)
+            base_len = 0 if self._base is None else len(self._base)
+            row_ids.append(np.arange(base_len, base_len + len(self._overflow)))
+            scores.append(self._overflow_matrix @ query)
+
+        if not row_ids:
+            return np.empty(0, dtype=np.int64)
+
+        all_rows = np.concatenate(row_ids)
+        all_scores = np.concatenate(scores)
+        if excluded is not None:
+            keep = np.fromiter(
+                (row not in excluded for row in all_rows.tolist()),
+                dtype=bool,
+                count=len(all_rows),
+            )
+            all_rows, all_scores = all_rows[keep], all_scores[keep]
+        if len(all_rows) > k:
+            top = np.argpartition(-all_scores, k - 1)[:k]
+        else:
+            top = np.arange(len(all_rows))
+        return all_rows[top[np.argsort(-all_scores[top])]]
+
+
+class EmbeddingMatcher(RapidFuzzMatcher):
+    """Product matcher that shortlists with an ANN index, then re-ranks with WRatio.
+
+    The index is built lazily from the products passed to find_matches()
+    and kept on the instance, so a long-lived matcher only vectorizes
+    products it has not seen before. Products appended to the same list
+    between calls (e.g. drafts created during a batch) are inserted
+    incrementally instead of triggering a rebuild.
+
+    Attributes:
+        shortlist_size: Number of nearest neighbours re-ranked with WRatio
+    """
+
+    def __init__(
+        self,
+        use_preprocessing: bool = True,
+        score_cutoff: Optional[float] = None,
+        dimensions: int = 256,
+        shortlist_size: int = 50,
+        n_probe: int = 8,
+        index_path: Optional[str] = None,
+    ):
+        """Initialize the embedding matcher.
+
+        Args:
+            use_preprocessing: Index and score canonical normalized names
+            score_cutoff: Minimum score cutoff (uses potential_threshold if None)
+            dimensions: Embedding dimensionality (hash buckets)
+            shortlist_size: Nearest neighbours re-ranked with WRatio
+            n_probe: IVF clusters scored per query
+            index_path: Memory-map the embedding matrix to this file if given
+        """
+        super().__init__(use_preprocessing=use_preprocessing, score_cutoff=score_cutoff)
+        self.shortlist_size = shortlist_size
+        self._vectorizer = HashedNgramVectorizer(dimensions=dimensions)
+        self._index = IVFIndex(n_probe=n_probe, storage_path=index_path)
+        self._products: List[ProductData] = []
+        self._vector_rows: Dict[Tuple[UUID, str], int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._source_id: Optional[int] = None
+        self._log = logger.bind(matcher="EmbeddingMatcher")
+
+    def get_strategy_name(self) -> str:
+        """Get the name of this matching strategy."""
+        return "embedding_ivf_wratio"
+
+    def build_index(self, products: Sequence[ProductData]) -> None:
+        """Build (or rebuild) the ANN index for a product catalog.
+
+        Vectors of products already indexed under the same name are reused,
+        and trained centroids are kept unless the catalog size changed by
+        more than 2x, so rebuilding for a slightly different catalog is cheap.
+
+        Args:
+            products: Products to index
+        """
+        products = list(products)
+        names = self._choice_names(products)
+
+        if not self._vectorizer.is_fitted:
+            self._vectorizer.fit(names)
+
+        vectors = np.empty((len(products), self._vectorizer.dimensions), dtype=np.float32)
+        missing: List[int] = []
+        for row, product in enumerate(products):
+            previous = self._vector_rows.get((product.id, product.name))
+            if previous is not None and self._vectors is not None:
+                vectors[row] = self._vectors[previous]
+            else:
+                missing.append(row)
+        if missing:
+            vectors[missing] = self._vectorizer.transform([names[i] for i in missing])
+
+        centroids = self._index.centroids
+        previous_size = len(self._products)
+        if centroids is not None and not (previous_size / 2 <= len(products) <= previous_size * 2):
+            centroids = None
+
+        self._index.build(vectors, centroids=centroids)
+        self._vectors = vectors
+        self._products = products
+        self._vector_rows = {(p.id, p.name): row for row, p in enumerate(products)}
+
+        self._log.info(
+            "embedding_index_built",
+            products=len(products),
+            vectorized=len(missing),
+            clustered=self._index.centroids is not None,
+        )
+
+    def add_products(self, products: Sequence[ProductData]) -> None:
+        """Insert products into the existing index without rebuilding.
+
+        Args:
+            products: Newly created products to make searchable
+        """
+        if not products:
+            return
+        vectors = self._vectorizer.transform(self._choice_names(products))
+        self._index.add(vectors)
+        self._products.extend(products)
+
+    def _sync_index(self, products: Sequence[ProductData]) -> None:
+        """Make sure the index reflects the given product sequence."""
+        indexed = len(self._products)
+        same_source = (
+            self._source_id == id(products)
+            and indexed > 0
+            and len(products) >= indexed
+            and products[0] is self._products[0]
+            and products[indexed - 1] is self._products[indexed - 1]
+        )
+        if same_source:
+            self.add_products(products[indexed:])
+        else:
+            self.build_index(products)
+            self._source_id = id(products)
+
+    def _extract_candidates(
+        self,
+        query: str,
+        products: Sequence[ProductData],
+        score_cutoff: float,
+        limit: int,
+    ) -> List[MatchCandidate]:
+        """Shortlist products through the ANN index, then score with WRatio."""
+        # Blocked products share the full catalog's index; blocked rows are
+        # dropped inside the search (rows are the catalog positions)
+        catalog: Sequence[ProductData] = products
+        excluded: Optional[Container[int]] = None
+        if isinstance(products, BlockedProducts):
+            catalog, excluded = products.source, products.excluded
+        self._sync_index(catalog)
+
+        vector = self._vectorizer.transform([query])[0]
+        rows = self._index.search(vector, max(self.shortlist_size, limit), excluded)
+        shortlist = [self._products[row] for row in rows]
+
+        return super()._extract_candidates(
+            query=query,
+            products=shortlist,
+            score_cutoff=score_cutoff,
+            limit=limit,
+        )
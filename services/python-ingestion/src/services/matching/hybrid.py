@@ -0,0 +1,111 @@
+"""Two-stage (prefilter + re-rank) product matching.
+
+fuzz.WRatio is one of the most expensive rapidfuzz scorers because it runs
+several sub-algorithms per comparison. This strategy scores the whole
+catalog with a cheap scorer first, keeps the top-N, and only re-scores that
+shortlist with WRatio. Auto/potential decisions are taken from the WRatio
+(stage two) scores only, so thresholds keep their meaning.
+
+Key Components:
+    - PREFILTER_SCORERS: Cheap stage-one scorers by name
+    - TwoStageMatcher: MatcherStrategy with a configurable prefilter stage
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import JaroWinkler
+
+from src.services.matching.matcher import (
+    MatchCandidate,
+    ProductData,
+    RapidFuzzMatcher,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+# Cheap scorers usable for stage one: name -> (scorer, scale of a 0-100 cutoff).
+# Scorers are passed to rapidfuzz natively so its C fast path is kept;
+# JaroWinkler reports 0-1 similarities, so the cutoff is scaled instead.
+PREFILTER_SCORERS: Dict[str, Tuple[Callable[..., float], float]] = {
+    "ratio": (fuzz.ratio, 1.0),
+    "token_sort_ratio": (fuzz.token_sort_ratio, 1.0),
+    "jaro_winkler": (JaroWinkler.normalized_similarity, 0.01),
+}
+
+
+class TwoStageMatcher(RapidFuzzMatcher):
+    """Product matcher with a cheap prefilter stage and a WRatio re-rank stage.
+
+    Stage one scores every product with `prefilter_scorer` (using
+    `prefilter_cutoff` as score_cutoff for early termination) and keeps the
+    best `prefilter_top_n`. Stage two re-scores only those with WRatio.
+
+    Attributes:
+        prefilter_scorer: Name of the stage-one scorer (see PREFILTER_SCORERS)
+        prefilter_top_n: Number of stage-one candidates re-scored with WRatio
+        prefilter_cutoff: Minimum stage-one score to survive the prefilter
+    """
+
+    def __init__(
+        self,
+        use_preprocessing: bool = True,
+        score_cutoff: Optional[float] = None,
+        prefilter_scorer: str = "ratio",
+        prefilter_top_n: int = 25,
+        prefilter_cutoff: float = 40.0,
+    ):
+        """Initialize the two-stage matcher.
+
+        Args:
+            use_preprocessing: Score canonical normalized names in both stages
+            score_cutoff: Minimum WRatio score (uses potential_threshold if None)
+            prefilter_scorer: Stage-one scorer name (ratio, token_sort_ratio, jaro_winkler)
+            prefilter_top_n: Candidates kept after stage one
+            prefilter_cutoff: Minimum stage-one score (0-100)
+
+        Raises:
+            ValueError: If unknown prefilter scorer name
+        """
+        if prefilter_scorer not in PREFILTER_SCORERS:
+            raise ValueError(
+                f"Unknown prefilter scorer: {prefilter_scorer}. "
+                f"Available: {list(PREFILTER_SCORERS.keys())}"
+            )
+        super().__init__(use_preprocessing=use_preprocessing, score_cutoff=score_cutoff)
+        self.prefilter_scorer = prefilter_scorer
+        self.prefilter_top_n = prefilter_top_n
+        self.prefilter_cutoff = prefilter_cutoff
+        self._log = logger.bind(matcher="TwoStageMatcher")
+
+    def get_strategy_name(self) -> str:
+        """Get the name of this matching strategy."""
+        return f"two_stage_{self.prefilter_scorer}_wratio"
+
+    def _extract_candidates(
+        self,
+        query: str,
+        products: Sequence[ProductData],
+        score_cutoff: float,
+        limit: int,
+    ) -> List[MatchCandidate]:
+        """Prefilter products with the cheap scorer, then score with WRatio."""
+        scorer, cutoff_scale = PREFILTER_SCORERS[self.prefilter_scorer]
+
+        prefiltered = process.extract(
+            query=query,
+            choices=self._choice_names(products),
+            scorer=scorer,
+            processor=None,
+            score_cutoff=self.prefilter_cutoff * cutoff_scale,
+            limit=max(self.prefilter_top_n, limit),
+        )
+        shortlist = [products[index] for _, _, index in prefiltered]
+
+        return super()._extract_candidates(
+            query=query,
+            products=shortlist,
+            score_cutoff=score_cutoff,
+            limit=limit,
+        )
@@ -0,0 +1,171 @@
+"""Exact product identifiers (GTIN/EAN, MPN) for the matching fast path.
+
+A supplier item that carries a barcode or manufacturer part number that is
+already known for a linked item identifies its product outright, so
+match_items_task links it with an O(1) lookup and skips fuzzy scoring.
+
+Identifiers are stored as prefixed keys in supplier_items.identifiers:
+    - "gtin:<14 digits>": EAN-8/UPC-A/EAN-13/GTIN-14, zero-padded to 14
+      digits, only if the check digit is valid
+    - "mpn:<UPPERCASE ALNUM>": manufacturer part number with separators removed
+
+Key Components:
+    - extract_identifiers: Identifier keys from characteristics and name
+    - is_valid_gtin: GTIN check-digit validation
+    - IdentifierIndex: identifier -> product_id map that drops ambiguous keys
+"""
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+from uuid import UUID
+
+GTIN_LENGTHS = (8, 12, 13, 14)
+
+# Characteristics keys (lowercased, spaces/hyphens -> "_", as parsers store them)
+GTIN_KEYS = frozenset({
+    "ean", "ean13", "ean_13", "ean8", "gtin", "upc", "barcode", "bar_code",
+    "штрихкод", "штрих_код", "шк",
+})
+MPN_KEYS = frozenset({
+    "mpn", "part_number", "part_no", "pn", "p/n", "manufacturer_part_number",
+    "model_number", "артикул_производителя", "парт_номер", "партномер",
+})
+
+# Barcodes inside names: only 12-14 digits, shorter numbers are too ambiguous
+_NAME_GTIN_RE = re.compile(r"(?<!\d)(\d{12,14})(?!\d)")
+
+# Part numbers inside names only after an explicit marker ("P/N: SM-A546E").
+# Supplier article markers ("арт.") are not used: those codes are per-supplier.
+_NAME_MPN_RE = re.compile(
+    r"(?:\bp/n|\bpn|\bmpn)\s*[:#№]?\s*([A-Za-z0-9][A-Za-z0-9\-/.]{3,39})",
+    re.IGNORECASE,
+)
+_MPN_STRIP_RE = re.compile(r"[^A-Z0-9]")
+
+
+def is_valid_gtin(code: str) -> bool:
+    """Check a GTIN-8/12/13/14 code including its mod-10 check digit.
+
+    Args:
+        code: Digit string
+
+    Returns:
+        True if code has a GTIN length and a valid check digit
+    """
+    if not code.isdigit() or len(code) not in GTIN_LENGTHS or not code.strip("0"):
+        return False
+    digits = [int(d) for d in code]
+    body, check = digits[:-1], digits[-1]
+    # Weights alternate 3,1,... starting from the digit next to the check digit
+    total = sum(d * (3 if i % 2 == 0 else 1) for i, d in enumerate(reversed(body)))
+    return (10 - total % 10) % 10 == check
+
+
+def normalize_gtin(value: Any) -> Optional[str]:
+    """Get the "gtin:" key for a raw barcode value, or None if invalid."""
+    if isinstance(value, float):
+        if not value.is_integer():
+            return None
+        value = int(value)
+    code = re.sub(r"[\s\-]", "", str(value))
+    # Spreadsheets drop leading zeros of UPC/EAN codes stored as numbers
+    for candidate in (code, code.zfill(12), code.zfill(13)):
+        if is_valid_gtin(candidate):
+            return f"gtin:{candidate.zfill(14)}"
+    return None
+
+
+def normalize_mpn(value: Any) -> Optional[str]:
+    """Get the "mpn:" key for a raw part number, or None if too short."""
+    code = _MPN_STRIP_RE.sub("", str(value).upper())
+    if len(code) < 5 or code.isalpha():
+        return None
+    return f"mpn:{code}"
+
+
+def _normalize_key(key: str) -> str:
+    return key.lower().strip().replace(" ", "_").replace("-", "_")
+
+
+def extract_identifiers(
+    name: Optional[str],
+    characteristics: Optional[Mapping[str, Any]] = None,
+) -> List[str]:
+    """Extract identifier keys for a supplier item.
+
+    Args:
+        name: Supplier item name
+        characteristics: Supplier item characteristics (JSONB)
+
+    Returns:
+        Sorted, de-duplicated identifier keys (empty if none found)
+
+    Example:
+        >>> extract_identifiers("Drill P/N: GSB-13RE", {"ean": "4006381333931"})
+        ['gtin:04006381333931', 'mpn:GSB13RE']
+    """
+    keys = set()
+
+    for raw_key, value in (characteristics or {}).items():
+        if value is None or value == "":
+            continue
+        key = _normalize_key(str(raw_key))
+        if key in GTIN_KEYS:
+            normalized = normalize_gtin(value)
+        elif key in MPN_KEYS:
+            normalized = normalize_mpn(value)
+        else:
+            continue
+        if normalized:
+            keys.add(normalized)
+
+    if name:
+        for code in _NAME_GTIN_RE.findall(name):
+            normalized = normalize_gtin(code)
+            if normalized:
+                keys.add(normalized)
+        for code in _NAME_MPN_RE.findall(name):
+            normalized = normalize_mpn(code)
+            if normalized:
+                keys.add(normalized)
+
+    return sorted(keys)
+
+
+class IdentifierIndex:
+    """In-memory identifier -> product_id map for exact-key matching.
+
+    An identifier seen on items linked to different products is ambiguous
+    (e.g. a supplier reusing a barcode) and never produces a match.
+    """
+
+    def __init__(self) -> None:
+        self._products: Dict[str, Optional[UUID]] = {}
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def add(self, identifiers: Optional[Iterable[str]], product_id: UUID) -> None:
+        """Register identifiers of an item linked to product_id."""
+        for key in identifiers or ():
+            if key not in self._products:
+                self._products[key] = product_id
+            elif self._products[key] != product_id:
+                self._products[key] = None
+
+    def lookup(self, identifiers: Optional[Iterable[str]]) -> Optional[UUID]:
+        """Get the single product the identifiers point to.
+
+        Args:
+            identifiers: Identifier keys of the item being matched
+
+        Returns:
+            Product UUID, or None on a miss or if identifiers disagree
+        """
+        found = {
+            self._products.get(key)
+            for key in identifiers or ()
+            if key in self._products
+        }
+        if len(found) != 1:
+            return None
+        return found.pop()
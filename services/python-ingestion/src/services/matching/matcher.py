@@ -17,9 +17,11 @@ from decimal import Decimal
 from enum import Enum
 import structlog
 
-from rapidfuzz import fuzz, process, utils
+from rapidfuzz import fuzz, process
 
 from src.config import matching_settings
+from src.services.matching.catalog import BlockedProducts, ProductIndex, scored_name
+from src.services.matching.normalization import normalize_name
 
 logger = structlog.get_logger(__name__)
 
@@ -83,7 +85,9 @@ class ProductData(Protocol):
     """Protocol for product data used in matching.
     
     This allows passing any object with these attributes,
-    supporting both ORM models and plain data classes.
+    supporting both ORM models and plain data classes. Objects may also
+    carry a `normalized_name` attribute (as ORM models do); matchers use
+    it instead of normalizing the name themselves.
     """
     id: UUID
     name: str
@@ -113,6 +117,7 @@ class MatcherStrategy(ABC):
         auto_threshold: float = 95.0,
         potential_threshold: float = 70.0,
         max_candidates: int = 5,
+        normalized_name: Optional[str] = None,
     ) -> MatchResult:
         """Find matching products for a supplier item.
         
@@ -123,6 +128,7 @@ class MatcherStrategy(ABC):
             auto_threshold: Score threshold for auto-match (default: 95%)
             potential_threshold: Score threshold for potential match (default: 70%)
             max_candidates: Maximum number of candidates to return
+            normalized_name: Stored canonical form of item_name, if available
             
         Returns:
             MatchResult with status and candidates
@@ -144,7 +150,9 @@ class RapidFuzzMatcher(MatcherStrategy):
     
     Performance optimizations:
         - score_cutoff: Early termination for low-scoring matches
-        - processor: Default preprocessing (lowercase, remove non-alphanumeric)
+        - Names are scored in their canonical normalized form (see
+          normalization.normalize_name), read from products' stored
+          normalized_name instead of being re-processed per comparison
         - Batch extraction using process.extract()
     
     Attributes:
@@ -160,7 +168,7 @@ class RapidFuzzMatcher(MatcherStrategy):
         """Initialize the RapidFuzz matcher.
         
         Args:
-            use_preprocessing: Apply default preprocessing (lowercase, remove special chars)
+            use_preprocessing: Score canonical normalized names instead of raw names
             score_cutoff: Minimum score cutoff for performance (uses potential_threshold if None)
         """
         self.use_preprocessing = use_preprocessing
@@ -179,6 +187,7 @@ class RapidFuzzMatcher(MatcherStrategy):
         auto_threshold: float = 95.0,
         potential_threshold: float = 70.0,
         max_candidates: int = 5,
+        normalized_name: Optional[str] = None,
     ) -> MatchResult:
         """Find matching products using RapidFuzz WRatio.
         
@@ -192,6 +201,7 @@ class RapidFuzzMatcher(MatcherStrategy):
             auto_threshold: Score threshold for auto-match (default: 95%)
             potential_threshold: Score threshold for potential match (default: 70%)
             max_candidates: Maximum number of candidates to return
+            normalized_name: Stored canonical form of item_name, if available
             
         Returns:
             MatchResult with status and sorted candidates (by score descending)
@@ -212,36 +222,15 @@ class RapidFuzzMatcher(MatcherStrategy):
         # Use score_cutoff for performance (early termination of low matches)
         score_cutoff = self._score_cutoff or potential_threshold
         
-        # Build choices dict: product_name -> product_data
-        # Using dict preserves product data for lookup after matching
-        choices = {p.name: p for p in products}
+        query = self._query_name(item_name, normalized_name)
         
-        # Configure processor
-        processor = utils.default_process if self.use_preprocessing else None
-        
-        # Extract matches using RapidFuzz process.extract
-        # Returns list of tuples: (choice, score, index)
-        matches = process.extract(
-            query=item_name,
-            choices=list(choices.keys()),
-            scorer=fuzz.WRatio,
-            processor=processor,
+        candidates = self._extract_candidates(
+            query=query,
+            products=products,
             score_cutoff=score_cutoff,
             limit=max_candidates,
         )
         
-        # Convert to MatchCandidate objects
-        candidates: List[MatchCandidate] = []
-        for choice_name, score, _ in matches:
-            product = choices[choice_name]
-            candidate = MatchCandidate(
-                product_id=product.id,
-                product_name=product.name,
-                score=score,
-                category_id=product.category_id,
-            )
-            candidates.append(candidate)
-        
         # Sort by score descending (should already be sorted, but ensure)
         candidates.sort(key=lambda c: c.score, reverse=True)
         
@@ -278,6 +267,72 @@ class RapidFuzzMatcher(MatcherStrategy):
             candidates=candidates,
             match_score=match_score,
         )
+    
+    def _query_name(self, item_name: str, normalized_name: Optional[str] = None) -> str:
+        """Get the form of the item name that is scored."""
+        if not self.use_preprocessing:
+            return item_name
+        return normalized_name or normalize_name(item_name)
+    
+    def _choice_names(self, products: Sequence[ProductData]) -> Sequence[str]:
+        """Get the form of each product name that is scored.
+        
+        Uses the stored `normalized_name` when the product has one and
+        falls back to normalizing (LRU cached) otherwise. A ProductIndex
+        built with the same preprocessing returns its cached names as is.
+        A BlockedProducts sequence picks its names from its source's.
+        """
+        if isinstance(products, BlockedProducts):
+            return products.select_names(self._choice_names(products.source))
+        if isinstance(products, ProductIndex) and products.use_preprocessing == self.use_preprocessing:
+            return products.names
+        return [scored_name(p, self.use_preprocessing) for p in products]
+    
+    def _extract_candidates(
+        self,
+        query: str,
+        products: Sequence[ProductData],
+        score_cutoff: float,
+        limit: int,
+    ) -> List[MatchCandidate]:
+        """Score products against the query with WRatio.
+        
+        Subclasses override this to narrow the product list (shortlisting)
+        before delegating the final WRatio scoring back to this method.
+        
+        Args:
+            query: Item name as returned by _query_name()
+            products: Products to score
+            score_cutoff: Minimum score to include in results
+            limit: Maximum number of candidates to return
+            
+        Returns:
+            List of MatchCandidate objects (best first)
+        """
+        # Match on list positions so products with identical names are kept
+        matches = process.extract(
+            query=query,
+            choices=self._choice_names(products),
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=score_cutoff,
+            limit=limit,
+        )
+        
+        # Convert to MatchCandidate objects
+        candidates: List[MatchCandidate] = []
+        for _, score, index in matches:
+            product = products[index]
+            candidates.append(
+                MatchCandidate(
+                    product_id=product.id,
+                    product_name=product.name,
+                    score=score,
+                    category_id=product.category_id,
+                )
+            )
+        
+        return candidates
 
 
 def create_matcher(
@@ -287,7 +342,7 @@ def create_matcher(
     """Factory function to create a matcher strategy.
     
     Args:
-        strategy: Strategy name ("rapidfuzz" for now)
+        strategy: Strategy name ("rapidfuzz", "hybrid" or "embedding")
         **kwargs: Additional arguments passed to the matcher
         
     Returns:
@@ -296,8 +351,14 @@ def create_matcher(
     Raises:
         ValueError: If unknown strategy name
     """
+    # Import here to avoid circular imports (strategies subclass RapidFuzzMatcher)
+    from src.services.matching.embedding import EmbeddingMatcher
+    from src.services.matching.hybrid import TwoStageMatcher
+    
     strategies = {
         "rapidfuzz": RapidFuzzMatcher,
+        "hybrid": TwoStageMatcher,
+        "embedding": EmbeddingMatcher,
     }
     
     if strategy not in strategies:
@@ -0,0 +1,158 @@
+"""Canonical name normalization for product matching.
+
+Supplier names for the same product differ in ways that are noise for
+fuzzy matching: Cyrillic vs Latin spelling (including Cyrillic letters
+that look like Latin ones), unit spelling ("128 ГБ" vs "128GB"), decimal
+commas and marketing tokens ("new", "акция"). normalize_name() maps all
+of these to one canonical form that is stored in the `normalized_name`
+column of products and supplier items, so it is computed once per row
+instead of once per comparison.
+
+The canonical form is already lowercased, alphanumeric and
+whitespace-collapsed, so matchers score it without a rapidfuzz processor.
+
+Key Components:
+    - normalize_name: Name -> canonical form (LRU cached)
+    - transliterate: Cyrillic -> Latin for a single token
+    - name_hash: Stable key for a normalized name (match_affinity.name_hash)
+    - NORMALIZATION_VERSION: Bump when rules change and re-run the backfill
+"""
+import hashlib
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# Bump when the rules below change so stored normalized_name values can be
+# recomputed (see migrations/versions/003_add_normalized_names.py).
+NORMALIZATION_VERSION = 1
+
+# Phonetic Cyrillic -> Latin transliteration for purely Cyrillic tokens
+_TRANSLIT: Dict[str, str] = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e",
+    "ж": "zh", "з": "z", "и": "i", "й": "i", "к": "k", "л": "l", "м": "m",
+    "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+    "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch",
+    "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
+    "і": "i", "ї": "i", "є": "e", "ґ": "g",
+}
+
+# Cyrillic letters that look like Latin ones. Used for tokens that mix both
+# scripts ("Sаmsung" typed with a Cyrillic "а"), where a phonetic
+# transliteration would turn "с" into "s" instead of the intended "c".
+_HOMOGLYPHS: Dict[str, str] = {
+    "а": "a", "в": "b", "е": "e", "ё": "e", "к": "k", "м": "m", "н": "h",
+    "о": "o", "р": "p", "с": "c", "т": "t", "у": "y", "х": "x", "і": "i",
+}
+
+# Unit spellings (lowercase) -> canonical unit, longest alternatives first
+_UNITS: Dict[str, str] = {
+    "тб": "tb", "tb": "tb",
+    "гб": "gb", "gb": "gb",
+    "мб": "mb", "mb": "mb",
+    "мач": "mah", "mah": "mah",
+    "квт": "kw", "kw": "kw",
+    "вт": "w", "w": "w",
+    "вольт": "v", "volt": "v", "volts": "v", "в": "v", "v": "v",
+    "ггц": "ghz", "ghz": "ghz",
+    "мгц": "mhz", "mhz": "mhz",
+    "гц": "hz", "hz": "hz",
+    "кг": "kg", "kg": "kg",
+    "гр": "g", "г": "g", "g": "g",
+    "мм": "mm", "mm": "mm",
+    "см": "cm", "cm": "cm",
+    "мл": "ml", "ml": "ml",
+    "л": "l", "l": "l",
+    "дюймов": "in", "дюйма": "in", "дюйм": "in", "inch": "in", '"': "in",
+}
+
+_UNIT_RE = re.compile(
+    r"(?<![\w.])(\d+(?:[.,]\d+)?)\s*("
+    + "|".join(re.escape(u) for u in sorted(_UNITS, key=len, reverse=True))
+    + r")(?!\w)"
+)
+
+# Tokens that carry no product identity (checked before transliteration)
+STOP_TOKENS = frozenset({
+    "new", "sale", "hit", "promo", "original", "pcs",
+    "новинка", "новый", "новая", "акция", "скидка", "распродажа", "хит",
+    "оригинал", "оригинальный", "шт",
+})
+
+_TOKEN_RE = re.compile(r"\d+(?:\.\d+)?[^\W_]*|[^\W_]+")
+_CYRILLIC_RE = re.compile(r"[\u0400-\u04ff]")
+_LATIN_RE = re.compile(r"[a-z]")
+
+
+def _canonical_unit(match: "re.Match[str]") -> str:
+    """Join a number to its canonical unit ("1,5 кВт" -> "1.5kw")."""
+    number, unit = match.group(1), match.group(2)
+    # "2 в 1" means "2 in 1", not 2 volts
+    if unit == "в" and re.match(r"\s+\d", match.string[match.end():]):
+        return match.group(0)
+    return f"{number.replace(',', '.')}{_UNITS[unit]} "
+
+
+def transliterate(token: str) -> str:
+    """Transliterate a lowercase token to Latin script.
+
+    Tokens mixing Latin and Cyrillic letters are treated as Latin words
+    with Cyrillic look-alikes; purely Cyrillic tokens are transliterated
+    phonetically.
+
+    Args:
+        token: Lowercase token
+
+    Returns:
+        Token containing no Cyrillic letters
+    """
+    if not _CYRILLIC_RE.search(token):
+        return token
+    table = _HOMOGLYPHS if _LATIN_RE.search(token) else _TRANSLIT
+    return "".join(table.get(ch, _TRANSLIT.get(ch, ch)) for ch in token)
+
+
+@lru_cache(maxsize=65536)
+def normalize_name(name: Optional[str]) -> str:
+    """Normalize a product or supplier item name to its canonical form.
+
+    Steps: Unicode NFKC + lowercase, unit canonicalization, tokenization
+    (punctuation dropped, decimals kept), stop-token removal and
+    transliteration to Latin script.
+
+    Args:
+        name: Raw product or supplier item name
+
+    Returns:
+        Canonical name ("" for empty input)
+
+    Example:
+        >>> normalize_name("Смартфон Samsung Galaxy A54 128 ГБ (новинка!)")
+        'smartfon samsung galaxy a54 128gb'
+    """
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKC", name).lower().replace("ё", "е")
+    text = _UNIT_RE.sub(_canonical_unit, text)
+
+    tokens: List[str] = []
+    for token in _TOKEN_RE.findall(text):
+        if token in STOP_TOKENS:
+            continue
+        tokens.append(transliterate(token))
+    return " ".join(t for t in tokens if t)
+
+
+def name_hash(normalized_name: str) -> str:
+    """Get the stable hash key of a normalized name.
+
+    Matches the SQL expression
+    encode(sha256(convert_to(normalized_name, 'UTF8')), 'hex').
+
+    Args:
+        normalized_name: Output of normalize_name()
+
+    Returns:
+        64-character hex SHA-256 digest
+    """
+    return hashlib.sha256(normalized_name.encode("utf-8")).hexdigest()
@@ -0,0 +1,300 @@
+"""Bulk write-back of match decisions.
+
+match_items_task decides every item of a batch in memory and records the
+decisions here; flush() then persists the whole batch in a fixed number of
+statements instead of mutating and flushing ORM objects one by one:
+
+    1. One multi-row INSERT for new draft products (ids are generated
+       client-side, so items can reference them before the insert; SKUs
+       are allocated for the whole batch at flush, see sku_allocator)
+    2. One UPDATE supplier_items ... FROM (VALUES ...) for all item decisions
+    3. One INSERT ... ON CONFLICT (supplier_item_id) DO UPDATE for review
+       queue entries, with the matching review_queue_stats count changes
+       (see services.review_queue)
+
+Key Components:
+    - ItemDecision: New match state of one supplier item
+    - ReviewDecision: Review queue entry for a potential match
+    - MatchWriteBack: Accumulates a batch's decisions and flushes them
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID, uuid4
+import structlog
+
+from sqlalchemy import cast, column, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    MatchReviewQueue,
+    MatchStatus,
+    Product,
+    ProductStatus,
+    ReviewStatus,
+    SupplierItem,
+)
+from src.services.review_queue import ReviewStatsDelta, apply_review_stats_delta
+from src.services.sku_allocator import allocate_skus
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class ItemDecision:
+    """New match state of one supplier item.
+
+    Attributes:
+        item_id: Supplier item to update
+        match_status: New match status
+        product_id: Linked product (None for potential matches)
+        match_score: Match score (0-100)
+        match_candidates: Candidate dicts stored on the item
+    """
+    item_id: UUID
+    match_status: MatchStatus
+    product_id: Optional[UUID]
+    match_score: Optional[Decimal]
+    match_candidates: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class ReviewDecision:
+    """Review queue entry for a potential match.
+
+    Attributes:
+        supplier_item_id: Item awaiting review
+        candidate_products: Candidate dicts shown to the reviewer
+        expires_at: When the review expires
+        supplier_id: Supplier of the item (review_queue_stats key)
+        match_score: Best candidate score (listing order)
+    """
+    supplier_item_id: UUID
+    candidate_products: List[Dict[str, Any]]
+    expires_at: datetime
+    supplier_id: UUID
+    match_score: Decimal
+
+
+class MatchWriteBack:
+    """Accumulates the decisions of a matching batch and persists them in bulk.
+
+    Products created for a batch are transient Product objects with a
+    client-side id, so they can be matched against (and linked to) by later
+    items of the same batch before they are inserted.
+    """
+
+    def __init__(self) -> None:
+        self.items: Dict[UUID, ItemDecision] = {}
+        self.products: List[Product] = []
+        self.reviews: Dict[UUID, ReviewDecision] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def decide(self, decision: ItemDecision) -> None:
+        """Record the new match state of an item (last decision wins)."""
+        self.items[decision.item_id] = decision
+
+    def add_product(self, product: Product) -> Product:
+        """Record a new draft product, assigning its id if unset."""
+        if product.id is None:
+            product.id = uuid4()
+        self.products.append(product)
+        return product
+
+    def add_review(self, review: ReviewDecision) -> None:
+        """Record a review queue entry (one per item)."""
+        self.reviews[review.supplier_item_id] = review
+
+    def retain(self, item_ids: Set[UUID]) -> Set[UUID]:
+        """Keep only decisions for the given items.
+
+        Used when some claimed items can no longer be written (their lease
+        was lost). New products no kept decision links to are dropped too.
+
+        Args:
+            item_ids: Items whose decisions may be written
+
+        Returns:
+            IDs of the items whose decisions were dropped
+        """
+        dropped = set(self.items) - item_ids
+        for item_id in dropped:
+            del self.items[item_id]
+        for item_id in set(self.reviews) - item_ids:
+            del self.reviews[item_id]
+        linked = {d.product_id for d in self.items.values()}
+        self.products = [p for p in self.products if p.id in linked]
+        return dropped
+
+    async def flush(self, session: AsyncSession) -> Dict[str, int]:
+        """Persist all recorded decisions and reset the accumulator.
+
+        Products are inserted first so item links satisfy the foreign key.
+        Products without an internal_sku get one from the SKU allocator.
+
+        Args:
+            session: Database session (caller owns the transaction)
+
+        Returns:
+            Counts of products inserted, items updated and reviews upserted
+        """
+        unnumbered = [p for p in self.products if not p.internal_sku]
+        if unnumbered:
+            skus = await allocate_skus(session, len(unnumbered))
+            for product, sku in zip(unnumbered, skus):
+                product.internal_sku = sku
+
+        counts = {
+            "products": await insert_products(session, self.products),
+            "items": await update_supplier_items(session, list(self.items.values())),
+            "reviews": await upsert_reviews(session, list(self.reviews.values())),
+        }
+        self.items.clear()
+        self.products.clear()
+        self.reviews.clear()
+
+        logger.debug("match_decisions_flushed", **counts)
+        return counts
+
+
+async def insert_products(session: AsyncSession, products: List[Product]) -> int:
+    """Insert draft products in one multi-row INSERT.
+
+    Args:
+        session: Database session
+        products: Transient products with id and internal_sku set
+
+    Returns:
+        Number of products inserted
+    """
+    if not products:
+        return 0
+
+    await session.execute(
+        insert(Product).values([
+            {
+                "id": p.id,
+                "internal_sku": p.internal_sku,
+                "name": p.name,
+                "normalized_name": p.normalized_name,
+                "category_id": p.category_id,
+                "status": p.status or ProductStatus.DRAFT,
+            }
+            for p in products
+        ])
+    )
+    return len(products)
+
+
+async def update_supplier_items(
+    session: AsyncSession,
+    decisions: List[ItemDecision],
+) -> int:
+    """Apply item decisions with one UPDATE ... FROM (VALUES ...).
+
+    Args:
+        session: Database session
+        decisions: Item decisions
+
+    Returns:
+        Number of items updated
+    """
+    if not decisions:
+        return 0
+
+    table = SupplierItem.__table__
+    types = {name: table.c[name].type for name in (
+        "id", "product_id", "match_status", "match_score", "match_candidates",
+    )}
+    decided = values(
+        *(column(name, type_) for name, type_ in types.items()),
+        name="decided",
+    ).data([
+        (d.item_id, d.product_id, d.match_status, d.match_score, d.match_candidates)
+        for d in decisions
+    ])
+
+    # Casts keep the column types when every row of a column is NULL
+    stmt = (
+        update(SupplierItem)
+        .where(SupplierItem.id == decided.c.id)
+        .values(
+            product_id=cast(decided.c.product_id, types["product_id"]),
+            match_status=cast(decided.c.match_status, types["match_status"]),
+            match_score=cast(decided.c.match_score, types["match_score"]),
+            match_candidates=cast(decided.c.match_candidates, types["match_candidates"]),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(stmt)
+    return len(decisions)
+
+
+async def upsert_reviews(
+    session: AsyncSession,
+    reviews: List[ReviewDecision],
+) -> int:
+    """Create or reset review queue entries in one INSERT ... ON CONFLICT.
+
+    An existing entry for the item gets the new candidates, score and
+    expiration and goes back to pending. Existing entries are locked and
+    read first so their review_queue_stats counts move to pending.
+
+    Args:
+        session: Database session
+        reviews: Review decisions
+
+    Returns:
+        Number of entries upserted
+    """
+    if not reviews:
+        return 0
+
+    supplier_ids = {r.supplier_item_id: r.supplier_id for r in reviews}
+    existing = await session.execute(
+        select(
+            MatchReviewQueue.supplier_item_id,
+            MatchReviewQueue.category_id,
+            MatchReviewQueue.status,
+        )
+        .where(MatchReviewQueue.supplier_item_id.in_(list(supplier_ids)))
+        .with_for_update()
+    )
+    delta = ReviewStatsDelta()
+    for supplier_item_id, category_id, status in existing.all():
+        delta.add(supplier_ids[supplier_item_id], category_id, status, count=-1)
+
+    # A potential match has no product, so the entry has no category
+    stmt = insert(MatchReviewQueue).values([
+        {
+            "id": uuid4(),
+            "supplier_item_id": r.supplier_item_id,
+            "candidate_products": r.candidate_products,
+            "match_score": r.match_score,
+            "category_id": None,
+            "status": ReviewStatus.PENDING,
+            "expires_at": r.expires_at,
+        }
+        for r in reviews
+    ])
+    excluded = stmt.excluded
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["supplier_item_id"],
+        set_={
+            "candidate_products": excluded.candidate_products,
+            "match_score": excluded.match_score,
+            "category_id": excluded.category_id,
+            "status": excluded.status,
+            "expires_at": excluded.expires_at,
+        },
+    )
+    await session.execute(stmt)
+
+    for r in reviews:
+        delta.add(r.supplier_id, None, ReviewStatus.PENDING)
+    await apply_review_stats_delta(session, delta)
+    return len(reviews)
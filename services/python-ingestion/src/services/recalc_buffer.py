@@ -0,0 +1,193 @@
+"""Debounced product aggregate recalculation using Redis.
+
+Producers (match batches, manual link events, price changes) do not
+enqueue a recalculation job per event. They push item-level deltas
+(AggregateDelta) to a Redis list, or add bare product ids to a Redis set
+of dirty products, and request the flush job of the current debounce
+window. All requests within a window share one arq job id, so at most one
+flush job is queued per window however many producers fire, and a
+product marked dirty many times is recalculated once.
+
+The flush job (flush_dirty_aggregates_task) runs when its window has
+ended. It applies the deltas in order (mostly incremental LEAST updates)
+and then drains the dirty set with SPOP, both in large chunks.
+
+Key Functions:
+    - push_aggregate_deltas: Queue item-level deltas and schedule a flush
+    - pop_aggregate_deltas: Take a chunk of deltas (oldest first)
+    - mark_products_dirty: Add products to the dirty set and schedule a flush
+    - pop_dirty_products: Take a chunk of dirty products
+    - restore_dirty_products: Put back products whose recalculation failed
+      and schedule a later flush
+"""
+import json
+import math
+import time
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from uuid import UUID
+import structlog
+from arq.connections import ArqRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.services.aggregation.service import AggregateDelta
+
+logger = structlog.get_logger(__name__)
+
+# Redis key constants
+RECALC_DIRTY_KEY = "aggregates:dirty"
+RECALC_DELTAS_KEY = "aggregates:deltas"
+RECALC_FLUSH_JOB_PREFIX = "recalc-flush:"
+
+RECALC_FLUSH_TASK = "flush_dirty_aggregates_task"
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+async def _schedule_flush(redis: ArqRedis, debounce_seconds: float) -> str:
+    """Request the flush job of the current debounce window.
+
+    The job is deferred until the window ends, so it always runs after
+    every change buffered during the window.
+
+    Returns:
+        Flush job id of the window
+    """
+    window = math.floor(time.time() / debounce_seconds)
+    job_id = f"{RECALC_FLUSH_JOB_PREFIX}{window}"
+    # Returns None when the window's job already exists (coalesced)
+    await redis.enqueue_job(
+        RECALC_FLUSH_TASK,
+        _job_id=job_id,
+        _defer_until=datetime.fromtimestamp((window + 1) * debounce_seconds, tz=timezone.utc),
+    )
+    return job_id
+
+
+async def push_aggregate_deltas(
+    redis: ArqRedis,
+    deltas: List[AggregateDelta],
+    debounce_seconds: float,
+) -> Optional[str]:
+    """Queue item-level deltas and schedule the window's flush job.
+
+    Args:
+        redis: ArqRedis connection
+        deltas: Changes of items' contributions to product aggregates
+        debounce_seconds: Length of a debounce window
+
+    Returns:
+        Flush job id of the window, or None if there was nothing to queue
+    """
+    if not deltas:
+        return None
+
+    await redis.rpush(RECALC_DELTAS_KEY, *(json.dumps(d.to_dict()) for d in deltas))
+    job_id = await _schedule_flush(redis, debounce_seconds)
+
+    logger.debug("aggregate_deltas_buffered", delta_count=len(deltas), flush_job_id=job_id)
+    return job_id
+
+
+async def pop_aggregate_deltas(redis: Redis, count: int) -> List[AggregateDelta]:
+    """Take up to `count` deltas off the list, oldest first.
+
+    Args:
+        redis: Redis connection
+        count: Maximum number of deltas
+
+    Returns:
+        Deltas (malformed entries are dropped)
+    """
+    entries = await redis.lpop(RECALC_DELTAS_KEY, count) or []
+    deltas = []
+    for entry in entries:
+        try:
+            deltas.append(AggregateDelta.from_dict(json.loads(_decode(entry))))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("invalid_aggregate_delta", entry=_decode(entry))
+    return deltas
+
+
+async def mark_products_dirty(
+    redis: ArqRedis,
+    product_ids: Iterable[UUID],
+    debounce_seconds: float,
+) -> Optional[str]:
+    """Mark products for a full recalculation and schedule the window's flush job.
+
+    Args:
+        redis: ArqRedis connection
+        product_ids: Products whose aggregates are stale
+        debounce_seconds: Length of a debounce window
+
+    Returns:
+        Flush job id of the window, or None if nothing was marked
+    """
+    members = [str(pid) for pid in product_ids]
+    if not members:
+        return None
+
+    await redis.sadd(RECALC_DIRTY_KEY, *members)
+    job_id = await _schedule_flush(redis, debounce_seconds)
+
+    logger.debug("products_marked_dirty", product_count=len(members), flush_job_id=job_id)
+    return job_id
+
+
+async def pop_dirty_products(redis: Redis, count: int) -> List[UUID]:
+    """Take up to `count` dirty products off the set.
+
+    Args:
+        redis: Redis connection
+        count: Maximum number of products
+
+    Returns:
+        Product ids (invalid members are dropped)
+    """
+    members = await redis.spop(RECALC_DIRTY_KEY, count) or []
+    product_ids = []
+    for member in members:
+        try:
+            product_ids.append(UUID(_decode(member)))
+        except ValueError:
+            logger.warning("invalid_dirty_product_id", product_id=_decode(member))
+    return product_ids
+
+
+async def restore_dirty_products(
+    redis: ArqRedis,
+    product_ids: List[UUID],
+    debounce_seconds: float,
+) -> bool:
+    """Put products back into the dirty set (e.g. after a failed chunk).
+
+    Also schedules the flush job of the current window: arq does not retry
+    the failed flush, and without a new job the restored products would
+    wait for the next unrelated producer.
+
+    Args:
+        redis: ArqRedis connection
+        product_ids: Products to restore
+        debounce_seconds: Length of a debounce window
+
+    Returns:
+        True if the products were restored and a flush was scheduled
+    """
+    if not product_ids:
+        return True
+    try:
+        await redis.sadd(RECALC_DIRTY_KEY, *(str(pid) for pid in product_ids))
+        job_id = await _schedule_flush(redis, debounce_seconds)
+        logger.debug("dirty_products_restored", product_count=len(product_ids), flush_job_id=job_id)
+        return True
+    except RedisError as e:
+        logger.error(
+            "restore_dirty_products_failed",
+            product_count=len(product_ids),
+            error=str(e),
+        )
+        return False
@@ -0,0 +1,526 @@
+"""Materialized review queue statistics and keyset-paginated listing.
+
+The review dashboard polls queue statistics and pages through pending
+entries. Both are served without scanning the queue:
+
+    - review_queue_stats holds entry counts per (supplier_id, category_id,
+      status). Every writer of match_review_queue applies its count changes
+      in the same transaction (upsert_reviews for match_items_task,
+      handle_manual_match_event, expire_review_queue_task).
+      rebuild_review_queue_stats() recounts from the queue, e.g. after
+      entries were changed outside those paths.
+    - Entries carry match_score and category_id, so listing walks the
+      (status, match_score DESC, id) index and stops after one page.
+
+An entry's category is the category of its item's product when the entry
+was last written (potential matches have no product, so no category).
+
+Expiration (expire_review_queue_task) works in short chunks; the progress
+of the latest run is kept in a Redis hash so an interrupted run is resumed
+(and its counters continued) by the next one.
+
+Key Functions:
+    - ReviewStatsDelta: Accumulated count changes per stats key
+    - apply_review_stats_delta: Apply count changes in one upsert
+    - resolve_reviews: Approve/reject entries in one UPDATE ... FROM (VALUES)
+    - expire_review_chunk: Expire one bounded chunk of overdue entries
+    - rebuild_review_queue_stats: Recount review_queue_stats from the queue
+    - list_review_queue: One page of entries by (match_score DESC, id)
+    - encode_review_cursor / decode_review_cursor: Opaque keyset cursors
+    - start_review_expiration / record_review_expiration_chunk /
+      finish_review_expiration: Expiration run progress in Redis
+    - get_review_expiration_progress: Read the latest run's progress
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import and_, cast, column, delete, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import MatchReviewQueue, ReviewQueueStats, ReviewStatus, SupplierItem
+
+logger = structlog.get_logger(__name__)
+
+# Stats key: (supplier_id, category_id, status)
+StatsKey = Tuple[UUID, Optional[UUID], ReviewStatus]
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Redis hash with the progress of the latest expiration run
+REVIEW_EXPIRATION_KEY = "review_queue:expiration"
+REVIEW_EXPIRATION_TTL_SECONDS = 86400
+
+
+class ReviewStatsDelta:
+    """Count changes of review_queue_stats keys, applied in one statement."""
+
+    def __init__(self) -> None:
+        self._counts: DefaultDict[StatsKey, int] = defaultdict(int)
+
+    def __bool__(self) -> bool:
+        return any(self._counts.values())
+
+    def add(
+        self,
+        supplier_id: UUID,
+        category_id: Optional[UUID],
+        status: ReviewStatus,
+        count: int = 1,
+    ) -> None:
+        """Count entries into a key (negative count removes them)."""
+        self._counts[(supplier_id, category_id, status)] += count
+
+    def move(
+        self,
+        supplier_id: UUID,
+        old: Tuple[Optional[UUID], ReviewStatus],
+        new: Tuple[Optional[UUID], ReviewStatus],
+    ) -> None:
+        """Move one entry of a supplier from (category_id, status) old to new."""
+        self.add(supplier_id, *old, count=-1)
+        self.add(supplier_id, *new)
+
+    def rows(self) -> List[Tuple[StatsKey, int]]:
+        """Non-zero changes in a stable key order (consistent row lock order)."""
+        return sorted(
+            ((key, count) for key, count in self._counts.items() if count),
+            key=lambda row: (str(row[0][0]), str(row[0][1] or ""), row[0][2].value),
+        )
+
+
+async def apply_review_stats_delta(session: AsyncSession, delta: ReviewStatsDelta) -> int:
+    """Apply count changes in one INSERT ... ON CONFLICT DO UPDATE.
+
+    Args:
+        session: Database session (the transaction that changed the entries)
+        delta: Count changes
+
+    Returns:
+        Number of stats rows changed
+    """
+    rows = delta.rows()
+    if not rows:
+        return 0
+
+    stmt = insert(ReviewQueueStats).values([
+        {
+            "id": uuid4(),
+            "supplier_id": supplier_id,
+            "category_id": category_id,
+            "status": status,
+            "count": count,
+        }
+        for (supplier_id, category_id, status), count in rows
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["supplier_id", "category_id", "status"],
+        set_={
+            "count": ReviewQueueStats.count + stmt.excluded.count,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+    return len(rows)
+
+
+@dataclass
+class ReviewResolution:
+    """Reviewer decision on an item's review queue entry.
+
+    Attributes:
+        supplier_item_id: Item whose entry is resolved
+        supplier_id: Supplier of the item (review_queue_stats key)
+        status: New status (approved or rejected)
+        category_id: Category of the product the item is now linked to
+    """
+    supplier_item_id: UUID
+    supplier_id: UUID
+    status: ReviewStatus
+    category_id: Optional[UUID]
+
+
+async def resolve_reviews(
+    session: AsyncSession,
+    resolutions: List[ReviewResolution],
+    reviewed_by: Optional[UUID] = None,
+) -> int:
+    """Resolve review queue entries and move their stats counts.
+
+    Entries are locked and read (for their previous stats key), updated
+    with one UPDATE ... FROM (VALUES ...), and the count changes applied in
+    one upsert. Items without an entry are skipped.
+
+    Args:
+        session: Database session (caller owns the transaction)
+        resolutions: Decisions, one per item (last one wins)
+        reviewed_by: Reviewing user (audit)
+
+    Returns:
+        Number of entries resolved
+    """
+    by_item = {r.supplier_item_id: r for r in resolutions}
+    if not by_item:
+        return 0
+
+    existing = await session.execute(
+        select(
+            MatchReviewQueue.supplier_item_id,
+            MatchReviewQueue.category_id,
+            MatchReviewQueue.status,
+        )
+        .where(MatchReviewQueue.supplier_item_id.in_(list(by_item)))
+        .order_by(MatchReviewQueue.supplier_item_id)
+        .with_for_update()
+    )
+    rows = existing.all()
+    if not rows:
+        return 0
+
+    delta = ReviewStatsDelta()
+    for supplier_item_id, category_id, status in rows:
+        r = by_item[supplier_item_id]
+        delta.move(r.supplier_id, (category_id, status), (r.category_id, r.status))
+
+    table = MatchReviewQueue.__table__
+    types = {name: table.c[name].type for name in ("supplier_item_id", "status", "category_id")}
+    resolved = values(
+        *(column(name, type_) for name, type_ in types.items()),
+        name="resolved",
+    ).data([
+        (supplier_item_id, by_item[supplier_item_id].status, by_item[supplier_item_id].category_id)
+        for supplier_item_id, _, _ in rows
+    ])
+
+    # Casts keep the column types when every row of a column is NULL
+    await session.execute(
+        update(MatchReviewQueue)
+        .where(MatchReviewQueue.supplier_item_id == resolved.c.supplier_item_id)
+        .values(
+            status=cast(resolved.c.status, types["status"]),
+            category_id=cast(resolved.c.category_id, types["category_id"]),
+            reviewed_by=reviewed_by,
+            reviewed_at=datetime.now(timezone.utc),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await apply_review_stats_delta(session, delta)
+    return len(rows)
+
+
+async def expire_review_chunk(
+    session: AsyncSession,
+    cutoff: datetime,
+    chunk_size: int,
+) -> int:
+    """Expire up to chunk_size pending entries that expired before cutoff.
+
+    The chunk is picked oldest first through idx_review_queue_status_expires
+    with FOR UPDATE SKIP LOCKED, so entries being reviewed concurrently are
+    left for a later chunk or run instead of being waited on. The stats
+    counts of the chunk are moved in the same transaction.
+
+    Args:
+        session: Database session (one short transaction per chunk)
+        cutoff: Entries with expires_at before this are overdue
+        chunk_size: Maximum entries to expire
+
+    Returns:
+        Number of entries expired
+    """
+    chunk = (
+        select(MatchReviewQueue.id)
+        .where(
+            MatchReviewQueue.status == ReviewStatus.PENDING,
+            MatchReviewQueue.expires_at < cutoff,
+        )
+        .order_by(MatchReviewQueue.expires_at)
+        .limit(chunk_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(
+        update(MatchReviewQueue)
+        .where(
+            MatchReviewQueue.id.in_(chunk.scalar_subquery()),
+            MatchReviewQueue.supplier_item_id == SupplierItem.id,
+        )
+        .values(status=ReviewStatus.EXPIRED)
+        .returning(SupplierItem.supplier_id, MatchReviewQueue.category_id)
+        .execution_options(synchronize_session=False)
+    )
+    expired = result.all()
+
+    delta = ReviewStatsDelta()
+    for supplier_id, category_id in expired:
+        delta.move(
+            supplier_id,
+            (category_id, ReviewStatus.PENDING),
+            (category_id, ReviewStatus.EXPIRED),
+        )
+    await apply_review_stats_delta(session, delta)
+    return len(expired)
+
+
+async def rebuild_review_queue_stats(session: AsyncSession) -> int:
+    """Recount review_queue_stats from match_review_queue.
+
+    Args:
+        session: Database session (caller owns the transaction)
+
+    Returns:
+        Number of stats rows written
+    """
+    await session.execute(delete(ReviewQueueStats))
+    counts = (
+        select(
+            SupplierItem.supplier_id,
+            MatchReviewQueue.category_id,
+            MatchReviewQueue.status,
+            func.count().label("count"),
+        )
+        .join(SupplierItem, MatchReviewQueue.supplier_item_id == SupplierItem.id)
+        .group_by(SupplierItem.supplier_id, MatchReviewQueue.category_id, MatchReviewQueue.status)
+    )
+    result = await session.execute(
+        insert(ReviewQueueStats)
+        .from_select(["supplier_id", "category_id", "status", "count"], counts)
+        .returning(ReviewQueueStats.id)
+    )
+    rebuilt = len(result.all())
+    logger.info("review_queue_stats_rebuilt", rows=rebuilt)
+    return rebuilt
+
+
+def encode_review_cursor(match_score: Decimal, entry_id: UUID) -> str:
+    """Encode the position after an entry as a cursor."""
+    return f"{match_score}:{entry_id}"
+
+
+def decode_review_cursor(cursor: str) -> Tuple[Decimal, UUID]:
+    """Decode a cursor returned by list_review_queue.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    score, _, entry_id = cursor.partition(":")
+    try:
+        return Decimal(score), UUID(entry_id)
+    except (InvalidOperation, ValueError) as e:
+        raise ValueError(f"Invalid review queue cursor: {cursor!r}") from e
+
+
+async def list_review_queue(
+    session: AsyncSession,
+    status: ReviewStatus = ReviewStatus.PENDING,
+    supplier_id: Optional[UUID] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Get one page of review queue entries, best match score first.
+
+    Entries are ordered by (match_score DESC, id). The page is read from
+    the (status, match_score DESC, id) index starting after the cursor,
+    so the cost depends on the page size, not on the queue size (with a
+    supplier filter, on the entries skipped for other suppliers).
+
+    Args:
+        session: AsyncSession for database operations
+        status: Entries with this status
+        supplier_id: Optional filter by supplier
+        limit: Page size (1-MAX_PAGE_SIZE)
+        cursor: next_cursor of the previous page (None for the first page)
+
+    Returns:
+        Dictionary with:
+            - items: Entries of the page
+            - next_cursor: Cursor of the next page (None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    query = (
+        select(
+            MatchReviewQueue.id,
+            MatchReviewQueue.supplier_item_id,
+            MatchReviewQueue.match_score,
+            MatchReviewQueue.category_id,
+            MatchReviewQueue.candidate_products,
+            MatchReviewQueue.status,
+            MatchReviewQueue.created_at,
+            MatchReviewQueue.expires_at,
+            SupplierItem.name.label("supplier_item_name"),
+            SupplierItem.supplier_id,
+        )
+        .join(SupplierItem, MatchReviewQueue.supplier_item_id == SupplierItem.id)
+        .where(MatchReviewQueue.status == status)
+        .order_by(MatchReviewQueue.match_score.desc(), MatchReviewQueue.id)
+        .limit(limit + 1)
+    )
+    if supplier_id:
+        query = query.where(SupplierItem.supplier_id == supplier_id)
+    if cursor:
+        after_score, after_id = decode_review_cursor(cursor)
+        # The first condition bounds the index range, the second skips ties
+        query = query.where(
+            and_(
+                MatchReviewQueue.match_score <= after_score,
+                or_(
+                    MatchReviewQueue.match_score < after_score,
+                    MatchReviewQueue.id > after_id,
+                ),
+            )
+        )
+
+    rows = (await session.execute(query)).all()
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = page[-1]
+        next_cursor = encode_review_cursor(last.match_score, last.id)
+
+    return {
+        "items": [
+            {
+                "id": str(row.id),
+                "supplier_item_id": str(row.supplier_item_id),
+                "supplier_item_name": row.supplier_item_name,
+                "supplier_id": str(row.supplier_id),
+                "category_id": str(row.category_id) if row.category_id else None,
+                "match_score": float(row.match_score),
+                "candidate_products": row.candidate_products,
+                "status": row.status.value,
+                "created_at": row.created_at.isoformat(),
+                "expires_at": row.expires_at.isoformat(),
+            }
+            for row in page
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+async def get_review_expiration_progress(redis: Redis) -> Optional[Dict[str, Any]]:
+    """Get the progress of the latest expiration run.
+
+    Args:
+        redis: Redis connection
+
+    Returns:
+        Dictionary with task_id, started_at, updated_at, finished_at (None
+        while running or interrupted), chunks and expired; None if no run
+        is known
+    """
+    try:
+        raw = await redis.hgetall(REVIEW_EXPIRATION_KEY)
+    except RedisError as e:
+        logger.warning("get_review_expiration_progress_failed", error=str(e))
+        return None
+    if not raw:
+        return None
+
+    data = {_decode(k): _decode(v) for k, v in raw.items()}
+    return {
+        "task_id": data.get("task_id"),
+        "started_at": data.get("started_at"),
+        "updated_at": data.get("updated_at"),
+        "finished_at": data.get("finished_at") or None,
+        "chunks": int(data.get("chunks", 0)),
+        "expired": int(data.get("expired", 0)),
+    }
+
+
+async def start_review_expiration(redis: Redis, task_id: str) -> bool:
+    """Start an expiration run, or resume the latest one if it was interrupted.
+
+    Args:
+        redis: Redis connection
+        task_id: Task starting (or resuming) the run
+
+    Returns:
+        True if an unfinished run is resumed (its counters are continued)
+    """
+    progress = await get_review_expiration_progress(redis)
+    resumed = bool(progress and not progress["finished_at"])
+    now = datetime.now(timezone.utc).isoformat()
+
+    try:
+        pipe = redis.pipeline(transaction=True)
+        if resumed:
+            pipe.hset(REVIEW_EXPIRATION_KEY, mapping={"task_id": task_id, "updated_at": now})
+        else:
+            pipe.delete(REVIEW_EXPIRATION_KEY)
+            pipe.hset(REVIEW_EXPIRATION_KEY, mapping={
+                "task_id": task_id,
+                "started_at": now,
+                "updated_at": now,
+                "chunks": 0,
+                "expired": 0,
+            })
+        pipe.expire(REVIEW_EXPIRATION_KEY, REVIEW_EXPIRATION_TTL_SECONDS)
+        await pipe.execute()
+    except RedisError as e:
+        logger.warning("start_review_expiration_failed", task_id=task_id, error=str(e))
+
+    if resumed and progress:
+        logger.info(
+            "review_expiration_resumed",
+            task_id=task_id,
+            interrupted_task_id=progress["task_id"],
+            expired=progress["expired"],
+        )
+    return resumed
+
+
+async def record_review_expiration_chunk(redis: Redis, expired: int) -> bool:
+    """Add a committed chunk to the run counters.
+
+    Args:
+        redis: Redis connection
+        expired: Entries expired by the chunk
+
+    Returns:
+        True if the counters were updated successfully
+    """
+    try:
+        pipe = redis.pipeline(transaction=True)
+        pipe.hincrby(REVIEW_EXPIRATION_KEY, "chunks", 1)
+        pipe.hincrby(REVIEW_EXPIRATION_KEY, "expired", expired)
+        pipe.hset(REVIEW_EXPIRATION_KEY, "updated_at", datetime.now(timezone.utc).isoformat())
+        pipe.expire(REVIEW_EXPIRATION_KEY, REVIEW_EXPIRATION_TTL_SECONDS)
+        await pipe.execute()
+        return True
+    except RedisError as e:
+        logger.warning("record_review_expiration_chunk_failed", error=str(e))
+        return False
+
+
+async def finish_review_expiration(redis: Redis) -> bool:
+    """Mark the current expiration run as finished.
+
+    Args:
+        redis: Redis connection
+
+    Returns:
+        True if the run state was updated successfully
+    """
+    try:
+        await redis.hset(
+            REVIEW_EXPIRATION_KEY, "finished_at", datetime.now(timezone.utc).isoformat()
+        )
+        return True
+    except RedisError as e:
+        logger.warning("finish_review_expiration_failed", error=str(e))
+        return False
@@ -0,0 +1,106 @@
+"""Internal SKU allocation backed by a Postgres sequence.
+
+Draft products get SKUs of the form PROD-{number} with numbers drawn from
+the product_sku_seq sequence. The sequence increments by SKU_BLOCK_SIZE,
+so each nextval() reserves a whole block of numbers for the calling
+process: a worker allocates up to 1,000 SKUs per database round trip and
+SKUs never collide across workers. Numbers of a block that is not used up
+(or belongs to a rolled back transaction) are skipped, never reused.
+
+Key Functions:
+    - allocate_skus: Allocate SKUs from the process-wide allocator
+    - format_sku: Format a sequence number as an internal SKU
+"""
+import asyncio
+import math
+from typing import List
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = structlog.get_logger(__name__)
+
+# Must match the INCREMENT of product_sku_seq (migration 007)
+SKU_BLOCK_SIZE = 1000
+SKU_SEQUENCE = "product_sku_seq"
+SKU_PREFIX = "PROD"
+
+
+def format_sku(number: int) -> str:
+    """Format a sequence number as an internal SKU (e.g. PROD-000001001)."""
+    return f"{SKU_PREFIX}-{number:09d}"
+
+
+class SkuAllocator:
+    """Hands out SKU numbers from blocks reserved on product_sku_seq.
+
+    Attributes:
+        block_size: Numbers reserved per nextval() (the sequence increment)
+    """
+
+    def __init__(self, block_size: int = SKU_BLOCK_SIZE):
+        self.block_size = block_size
+        self._blocks: List[int] = []
+        self._next = 0
+        self._end = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> int:
+        """Numbers left in the reserved blocks."""
+        return (self._end - self._next) + len(self._blocks) * self.block_size
+
+    async def _reserve(self, session: AsyncSession, blocks: int) -> None:
+        """Reserve blocks with a single round trip."""
+        result = await session.execute(
+            text(f"SELECT nextval('{SKU_SEQUENCE}') FROM generate_series(1, :blocks)"),
+            {"blocks": blocks},
+        )
+        self._blocks.extend(result.scalars().all())
+        logger.debug("sku_blocks_reserved", blocks=blocks, block_size=self.block_size)
+
+    async def allocate(self, session: AsyncSession, count: int = 1) -> List[str]:
+        """Allocate `count` unique SKUs.
+
+        Args:
+            session: Database session used to reserve new blocks if needed
+            count: Number of SKUs
+
+        Returns:
+            List of SKUs
+        """
+        if count <= 0:
+            return []
+
+        async with self._lock:
+            missing = count - self.available
+            if missing > 0:
+                await self._reserve(session, math.ceil(missing / self.block_size))
+
+            skus: List[str] = []
+            while len(skus) < count:
+                if self._next >= self._end:
+                    self._next = self._blocks.pop(0)
+                    self._end = self._next + self.block_size
+                take = min(count - len(skus), self._end - self._next)
+                skus.extend(format_sku(n) for n in range(self._next, self._next + take))
+                self._next += take
+            return skus
+
+
+# Process-wide allocator: blocks are reserved per worker process
+_allocator = SkuAllocator()
+
+
+async def allocate_skus(session: AsyncSession, count: int = 1) -> List[str]:
+    """Allocate `count` unique internal SKUs for new products.
+
+    Args:
+        session: Database session
+        count: Number of SKUs
+
+    Returns:
+        List of SKUs
+    """
+    return await _allocator.allocate(session, count)
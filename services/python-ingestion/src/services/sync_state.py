@@ -4,7 +4,14 @@ This module provides helper functions for managing sync pipeline state
 in Redis, including:
 - Distributed lock acquisition/release
 - Sync status tracking
-- Progress updates for UI feedback
+- Progress updates for UI feedback (parse jobs count their own completion)
+
+While suppliers are processed, the status key expires if no parse job
+finishes for SYNC_PROGRESS_TIMEOUT_SECONDS, and a missing key reads as
+idle (here and in the Bun API). Without it, a parse job that never
+reports back leaves the status in processing_suppliers for good. That
+happens when arq drops it after max_tries, cancels it on timeout, its
+worker is killed, or its job key expires before it runs.
 """
 import json
 from typing import Optional, Tuple
@@ -29,6 +36,10 @@ SYNC_LAST_RUN_KEY = "sync:last_run"
 # Lock TTL (1 hour) - auto-expires to prevent deadlocks
 SYNC_LOCK_TTL_SECONDS = 3600
 
+# processing_suppliers falls back to idle if no parse job finishes for
+# this long (1 hour; a parse job takes at most ~16 min over 3 tries)
+SYNC_PROGRESS_TIMEOUT_SECONDS = 3600
+
 
 async def acquire_sync_lock(
     redis: Redis,
@@ -153,6 +164,7 @@ async def update_sync_status(
     started_at: Optional[str] = None,
     progress_current: int = 0,
     progress_total: int = 0,
+    ttl_seconds: Optional[int] = None,
 ) -> bool:
     """Update sync status in Redis.
     
@@ -163,6 +175,7 @@ async def update_sync_status(
         started_at: ISO timestamp when sync started
         progress_current: Number of suppliers processed
         progress_total: Total suppliers to process
+        ttl_seconds: Expire the status (read as idle) after this long
     
     Returns:
         True if status was updated successfully
@@ -181,9 +194,10 @@ async def update_sync_status(
         await redis.set(
             SYNC_STATUS_KEY,
             json.dumps(status.model_dump()),
+            ex=ttl_seconds,
         )
         
-        log.debug("sync_status_updated")
+        log.debug("sync_status_updated", ttl_seconds=ttl_seconds)
         return True
         
     except (json.JSONDecodeError, RedisError) as e:
@@ -219,9 +233,11 @@ async def update_sync_progress(
         status.progress_current = current
         status.progress_total = total
         
+        # keepttl: keep a processing run's progress timeout
         await redis.set(
             SYNC_STATUS_KEY,
             json.dumps(status.model_dump()),
+            keepttl=True,
         )
         
         log.debug(
@@ -235,6 +251,63 @@ async def update_sync_progress(
         return False
 
 
+# Counts one finished parse job of the sync run ARGV[1] in the status JSON
+# (read by the Bun API) in one atomic step and pushes the status expiry
+# back to ARGV[2] seconds; the last one sets the status idle (no expiry).
+# Jobs of an older or expired run (another task_id, no status) are ignored.
+SYNC_PARSE_COMPLETED_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then return -1 end
+local status = cjson.decode(raw)
+if status['task_id'] ~= ARGV[1] or status['state'] ~= 'processing_suppliers' then
+    return -1
+end
+local current = tonumber(status['progress_current']) + 1
+if current >= tonumber(status['progress_total']) then
+    status = {state = 'idle', task_id = cjson.null, started_at = cjson.null,
+              progress_current = 0, progress_total = 0}
+    redis.call('SET', KEYS[1], cjson.encode(status))
+else
+    status['progress_current'] = current
+    redis.call('SET', KEYS[1], cjson.encode(status), 'EX', ARGV[2])
+end
+return current
+"""
+
+
+async def record_sync_parse_completed(
+    redis: Redis,
+    sync_task_id: str,
+    timeout_seconds: int = SYNC_PROGRESS_TIMEOUT_SECONDS,
+) -> Optional[int]:
+    """Count a finished parse job towards its sync run's progress.
+    
+    Called by parse_task when it finishes for good (success or final
+    failure), so progress follows parse completion, not enqueue order.
+    Each call restarts the run's progress timeout.
+    
+    Args:
+        redis: Redis connection
+        sync_task_id: Task ID of the sync run that enqueued the job
+        timeout_seconds: Expire the status if no further job finishes in time
+    
+    Returns:
+        Parse jobs finished so far, or None if the run is no longer current
+    """
+    try:
+        current = await redis.eval(
+            SYNC_PARSE_COMPLETED_SCRIPT, 1, SYNC_STATUS_KEY, sync_task_id, str(timeout_seconds)
+        )
+    except RedisError as e:
+        logger.warning("record_sync_parse_completed_failed", sync_task_id=sync_task_id, error=str(e))
+        return None
+    
+    if current < 0:
+        return None
+    logger.debug("sync_parse_completed", sync_task_id=sync_task_id, progress_current=current)
+    return current
+
+
 async def set_sync_started(
     redis: Redis,
     task_id: str,
@@ -260,13 +333,18 @@ async def set_sync_processing_suppliers(
     redis: Redis,
     task_id: str,
     total_suppliers: int,
+    timeout_seconds: int = SYNC_PROGRESS_TIMEOUT_SECONDS,
 ) -> bool:
     """Mark sync as processing suppliers.
     
+    The status expires (reads as idle) unless a parse job of the run
+    finishes within timeout_seconds (see record_sync_parse_completed).
+    
     Args:
         redis: Redis connection
         task_id: Task ID for the sync operation
         total_suppliers: Total number of suppliers to process
+        timeout_seconds: Progress timeout of the run
     
     Returns:
         True if status was updated successfully
@@ -281,6 +359,7 @@ async def set_sync_processing_suppliers(
         started_at=current_status.started_at,
         progress_current=0,
         progress_total=total_suppliers,
+        ttl_seconds=timeout_seconds,
     )
 
 
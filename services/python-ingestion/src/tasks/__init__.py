@@ -3,8 +3,10 @@
 This module contains arq task functions for:
     - match_items_task: Process unmatched supplier items
     - enrich_item_task: Extract features from item text
+    - enrich_items_batch_task: Extract features for many items in pages
     - recalc_product_aggregates_task: Update product min_price/availability
     - handle_manual_match_event: Process manual link/unlink events
+    - handle_manual_match_events_batch: Approve/reject many review entries
     - expire_review_queue_task: Clean up expired review items
     - trigger_master_sync_task: Execute master sync pipeline
     - scheduled_sync_task: Cron wrapper for scheduled syncs
@@ -12,7 +14,6 @@ This module contains arq task functions for:
 from src.tasks.matching_tasks import (
     match_items_task,
     MatchingMetrics,
-    generate_internal_sku,
 )
 from src.tasks.sync_tasks import (
     trigger_master_sync_task,
@@ -26,7 +27,6 @@ __all__ = [
     # Matching tasks
     "match_items_task",
     "MatchingMetrics",
-    "generate_internal_sku",
     # Sync tasks
     "trigger_master_sync_task",
     "scheduled_sync_task",
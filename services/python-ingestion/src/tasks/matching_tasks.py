@@ -3,19 +3,28 @@
 This module implements the core matching pipeline tasks:
     - match_items_task: Process unmatched supplier items and link to products
     - Supports category blocking for performance optimization
-    - Uses SELECT FOR UPDATE SKIP LOCKED for concurrent worker safety
+    - Claims batches with short lease transactions (SELECT FOR UPDATE SKIP
+      LOCKED + lease owner/expiry) and scores outside any transaction
+    - Drain mode: fans out parallel batch jobs that re-enqueue themselves
+      until the unmatched backlog is empty
 """
+import asyncio
+import functools
+import math
+import multiprocessing
+import os
+import socket
 import time
 import uuid
-import random
-import string
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, Any, List, Optional, Sequence
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 
 from arq.connections import ArqRedis
-from sqlalchemy import select, update, and_, or_, func
+from sqlalchemy import String, cast, column, select, update, values, and_, or_, func
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 import structlog
@@ -32,11 +41,50 @@ from src.db.models import (
     Category,
 )
 from src.services.matching import (
+    MatcherStrategy,
     RapidFuzzMatcher,
     MatchResult,
     MatchCandidate,
     MatchStatusEnum,
+    IdentifierIndex,
+    Affinity,
+    affinity_key,
+    load_affinities,
+    record_affinities,
+    invalidate_affinity,
+    ItemDecision,
+    ReviewDecision,
+    MatchWriteBack,
+    ProductData,
+    ProductIndex,
+    attributes_conflict,
+    cluster_names,
     create_matcher,
+    name_attributes,
+    normalize_name,
+    parse_blocking_attributes,
+)
+from src.services.sku_allocator import allocate_skus
+from src.services.aggregation import AggregateDelta
+from src.services.review_queue import (
+    ReviewResolution,
+    expire_review_chunk,
+    finish_review_expiration,
+    record_review_expiration_chunk,
+    resolve_reviews,
+    start_review_expiration,
+)
+from src.services.recalc_buffer import (
+    push_aggregate_deltas,
+    pop_aggregate_deltas,
+    pop_dirty_products,
+    restore_dirty_products,
+)
+from src.services.match_drain import (
+    claim_match_drain,
+    start_match_drain,
+    record_match_drain_batch,
+    finish_match_drain_lane,
 )
 from src.errors.exceptions import DatabaseError
 
@@ -123,18 +171,37 @@ def emit_items_processed_total(count: int, status: str) -> None:
     )
 
 
-def generate_internal_sku() -> str:
-    """Generate a unique internal SKU for a new product.
-    
-    Format: PROD-{timestamp}-{random}
-    Example: PROD-1732623600000-A3F5
+# Process-wide matcher instance. Stateful strategies (e.g. "embedding") keep
+# their index between batches, so it must outlive a single task run.
+_matcher: Optional[MatcherStrategy] = None
+
+
+def get_matcher() -> MatcherStrategy:
+    """Get the worker's matcher for the configured MATCH_STRATEGY.
     
     Returns:
-        Unique SKU string
+        MatcherStrategy instance shared by all matching tasks in this process
     """
-    timestamp = int(time.time() * 1000)
-    random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
-    return f"PROD-{timestamp}-{random_suffix}"
+    global _matcher
+    if _matcher is None:
+        strategy = matching_settings.strategy
+        kwargs: Dict[str, Any] = {}
+        if strategy == "hybrid":
+            kwargs = {
+                "prefilter_scorer": matching_settings.hybrid_prefilter_scorer,
+                "prefilter_top_n": matching_settings.hybrid_prefilter_top_n,
+                "prefilter_cutoff": matching_settings.hybrid_prefilter_cutoff,
+            }
+        elif strategy == "embedding":
+            kwargs = {
+                "dimensions": matching_settings.embedding_dimensions,
+                "shortlist_size": matching_settings.embedding_shortlist_size,
+                "n_probe": matching_settings.embedding_n_probe,
+                "index_path": matching_settings.embedding_index_path,
+            }
+        _matcher = create_matcher(strategy, **kwargs)
+        logger.info("matcher_created", strategy=_matcher.get_strategy_name())
+    return _matcher
 
 
 @dataclass
@@ -142,11 +209,16 @@ class MatchingMetrics:
     """Metrics collected during matching task execution."""
     items_processed: int = 0
     auto_matched: int = 0
+    identifier_matched: int = 0
+    affinity_matched: int = 0
+    cluster_matched: int = 0
+    attribute_blocked: int = 0
     potential_matches: int = 0
     new_products_created: int = 0
     skipped_no_category: int = 0
     skipped_verified: int = 0
     errors: int = 0
+    lease_lost: int = 0
     duration_seconds: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
@@ -154,11 +226,16 @@ class MatchingMetrics:
         return {
             "items_processed": self.items_processed,
             "auto_matched": self.auto_matched,
+            "identifier_matched": self.identifier_matched,
+            "affinity_matched": self.affinity_matched,
+            "cluster_matched": self.cluster_matched,
+            "attribute_blocked": self.attribute_blocked,
             "potential_matches": self.potential_matches,
             "new_products_created": self.new_products_created,
             "skipped_no_category": self.skipped_no_category,
             "skipped_verified": self.skipped_verified,
             "errors": self.errors,
+            "lease_lost": self.lease_lost,
             "duration_seconds": round(self.duration_seconds, 3),
         }
 
@@ -170,17 +247,37 @@ async def match_items_task(
     batch_size: int = 100,
     retry_count: int = 0,
     max_retries: int = 3,
+    drain: bool = False,
+    drain_id: Optional[str] = None,
+    drain_lane: int = 0,
+    drain_step: int = 0,
     **kwargs
 ) -> Dict[str, Any]:
     """Process a batch of unmatched supplier items and attempt to link to products.
     
     This task:
-    1. Selects unmatched items using SELECT FOR UPDATE SKIP LOCKED
-    2. For each item, finds candidate products (with optional category blocking)
-    3. Applies threshold logic:
+    1. Claims unmatched items in a short transaction (SELECT FOR UPDATE SKIP
+       LOCKED, then a lease: owner + expiry); scoring runs outside any
+       transaction and a second short transaction writes the decisions
+    2. Links items whose GTIN/MPN is already known for a linked item (exact
+       identifier fast path), or whose normalized name was already linked
+       (affinity cache), without fuzzy scoring
+    3. For other items, finds candidate products (with optional category
+       blocking, and attribute blocking: products whose extracted
+       MATCH_BLOCKING_ATTRIBUTES differ from the item's are never
+       candidates); a near-duplicate of an item that created a draft earlier
+       in the batch (see MATCH_CLUSTER_THRESHOLD) is linked to that draft
+       unless it auto-matches an existing product or their attributes differ
+    4. Applies threshold logic:
        - Score ≥95%: Auto-link to product
        - Score 70-94%: Add to review queue
        - Score <70%: Create new draft product
+    5. Persists the batch's decisions in bulk (MatchWriteBack): one INSERT
+       for new products, one UPDATE ... FROM (VALUES) for the items and one
+       upsert for review queue entries, for items still leased by the job
+    6. In drain mode, continues the backlog (see _advance_drain): a full
+       first batch fans out parallel lanes; each lane re-enqueues itself
+       after every full batch until no unmatched items remain
     
     Args:
         ctx: Worker context (contains Redis connection)
@@ -189,13 +286,19 @@ async def match_items_task(
         batch_size: Number of items to process (1-1000)
         retry_count: Current retry attempt
         max_retries: Maximum retry attempts
+        drain: Process the backlog to completion
+        drain_id: Drain run of a fanned-out lane job (None for the first job)
+        drain_lane: Lane index within the drain run
+        drain_step: Batches the lane processed before this job
         
     Returns:
         Dictionary with task results and metrics
         
     Note:
-        Uses SELECT FOR UPDATE SKIP LOCKED to prevent duplicate processing
-        when multiple workers are running concurrently.
+        Uses SELECT FOR UPDATE SKIP LOCKED plus a lease to prevent duplicate
+        processing when multiple workers are running concurrently. Leases
+        expire after MATCH_LEASE_SECONDS, so batches of crashed workers are
+        reclaimed automatically.
     """
     start_time = time.time()
     metrics = MatchingMetrics()
@@ -212,6 +315,7 @@ async def match_items_task(
         task_id=task_id,
         batch_size=batch_size,
         category_id=str(category_uuid) if category_uuid else None,
+        drain_id=drain_id,
     )
     
     log.info("match_items_task_started")
@@ -221,44 +325,52 @@ async def match_items_task(
     potential_threshold = matching_settings.potential_threshold
     max_candidates = matching_settings.max_candidates
     review_expiration_days = matching_settings.review_expiration_days
+    blocking_attributes = parse_blocking_attributes(matching_settings.blocking_attributes)
+    
+    lease_owner = _lease_owner(task_id)
     
     try:
+        # Step 1: Claim a batch in a short transaction. Claimed items are
+        # leased (owner + expiry) rather than kept locked while scoring;
+        # items whose lease expired (crashed worker) are claimable again.
         async with async_session_maker() as session:
             async with session.begin():
-                # Step 1: Select unmatched items with FOR UPDATE SKIP LOCKED
-                # This prevents concurrent workers from processing the same items
-                query = (
-                    select(SupplierItem)
-                    .where(
-                        and_(
-                            SupplierItem.product_id.is_(None),
-                            SupplierItem.match_status == MatchStatus.UNMATCHED,
-                        )
-                    )
-                    .order_by(SupplierItem.created_at)
-                    .limit(batch_size)
-                    .with_for_update(skip_locked=True)
+                unmatched_items = await _claim_unmatched_items(
+                    session=session,
+                    batch_size=batch_size,
+                    lease_owner=lease_owner,
+                    lease_seconds=matching_settings.lease_seconds,
                 )
-                
-                # If category_id is provided, filter by items that have
-                # supplier.category or will be matched against that category
-                # For now, we'll load all unmatched and filter during matching
-                
-                result = await session.execute(query)
-                unmatched_items = result.scalars().all()
-                
-                if not unmatched_items:
-                    log.info("no_unmatched_items_found")
-                    metrics.duration_seconds = time.time() - start_time
-                    return {
-                        "task_id": task_id,
-                        "status": "success",
-                        **metrics.to_dict(),
-                    }
-                
-                log.info("unmatched_items_selected", count=len(unmatched_items))
-                
-                # Step 2: Load products for matching (with category blocking if specified)
+        
+        if not unmatched_items:
+            log.info("no_unmatched_items_found")
+            metrics.duration_seconds = time.time() - start_time
+            if drain and drain_id:
+                await _advance_drain(
+                    redis=ctx.get("redis"),
+                    task_id=task_id,
+                    category_id=category_id,
+                    batch_size=batch_size,
+                    claimed=0,
+                    metrics=metrics,
+                    drain_id=drain_id,
+                    drain_lane=drain_lane,
+                    drain_step=drain_step,
+                    log=log,
+                )
+            return {
+                "task_id": task_id,
+                "status": "success",
+                "drain_id": drain_id,
+                **metrics.to_dict(),
+            }
+        
+        claimed = len(unmatched_items)
+        log.info("unmatched_items_selected", count=claimed, lease_owner=lease_owner)
+        
+        # Step 2: Load products and lookup data (read-only, short transaction)
+        async with async_session_maker() as session:
+            async with session.begin():
                 # Include both ACTIVE and DRAFT products to enable matching against
                 # recently created products that haven't been activated yet
                 products_query = (
@@ -278,143 +390,296 @@ async def match_items_task(
                     )
                 
                 products_result = await session.execute(products_query)
-                # Convert to list to allow appending new products during batch processing
-                products: List[Product] = list(products_result.scalars().all())
+                # Index with cached scored names; drafts created during the
+                # batch are added in O(1) so subsequent items can match them
+                catalog = ProductIndex(
+                    products_result.scalars().all(),
+                    blocking_attributes=blocking_attributes,
+                )
                 
-                log.debug("products_loaded", count=len(products))
+                log.debug("products_loaded", count=len(catalog))
                 
-                # Step 3: Create matcher instance
-                matcher = create_matcher("rapidfuzz")
+                # Identifier fast path: known GTIN/MPN -> product lookup
+                identifier_index = IdentifierIndex()
+                if matching_settings.identifier_fast_path:
+                    identifier_index = await _load_identifier_index(
+                        session=session,
+                        items=unmatched_items,
+                    )
+                    log.debug("identifier_index_loaded", identifiers=len(identifier_index))
                 
-                # Step 4: Process each item
-                product_ids_to_recalc: List[uuid.UUID] = []
+                # Affinity cache: prior decisions for identical normalized names
+                item_names: Dict[uuid.UUID, str] = {
+                    item.id: item.normalized_name or normalize_name(item.name)
+                    for item in unmatched_items
+                }
+                item_keys: Dict[uuid.UUID, Optional[str]] = {
+                    item_id: affinity_key(name) for item_id, name in item_names.items()
+                }
+                affinities: Dict[str, Affinity] = {}
+                affinity_updates: Dict[str, Affinity] = {}
+                if matching_settings.affinity_cache:
+                    affinities = await load_affinities(session, item_keys.values())
+                    log.debug("affinities_loaded", count=len(affinities))
+        
+        # Step 3: Get matcher instance (strategy from MATCH_STRATEGY)
+        matcher = get_matcher()
+        
+        # Near-duplicate clusters within the batch: item -> (leader, similarity).
+        # A follower whose leader created a draft is linked to that draft.
+        cluster_of: Dict[uuid.UUID, Tuple[uuid.UUID, float]] = {}
+        if matching_settings.batch_clustering:
+            clusters = cluster_names(
+                [item_names[item.id] for item in unmatched_items],
+                threshold=matching_settings.cluster_threshold,
+            )
+            cluster_of = {
+                item.id: (unmatched_items[leader].id, score)
+                for item, (leader, score) in zip(unmatched_items, clusters)
+                if unmatched_items[leader].id != item.id
+            }
+        cluster_drafts: Dict[uuid.UUID, uuid.UUID] = {}
+        
+        # Attribute blocking keys extracted from the item names
+        item_attributes: Dict[uuid.UUID, Dict[str, Any]] = {
+            item.id: name_attributes(item.name, blocking_attributes)
+            for item in unmatched_items
+        }
+        
+        # Step 4: Decide each item outside any transaction (persisted in bulk
+        # after the loop)
+        writeback = MatchWriteBack()
+        
+        for item in unmatched_items:
+            try:
+                # Skip items that are verified (protected from auto-matching)
+                if item.match_status == MatchStatus.VERIFIED_MATCH:
+                    metrics.skipped_verified += 1
+                    continue
                 
-                for item in unmatched_items:
-                    try:
-                        # Skip items that are verified (protected from auto-matching)
-                        if item.match_status == MatchStatus.VERIFIED_MATCH:
-                            metrics.skipped_verified += 1
-                            continue
-                        
-                        # Get products for this item (category blocking)
-                        item_products = products
-                        if category_uuid:
-                            # Already filtered in query
-                            pass
-                        elif item.product_id and item.product:
-                            # If item somehow has a product, use its category
-                            item_products = [
-                                p for p in products
-                                if p.category_id == item.product.category_id
-                            ]
-                        
-                        # If no products to match against, create a new product
-                        if not item_products:
-                            # No existing products to match - create new draft product
-                            new_product = await _handle_no_match(
-                                session=session,
-                                item=item,
-                                log=log,
-                            )
-                            metrics.new_products_created += 1
-                            metrics.items_processed += 1
-                            
-                            # IMPORTANT: Add new product to the list so subsequent items
-                            # in the same batch can match against it
-                            products.append(new_product)
-                            
-                            # Queue recalculation for the new product
-                            product_ids_to_recalc.append(new_product.id)
-                            continue
-                        
-                        # Perform matching
-                        match_result = matcher.find_matches(
-                            item_name=item.name,
-                            item_id=item.id,
-                            products=item_products,
-                            auto_threshold=auto_threshold,
-                            potential_threshold=potential_threshold,
-                            max_candidates=max_candidates,
-                        )
-                        
-                        metrics.items_processed += 1
-                        
-                        # Step 5: Apply threshold logic
-                        if match_result.match_status == MatchStatusEnum.AUTO_MATCHED:
-                            # Auto-link to product
-                            await _handle_auto_match(
-                                session=session,
-                                item=item,
-                                match_result=match_result,
-                                log=log,
-                            )
-                            metrics.auto_matched += 1
-                            
-                            # Queue recalculation for the linked product
-                            if match_result.best_match:
-                                product_ids_to_recalc.append(match_result.best_match.product_id)
-                        
-                        elif match_result.match_status == MatchStatusEnum.POTENTIAL_MATCH:
-                            # Add to review queue
-                            await _handle_potential_match(
-                                session=session,
-                                item=item,
-                                match_result=match_result,
-                                review_expiration_days=review_expiration_days,
-                                log=log,
-                            )
-                            metrics.potential_matches += 1
-                        
-                        else:
-                            # Create new draft product
-                            new_product = await _handle_no_match(
-                                session=session,
-                                item=item,
-                                log=log,
-                            )
-                            metrics.new_products_created += 1
-                            
-                            # IMPORTANT: Add new product to the list so subsequent items
-                            # in the same batch can match against it
-                            products.append(new_product)
-                            
-                            # Queue recalculation for the new product
-                            product_ids_to_recalc.append(new_product.id)
+                # Get products for this item (attribute and category blocking)
+                attributes = item_attributes[item.id]
+                item_products = catalog.blocked(attributes)
+                if item_products is not catalog:
+                    metrics.attribute_blocked += 1
+                if category_uuid:
+                    # Already filtered in query
+                    pass
+                elif item.product_id and item.product:
+                    # If item somehow has a product, use its category
+                    item_products = [
+                        p for p in item_products
+                        if p.category_id == item.product.category_id
+                    ]
+                
+                # Exact identifier hit: link without fuzzy scoring
+                identifier_product = catalog.get(identifier_index.lookup(item.identifiers))
+                if identifier_product is not None:
+                    _handle_identifier_match(
+                        writeback=writeback,
+                        item=item,
+                        product=identifier_product,
+                        log=log,
+                    )
+                    metrics.items_processed += 1
+                    metrics.auto_matched += 1
+                    metrics.identifier_matched += 1
+                    continue
+                
+                # Affinity hit: same normalized name already linked
+                item_key = item_keys[item.id]
+                affinity = affinities.get(item_key) if item_key else None
+                affinity_product = catalog.get(affinity.product_id) if affinity else None
+                if affinity is not None and affinity_product is not None:
+                    _handle_affinity_match(
+                        writeback=writeback,
+                        item=item,
+                        product=affinity_product,
+                        affinity=affinity,
+                        log=log,
+                    )
+                    metrics.items_processed += 1
+                    metrics.auto_matched += 1
+                    metrics.affinity_matched += 1
+                    continue
+                
+                # If no products to match against, create a new product
+                if not item_products:
+                    # No existing products to match - create new draft product
+                    new_product = _handle_no_match(
+                        writeback=writeback,
+                        item=item,
+                        log=log,
+                    )
+                    metrics.new_products_created += 1
+                    metrics.items_processed += 1
                     
-                    except Exception as e:
-                        log.error(
-                            "item_matching_failed",
-                            item_id=str(item.id),
-                            item_name=item.name,
-                            error=str(e),
-                            error_type=type(e).__name__,
+                    # IMPORTANT: Add new product to the catalog so subsequent items
+                    # in the same batch can match against it
+                    catalog.add(new_product)
+                    cluster_drafts[item.id] = new_product.id
+                    identifier_index.add(item.identifiers, new_product.id)
+                    if item_key and matching_settings.affinity_cache:
+                        affinities[item_key] = affinity_updates[item_key] = Affinity(
+                            product_id=new_product.id,
+                            confidence=Decimal("100.00"),
+                            source=MatchStatus.AUTO_MATCHED,
                         )
-                        metrics.errors += 1
-                        # Continue processing other items
+                    continue
                 
-                # Commit transaction
-                await session.commit()
-                
-                log.info(
-                    "match_items_task_batch_committed",
-                    **metrics.to_dict(),
+                # Perform matching
+                match_result = matcher.find_matches(
+                    item_name=item.name,
+                    item_id=item.id,
+                    products=item_products,
+                    auto_threshold=auto_threshold,
+                    potential_threshold=potential_threshold,
+                    max_candidates=max_candidates,
+                    normalized_name=item.normalized_name,
                 )
                 
-                # Step 6: Enqueue aggregate recalculation for affected products
-                if product_ids_to_recalc:
-                    # Deduplicate product IDs
-                    unique_product_ids = list(set(product_ids_to_recalc))
+                metrics.items_processed += 1
+                
+                leader_id, cluster_score = cluster_of.get(item.id, (None, 0.0))
+                cluster_product: Optional[ProductData] = None
+                if leader_id is not None:
+                    cluster_product = catalog.get(cluster_drafts.get(leader_id))
+                    if cluster_product is not None and attributes_conflict(
+                        attributes, item_attributes[leader_id]
+                    ):
+                        # Near-duplicate name of another variant (e.g. 128GB/256GB)
+                        cluster_product = None
+                
+                # Step 5: Apply threshold logic
+                if match_result.match_status == MatchStatusEnum.AUTO_MATCHED:
+                    # Auto-link to product
+                    decision = _handle_auto_match(
+                        writeback=writeback,
+                        item=item,
+                        match_result=match_result,
+                        log=log,
+                    )
+                    metrics.auto_matched += 1
                     
-                    # Enqueue recalc task (will be implemented in Phase 4)
-                    redis: Optional[ArqRedis] = ctx.get("redis")
-                    if redis:
-                        await _enqueue_recalc_task(
-                            redis=redis,
-                            task_id=task_id,
-                            product_ids=unique_product_ids,
-                            trigger="auto_match",
-                            log=log,
+                    if decision and match_result.best_match:
+                        identifier_index.add(item.identifiers, match_result.best_match.product_id)
+                        if (
+                            item_key
+                            and matching_settings.affinity_cache
+                            and decision.match_score is not None
+                        ):
+                            affinities[item_key] = affinity_updates[item_key] = Affinity(
+                                product_id=match_result.best_match.product_id,
+                                confidence=decision.match_score,
+                                source=MatchStatus.AUTO_MATCHED,
+                            )
+                
+                elif cluster_product is not None and leader_id is not None:
+                    # Near-duplicate of an item that created a draft in this
+                    # batch: link to it instead of a review entry / another draft
+                    _handle_cluster_match(
+                        writeback=writeback,
+                        item=item,
+                        product=cluster_product,
+                        leader_id=leader_id,
+                        similarity=cluster_score,
+                        log=log,
+                    )
+                    metrics.auto_matched += 1
+                    metrics.cluster_matched += 1
+                    identifier_index.add(item.identifiers, cluster_product.id)
+                
+                elif match_result.match_status == MatchStatusEnum.POTENTIAL_MATCH:
+                    # Add to review queue
+                    _handle_potential_match(
+                        writeback=writeback,
+                        item=item,
+                        match_result=match_result,
+                        review_expiration_days=review_expiration_days,
+                        log=log,
+                    )
+                    metrics.potential_matches += 1
+                
+                else:
+                    # Create new draft product
+                    new_product = _handle_no_match(
+                        writeback=writeback,
+                        item=item,
+                        log=log,
+                    )
+                    metrics.new_products_created += 1
+                    
+                    # IMPORTANT: Add new product to the catalog so subsequent items
+                    # in the same batch can match against it
+                    catalog.add(new_product)
+                    cluster_drafts[item.id] = new_product.id
+                    identifier_index.add(item.identifiers, new_product.id)
+                    if item_key and matching_settings.affinity_cache:
+                        affinities[item_key] = affinity_updates[item_key] = Affinity(
+                            product_id=new_product.id,
+                            confidence=Decimal("100.00"),
+                            source=MatchStatus.AUTO_MATCHED,
                         )
+            
+            except Exception as e:
+                log.error(
+                    "item_matching_failed",
+                    item_id=str(item.id),
+                    item_name=item.name,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                metrics.errors += 1
+                # Continue processing other items
+        
+        # Step 5: Commit the decisions in a second short transaction. Only
+        # items still leased by this job (and still unmatched) are written:
+        # a lease that expired and was reclaimed, or an item linked manually
+        # meanwhile, drops its decision.
+        async with async_session_maker() as session:
+            async with session.begin():
+                held_ids = await _lock_leased_items(
+                    session=session,
+                    item_ids=[item.id for item in unmatched_items],
+                    lease_owner=lease_owner,
+                )
+                new_product_ids = {p.id for p in writeback.products}
+                lost_ids = writeback.retain(held_ids)
+                if lost_ids:
+                    dropped_products = new_product_ids - {p.id for p in writeback.products}
+                    affinity_updates = {
+                        key: affinity for key, affinity in affinity_updates.items()
+                        if affinity.product_id not in dropped_products
+                    }
+                    metrics.lease_lost = len(lost_ids)
+                    log.warning("match_lease_lost", count=len(lost_ids))
+                
+                # Every written link adds its item's price/stock to a product
+                aggregate_deltas = _link_deltas(writeback, unmatched_items)
+                
+                # Bulk-write the decisions, then the new affinity entries
+                # (they reference the new products), then release the leases
+                written = await writeback.flush(session)
+                log.debug("match_decisions_written", **written)
+                await record_affinities(session, affinity_updates)
+                await _release_leases(session, held_ids, lease_owner)
+        
+        log.info(
+            "match_items_task_batch_committed",
+            **metrics.to_dict(),
+        )
+        
+        # Step 6: Queue aggregate maintenance for the linked products
+        if aggregate_deltas:
+            redis: Optional[ArqRedis] = ctx.get("redis")
+            if redis:
+                await _enqueue_recalc_task(
+                    redis=redis,
+                    task_id=task_id,
+                    deltas=aggregate_deltas,
+                    trigger="auto_match",
+                    log=log,
+                )
         
         metrics.duration_seconds = time.time() - start_time
         
@@ -440,9 +705,25 @@ async def match_items_task(
         emit_items_processed_total(metrics.items_processed, status)
         emit_items_processed_total(metrics.errors, "error")
         
+        # Step 7: Drain mode - keep going until the backlog is empty
+        if drain:
+            drain_id = await _advance_drain(
+                redis=ctx.get("redis"),
+                task_id=task_id,
+                category_id=category_id,
+                batch_size=batch_size,
+                claimed=claimed,
+                metrics=metrics,
+                drain_id=drain_id,
+                drain_lane=drain_lane,
+                drain_step=drain_step,
+                log=log,
+            )
+        
         return {
             "task_id": task_id,
             "status": status,
+            "drain_id": drain_id,
             **metrics.to_dict(),
         }
     
@@ -454,41 +735,52 @@ async def match_items_task(
             error_type=type(e).__name__,
             **metrics.to_dict(),
         )
+        # arq does not retry the job: end its lane so the run still
+        # completes (items it had claimed are reclaimed by a later run
+        # once their lease expires)
+        redis = ctx.get("redis")
+        if drain and drain_id and redis:
+            log.warning("match_drain_lane_failed", drain_lane=drain_lane, drain_step=drain_step)
+            await finish_match_drain_lane(redis, drain_id)
         raise
 
 
-async def _handle_auto_match(
-    session: AsyncSession,
+def _handle_auto_match(
+    writeback: MatchWriteBack,
     item: SupplierItem,
     match_result: MatchResult,
     log: Any,
-) -> None:
+) -> Optional[ItemDecision]:
     """Handle auto-match case (score ≥95%).
     
-    Updates the supplier item:
+    Decides the supplier item update:
     - Links to the matched product
     - Sets match_status to AUTO_MATCHED
     - Stores match_score
     
     Args:
-        session: Database session
+        writeback: Batch decision accumulator
         item: SupplierItem to update
         match_result: Result from matcher
         log: Logger instance
+        
+    Returns:
+        The recorded decision, or None without a best match
     """
     if not match_result.best_match:
         log.warning("auto_match_no_best_match", item_id=str(item.id))
-        return
+        return None
     
     best_match = match_result.best_match
     
-    # Update supplier item
-    item.product_id = best_match.product_id
-    item.match_status = MatchStatus.AUTO_MATCHED
-    item.match_score = Decimal(str(round(best_match.score, 2)))
-    item.match_candidates = [c.to_dict() for c in match_result.candidates]
-    
-    session.add(item)
+    decision = ItemDecision(
+        item_id=item.id,
+        match_status=MatchStatus.AUTO_MATCHED,
+        product_id=best_match.product_id,
+        match_score=Decimal(str(round(best_match.score, 2))),
+        match_candidates=[c.to_dict() for c in match_result.candidates],
+    )
+    writeback.decide(decision)
     
     log.info(
         "item_auto_matched",
@@ -498,10 +790,303 @@ async def _handle_auto_match(
         product_name=best_match.product_name,
         score=best_match.score,
     )
+    
+    return decision
+
+
+def _lease_owner(task_id: str) -> str:
+    """Lease owner of a job: host, process and task."""
+    return f"{socket.gethostname()}:{os.getpid()}:{task_id}"[:255]
+
+
+async def _claim_unmatched_items(
+    session: AsyncSession,
+    batch_size: int,
+    lease_owner: str,
+    lease_seconds: int,
+) -> Sequence[SupplierItem]:
+    """Claim a batch of unmatched items by leasing them.
+    
+    Row locks (SKIP LOCKED) are only held by the claim transaction; the
+    lease then keeps other workers off the items while they are scored.
+    Items whose lease expired are claimable again.
+    
+    Args:
+        session: Database session (short claim transaction)
+        batch_size: Maximum items to claim
+        lease_owner: Lease owner of the claiming job
+        lease_seconds: Lease duration
+        
+    Returns:
+        Claimed supplier items
+    """
+    query = (
+        select(SupplierItem)
+        .where(
+            and_(
+                SupplierItem.product_id.is_(None),
+                SupplierItem.match_status == MatchStatus.UNMATCHED,
+                or_(
+                    SupplierItem.match_lease_expires_at.is_(None),
+                    SupplierItem.match_lease_expires_at < func.now(),
+                ),
+            )
+        )
+        .order_by(SupplierItem.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(query)
+    items = result.scalars().all()
+    
+    if items:
+        await session.execute(
+            update(SupplierItem)
+            .where(SupplierItem.id.in_([item.id for item in items]))
+            .values(
+                match_lease_owner=lease_owner,
+                match_lease_expires_at=func.now() + timedelta(seconds=lease_seconds),
+                # A lease is not a content change
+                updated_at=SupplierItem.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+    return items
 
 
-async def _handle_potential_match(
+async def _lock_leased_items(
     session: AsyncSession,
+    item_ids: List[uuid.UUID],
+    lease_owner: str,
+) -> Set[uuid.UUID]:
+    """Lock the claimed items that may still be written by this job.
+    
+    Args:
+        session: Database session (short commit transaction)
+        item_ids: Items claimed by the job
+        lease_owner: Lease owner of the job
+        
+    Returns:
+        IDs of items still leased by the job and still unmatched
+    """
+    result = await session.execute(
+        select(SupplierItem.id)
+        .where(
+            and_(
+                SupplierItem.id.in_(item_ids),
+                SupplierItem.match_lease_owner == lease_owner,
+                SupplierItem.product_id.is_(None),
+                SupplierItem.match_status == MatchStatus.UNMATCHED,
+            )
+        )
+        .with_for_update()
+    )
+    return set(result.scalars().all())
+
+
+async def _release_leases(
+    session: AsyncSession,
+    item_ids: Set[uuid.UUID],
+    lease_owner: str,
+) -> None:
+    """Clear the leases of this job's items (decided or failed).
+    
+    Args:
+        session: Database session
+        item_ids: Items to release
+        lease_owner: Lease owner of the job
+    """
+    if not item_ids:
+        return
+    
+    await session.execute(
+        update(SupplierItem)
+        .where(
+            and_(
+                SupplierItem.id.in_(item_ids),
+                SupplierItem.match_lease_owner == lease_owner,
+            )
+        )
+        .values(
+            match_lease_owner=None,
+            match_lease_expires_at=None,
+            updated_at=SupplierItem.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _load_identifier_index(
+    session: AsyncSession,
+    items: Sequence[SupplierItem],
+) -> IdentifierIndex:
+    """Load identifiers of linked items that share an identifier with the batch.
+    
+    Only rows overlapping the batch's identifiers are fetched (GIN index on
+    supplier_items.identifiers), so the index stays small regardless of
+    catalog size.
+    
+    Args:
+        session: Database session
+        items: Unmatched items of the current batch
+        
+    Returns:
+        IdentifierIndex mapping identifier keys to linked product IDs
+    """
+    index = IdentifierIndex()
+    batch_identifiers = sorted({key for item in items for key in (item.identifiers or ())})
+    if not batch_identifiers:
+        return index
+    
+    result = await session.execute(
+        select(SupplierItem.identifiers, SupplierItem.product_id)
+        .where(
+            and_(
+                SupplierItem.product_id.is_not(None),
+                SupplierItem.identifiers.op("&&")(
+                    postgresql.array(batch_identifiers, type_=String(64))
+                ),
+            )
+        )
+    )
+    for identifiers, product_id in result.all():
+        if product_id is not None:
+            index.add(identifiers, product_id)
+    return index
+
+
+def _handle_identifier_match(
+    writeback: MatchWriteBack,
+    item: SupplierItem,
+    product: ProductData,
+    log: Any,
+) -> None:
+    """Handle exact identifier hit (GTIN/MPN known for a linked item).
+    
+    Links the item like an auto-match with score 100 and the identified
+    product as the only candidate.
+    
+    Args:
+        writeback: Batch decision accumulator
+        item: SupplierItem to update
+        product: Product identified by the item's identifiers
+        log: Logger instance
+    """
+    candidate = MatchCandidate(
+        product_id=product.id,
+        product_name=product.name,
+        score=100.0,
+        category_id=product.category_id,
+    )
+    
+    writeback.decide(ItemDecision(
+        item_id=item.id,
+        match_status=MatchStatus.AUTO_MATCHED,
+        product_id=product.id,
+        match_score=Decimal("100.00"),
+        match_candidates=[candidate.to_dict()],
+    ))
+    
+    log.info(
+        "item_identifier_matched",
+        item_id=str(item.id),
+        item_name=item.name,
+        product_id=str(product.id),
+        identifiers=item.identifiers,
+    )
+
+
+def _handle_affinity_match(
+    writeback: MatchWriteBack,
+    item: SupplierItem,
+    product: ProductData,
+    affinity: Affinity,
+    log: Any,
+) -> None:
+    """Handle affinity hit (normalized name already linked to a product).
+    
+    Links the item like an auto-match, reusing the remembered decision's
+    confidence as match score.
+    
+    Args:
+        writeback: Batch decision accumulator
+        item: SupplierItem to update
+        product: Product the normalized name was linked to
+        affinity: Remembered decision
+        log: Logger instance
+    """
+    candidate = MatchCandidate(
+        product_id=product.id,
+        product_name=product.name,
+        score=float(affinity.confidence),
+        category_id=product.category_id,
+    )
+    
+    writeback.decide(ItemDecision(
+        item_id=item.id,
+        match_status=MatchStatus.AUTO_MATCHED,
+        product_id=product.id,
+        match_score=affinity.confidence,
+        match_candidates=[candidate.to_dict()],
+    ))
+    
+    log.info(
+        "item_affinity_matched",
+        item_id=str(item.id),
+        item_name=item.name,
+        product_id=str(product.id),
+        affinity_source=affinity.source.value,
+    )
+
+
+def _handle_cluster_match(
+    writeback: MatchWriteBack,
+    item: SupplierItem,
+    product: ProductData,
+    leader_id: uuid.UUID,
+    similarity: float,
+    log: Any,
+) -> None:
+    """Handle a near-duplicate of an item that created a draft in this batch.
+    
+    Links the item to the leader's draft product (score = similarity to the
+    leader) so a group of near-duplicates creates a single draft.
+    
+    Args:
+        writeback: Batch decision accumulator
+        item: SupplierItem to update
+        product: Draft product created for the cluster leader
+        leader_id: Supplier item that created the draft
+        similarity: WRatio similarity of the item to the leader (0-100)
+        log: Logger instance
+    """
+    candidate = MatchCandidate(
+        product_id=product.id,
+        product_name=product.name,
+        score=similarity,
+        category_id=product.category_id,
+    )
+    
+    writeback.decide(ItemDecision(
+        item_id=item.id,
+        match_status=MatchStatus.AUTO_MATCHED,
+        product_id=product.id,
+        match_score=Decimal(str(round(similarity, 2))),
+        match_candidates=[candidate.to_dict()],
+    ))
+    
+    log.info(
+        "item_cluster_matched",
+        item_id=str(item.id),
+        item_name=item.name,
+        product_id=str(product.id),
+        leader_item_id=str(leader_id),
+        similarity=round(similarity, 2),
+    )
+
+
+def _handle_potential_match(
+    writeback: MatchWriteBack,
     item: SupplierItem,
     match_result: MatchResult,
     review_expiration_days: int,
@@ -509,51 +1094,41 @@ async def _handle_potential_match(
 ) -> None:
     """Handle potential match case (score 70-94%).
     
-    Updates the supplier item and creates a review queue entry:
+    Decides the supplier item update and its review queue entry:
     - Sets match_status to POTENTIAL_MATCH
     - Stores candidates for review
-    - Creates MatchReviewQueue entry with expiration
+    - Creates (or resets to pending) the MatchReviewQueue entry with expiration
     
     Args:
-        session: Database session
+        writeback: Batch decision accumulator
         item: SupplierItem to update
         match_result: Result from matcher
         review_expiration_days: Days until review expires
         log: Logger instance
     """
-    # Update supplier item
-    item.match_status = MatchStatus.POTENTIAL_MATCH
+    candidates = [c.to_dict() for c in match_result.candidates]
+    match_score = item.match_score
     if match_result.match_score:
-        item.match_score = Decimal(str(round(match_result.match_score, 2)))
-    item.match_candidates = [c.to_dict() for c in match_result.candidates]
+        match_score = Decimal(str(round(match_result.match_score, 2)))
     
-    session.add(item)
+    writeback.decide(ItemDecision(
+        item_id=item.id,
+        match_status=MatchStatus.POTENTIAL_MATCH,
+        product_id=None,
+        match_score=match_score,
+        match_candidates=candidates,
+    ))
     
     # Calculate expiration date
     expires_at = datetime.now(timezone.utc) + timedelta(days=review_expiration_days)
     
-    # Check if review queue entry already exists
-    existing_query = select(MatchReviewQueue).where(
-        MatchReviewQueue.supplier_item_id == item.id
-    )
-    existing_result = await session.execute(existing_query)
-    existing_review = existing_result.scalar_one_or_none()
-    
-    if existing_review:
-        # Update existing review
-        existing_review.candidate_products = [c.to_dict() for c in match_result.candidates]
-        existing_review.status = ReviewStatus.PENDING
-        existing_review.expires_at = expires_at
-        session.add(existing_review)
-    else:
-        # Create new review queue entry
-        review_entry = MatchReviewQueue(
-            supplier_item_id=item.id,
-            candidate_products=[c.to_dict() for c in match_result.candidates],
-            status=ReviewStatus.PENDING,
-            expires_at=expires_at,
-        )
-        session.add(review_entry)
+    writeback.add_review(ReviewDecision(
+        supplier_item_id=item.id,
+        candidate_products=candidates,
+        expires_at=expires_at,
+        supplier_id=item.supplier_id,
+        match_score=match_score or Decimal("0"),
+    ))
     
     log.info(
         "item_potential_match",
@@ -565,101 +1140,276 @@ async def _handle_potential_match(
     )
 
 
-async def _handle_no_match(
-    session: AsyncSession,
+def _handle_no_match(
+    writeback: MatchWriteBack,
     item: SupplierItem,
     log: Any,
 ) -> Product:
     """Handle no match case (score <70%).
     
     Creates a new draft product and links the supplier item:
-    - Creates Product with status=DRAFT
+    - Creates Product with status=DRAFT (id generated client-side; SKU
+      allocated and product inserted with the batch)
     - Links supplier item to new product
     - Sets match_status to AUTO_MATCHED (linked to new product)
     
     Args:
-        session: Database session
+        writeback: Batch decision accumulator
         item: SupplierItem to update
         log: Logger instance
         
     Returns:
-        Newly created Product
+        Newly created (not yet inserted) Product
     """
-    # Generate unique SKU
-    internal_sku = generate_internal_sku()
-    
     # Create new draft product
-    new_product = Product(
-        internal_sku=internal_sku,
+    new_product = writeback.add_product(Product(
+        id=uuid.uuid4(),
         name=item.name,
+        normalized_name=item.normalized_name or normalize_name(item.name),
         status=ProductStatus.DRAFT,
         # Copy category from supplier if available (would need supplier relationship)
         # For now, leave category_id as None
-    )
-    session.add(new_product)
-    await session.flush()  # Get the product ID
+    ))
     
     # Link supplier item to new product
-    item.product_id = new_product.id
-    item.match_status = MatchStatus.AUTO_MATCHED  # Linked to own product
-    item.match_score = Decimal("100.00")  # Perfect match to self
-    item.match_candidates = []
-    
-    session.add(item)
+    writeback.decide(ItemDecision(
+        item_id=item.id,
+        match_status=MatchStatus.AUTO_MATCHED,  # Linked to own product
+        product_id=new_product.id,
+        match_score=Decimal("100.00"),  # Perfect match to self
+        match_candidates=[],
+    ))
     
     log.info(
         "item_new_product_created",
         item_id=str(item.id),
         item_name=item.name,
         product_id=str(new_product.id),
-        product_sku=new_product.internal_sku,
     )
     
     return new_product
 
 
+def _link_deltas(
+    writeback: MatchWriteBack,
+    items: Sequence[SupplierItem],
+) -> List[AggregateDelta]:
+    """Aggregate deltas of the links a write-back will persist.
+    
+    Must be called before flush() (which resets the write-back).
+    """
+    items_by_id = {item.id: item for item in items}
+    return [
+        AggregateDelta.link(
+            decision.product_id,
+            items_by_id[decision.item_id].current_price,
+            items_by_id[decision.item_id].characteristics,
+        )
+        for decision in writeback.items.values()
+        if decision.product_id is not None and decision.item_id in items_by_id
+    ]
+
+
 async def _enqueue_recalc_task(
     redis: ArqRedis,
     task_id: str,
-    product_ids: List[uuid.UUID],
+    deltas: List[AggregateDelta],
     trigger: str,
     log: Any,
 ) -> None:
-    """Enqueue aggregate recalculation task for products.
+    """Schedule aggregate maintenance for item-level deltas.
+    
+    Deltas are pushed to the Redis buffer; the debounced
+    flush_dirty_aggregates_task applies them (see recalc_buffer).
     
     Args:
         redis: ArqRedis connection
         task_id: Parent task ID for correlation
-        product_ids: List of product UUIDs to recalculate
+        deltas: Changes of items' contributions to product aggregates
         trigger: What triggered the recalculation
         log: Logger instance
     """
     try:
-        recalc_task_id = f"recalc-{task_id}-{int(time.time())}"
-        
-        # Enqueue the recalculation task
-        await redis.enqueue_job(
-            "recalc_product_aggregates_task",
-            task_id=recalc_task_id,
-            product_ids=[str(pid) for pid in product_ids],
-            trigger=trigger,
+        flush_job_id = await push_aggregate_deltas(
+            redis,
+            deltas,
+            debounce_seconds=matching_settings.recalc_debounce_seconds,
         )
         
         log.debug(
-            "recalc_task_enqueued",
-            recalc_task_id=recalc_task_id,
-            product_count=len(product_ids),
+            "recalc_deltas_buffered",
+            flush_job_id=flush_job_id,
+            delta_count=len(deltas),
             trigger=trigger,
         )
     except Exception as e:
         log.warning(
             "recalc_task_enqueue_failed",
             error=str(e),
-            product_count=len(product_ids),
+            delta_count=len(deltas),
         )
         # Don't raise - recalc failure shouldn't fail the matching task
 
 
+async def _count_unmatched_items() -> int:
+    """Count supplier items waiting to be matched."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(func.count())
+            .select_from(SupplierItem)
+            .where(
+                and_(
+                    SupplierItem.product_id.is_(None),
+                    SupplierItem.match_status == MatchStatus.UNMATCHED,
+                )
+            )
+        )
+        return int(result.scalar_one())
+
+
+async def _enqueue_drain_job(
+    redis: ArqRedis,
+    drain_id: str,
+    drain_lane: int,
+    drain_step: int,
+    category_id: Optional[str],
+    batch_size: int,
+    log: Any,
+) -> bool:
+    """Enqueue the next batch job of a drain lane.
+    
+    The job id is derived from (drain_id, lane, step), so a retried job
+    cannot enqueue the same successor twice.
+    
+    Args:
+        redis: ArqRedis connection
+        drain_id: Drain run identifier
+        drain_lane: Lane index
+        drain_step: Step of the job being enqueued
+        category_id: Category filter passed through to the job
+        batch_size: Batch size passed through to the job
+        log: Logger instance
+    
+    Returns:
+        True if the job was enqueued (or already exists)
+    """
+    job_id = f"{drain_id}:{drain_lane}:{drain_step}"
+    try:
+        await redis.enqueue_job(
+            "match_items_task",
+            task_id=job_id,
+            category_id=category_id,
+            batch_size=batch_size,
+            drain=True,
+            drain_id=drain_id,
+            drain_lane=drain_lane,
+            drain_step=drain_step,
+            _job_id=job_id,
+        )
+        return True
+    except Exception as e:
+        log.warning(
+            "match_drain_enqueue_failed",
+            drain_lane=drain_lane,
+            drain_step=drain_step,
+            error=str(e),
+        )
+        return False
+
+
+async def _advance_drain(
+    redis: Optional[ArqRedis],
+    task_id: str,
+    category_id: Optional[str],
+    batch_size: int,
+    claimed: int,
+    metrics: MatchingMetrics,
+    drain_id: Optional[str],
+    drain_lane: int,
+    drain_step: int,
+    log: Any,
+) -> Optional[str]:
+    """Continue a drain run after a committed batch.
+    
+    The first job (no drain_id) starts a run only if it claimed a full
+    batch and no other run is active: it counts the remaining backlog,
+    claims the active run and fans out
+    min(MATCH_DRAIN_MAX_PARALLEL, ceil(remaining / batch_size)) lanes.
+    A first job that finds another run active leaves the backlog to it.
+    A lane job re-enqueues its successor after a full batch that made
+    progress; otherwise the lane finishes (the last lane completes the run).
+    A batch where every item failed also ends the lane, so items that keep
+    failing cannot loop forever.
+    
+    Args:
+        redis: ArqRedis connection (drain is skipped without one)
+        task_id: Current task ID (becomes the drain_id of a new run)
+        category_id: Category filter passed through to lane jobs
+        batch_size: Batch size of the run
+        claimed: Items claimed by the current batch
+        metrics: Metrics of the current batch
+        drain_id: Drain run of the current job (None for the first job)
+        drain_lane: Lane index of the current job
+        drain_step: Step of the current job within its lane
+        log: Logger instance
+    
+    Returns:
+        drain_id of the run the job belongs to (or left the backlog to),
+        or None if no run was started
+    """
+    if redis is None:
+        log.warning("match_drain_skipped_no_redis")
+        return drain_id
+    
+    batch_full = claimed >= batch_size
+    
+    if drain_id is None:
+        if not batch_full:
+            return None
+        try:
+            remaining = await _count_unmatched_items()
+        except Exception as e:
+            log.warning("match_drain_backlog_count_failed", error=str(e))
+            return None
+        if remaining == 0:
+            return None
+        
+        active_id = await claim_match_drain(redis, task_id)
+        if active_id is None:
+            return None
+        if active_id != task_id:
+            log.info("match_drain_already_running", active_drain_id=active_id)
+            return active_id
+        
+        drain_id = task_id
+        lanes = min(matching_settings.drain_max_parallel, math.ceil(remaining / batch_size))
+        await start_match_drain(redis, drain_id, backlog_total=claimed + remaining, lanes=lanes)
+        await record_match_drain_batch(redis, drain_id, metrics.to_dict())
+        for lane in range(lanes):
+            enqueued = await _enqueue_drain_job(
+                redis, drain_id, lane, 1, category_id, batch_size, log
+            )
+            if not enqueued:
+                await finish_match_drain_lane(redis, drain_id)
+        log.info("match_drain_fanned_out", drain_id=drain_id, backlog=remaining, lanes=lanes)
+        return drain_id
+    
+    if claimed:
+        await record_match_drain_batch(redis, drain_id, metrics.to_dict())
+    
+    if batch_full and metrics.items_processed > 0:
+        enqueued = await _enqueue_drain_job(
+            redis, drain_id, drain_lane, drain_step + 1, category_id, batch_size, log
+        )
+        if enqueued:
+            return drain_id
+    elif batch_full:
+        log.warning("match_drain_lane_stalled", drain_lane=drain_lane, errors=metrics.errors)
+    
+    await finish_match_drain_lane(redis, drain_id)
+    return drain_id
+
+
 @dataclass
 class RecalcMetrics:
     """Metrics collected during aggregate recalculation task execution."""
@@ -681,10 +1431,11 @@ class RecalcMetrics:
 async def recalc_product_aggregates_task(
     ctx: Dict[str, Any],
     task_id: str,
-    product_ids: List[str],
+    product_ids: Optional[List[str]] = None,
     trigger: str = "manual",
     retry_count: int = 0,
     max_retries: int = 3,
+    deltas: Optional[List[Dict[str, Any]]] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """Recalculate aggregate fields (min_price, availability) for products.
@@ -698,6 +1449,9 @@ async def recalc_product_aggregates_task(
         - min_price: MIN(current_price) of linked items
         - availability: TRUE if ANY linked item has stock
     
+    Item-level deltas are applied incrementally where possible (see
+    apply_aggregate_deltas); product_ids are always fully recalculated.
+    
     Args:
         ctx: Worker context (contains Redis connection)
         task_id: Unique task identifier for logging
@@ -705,6 +1459,7 @@ async def recalc_product_aggregates_task(
         trigger: What triggered the recalculation (for audit trail)
         retry_count: Current retry attempt
         max_retries: Maximum retry attempts
+        deltas: AggregateDelta.to_dict() entries to apply
         
     Returns:
         Dictionary with task results and metrics:
@@ -722,21 +1477,29 @@ async def recalc_product_aggregates_task(
     
     # Parse product_ids from strings to UUIDs
     parsed_product_ids: List[uuid.UUID] = []
-    for pid_str in product_ids:
+    for pid_str in product_ids or []:
         try:
             parsed_product_ids.append(uuid.UUID(pid_str))
         except ValueError:
             logger.warning("invalid_product_id", task_id=task_id, product_id=pid_str)
     
+    parsed_deltas: List[AggregateDelta] = []
+    for delta in deltas or []:
+        try:
+            parsed_deltas.append(AggregateDelta.from_dict(delta))
+        except (ValueError, KeyError, TypeError):
+            logger.warning("invalid_aggregate_delta", task_id=task_id, delta=delta)
+    
     log = logger.bind(
         task_id=task_id,
         product_count=len(parsed_product_ids),
+        delta_count=len(parsed_deltas),
         trigger=trigger,
     )
     
     log.info("recalc_product_aggregates_task_started")
     
-    if not parsed_product_ids:
+    if not parsed_product_ids and not parsed_deltas:
         log.warning("no_valid_product_ids")
         return {
             "task_id": task_id,
@@ -747,17 +1510,28 @@ async def recalc_product_aggregates_task(
         }
     
     # Import here to avoid circular imports
-    from src.services.aggregation import calculate_product_aggregates_batch
+    from src.services.aggregation import (
+        apply_aggregate_deltas,
+        calculate_product_aggregates_batch,
+    )
     
     try:
         async with async_session_maker() as session:
             async with session.begin():
-                # Calculate aggregates for all products in batch
-                results = await calculate_product_aggregates_batch(
-                    session=session,
-                    product_ids=parsed_product_ids,
-                    trigger=trigger,
-                )
+                results = []
+                if parsed_deltas:
+                    results.extend(await apply_aggregate_deltas(
+                        session=session,
+                        deltas=parsed_deltas,
+                        trigger=trigger,
+                    ))
+                if parsed_product_ids:
+                    # Calculate aggregates for all products in batch
+                    results.extend(await calculate_product_aggregates_batch(
+                        session=session,
+                        product_ids=parsed_product_ids,
+                        trigger=trigger,
+                    ))
                 
                 # Process results
                 for result in results:
@@ -815,6 +1589,96 @@ async def recalc_product_aggregates_task(
         raise
 
 
+async def flush_dirty_aggregates_task(ctx: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+    """Apply buffered aggregate deltas and recalculate dirty products.
+    
+    Scheduled by _enqueue_recalc_task at most once per debounce window.
+    Drains the delta list (oldest first), then the dirty product set, in
+    chunks of MATCH_RECALC_CHUNK_SIZE, each in its own transaction.
+    Entries added while the task runs are included until both are empty.
+    The products of a failed chunk are marked dirty (so they get a full
+    recalculation later), a flush job is scheduled for the current window
+    and the task fails.
+    
+    Args:
+        ctx: Worker context (contains Redis connection)
+        
+    Returns:
+        Dictionary with task results and metrics (see RecalcMetrics)
+            plus chunks: Number of chunks recalculated
+    """
+    from src.services.aggregation import (
+        apply_aggregate_deltas,
+        calculate_product_aggregates_batch,
+    )
+    
+    start_time = time.time()
+    metrics = RecalcMetrics()
+    chunks = 0
+    task_id = ctx.get("job_id", "recalc-flush")
+    log = logger.bind(task_id=task_id)
+    redis: ArqRedis = ctx["redis"]
+    chunk_size = matching_settings.recalc_chunk_size
+    
+    while True:
+        deltas = await pop_aggregate_deltas(redis, chunk_size)
+        if deltas:
+            product_ids = list({d.product_id for d in deltas})
+        else:
+            product_ids = await pop_dirty_products(redis, chunk_size)
+            if not product_ids:
+                break
+        
+        try:
+            async with async_session_maker() as session:
+                async with session.begin():
+                    if deltas:
+                        results = await apply_aggregate_deltas(
+                            session=session,
+                            deltas=deltas,
+                            trigger="debounced",
+                        )
+                    else:
+                        results = await calculate_product_aggregates_batch(
+                            session=session,
+                            product_ids=product_ids,
+                            trigger="debounced",
+                        )
+        except Exception as e:
+            await restore_dirty_products(
+                redis, product_ids, matching_settings.recalc_debounce_seconds
+            )
+            metrics.duration_seconds = time.time() - start_time
+            log.error(
+                "flush_dirty_aggregates_task_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                chunk_size=len(product_ids),
+                **metrics.to_dict(),
+            )
+            raise
+        
+        chunks += 1
+        metrics.products_processed += len(results)
+        metrics.errors += sum(1 for r in results if "error" in r)
+        metrics.products_updated = metrics.products_processed - metrics.errors
+    
+    metrics.duration_seconds = time.time() - start_time
+    log.info("flush_dirty_aggregates_task_completed", chunks=chunks, **metrics.to_dict())
+    
+    if chunks:
+        emit_matching_duration_seconds(metrics.duration_seconds, "recalc_aggregates")
+        emit_items_processed_total(metrics.products_updated, "success")
+        emit_items_processed_total(metrics.errors, "error")
+    
+    return {
+        "task_id": task_id,
+        "status": "success",
+        "chunks": chunks,
+        **metrics.to_dict(),
+    }
+
+
 @dataclass
 class EnrichMetrics:
     """Metrics collected during enrichment task execution."""
@@ -898,7 +1762,7 @@ async def enrich_item_task(
     log.info("enrich_item_task_started")
     
     # Import here to avoid circular imports
-    from src.services.extraction import extract_all_features
+    from src.services.extraction import extract_characteristics, merge_characteristics
     
     try:
         async with async_session_maker() as session:
@@ -922,13 +1786,10 @@ async def enrich_item_task(
                         **metrics.to_dict(),
                     }
                 
-                # Extract features from item name
-                extracted = extract_all_features(
-                    text=item.name,
-                    extractors=extractors,
-                )
+                # Extract features from item name (cached per name)
+                new_characteristics, sources = extract_characteristics(item.name, extractors)
                 
-                if not extracted.has_any_features():
+                if not new_characteristics:
                     log.info("no_features_extracted")
                     metrics.duration_seconds = time.time() - start_time
                     return {
@@ -938,23 +1799,12 @@ async def enrich_item_task(
                         **metrics.to_dict(),
                     }
                 
-                # Convert to characteristics format
-                new_characteristics = extracted.to_characteristics()
-                
                 # Merge with existing characteristics
                 current = item.characteristics or {}
-                
-                if preserve_existing:
-                    # Only add new keys, don't overwrite existing
-                    merged = {**current}
-                    for key, value in new_characteristics.items():
-                        if key not in merged or merged[key] is None:
-                            merged[key] = value
-                            metrics.features_extracted += 1
-                else:
-                    # New values overwrite existing
-                    merged = {**current, **new_characteristics}
-                    metrics.features_extracted = len(new_characteristics)
+                merged, added = merge_characteristics(
+                    current, new_characteristics, preserve_existing
+                )
+                metrics.features_extracted = len(added)
                 
                 # Update if there are changes
                 if merged != current:
@@ -963,10 +1813,9 @@ async def enrich_item_task(
                     metrics.characteristics_updated = True
                     
                     # Track which extractors contributed
-                    if extracted.voltage is not None or extracted.power_watts is not None:
-                        metrics.extractors_applied.append("electronics")
-                    if extracted.weight_kg is not None or extracted.dimensions_cm is not None:
-                        metrics.extractors_applied.append("dimensions")
+                    metrics.extractors_applied.extend(
+                        name for name in extractors if name in sources.values()
+                    )
                 
                 await session.commit()
         
@@ -1001,6 +1850,308 @@ async def enrich_item_task(
         raise
 
 
+@dataclass
+class EnrichBatchMetrics:
+    """Metrics collected during batch enrichment."""
+    pages: int = 0
+    items_scanned: int = 0
+    items_updated: int = 0
+    items_skipped: int = 0
+    features_extracted: int = 0
+    features_by_extractor: Dict[str, int] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging/response."""
+        return {
+            "pages": self.pages,
+            "items_scanned": self.items_scanned,
+            "items_updated": self.items_updated,
+            "items_skipped": self.items_skipped,
+            "features_extracted": self.features_extracted,
+            "features_by_extractor": dict(self.features_by_extractor),
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+# Process pool for batch extraction (spawned lazily, once per worker process)
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_extraction_pool() -> Optional[ProcessPoolExecutor]:
+    """Get the extraction process pool (None when MATCH_ENRICH_PROCESSES=0)."""
+    from src.services.extraction import warm_extractors
+    
+    global _extraction_pool
+    if _extraction_pool is None and matching_settings.enrich_processes > 0:
+        # spawn: children must not inherit the worker's event loop and sockets;
+        # each child compiles its extractors once, when it starts
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=matching_settings.enrich_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_extractors,
+        )
+    return _extraction_pool
+
+
+async def _extract_page(
+    names: List[str],
+    extractors: List[str],
+) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """Extract characteristics for a page of names, split across the pool."""
+    from src.services.extraction import extract_characteristics_batch
+    
+    pool = _get_extraction_pool()
+    if pool is None or len(names) < 2:
+        return extract_characteristics_batch(names, extractors)
+    
+    loop = asyncio.get_running_loop()
+    size = math.ceil(len(names) / matching_settings.enrich_processes)
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(pool, extract_characteristics_batch, names[i:i + size], extractors)
+        for i in range(0, len(names), size)
+    ))
+    return [result for chunk in chunks for result in chunk]
+
+
+async def extract_item_names(
+    names: List[str],
+    extractors: List[str],
+    redis: Optional[ArqRedis] = None,
+) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """Extract characteristics for item names through the extraction cache.
+    
+    Distinct uncached names are extracted in the extraction process pool.
+    
+    Args:
+        names: Item names
+        extractors: List of extractor names to apply
+        redis: Redis connection for the shared extraction cache
+        
+    Returns:
+        For each name, (characteristics, extractor name per characteristic key)
+    """
+    from src.services.extraction import extract_characteristics_many
+    
+    return await extract_characteristics_many(
+        names,
+        extractors,
+        extract=functools.partial(_extract_page, extractors=extractors),
+        redis=redis,
+    )
+
+
+async def _write_enriched_page(
+    session: AsyncSession,
+    updates: List[Tuple[uuid.UUID, datetime, Dict[str, Any]]],
+) -> Set[uuid.UUID]:
+    """Write merged characteristics with one UPDATE ... FROM (VALUES ...).
+    
+    Rows changed since they were read (updated_at differs) are skipped so
+    a concurrent ingestion is never overwritten.
+    
+    Args:
+        session: Database session
+        updates: (item id, updated_at as read, merged characteristics)
+        
+    Returns:
+        IDs of the items updated
+    """
+    table = SupplierItem.__table__
+    enriched = values(
+        column("id", table.c.id.type),
+        column("read_at", table.c.updated_at.type),
+        column("characteristics", table.c.characteristics.type),
+        name="enriched",
+    ).data(updates)
+    
+    result = await session.execute(
+        update(SupplierItem)
+        .where(
+            and_(
+                SupplierItem.id == enriched.c.id,
+                SupplierItem.updated_at == enriched.c.read_at,
+            )
+        )
+        .values(characteristics=cast(enriched.c.characteristics, table.c.characteristics.type))
+        .returning(SupplierItem.id)
+        .execution_options(synchronize_session=False)
+    )
+    return set(result.scalars().all())
+
+
+async def enrich_items_batch_task(
+    ctx: Dict[str, Any],
+    task_id: str,
+    supplier_id: Optional[str] = None,
+    item_ids: Optional[List[str]] = None,
+    since: Optional[str] = None,
+    extractors: Optional[List[str]] = None,
+    preserve_existing: bool = True,
+    **kwargs
+) -> Dict[str, Any]:
+    """Extract and enrich characteristics for many supplier items.
+    
+    Batch counterpart of enrich_item_task: streams the selected items in
+    keyset pages of MATCH_ENRICH_PAGE_SIZE (no row locks are held),
+    extracts features for a page's distinct uncached names in the
+    extraction process pool (see extract_characteristics_many) and writes
+    the merged characteristics back with one bulk UPDATE per page.
+    
+    Args:
+        ctx: Worker context (contains Redis connection)
+        task_id: Unique task identifier for logging
+        supplier_id: Only enrich this supplier's items (UUID string)
+        item_ids: Only enrich these items (UUID strings)
+        since: Only enrich items ingested at or after this ISO timestamp
+        extractors: List of extractor names to apply (default: all)
+        preserve_existing: If True, don't overwrite existing characteristics
+        
+    Returns:
+        Dictionary with task results and metrics (see EnrichBatchMetrics);
+        features_by_extractor counts characteristics written per extractor
+    """
+    start_time = time.time()
+    metrics = EnrichBatchMetrics()
+    
+    if extractors is None:
+        extractors = ["electronics", "dimensions"]
+    
+    log = logger.bind(
+        task_id=task_id,
+        supplier_id=supplier_id,
+        item_count=len(item_ids) if item_ids else None,
+        since=since,
+        extractors=extractors,
+    )
+    
+    try:
+        conditions = []
+        if supplier_id:
+            conditions.append(SupplierItem.supplier_id == uuid.UUID(supplier_id))
+        if item_ids:
+            conditions.append(SupplierItem.id.in_([uuid.UUID(i) for i in item_ids]))
+        if since:
+            conditions.append(SupplierItem.last_ingested_at >= datetime.fromisoformat(since))
+    except ValueError as e:
+        log.error("invalid_enrich_batch_filter", error=str(e))
+        return {
+            "task_id": task_id,
+            "status": "error",
+            "error": f"Invalid filter: {e}",
+            **metrics.to_dict(),
+        }
+    
+    log.info("enrich_items_batch_task_started")
+    
+    # Import here to avoid circular imports
+    from src.services.extraction import merge_characteristics
+    page_size = matching_settings.enrich_page_size
+    last_id: Optional[uuid.UUID] = None
+    
+    try:
+        while True:
+            query = (
+                select(
+                    SupplierItem.id,
+                    SupplierItem.name,
+                    SupplierItem.characteristics,
+                    SupplierItem.updated_at,
+                )
+                .where(*conditions)
+                .order_by(SupplierItem.id)
+                .limit(page_size)
+            )
+            if last_id is not None:
+                query = query.where(SupplierItem.id > last_id)
+            
+            async with async_session_maker() as session:
+                rows = (await session.execute(query)).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            metrics.pages += 1
+            metrics.items_scanned += len(rows)
+            
+            extracted = await extract_item_names(
+                [row.name for row in rows], extractors, redis=ctx.get("redis")
+            )
+            
+            updates = []
+            added_by_item: Dict[uuid.UUID, List[str]] = {}
+            for row, (characteristics, sources) in zip(rows, extracted):
+                current = row.characteristics or {}
+                merged, added = merge_characteristics(current, characteristics, preserve_existing)
+                if merged != current:
+                    updates.append((row.id, row.updated_at, merged))
+                    added_by_item[row.id] = [sources[key] for key in added]
+            
+            if updates:
+                async with async_session_maker() as session:
+                    async with session.begin():
+                        written = await _write_enriched_page(session, updates)
+                
+                metrics.items_updated += len(written)
+                metrics.items_skipped += len(updates) - len(written)
+                for item_id in written:
+                    for source in added_by_item[item_id]:
+                        metrics.features_extracted += 1
+                        metrics.features_by_extractor[source] = (
+                            metrics.features_by_extractor.get(source, 0) + 1
+                        )
+            
+            log.debug(
+                "enrich_items_batch_page_completed",
+                page=metrics.pages,
+                items=len(rows),
+                updates=len(updates),
+            )
+            
+            if len(rows) < page_size:
+                break
+        
+        metrics.duration_seconds = time.time() - start_time
+        log.info("enrich_items_batch_task_completed", status="success", **metrics.to_dict())
+        
+        emit_matching_duration_seconds(metrics.duration_seconds, "enrich_items_batch")
+        emit_items_processed_total(metrics.items_updated, "success")
+        emit_metric("features_extracted_total", metrics.features_extracted)
+        
+        return {
+            "task_id": task_id,
+            "status": "success",
+            **metrics.to_dict(),
+        }
+    
+    except Exception as e:
+        metrics.duration_seconds = time.time() - start_time
+        log.error(
+            "enrich_items_batch_task_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            **metrics.to_dict(),
+        )
+        raise
+
+
+async def _record_verified_affinity(
+    session: AsyncSession,
+    item: SupplierItem,
+    product_id: Optional[uuid.UUID],
+) -> None:
+    """Remember a user-verified link for the item's normalized name."""
+    key = affinity_key(item.normalized_name or normalize_name(item.name))
+    if not key or not product_id or not matching_settings.affinity_cache:
+        return
+    await record_affinities(session, {
+        key: Affinity(
+            product_id=product_id,
+            confidence=Decimal("100.00"),
+            source=MatchStatus.VERIFIED_MATCH,
+        )
+    })
+
+
 async def handle_manual_match_event(
     ctx: Dict[str, Any],
     task_id: str,
@@ -1127,9 +2278,9 @@ async def handle_manual_match_event(
                         "error": "Supplier item not found",
                     }
                 
-                # Track previous product for aggregate recalculation
+                # Track previous product for aggregate maintenance
                 previous_product_id = item.product_id
-                products_to_recalc: List[uuid.UUID] = []
+                aggregate_deltas: List[AggregateDelta] = []
                 
                 # Execute action
                 if action == "link":
@@ -1139,12 +2290,16 @@ async def handle_manual_match_event(
                     item.match_score = Decimal("100.00")  # Manual = perfect confidence
                     session.add(item)
                     
-                    # Recalc new product
+                    await _record_verified_affinity(session, item, product_uuid)
+                    
+                    # Item now counts towards the new product
                     if product_uuid:
-                        products_to_recalc.append(product_uuid)
-                    # Recalc old product if it was different
+                        aggregate_deltas.append(AggregateDelta.link(
+                            product_uuid, item.current_price, item.characteristics
+                        ))
+                    # ...and no longer towards the old one if it was different
                     if previous_product_id and previous_product_id != product_uuid:
-                        products_to_recalc.append(previous_product_id)
+                        aggregate_deltas.append(AggregateDelta.unlink(previous_product_id))
                     
                     log.info(
                         "manual_link_applied",
@@ -1160,9 +2315,16 @@ async def handle_manual_match_event(
                     item.match_candidates = None
                     session.add(item)
                     
-                    # Recalc old product
+                    # The name -> product decision is no longer valid
+                    await invalidate_affinity(
+                        session,
+                        item.normalized_name or normalize_name(item.name),
+                        previous_product_id,
+                    )
+                    
+                    # Item no longer counts towards the old product
                     if previous_product_id:
-                        products_to_recalc.append(previous_product_id)
+                        aggregate_deltas.append(AggregateDelta.unlink(previous_product_id))
                     
                     log.info(
                         "manual_unlink_applied",
@@ -1180,6 +2342,12 @@ async def handle_manual_match_event(
                     # Keep product_id - just reset the match status
                     session.add(item)
                     
+                    await invalidate_affinity(
+                        session,
+                        item.normalized_name or normalize_name(item.name),
+                        item.product_id,
+                    )
+                    
                     log.info("match_reset_applied")
                 
                 elif action == "approve_match":
@@ -1188,25 +2356,32 @@ async def handle_manual_match_event(
                     item.match_status = MatchStatus.VERIFIED_MATCH
                     session.add(item)
                     
-                    # Update review queue entry if exists
-                    review_query = select(MatchReviewQueue).where(
-                        MatchReviewQueue.supplier_item_id == item_uuid
+                    # Update review queue entry if exists; it now counts
+                    # under the approved product's category
+                    category_id = await session.scalar(
+                        select(Product.category_id).where(Product.id == product_uuid)
+                    )
+                    await resolve_reviews(
+                        session,
+                        [ReviewResolution(
+                            supplier_item_id=item_uuid,
+                            supplier_id=item.supplier_id,
+                            status=ReviewStatus.APPROVED,
+                            category_id=category_id,
+                        )],
+                        reviewed_by=user_uuid,
                     )
-                    review_result = await session.execute(review_query)
-                    review_entry = review_result.scalar_one_or_none()
                     
-                    if review_entry:
-                        review_entry.status = ReviewStatus.APPROVED
-                        review_entry.reviewed_by = user_uuid
-                        review_entry.reviewed_at = datetime.now(timezone.utc)
-                        session.add(review_entry)
+                    await _record_verified_affinity(session, item, product_uuid)
                     
-                    # Recalc new product
+                    # Item now counts towards the new product
                     if product_uuid:
-                        products_to_recalc.append(product_uuid)
-                    # Recalc old product if different
+                        aggregate_deltas.append(AggregateDelta.link(
+                            product_uuid, item.current_price, item.characteristics
+                        ))
+                    # ...and no longer towards the old one if different
                     if previous_product_id and previous_product_id != product_uuid:
-                        products_to_recalc.append(previous_product_id)
+                        aggregate_deltas.append(AggregateDelta.unlink(previous_product_id))
                     
                     log.info(
                         "match_approved",
@@ -1216,11 +2391,12 @@ async def handle_manual_match_event(
                 elif action == "reject_match":
                     # Reject from review queue: create new product and link
                     product_name = new_product_name or item.name
-                    internal_sku = generate_internal_sku()
+                    internal_sku, = await allocate_skus(session, 1)
                     
                     new_product = Product(
                         internal_sku=internal_sku,
                         name=product_name,
+                        normalized_name=normalize_name(product_name),
                         status=ProductStatus.DRAFT,
                     )
                     session.add(new_product)
@@ -1233,24 +2409,27 @@ async def handle_manual_match_event(
                     item.match_candidates = None
                     session.add(item)
                     
-                    # Update review queue entry if exists
-                    review_query = select(MatchReviewQueue).where(
-                        MatchReviewQueue.supplier_item_id == item_uuid
+                    # Update review queue entry if exists (the new draft
+                    # product has no category yet)
+                    await resolve_reviews(
+                        session,
+                        [ReviewResolution(
+                            supplier_item_id=item_uuid,
+                            supplier_id=item.supplier_id,
+                            status=ReviewStatus.REJECTED,
+                            category_id=None,
+                        )],
+                        reviewed_by=user_uuid,
                     )
-                    review_result = await session.execute(review_query)
-                    review_entry = review_result.scalar_one_or_none()
                     
-                    if review_entry:
-                        review_entry.status = ReviewStatus.REJECTED
-                        review_entry.reviewed_by = user_uuid
-                        review_entry.reviewed_at = datetime.now(timezone.utc)
-                        session.add(review_entry)
+                    await _record_verified_affinity(session, item, new_product.id)
                     
-                    # Recalc new product
-                    products_to_recalc.append(new_product.id)
-                    # Recalc old product if was linked
+                    # Item now counts towards the new product only
+                    aggregate_deltas.append(AggregateDelta.link(
+                        new_product.id, item.current_price, item.characteristics
+                    ))
                     if previous_product_id:
-                        products_to_recalc.append(previous_product_id)
+                        aggregate_deltas.append(AggregateDelta.unlink(previous_product_id))
                     
                     product_uuid = new_product.id  # For response
                     
@@ -1262,14 +2441,14 @@ async def handle_manual_match_event(
                 
                 await session.commit()
                 
-                # Enqueue aggregate recalculation for affected products
-                if products_to_recalc:
+                # Queue aggregate maintenance for affected products
+                if aggregate_deltas:
                     redis: Optional[ArqRedis] = ctx.get("redis")
                     if redis:
                         await _enqueue_recalc_task(
                             redis=redis,
                             task_id=task_id,
-                            product_ids=list(set(products_to_recalc)),
+                            deltas=aggregate_deltas,
                             trigger=f"manual_{action}",
                             log=log,
                         )
@@ -1304,53 +2483,331 @@ async def handle_manual_match_event(
         raise
 
 
-async def expire_review_queue_task(
+# Review actions accepted by handle_manual_match_events_batch
+BATCH_REVIEW_ACTIONS = {
+    "approve_match": ReviewStatus.APPROVED,
+    "reject_match": ReviewStatus.REJECTED,
+}
+
+
+def _parse_review_events(
+    events: List[Dict[str, Any]],
+) -> Tuple[Dict[uuid.UUID, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Validate batch review events.
+    
+    Args:
+        events: Event dicts (supplier_item_id, action, product_id, new_product_name)
+        
+    Returns:
+        Tuple of (item UUID -> parsed event, errors); the last event per item wins
+    """
+    parsed: Dict[uuid.UUID, Dict[str, Any]] = {}
+    errors: List[Dict[str, Any]] = []
+    
+    for event in events:
+        supplier_item_id = event.get("supplier_item_id")
+        action = event.get("action")
+        product_id = event.get("product_id")
+        
+        error = None
+        item_uuid: Optional[uuid.UUID] = None
+        product_uuid: Optional[uuid.UUID] = None
+        try:
+            item_uuid = uuid.UUID(str(supplier_item_id))
+        except ValueError:
+            error = f"Invalid supplier_item_id: {supplier_item_id}"
+        if not error and action not in BATCH_REVIEW_ACTIONS:
+            error = f"Invalid action: {action}. Valid: {set(BATCH_REVIEW_ACTIONS)}"
+        if not error and action == "approve_match":
+            try:
+                product_uuid = uuid.UUID(str(product_id))
+            except ValueError:
+                error = f"product_id is required for action '{action}'"
+        
+        if error or item_uuid is None:
+            errors.append({"supplier_item_id": supplier_item_id, "error": error})
+            continue
+        
+        parsed[item_uuid] = {
+            "action": action,
+            "product_id": product_uuid,
+            "new_product_name": event.get("new_product_name"),
+        }
+    
+    return parsed, errors
+
+
+async def handle_manual_match_events_batch(
     ctx: Dict[str, Any],
     task_id: str,
+    events: List[Dict[str, Any]],
+    user_id: Optional[str] = None,
     **kwargs
 ) -> Dict[str, Any]:
-    """Expire old review queue items that have passed their expiration date.
+    """Apply many review decisions (approve_match, reject_match) in one job.
+    
+    Each event has the same effect as handle_manual_match_event with that
+    action, but the batch is applied set-based in one transaction:
+        - One locked SELECT of the items
+        - One SELECT of the approved products (existence and category)
+        - New draft products for rejections in one INSERT (SKUs allocated once)
+        - Item links in one UPDATE ... FROM (VALUES ...) (see MatchWriteBack)
+        - Review entries and their stats counts via resolve_reviews()
+        - Verified affinities in one upsert
+    and the aggregate deltas of all items are buffered once after commit.
     
-    This task runs as a cron job to mark pending review items as expired
-    when their expires_at timestamp has passed.
+    Invalid events (malformed ids, unknown items or products) are reported
+    in "errors" and skipped; the rest of the batch is applied.
     
     Args:
         ctx: Worker context (contains Redis connection)
         task_id: Unique task identifier for logging
+        events: Dicts with supplier_item_id, action and product_id
+            (approve_match) or optional new_product_name (reject_match)
+        user_id: User UUID string who reviewed the batch (for audit)
+        
+    Returns:
+        Dictionary with task results:
+            - task_id: Task identifier
+            - status: "success"
+            - approved: Items linked to the chosen product
+            - rejected: Items linked to a new draft product
+            - reviews_resolved: Review queue entries updated
+            - errors: Skipped events with the reason
+            - duration_seconds: Task duration
+    """
+    start_time = time.time()
+    
+    log = logger.bind(task_id=task_id, user_id=user_id)
+    log.info("handle_manual_match_events_batch_started", events=len(events))
+    
+    user_uuid: Optional[uuid.UUID] = None
+    if user_id:
+        try:
+            user_uuid = uuid.UUID(user_id)
+        except ValueError:
+            log.warning("invalid_user_id")
+            # Don't fail - user_id is optional for audit
+    
+    parsed, errors = _parse_review_events(events)
+    approved = rejected = reviews_resolved = 0
+    aggregate_deltas: List[AggregateDelta] = []
+    
+    try:
+        if parsed:
+            async with async_session_maker() as session:
+                async with session.begin():
+                    # Lock in id order so concurrent batches cannot deadlock
+                    items_result = await session.execute(
+                        select(SupplierItem)
+                        .where(SupplierItem.id.in_(list(parsed)))
+                        .order_by(SupplierItem.id)
+                        .with_for_update()
+                    )
+                    items = items_result.scalars().all()
+                    
+                    approved_product_ids = {
+                        event["product_id"]
+                        for event in parsed.values()
+                        if event["action"] == "approve_match"
+                    }
+                    product_categories: Dict[uuid.UUID, Optional[uuid.UUID]] = {}
+                    if approved_product_ids:
+                        products_result = await session.execute(
+                            select(Product.id, Product.category_id)
+                            .where(Product.id.in_(list(approved_product_ids)))
+                        )
+                        product_categories = dict(products_result.all())
+                    
+                    found = {item.id for item in items}
+                    errors.extend(
+                        {"supplier_item_id": str(item_uuid), "error": "Supplier item not found"}
+                        for item_uuid in parsed
+                        if item_uuid not in found
+                    )
+                    
+                    writeback = MatchWriteBack()
+                    resolutions: List[ReviewResolution] = []
+                    affinities: Dict[str, Affinity] = {}
+                    
+                    for item in items:
+                        event = parsed[item.id]
+                        
+                        if event["action"] == "approve_match":
+                            product_uuid = event["product_id"]
+                            if product_uuid not in product_categories:
+                                errors.append({
+                                    "supplier_item_id": str(item.id),
+                                    "error": f"Product not found: {product_uuid}",
+                                })
+                                continue
+                            writeback.decide(ItemDecision(
+                                item_id=item.id,
+                                match_status=MatchStatus.VERIFIED_MATCH,
+                                product_id=product_uuid,
+                                match_score=item.match_score,
+                                match_candidates=item.match_candidates,
+                            ))
+                            category_id = product_categories[product_uuid]
+                            approved += 1
+                        else:
+                            product_name = event["new_product_name"] or item.name
+                            new_product = writeback.add_product(Product(
+                                name=product_name,
+                                normalized_name=normalize_name(product_name),
+                                status=ProductStatus.DRAFT,
+                            ))
+                            product_uuid = new_product.id
+                            writeback.decide(ItemDecision(
+                                item_id=item.id,
+                                match_status=MatchStatus.VERIFIED_MATCH,
+                                product_id=product_uuid,
+                                match_score=Decimal("100.00"),
+                                match_candidates=[],
+                            ))
+                            # The new draft product has no category yet
+                            category_id = None
+                            rejected += 1
+                        
+                        resolutions.append(ReviewResolution(
+                            supplier_item_id=item.id,
+                            supplier_id=item.supplier_id,
+                            status=BATCH_REVIEW_ACTIONS[event["action"]],
+                            category_id=category_id,
+                        ))
+                        
+                        key = affinity_key(item.normalized_name or normalize_name(item.name))
+                        if key and matching_settings.affinity_cache:
+                            affinities[key] = Affinity(
+                                product_id=product_uuid,
+                                confidence=Decimal("100.00"),
+                                source=MatchStatus.VERIFIED_MATCH,
+                            )
+                        
+                        # Item now counts towards the chosen product only
+                        aggregate_deltas.append(AggregateDelta.link(
+                            product_uuid, item.current_price, item.characteristics
+                        ))
+                        if item.product_id and item.product_id != product_uuid:
+                            aggregate_deltas.append(AggregateDelta.unlink(item.product_id))
+                    
+                    await writeback.flush(session)
+                    reviews_resolved = await resolve_reviews(
+                        session, resolutions, reviewed_by=user_uuid
+                    )
+                    await record_affinities(session, affinities)
+        
+        # One coalesced aggregate update for every affected product
+        redis: Optional[ArqRedis] = ctx.get("redis")
+        if aggregate_deltas and redis:
+            await _enqueue_recalc_task(
+                redis=redis,
+                task_id=task_id,
+                deltas=aggregate_deltas,
+                trigger="manual_batch",
+                log=log,
+            )
+        
+        duration_seconds = time.time() - start_time
+        
+        log.info(
+            "handle_manual_match_events_batch_completed",
+            status="success",
+            approved=approved,
+            rejected=rejected,
+            reviews_resolved=reviews_resolved,
+            errors=len(errors),
+            duration_seconds=round(duration_seconds, 3),
+        )
+        
+        emit_matching_duration_seconds(duration_seconds, "manual_match_batch")
+        
+        return {
+            "task_id": task_id,
+            "status": "success",
+            "approved": approved,
+            "rejected": rejected,
+            "reviews_resolved": reviews_resolved,
+            "errors": errors,
+            "user_id": user_id,
+            "duration_seconds": round(duration_seconds, 3),
+        }
+    
+    except Exception as e:
+        duration_seconds = time.time() - start_time
+        log.error(
+            "handle_manual_match_events_batch_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            duration_seconds=round(duration_seconds, 3),
+        )
+        raise
+
+
+async def expire_review_queue_task(
+    ctx: Dict[str, Any],
+    task_id: Optional[str] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """Expire old review queue items that have passed their expiration date.
+    
+    This task runs hourly as a cron job to mark pending review items as
+    expired when their expires_at timestamp has passed. Items are expired
+    in chunks of MATCH_REVIEW_EXPIRE_CHUNK_SIZE, each in its own short
+    transaction (skipping rows locked by reviewers), with a pause of
+    MATCH_REVIEW_EXPIRE_PAUSE_SECONDS between chunks. Committed chunks
+    survive an interruption; the next run continues with the rest and
+    resumes the run's progress in Redis (see review_queue).
+    
+    Args:
+        ctx: Worker context (contains Redis connection)
+        task_id: Unique task identifier for logging (generated for cron runs)
         
     Returns:
         Dictionary with task results:
             - task_id: Task identifier
             - status: "success" or "error"
             - expired_count: Number of items expired
+            - chunks: Number of chunks committed
+            - resumed: Whether an interrupted run was continued
             - duration_seconds: Task duration
     """
     start_time = time.time()
+    task_id = task_id or f"expire-reviews-{int(datetime.now(timezone.utc).timestamp())}"
     
     log = logger.bind(task_id=task_id)
     log.info("expire_review_queue_task_started")
     
+    redis: Optional[ArqRedis] = ctx.get("redis")
+    chunk_size = matching_settings.review_expire_chunk_size
+    pause_seconds = matching_settings.review_expire_pause_seconds
+    
     try:
-        async with async_session_maker() as session:
-            async with session.begin():
-                # Update all pending items that have expired
-                now = datetime.now(timezone.utc)
-                
-                update_stmt = (
-                    update(MatchReviewQueue)
-                    .where(
-                        and_(
-                            MatchReviewQueue.status == ReviewStatus.PENDING,
-                            MatchReviewQueue.expires_at < now,
-                        )
-                    )
-                    .values(status=ReviewStatus.EXPIRED)
-                )
-                
-                result = await session.execute(update_stmt)
-                expired_count = result.rowcount
-                
-                await session.commit()
+        resumed = await start_review_expiration(redis, task_id) if redis else False
+        
+        # Fixed cutoff: entries expiring while the run goes wait for the next one
+        now = datetime.now(timezone.utc)
+        expired_count = 0
+        chunks = 0
+        
+        while True:
+            async with async_session_maker() as session:
+                async with session.begin():
+                    expired = await expire_review_chunk(session, now, chunk_size)
+            
+            if expired:
+                chunks += 1
+                expired_count += expired
+                if redis:
+                    await record_review_expiration_chunk(redis, expired)
+                log.debug("review_chunk_expired", chunk=chunks, expired=expired)
+            
+            if expired < chunk_size:
+                break
+            await asyncio.sleep(pause_seconds)
+        
+        if redis:
+            await finish_review_expiration(redis)
         
         duration_seconds = time.time() - start_time
         
@@ -1358,6 +2815,8 @@ async def expire_review_queue_task(
             "expire_review_queue_task_completed",
             status="success",
             expired_count=expired_count,
+            chunks=chunks,
+            resumed=resumed,
             duration_seconds=round(duration_seconds, 3),
         )
         
@@ -1369,6 +2828,8 @@ async def expire_review_queue_task(
             "task_id": task_id,
             "status": "success",
             "expired_count": expired_count,
+            "chunks": chunks,
+            "resumed": resumed,
             "duration_seconds": round(duration_seconds, 3),
         }
     
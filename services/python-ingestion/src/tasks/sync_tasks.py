@@ -20,13 +20,13 @@ from src.config import settings
 from src.db.base import async_session_maker
 from src.db.models import Supplier
 from src.services.master_sheet_ingestor import MasterSheetIngestor
+from src.services.job_priority import enqueue_jobs
 from src.services.sync_state import (
     acquire_sync_lock,
     release_sync_lock,
     set_sync_started,
     set_sync_processing_suppliers,
     set_sync_idle,
-    update_sync_progress,
     record_sync_completion,
     get_sync_trigger,
     clear_sync_trigger,
@@ -139,9 +139,17 @@ async def trigger_master_sync_task(
     3. Parse Master Sheet and get supplier configs
     4. Sync suppliers to database (create/update/deactivate)
     5. Update status to processing_suppliers
-    6. Enqueue parse_task for each active supplier
+    6. Enqueue parse_task for all active suppliers in one Redis transaction
     7. Record completion and release lock
     
+    Parse jobs of scheduled syncs are enqueued at "low" priority, those of
+    manual syncs at "normal", so file uploads ("high") are not queued
+    behind a full sync.
+    
+    The status stays processing_suppliers after the task returns: each
+    parse job counts its completion (record_sync_parse_completed) and the
+    last one sets the status back to idle.
+    
     Args:
         ctx: Worker context (contains Redis connection)
         task_id: Unique identifier for tracking the sync job
@@ -158,6 +166,7 @@ async def trigger_master_sync_task(
     """
     start_time = time.time()
     metrics = SyncMetrics()
+    parse_priority = "low" if triggered_by == "scheduled" else "normal"
     
     log = logger.bind(
         task_id=task_id,
@@ -259,36 +268,41 @@ async def trigger_master_sync_task(
             # Step 5: Get active suppliers for parsing
             active_suppliers = await _get_active_suppliers()
             
-            # Step 6: Update status to processing_suppliers
+            parse_jobs: List[Dict[str, Any]] = []
+            for supplier in active_suppliers:
+                try:
+                    parse_jobs.append(_supplier_parse_job(supplier, task_id, parse_priority))
+                except ValueError as e:
+                    metrics.errors.append(f"Failed to enqueue parse for {supplier.name}: {e}")
+                    log.warning(
+                        "parse_task_enqueue_failed",
+                        supplier_name=supplier.name,
+                        error=str(e),
+                    )
+            
+            # Step 6: Update status to processing_suppliers (parse jobs
+            # advance progress_current as they finish)
             await set_sync_processing_suppliers(
-                redis, task_id, len(active_suppliers)
+                redis, task_id, len(parse_jobs)
             )
             
-            # Step 7: Enqueue parse_task for each active supplier
+            # Step 7: Enqueue parse_task for all active suppliers at once
             log.info(
                 "enqueuing_parse_tasks",
                 active_suppliers=len(active_suppliers),
+                parse_jobs=len(parse_jobs),
+                priority=parse_priority,
             )
             
-            for idx, supplier in enumerate(active_suppliers, start=1):
+            if parse_jobs:
                 try:
-                    await _enqueue_supplier_parse(
-                        redis=redis,
-                        supplier=supplier,
-                        parent_task_id=task_id,
-                        log=log,
-                    )
-                    metrics.parse_tasks_enqueued += 1
-                    
-                    # Update progress
-                    await update_sync_progress(redis, idx, len(active_suppliers))
-                    
+                    await enqueue_jobs(redis, "parse_task", parse_jobs, parse_priority)
+                    metrics.parse_tasks_enqueued = len(parse_jobs)
                 except Exception as e:
-                    error_msg = f"Failed to enqueue parse for {supplier.name}: {e}"
-                    metrics.errors.append(error_msg)
+                    metrics.errors.append(f"Failed to enqueue parse tasks: {e}")
                     log.warning(
-                        "parse_task_enqueue_failed",
-                        supplier_name=supplier.name,
+                        "parse_tasks_enqueue_failed",
+                        parse_jobs=len(parse_jobs),
                         error=str(e),
                     )
             
@@ -319,8 +333,10 @@ async def trigger_master_sync_task(
             }
             
         finally:
-            # Always release lock and set idle
-            await set_sync_idle(redis)
+            # Always release lock; the last parse job sets the status idle
+            # (or now, if no parse job was enqueued)
+            if not metrics.parse_tasks_enqueued:
+                await set_sync_idle(redis)
             await release_sync_lock(redis, task_id)
     
     except Exception as e:
@@ -443,19 +459,23 @@ async def _get_active_suppliers() -> List[Supplier]:
         return active_suppliers
 
 
-async def _enqueue_supplier_parse(
-    redis: ArqRedis,
+def _supplier_parse_job(
     supplier: Supplier,
-    parent_task_id: str,
-    log: Any,
-) -> None:
-    """Enqueue a parse task for a supplier.
+    sync_task_id: str,
+    priority: str = "normal",
+) -> Dict[str, Any]:
+    """Build the parse_task arguments for a supplier.
     
     Args:
-        redis: ArqRedis connection
         supplier: Supplier model with configuration
-        parent_task_id: Parent sync task ID for correlation
-        log: Logger instance
+        sync_task_id: Sync task ID (correlation and progress tracking)
+        priority: Queue priority the job is enqueued at
+        
+    Returns:
+        Keyword arguments of parse_task
+        
+    Raises:
+        ValueError: If the supplier has no source_url configured
     """
     meta = supplier.meta or {}
     source_url = meta.get("source_url")
@@ -486,22 +506,19 @@ async def _enqueue_supplier_parse(
             "data_start_row": 2,
         })
     
-    # Enqueue parse_task
-    await redis.enqueue_job(
-        "parse_task",
-        task_id=task_id,
-        parser_type=parser_type,
-        supplier_name=supplier.name,
-        source_config=source_config,
-    )
+    # Per-supplier switch read by parse_task (falls back to MATCH_INLINE_ENRICHMENT)
+    inline_enrichment = meta.get("inline_enrichment")
+    if inline_enrichment is not None:
+        source_config["inline_enrichment"] = inline_enrichment
     
-    log.debug(
-        "parse_task_enqueued",
-        task_id=task_id,
-        supplier_name=supplier.name,
-        parser_type=parser_type,
-        parent_task_id=parent_task_id,
-    )
+    return {
+        "task_id": task_id,
+        "parser_type": parser_type,
+        "supplier_name": supplier.name,
+        "source_config": source_config,
+        "sync_task_id": sync_task_id,
+        "priority": priority,
+    }
 
 
 async def poll_parse_triggers(
@@ -511,7 +528,8 @@ async def poll_parse_triggers(
     """Poll for parse triggers from Bun API file uploads.
     
     This task runs every 10 seconds to check for pending parse triggers
-    set by the Bun API when files are uploaded.
+    set by the Bun API when files are uploaded. Upload parses are enqueued
+    at "high" priority unless the trigger sets another one.
     
     Args:
         ctx: Worker context (contains Redis connection)
@@ -541,23 +559,24 @@ async def poll_parse_triggers(
         parser_type = trigger.get("parser_type", "csv")
         supplier_name = trigger.get("supplier_name", "unknown")
         source_config = trigger.get("source_config", {})
+        priority = trigger.get("priority", "high")
         
         logger.info(
             "processing_parse_trigger",
             task_id=task_id,
             parser_type=parser_type,
             supplier_name=supplier_name,
+            priority=priority,
         )
         
         try:
-            # Enqueue the parse task using arq's native method
-            await redis.enqueue_job(
-                "parse_task",
-                task_id=task_id,
-                parser_type=parser_type,
-                supplier_name=supplier_name,
-                source_config=source_config,
-            )
+            await enqueue_jobs(redis, "parse_task", [{
+                "task_id": task_id,
+                "parser_type": parser_type,
+                "supplier_name": supplier_name,
+                "source_config": source_config,
+                "priority": priority,
+            }], priority)
             
             results.append({
                 "task_id": task_id,
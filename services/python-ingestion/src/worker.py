@@ -4,17 +4,22 @@ This module configures the arq worker with:
     - parse_task: Data source parsing (Google Sheets, CSV, Excel)
     - match_items_task: Product matching pipeline
     - recalc_product_aggregates_task: Aggregate recalculation
+    - flush_dirty_aggregates_task: Debounced aggregate recalculation
     - enrich_item_task: Feature extraction and enrichment
+    - enrich_items_batch_task: Paged bulk feature extraction
     - handle_manual_match_event: Manual link/unlink operations
+    - handle_manual_match_events_batch: Bulk approve/reject of review entries
     - expire_review_queue_task: Cron job to expire old review items
+    - promote_aged_queue_jobs: Cron job to age queued jobs up a priority level
 """
 from arq.connections import RedisSettings, ArqRedis
 from arq.worker import Retry
 from arq import cron
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import timedelta, datetime, timezone
 import structlog
 import asyncio
+import time
 from src.config import settings, matching_settings, configure_logging
 # Import parsers package to trigger __init__.py registration
 import src.parsers  # noqa: F401
@@ -32,10 +37,24 @@ from src.db.operations import (
 from src.tasks.matching_tasks import (
     match_items_task,
     recalc_product_aggregates_task,
+    flush_dirty_aggregates_task,
     enrich_item_task,
+    enrich_items_batch_task,
     handle_manual_match_event,
+    handle_manual_match_events_batch,
     expire_review_queue_task,
+    extract_item_names,
+    emit_metric,
 )
+from src.services.extraction import enrich_parsed_items, warm_extractors
+from src.services.sync_state import record_sync_parse_completed
+from src.services.job_priority import (
+    get_oldest_job_age_by_priority,
+    get_queue_depth_by_priority,
+    promote_aged_jobs,
+)
+from src.services.aggregation import AggregateDelta
+from src.services.recalc_buffer import push_aggregate_deltas
 # Import sync pipeline tasks
 from src.tasks.sync_tasks import (
     trigger_master_sync_task,
@@ -52,8 +71,11 @@ logger = structlog.get_logger(__name__)
 # Exponential backoff delays: [1s, 5s, 25s]
 RETRY_DELAYS = [1, 5, 25]  # seconds
 
+# Extractors applied by inline enrichment (same defaults as enrich_item_task)
+INLINE_ENRICHMENT_EXTRACTORS = ["electronics", "dimensions"]
+
 
-async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
+async def parse_task(ctx: Dict[str, Any], message: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
     """Process a parse task from the queue.
     
     This function is called by arq worker when a task is received from Redis queue.
@@ -63,6 +85,9 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
     Implements retry logic with exponential backoff (1s, 5s, 25s) and routes
     permanently failed tasks to dead letter queue after max_retries exceeded.
     
+    Tasks enqueued by a master sync (sync_task_id) count towards the sync
+    progress once they finish for good, successfully or not (not on retry).
+    
     Args:
         ctx: Worker context (contains Redis connection, job metadata)
         message: Task message dictionary (will be validated as ParseTaskMessage)
@@ -73,6 +98,7 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
             - task_id: Task identifier
             - status: "success", "partial_success", or "error"
             - items_parsed: Number of items successfully parsed
+            - features_extracted: Characteristics added by inline enrichment
             - errors: List of error messages (if any)
     
     Raises:
@@ -80,6 +106,29 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
         ParserError: If parser fails permanently (after max retries)
         DatabaseError: If database operation fails permanently (after max retries)
     """
+    sync_task_id = kwargs.get("sync_task_id") or (message or {}).get("sync_task_id")
+    
+    try:
+        result = await _run_parse_task(ctx, message, **kwargs)
+    except Retry:
+        raise
+    except Exception:
+        await _record_sync_parse_completed(ctx, sync_task_id)
+        raise
+    
+    await _record_sync_parse_completed(ctx, sync_task_id)
+    return result
+
+
+async def _record_sync_parse_completed(ctx: Dict[str, Any], sync_task_id: Optional[str]) -> None:
+    """Count a finished parse task towards its master sync's progress."""
+    redis: Optional[ArqRedis] = ctx.get("redis") if ctx else None
+    if sync_task_id and redis:
+        await record_sync_parse_completed(redis, sync_task_id)
+
+
+async def _run_parse_task(ctx: Dict[str, Any], message: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+    """Validate, parse and persist one parse task (see parse_task)."""
     # Merge message dict with kwargs (kwargs take precedence)
     task_data = {}
     if message:
@@ -176,11 +225,18 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
                 # Don't wrap it - let arq handle the failure
                 raise
         
+        # Optional inline enrichment: merge extracted features before persisting
+        features_extracted = 0
+        if parsed_items and _inline_enrichment_enabled(source_config):
+            features_extracted = await _enrich_parsed_items(ctx, parsed_items, log)
+        
         # Process parsed items and persist to database
         start_time = datetime.now(timezone.utc)
         success_count = 0
         failed_count = 0
         price_history_count = 0
+        # Price/stock changes of linked items, applied to products after commit
+        aggregate_deltas: List[AggregateDelta] = []
         
         try:
             # Get or create supplier within transaction
@@ -219,7 +275,8 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
                                 supplier_item, price_changed, is_new_item = await upsert_supplier_item(
                                     session=session,
                                     supplier_id=supplier_id,
-                                    parsed_item=parsed_item
+                                    parsed_item=parsed_item,
+                                    aggregate_deltas=aggregate_deltas,
                                 )
                                 
                                 # Create price history entry if price changed OR if it's a new item
@@ -339,6 +396,23 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
             duration_seconds=duration_seconds
         )
         
+        # Keep linked products' min_price/availability current
+        if aggregate_deltas and ctx.get("redis"):
+            try:
+                await push_aggregate_deltas(
+                    ctx["redis"],
+                    aggregate_deltas,
+                    debounce_seconds=matching_settings.recalc_debounce_seconds,
+                )
+                log.debug("recalc_deltas_buffered", delta_count=len(aggregate_deltas))
+            except Exception as recalc_err:
+                # Don't fail parse task: the next full recalculation catches up
+                log.warning(
+                    "recalc_task_enqueue_failed",
+                    error=str(recalc_err),
+                    delta_count=len(aggregate_deltas),
+                )
+        
         # Chain to matching pipeline on successful ingestion
         if status in ("success", "partial_success") and success_count > 0:
             redis: Optional[ArqRedis] = ctx.get("redis")
@@ -349,11 +423,13 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
                         "match_items_task",
                         task_id=match_task_id,
                         batch_size=matching_settings.batch_size,
+                        drain=matching_settings.drain_enabled,
                     )
                     log.info(
                         "match_task_chained",
                         match_task_id=match_task_id,
                         batch_size=matching_settings.batch_size,
+                        drain=matching_settings.drain_enabled,
                     )
                 except Exception as chain_err:
                     # Don't fail parse task if chaining fails
@@ -368,6 +444,7 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
             "items_parsed": success_count,
             "items_failed": failed_count,
             "price_history_entries": price_history_count,
+            "features_extracted": features_extracted,
             "duration_seconds": duration_seconds,
             "errors": [] if failed_count == 0 else [f"{failed_count} rows failed validation"]
         }
@@ -404,6 +481,58 @@ async def parse_task(ctx: Dict[str, Any], message: Dict[str, Any] = None, **kwar
             raise ParserError(f"Unexpected error after {max_retries} retries: {e}") from e
 
 
+def _inline_enrichment_enabled(source_config: Dict[str, Any]) -> bool:
+    """Check whether parsed items of a supplier are enriched during ingestion.
+    
+    Args:
+        source_config: Supplier source configuration (stored as supplier metadata)
+    
+    Returns:
+        The supplier's "inline_enrichment" flag if set, else MATCH_INLINE_ENRICHMENT
+    """
+    enabled = source_config.get("inline_enrichment")
+    if enabled is None:
+        return matching_settings.inline_enrichment
+    return bool(enabled)
+
+
+async def _enrich_parsed_items(ctx: Dict[str, Any], parsed_items: List[Any], log: Any) -> int:
+    """Merge features extracted from item names into parsed characteristics.
+    
+    Runs between parsing and persistence, so enriched characteristics are
+    written by the regular upsert. Characteristics read from the source are
+    preserved. Extraction failures never fail ingestion.
+    
+    Args:
+        ctx: Worker context (contains Redis connection for the extraction cache)
+        parsed_items: Parsed items (updated in place)
+        log: Structured logger instance
+    
+    Returns:
+        Number of characteristics added
+    """
+    start = time.perf_counter()
+    try:
+        extracted = await extract_item_names(
+            [item.name for item in parsed_items],
+            INLINE_ENRICHMENT_EXTRACTORS,
+            redis=ctx.get("redis"),
+        )
+        features_extracted = enrich_parsed_items(parsed_items, extracted)
+    except Exception as e:
+        # Items are persisted unenriched; enrich_items_batch_task can catch up
+        log.warning("inline_enrichment_failed", error=str(e), error_type=type(e).__name__)
+        return 0
+    
+    log.info(
+        "inline_enrichment_completed",
+        items=len(parsed_items),
+        features_extracted=features_extracted,
+        duration_seconds=round(time.perf_counter() - start, 3),
+    )
+    return features_extracted
+
+
 def _get_retry_delay(retry_count: int) -> timedelta:
     """Get exponential backoff delay for retry attempt.
     
@@ -510,7 +639,10 @@ async def monitor_queue_depth(ctx: Dict[str, Any]) -> None:
     """Periodic task to monitor queue depth and log statistics.
     
     This function runs periodically to log queue depth for monitoring.
-    It's registered as a cron job in WorkerSettings.
+    It's registered as a cron job in WorkerSettings. Queue depth and the
+    wait of the oldest queued job are also emitted as queue_depth and
+    queue_oldest_job_age_seconds metrics per priority level (alert on the
+    latter to catch starved low-priority jobs).
     
     Args:
         ctx: Worker context (contains Redis connection)
@@ -525,13 +657,21 @@ async def monitor_queue_depth(ctx: Dict[str, Any]) -> None:
         queue_name = settings.queue_name
         dlq_name = settings.dlq_name
         
-        queue_depth = await redis.llen(f"arq:queue:{queue_name}")
-        dlq_depth = await redis.llen(f"arq:queue:{dlq_name}")
+        depth_by_priority = await get_queue_depth_by_priority(redis, queue_name)
+        age_by_priority = await get_oldest_job_age_by_priority(redis, queue_name)
+        dlq_depth = await redis.scard(f"arq:dlq:{dlq_name}")
+        
+        for priority, depth in depth_by_priority.items():
+            labels = {"queue_name": queue_name, "priority": priority}
+            emit_metric("queue_depth", depth, labels)
+            emit_metric("queue_oldest_job_age_seconds", age_by_priority[priority], labels)
         
         logger.info(
             "queue_depth_monitor",
             queue_name=queue_name,
-            queue_depth=queue_depth,
+            queue_depth=sum(depth_by_priority.values()),
+            queue_depth_by_priority=depth_by_priority,
+            oldest_job_age_by_priority=age_by_priority,
             dlq_name=dlq_name,
             dlq_depth=dlq_depth
         )
@@ -539,6 +679,39 @@ async def monitor_queue_depth(ctx: Dict[str, Any]) -> None:
         logger.error("monitor_queue_depth_error", error=str(e))
 
 
+async def promote_aged_queue_jobs(ctx: Dict[str, Any]) -> None:
+    """Periodic task to move jobs that waited too long up one priority level.
+    
+    Bounds the wait of low-priority jobs while higher-priority ones keep
+    arriving (see job_priority). Registered as a cron job in WorkerSettings.
+    
+    Args:
+        ctx: Worker context (contains Redis connection)
+    """
+    try:
+        redis: Optional[ArqRedis] = ctx.get("redis")
+        if not redis:
+            logger.warning("promote_aged_queue_jobs_no_redis")
+            return
+        
+        await promote_aged_jobs(redis, settings.queue_name)
+    except Exception as e:
+        logger.error("promote_aged_queue_jobs_error", error=str(e))
+
+
+async def on_startup(ctx: Dict[str, Any]) -> None:
+    """Hook called once when the worker starts.
+    
+    Creates the shared feature extractors so their patterns are compiled
+    before the first enrichment job instead of during it.
+    
+    Args:
+        ctx: Worker context
+    """
+    extractors = warm_extractors()
+    logger.info("worker_started", extractors_warmed=extractors)
+
+
 async def on_job_end(ctx: Dict[str, Any]) -> None:
     """Hook called after each job ends (success or failure).
     
@@ -604,13 +777,17 @@ class WorkerSettings:
         - parse_task: Parse data sources (Google Sheets, CSV, Excel)
         - match_items_task: Match supplier items to products
         - recalc_product_aggregates_task: Recalculate product min_price/availability
+        - flush_dirty_aggregates_task: Recalculate products marked dirty (debounced)
         - enrich_item_task: Extract features from item names
+        - enrich_items_batch_task: Extract features for many items in pages
         - handle_manual_match_event: Process manual link/unlink events
+        - handle_manual_match_events_batch: Approve/reject many review entries
         - expire_review_queue_task: Expire old review queue items (cron)
         
     Cron Jobs:
         - monitor_queue_depth: Every 5 minutes
-        - expire_review_queue_task: Daily at midnight
+        - promote_aged_queue_jobs: Every minute
+        - expire_review_queue_task: Hourly (chunked)
     """
     
     redis_settings = RedisSettings.from_dsn(settings.redis_url)
@@ -627,23 +804,30 @@ class WorkerSettings:
         # Phase 4: Matching pipeline
         match_items_task,
         recalc_product_aggregates_task,
+        flush_dirty_aggregates_task,
         enrich_item_task,
+        enrich_items_batch_task,
         handle_manual_match_event,
+        handle_manual_match_events_batch,
         expire_review_queue_task,
         # Phase 6: Master sync pipeline
         trigger_master_sync_task,
         scheduled_sync_task,
     ]
     
-    # Register job lifecycle hooks
+    # Register worker and job lifecycle hooks
+    on_startup = on_startup
     on_job_end = on_job_end
     
     # Register cron jobs
     cron_jobs = [
         # Queue monitoring: every 5 minutes
         cron(monitor_queue_depth, minute={0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55}),
-        # Review queue expiration: daily at midnight UTC
-        cron(expire_review_queue_task, hour=0, minute=0),
+        # Priority aging: every minute, so no job waits much past the limit
+        cron(promote_aged_queue_jobs, minute=set(range(0, 60)), unique=True),
+        # Review queue expiration: hourly, so expirations are spread over the
+        # day in small chunks instead of one large update
+        cron(expire_review_queue_task, minute=20, unique=True),
         # Master sync: at configurable interval (default every 8 hours)
         # Hours are calculated from SYNC_INTERVAL_HOURS env var
         cron(
@@ -443,6 +443,7 @@ async def test_matching_pipeline_performance_1000_items(db_session: AsyncSession
     
     start_time = time.time()
     matches_found = 0
+    baseline_results = []
     
     for item in items:
         result = matcher.find_matches(
@@ -453,6 +454,7 @@ async def test_matching_pipeline_performance_1000_items(db_session: AsyncSession
             potential_threshold=70.0,
             max_candidates=5,
         )
+        baseline_results.append(result)
         
         if result.match_status.value != "unmatched":
             matches_found += 1
@@ -460,6 +462,33 @@ async def test_matching_pipeline_performance_1000_items(db_session: AsyncSession
     matching_time = time.time() - start_time
     items_per_minute = (len(items) / matching_time) * 60 if matching_time > 0 else 0
     
+    # 5b. Run the two-stage (prefilter + WRatio) matcher on the same items
+    hybrid_matcher = create_matcher("hybrid")
+    
+    start_time = time.time()
+    agreements = 0
+    
+    for item, expected in zip(items, baseline_results):
+        result = hybrid_matcher.find_matches(
+            item_name=item.name,
+            item_id=item.id,
+            products=products,
+            auto_threshold=95.0,
+            potential_threshold=70.0,
+            max_candidates=5,
+        )
+        same_status = result.match_status == expected.match_status
+        same_best = (
+            (result.best_match.product_id if result.best_match else None)
+            == (expected.best_match.product_id if expected.best_match else None)
+        )
+        if same_status and same_best:
+            agreements += 1
+    
+    hybrid_time = time.time() - start_time
+    speedup = matching_time / hybrid_time if hybrid_time > 0 else 0
+    agreement_rate = agreements / len(items) * 100
+    
     # 6. Report results
     print("\n" + "="*80)
     print("MATCHING PERFORMANCE TEST RESULTS")
@@ -469,6 +498,8 @@ async def test_matching_pipeline_performance_1000_items(db_session: AsyncSession
     print(f"Matches found:       {matches_found:,}")
     print(f"Matching time:       {matching_time:.2f} seconds")
     print(f"Throughput:          {items_per_minute:.0f} items/minute")
+    print(f"Hybrid time:         {hybrid_time:.2f} seconds ({speedup:.1f}x)")
+    print(f"Hybrid agreement:    {agreement_rate:.1f}% (status + best product)")
     print("="*80)
     
     # 7. Assertions
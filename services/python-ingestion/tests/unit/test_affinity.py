@@ -0,0 +1,127 @@
+"""Unit tests for the match affinity cache.
+
+Tests cover:
+    - name_hash / affinity_key keys
+    - load_affinities batch lookup
+    - record_affinities upsert (verified entries protected)
+    - invalidate_affinity
+"""
+import hashlib
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.db.models import MatchStatus
+from src.services.matching import (
+    Affinity,
+    affinity_key,
+    load_affinities,
+    record_affinities,
+    invalidate_affinity,
+)
+from src.services.matching.normalization import name_hash
+
+
+class TestAffinityKey:
+    """Tests for name hashing."""
+
+    def test_name_hash_is_sha256_hex(self):
+        """Test hash matches the SQL sha256 expression used by the backfill."""
+        assert name_hash("samsung 128gb") == hashlib.sha256(b"samsung 128gb").hexdigest()
+        assert len(name_hash("x")) == 64
+
+    def test_empty_name_has_no_key(self):
+        """Test empty normalized names never share an affinity entry."""
+        assert affinity_key("") is None
+        assert affinity_key(None) is None
+
+
+class TestLoadAffinities:
+    """Tests for load_affinities()."""
+
+    @pytest.mark.asyncio
+    async def test_no_keys_skips_query(self):
+        """Test batches without keys do not hit the database."""
+        session = AsyncMock()
+
+        assert await load_affinities(session, [None, None]) == {}
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_entries_by_hash(self):
+        """Test rows are returned keyed by name hash."""
+        product_id = uuid4()
+        row = MagicMock(
+            name_hash="abc",
+            product_id=product_id,
+            confidence=Decimal("97.50"),
+            source=MatchStatus.AUTO_MATCHED,
+        )
+        result = MagicMock()
+        result.all.return_value = [row]
+        session = AsyncMock()
+        session.execute.return_value = result
+
+        affinities = await load_affinities(session, ["abc", "abc", "def", None])
+
+        assert affinities == {
+            "abc": Affinity(product_id, Decimal("97.50"), MatchStatus.AUTO_MATCHED)
+        }
+        session.execute.assert_awaited_once()
+
+
+class TestRecordAffinities:
+    """Tests for record_affinities()."""
+
+    @pytest.mark.asyncio
+    async def test_empty_decisions_skip_query(self):
+        """Test nothing is written without decisions."""
+        session = AsyncMock()
+
+        assert await record_affinities(session, {}) == 0
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_single_upsert_protecting_verified_entries(self):
+        """Test decisions are upserted in one statement that keeps verified entries."""
+        session = AsyncMock()
+        decisions = {
+            "a": Affinity(uuid4(), Decimal("100.00"), MatchStatus.AUTO_MATCHED),
+            "b": Affinity(uuid4(), Decimal("96.00"), MatchStatus.AUTO_MATCHED),
+        }
+
+        assert await record_affinities(session, decisions) == 2
+
+        session.execute.assert_awaited_once()
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (name_hash) DO UPDATE" in sql
+        assert "WHERE match_affinity.source !=" in sql
+
+
+class TestInvalidateAffinity:
+    """Tests for invalidate_affinity()."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_entry_for_name_and_product(self):
+        """Test the name/product entry is deleted."""
+        session = AsyncMock()
+
+        await invalidate_affinity(session, "samsung 128gb", uuid4())
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("DELETE FROM match_affinity")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name,product_id", [("", uuid4()), ("samsung", None)])
+    async def test_noop_without_name_or_product(self, name, product_id):
+        """Test nothing is deleted without a key or a product."""
+        session = AsyncMock()
+
+        await invalidate_affinity(session, name, product_id)
+
+        session.execute.assert_not_called()
@@ -2,7 +2,9 @@
 
 Tests cover:
     - calculate_product_aggregates: single product aggregate calculation
-    - calculate_product_aggregates_batch: batch aggregate calculation
+    - calculate_product_aggregates_batch: set-based batch aggregate calculation
+    - apply_aggregate_deltas: incremental maintenance from item-level deltas
+    - upsert_supplier_item: deltas of re-parsed linked items
     - get_review_queue_stats: review queue statistics
     - Edge cases and error handling
 """
@@ -12,12 +14,18 @@ from uuid import uuid4
 from decimal import Decimal
 from datetime import datetime, timezone
 
+from sqlalchemy.dialects.postgresql import asyncpg
+
 from src.services.aggregation.service import (
+    AggregateDelta,
+    apply_aggregate_deltas,
     calculate_product_aggregates,
     calculate_product_aggregates_batch,
     get_review_queue_stats,
 )
 from src.db.models import MatchStatus, ReviewStatus
+from src.db.operations import upsert_supplier_item
+from src.models.parsed_item import ParsedSupplierItem
 
 
 class TestCalculateProductAggregates:
@@ -106,6 +114,23 @@ class TestCalculateProductAggregates:
         assert result["min_price"] is None
         assert result["availability"] is False
         assert result["linked_items_count"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_availability_uses_in_stock_column(self, mock_session):
+        """Test availability is an EXISTS on the generated in_stock column."""
+        count_result = MagicMock()
+        count_result.scalar.return_value = 1
+        update_result = MagicMock()
+        update_result.one_or_none.return_value = (Decimal("10.00"), True)
+        mock_session.execute = AsyncMock(side_effect=[count_result, update_result])
+        
+        await calculate_product_aggregates(session=mock_session, product_id=uuid4())
+        
+        stmt = mock_session.execute.call_args_list[1].args[0]
+        sql = str(stmt.compile(dialect=asyncpg.dialect()))
+        assert "availability=(EXISTS (SELECT" in sql
+        assert "AND supplier_items.in_stock)" in sql
+        assert "->>" not in sql
 
 
 class TestCalculateProductAggregatesBatch:
@@ -116,26 +141,22 @@ class TestCalculateProductAggregatesBatch:
         """Create a mock AsyncSession."""
         return AsyncMock()
     
+    @staticmethod
+    def returning(*rows):
+        """Mock result of the UPDATE ... RETURNING statement."""
+        result = MagicMock()
+        result.all.return_value = list(rows)
+        return result
+    
     @pytest.mark.asyncio
-    async def test_processes_multiple_products(self, mock_session):
-        """Test batch processing of multiple products."""
+    async def test_processes_multiple_products_in_one_statement(self, mock_session):
+        """Test batch recalculation runs a single UPDATE for all products."""
         product_ids = [uuid4(), uuid4(), uuid4()]
-        
-        # Mock each product's execution (2 calls per product: count + update)
-        mock_results = []
-        for i, _ in enumerate(product_ids):
-            count_result = MagicMock()
-            count_result.scalar.return_value = i + 1  # 1, 2, 3 linked items
-            mock_results.append(count_result)
-            
-            update_result = MagicMock()
-            update_result.one_or_none.return_value = (
-                Decimal(f"{100 - i * 10}.00"),
-                i % 2 == 0,  # Alternating availability
-            )
-            mock_results.append(update_result)
-        
-        mock_session.execute = AsyncMock(side_effect=mock_results)
+        mock_session.execute = AsyncMock(return_value=self.returning(
+            (product_ids[2], Decimal("80.00"), True, 3),
+            (product_ids[0], Decimal("100.00"), True, 1),
+            (product_ids[1], Decimal("90.00"), False, 2),
+        ))
         
         results = await calculate_product_aggregates_batch(
             session=mock_session,
@@ -143,53 +164,273 @@ class TestCalculateProductAggregatesBatch:
             trigger="auto_match",
         )
         
-        assert len(results) == 3
-        for i, result in enumerate(results):
-            assert result["product_id"] == product_ids[i]
-            assert "error" not in result
+        assert mock_session.execute.await_count == 1
+        assert [r["product_id"] for r in results] == product_ids
+        assert [r["linked_items_count"] for r in results] == [1, 2, 3]
+        assert all("error" not in r for r in results)
     
     @pytest.mark.asyncio
-    async def test_continues_on_individual_failure(self, mock_session):
-        """Test that batch continues processing after individual failures."""
-        product_ids = [uuid4(), uuid4(), uuid4()]
+    async def test_statement_groups_linked_items(self, mock_session):
+        """Test the UPDATE joins one grouped subquery filtered by ANY(ids)."""
+        mock_session.execute = AsyncMock(return_value=self.returning())
         
-        # First product: success
-        count_result1 = MagicMock()
-        count_result1.scalar.return_value = 2
-        update_result1 = MagicMock()
-        update_result1.one_or_none.return_value = (Decimal("50.00"), True)
+        await calculate_product_aggregates_batch(
+            session=mock_session,
+            product_ids=[uuid4()],
+        )
         
-        # Second product: raises exception
-        count_result2 = MagicMock()
-        count_result2.scalar.side_effect = Exception("Database connection error")
+        stmt = mock_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("UPDATE products SET min_price=linked.min_price")
+        assert "LEFT OUTER JOIN supplier_items" in sql
+        assert "WHERE products.id = ANY (" in sql
+        assert "GROUP BY products.id" in sql
+        assert "bool_or(supplier_items.in_stock)" in sql
+        assert "RETURNING products.id" in sql
+    
+    @pytest.mark.asyncio
+    async def test_unlinked_product_is_reset(self, mock_session):
+        """Test a product that lost all links gets no price and no availability."""
+        product_id = uuid4()
+        mock_session.execute = AsyncMock(
+            return_value=self.returning((product_id, None, False, 0))
+        )
         
-        # Third product: success
-        count_result3 = MagicMock()
-        count_result3.scalar.return_value = 1
-        update_result3 = MagicMock()
-        update_result3.one_or_none.return_value = (Decimal("75.00"), False)
+        results = await calculate_product_aggregates_batch(
+            session=mock_session,
+            product_ids=[product_id],
+            trigger="manual_link",
+        )
         
+        assert results == [{
+            "product_id": product_id,
+            "min_price": None,
+            "availability": False,
+            "linked_items_count": 0,
+            "trigger": "manual_link",
+        }]
+    
+    @pytest.mark.asyncio
+    async def test_missing_products_and_duplicates(self, mock_session):
+        """Test missing products get errors and duplicate ids are merged."""
+        found, missing = uuid4(), uuid4()
         mock_session.execute = AsyncMock(
-            side_effect=[
-                count_result1, update_result1,
-                count_result2,  # This will raise
-                count_result3, update_result3,
-            ]
+            return_value=self.returning((found, Decimal("50.00"), True, 2))
         )
         
         results = await calculate_product_aggregates_batch(
             session=mock_session,
-            product_ids=product_ids,
-            trigger="manual_link",
+            product_ids=[found, missing, found],
         )
         
-        assert len(results) == 3
-        # First should succeed
+        assert len(results) == 2
         assert "error" not in results[0]
-        # Second should have error
-        assert "error" in results[1]
-        # Third should succeed
-        assert "error" not in results[2]
+        assert results[1]["product_id"] == missing
+        assert results[1]["error"] == "Product not found"
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_query(self, mock_session):
+        """Test no statement is executed without product ids."""
+        assert await calculate_product_aggregates_batch(mock_session, []) == []
+        mock_session.execute.assert_not_called()
+
+
+class TestApplyAggregateDeltas:
+    """Tests for apply_aggregate_deltas function."""
+    
+    @staticmethod
+    def rows(*rows):
+        result = MagicMock()
+        result.all.return_value = list(rows)
+        result.scalars.return_value.all.return_value = list(rows)
+        return result
+    
+    @pytest.mark.parametrize("delta,expected", [
+        (AggregateDelta.link(uuid4(), Decimal("10")), False),
+        (AggregateDelta.unlink(uuid4()), True),
+        (AggregateDelta(uuid4(), Decimal("9"), Decimal("10"), was_in_stock=True), True),
+        (AggregateDelta(uuid4(), Decimal("9"), Decimal("10"), True, True), False),
+    ])
+    def test_needs_recompute(self, delta, expected):
+        """Test only unlinks and lost stock always force a recompute."""
+        assert delta.needs_recompute is expected
+    
+    def test_in_stock_representations(self):
+        """Test link deltas read in_stock like the SQL condition."""
+        pid = uuid4()
+        assert AggregateDelta.link(pid, None, {"in_stock": True}).in_stock
+        assert AggregateDelta.link(pid, None, {"in_stock": "Yes"}).in_stock
+        assert not AggregateDelta.link(pid, None, {"in_stock": "no"}).in_stock
+        assert not AggregateDelta.link(pid, None, None).in_stock
+    
+    @pytest.mark.asyncio
+    async def test_links_and_drops_apply_least_in_one_statement(self):
+        """Test new links and price drops update products incrementally."""
+        first, second = uuid4(), uuid4()
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=self.rows(
+            (first, Decimal("8.00"), True), (second, Decimal("5.00"), False),
+        ))
+        
+        results = await apply_aggregate_deltas(session, [
+            AggregateDelta.link(first, Decimal("9.00")),
+            AggregateDelta.link(first, Decimal("8.00"), {"in_stock": "yes"}),
+            AggregateDelta(second, new_price=Decimal("5.00"), old_price=Decimal("7.00")),
+        ])
+        
+        assert session.execute.await_count == 1
+        sql = str(session.execute.call_args.args[0].compile(dialect=asyncpg.dialect()))
+        assert "least(products.min_price, changes.min_price)" in sql
+        assert "products.availability OR changes.in_stock" in sql
+        assert {r["product_id"] for r in results} == {first, second}
+    
+    @pytest.mark.asyncio
+    async def test_unlink_recomputes(self):
+        """Test an unlinked product goes through the full recalculation."""
+        product_id = uuid4()
+        session = AsyncMock()
+        
+        with patch(
+            "src.services.aggregation.service.calculate_product_aggregates_batch",
+            new=AsyncMock(return_value=[{"product_id": product_id}]),
+        ) as batch:
+            await apply_aggregate_deltas(session, [
+                AggregateDelta.link(product_id, Decimal("3.00")),
+                AggregateDelta.unlink(product_id),
+            ])
+        
+        session.execute.assert_not_called()
+        assert batch.call_args.kwargs["product_ids"] == [product_id]
+    
+    @pytest.mark.asyncio
+    async def test_price_rise_recomputes_only_minimum_holders(self):
+        """Test a rise recomputes the product only if the item held its minimum."""
+        held, not_held = uuid4(), uuid4()
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[
+            self.rows(held),  # products whose min_price >= old price
+            self.rows((not_held, Decimal("1.00"), True)),
+        ])
+        
+        with patch(
+            "src.services.aggregation.service.calculate_product_aggregates_batch",
+            new=AsyncMock(return_value=[{"product_id": held}]),
+        ) as batch:
+            results = await apply_aggregate_deltas(session, [
+                AggregateDelta(held, new_price=Decimal("20"), old_price=Decimal("10")),
+                AggregateDelta(not_held, new_price=Decimal("20"), old_price=Decimal("10")),
+            ])
+        
+        assert batch.call_args.kwargs["product_ids"] == [held]
+        assert [r["product_id"] for r in results] == [not_held, held]
+
+
+class TestReparseDeltas:
+    """Tests for deltas of linked items re-parsed by upsert_supplier_item."""
+    
+    @staticmethod
+    async def upsert(existing, price, characteristics=None):
+        """Re-parse existing at price; return (collected deltas, upsert statement)."""
+        found = MagicMock()
+        found.scalar_one_or_none.return_value = existing
+        upserted = MagicMock()
+        upserted.scalar_one.return_value = existing
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=[found, upserted])
+        
+        deltas = []
+        await upsert_supplier_item(
+            session,
+            uuid4(),
+            ParsedSupplierItem(
+                supplier_sku="SKU-1",
+                name="Дрель 750W",
+                price=price,
+                characteristics=characteristics or {"in_stock": True},
+            ),
+            aggregate_deltas=deltas,
+        )
+        return deltas, session.execute.call_args_list[1].args[0]
+    
+    @staticmethod
+    def linked_item(product_id, price="10.00", status=MatchStatus.AUTO_MATCHED):
+        item = MagicMock()
+        item.product_id = product_id
+        item.match_status = status
+        item.current_price = Decimal(price)
+        item.characteristics = {"in_stock": True}
+        return item
+    
+    @pytest.mark.asyncio
+    async def test_lower_price_lowers_product_min_price(self):
+        """Test a price drop is applied to the product with LEAST."""
+        product_id = uuid4()
+        
+        deltas, _ = await self.upsert(self.linked_item(product_id), Decimal("8.00"))
+        
+        assert deltas == [AggregateDelta(product_id, Decimal("8.00"), Decimal("10.00"), True, True)]
+        session = AsyncMock()
+        session.execute = AsyncMock(
+            return_value=TestApplyAggregateDeltas.rows((product_id, Decimal("8.00"), True))
+        )
+        results = await apply_aggregate_deltas(session, deltas)
+        
+        sql = str(session.execute.call_args.args[0].compile(dialect=asyncpg.dialect()))
+        assert "least(products.min_price, changes.min_price)" in sql
+        assert results[0]["min_price"] == Decimal("8.00")
+    
+    @pytest.mark.asyncio
+    async def test_higher_price_recomputes_product(self):
+        """Test a price rise of the item holding the minimum recomputes the product."""
+        product_id = uuid4()
+        
+        deltas, _ = await self.upsert(self.linked_item(product_id), Decimal("12.00"))
+        
+        assert deltas[0].price_rose
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=TestApplyAggregateDeltas.rows(product_id))
+        with patch(
+            "src.services.aggregation.service.calculate_product_aggregates_batch",
+            new=AsyncMock(return_value=[{"product_id": product_id, "min_price": Decimal("11.00")}]),
+        ) as batch:
+            results = await apply_aggregate_deltas(session, deltas)
+        
+        assert batch.call_args.kwargs["product_ids"] == [product_id]
+        assert results[0]["min_price"] == Decimal("11.00")
+    
+    @pytest.mark.asyncio
+    async def test_lost_stock_is_a_delta(self):
+        """Test a stock change at the same price still produces a delta."""
+        product_id = uuid4()
+        
+        deltas, _ = await self.upsert(
+            self.linked_item(product_id), Decimal("10.00"), {"in_stock": False}
+        )
+        
+        assert len(deltas) == 1 and deltas[0].needs_recompute
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("product_id,status", [
+        (uuid4(), MatchStatus.AUTO_MATCHED),  # unchanged price and stock
+        (None, MatchStatus.UNMATCHED),
+        (uuid4(), MatchStatus.POTENTIAL_MATCH),
+    ])
+    async def test_no_delta(self, product_id, status):
+        """Test unchanged and non-contributing items produce no delta."""
+        price = "10.00" if status == MatchStatus.AUTO_MATCHED else "5.00"
+        item = self.linked_item(product_id, status=status)
+        
+        deltas, _ = await self.upsert(item, Decimal(price))
+        
+        assert deltas == []
+    
+    @pytest.mark.asyncio
+    async def test_reparse_keeps_product_link(self):
+        """Test the upsert does not overwrite product_id with NULL."""
+        _, stmt = await self.upsert(self.linked_item(uuid4()), Decimal("8.00"))
+        
+        sql = str(stmt.compile(dialect=asyncpg.dialect()))
+        assert "product_id = coalesce(excluded.product_id, supplier_items.product_id)" in sql
 
 
 class TestGetReviewQueueStats:
@@ -0,0 +1,201 @@
+"""Unit tests for extraction-derived attribute blocking.
+
+Tests cover:
+    - parse_blocking_attributes validation
+    - name_attributes extraction of the configured attributes
+    - attributes_conflict semantics (missing attributes never conflict)
+    - ProductIndex.blocked views, including drafts added afterwards
+    - Matchers never returning blocked products as candidates
+"""
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.services.matching import (
+    BlockedProducts,
+    EmbeddingMatcher,
+    MatchStatusEnum,
+    ProductIndex,
+    RapidFuzzMatcher,
+    TwoStageMatcher,
+    attributes_conflict,
+    name_attributes,
+    parse_blocking_attributes,
+)
+
+KEYS = ("storage_gb", "memory_gb", "power_watts")
+
+
+@dataclass
+class Product:
+    id: UUID
+    name: str
+    category_id: Optional[UUID] = None
+    normalized_name: Optional[str] = None
+
+
+def _catalog(*names):
+    return ProductIndex([Product(uuid4(), name) for name in names], blocking_attributes=KEYS)
+
+
+class TestParseBlockingAttributes:
+    """Tests for parse_blocking_attributes()."""
+
+    def test_parses_list(self):
+        """Test comma-separated names are parsed in order."""
+        assert parse_blocking_attributes(" storage_gb, memory_gb ,") == ("storage_gb", "memory_gb")
+
+    def test_empty_disables(self):
+        """Test an empty value yields no attributes."""
+        assert parse_blocking_attributes("") == ()
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes are rejected."""
+        with pytest.raises(ValueError, match="Unknown blocking attributes"):
+            parse_blocking_attributes("storage_gb,color")
+
+
+class TestNameAttributes:
+    """Tests for name_attributes() and attributes_conflict()."""
+
+    def test_reads_configured_attributes(self):
+        """Test only the requested attributes are returned."""
+        assert name_attributes("Дрель Makita 750W 220V", KEYS) == {"power_watts": 750}
+        assert name_attributes("Samsung Galaxy A54 128GB", KEYS) == {"storage_gb": 128}
+        assert name_attributes("Samsung Galaxy A54", KEYS) == {}
+
+    def test_conflict(self):
+        """Test only a shared attribute with different values conflicts."""
+        assert attributes_conflict({"storage_gb": 128}, {"storage_gb": 256})
+        assert not attributes_conflict({"storage_gb": 128}, {"storage_gb": 128})
+        assert not attributes_conflict({"storage_gb": 128}, {})
+        assert not attributes_conflict({"storage_gb": 128}, {"memory_gb": 8})
+
+
+class TestProductIndexBlocked:
+    """Tests for ProductIndex.blocked()."""
+
+    def test_excludes_conflicting_products(self):
+        """Test products with a different value are left out; unknown values stay."""
+        catalog = _catalog(
+            "Samsung Galaxy A54 128GB",
+            "Samsung Galaxy A54 256GB",
+            "Samsung Galaxy A54",
+        )
+
+        blocked = catalog.blocked({"storage_gb": 128})
+
+        assert isinstance(blocked, BlockedProducts)
+        assert set(blocked.excluded) == {1}
+        assert len(blocked) == 2
+        assert [p.name for p in blocked] == ["Samsung Galaxy A54 128GB", "Samsung Galaxy A54"]
+
+    def test_blocked_is_a_sequence(self):
+        """Test len(), indexing, slicing and iteration share one index space."""
+        catalog = _catalog(
+            "Samsung Galaxy A54 256GB",
+            "Samsung Galaxy A54 128GB",
+            "Samsung Galaxy A54",
+        )
+
+        blocked = catalog.blocked({"storage_gb": 128})
+
+        assert [blocked[i] for i in range(len(blocked))] == list(blocked)
+        assert blocked[-1].name == "Samsung Galaxy A54"
+        assert blocked[:1] == [catalog[1]]
+        assert blocked.index(catalog[2]) == 1
+        assert blocked.select_names(catalog.names) == [catalog.names[1], catalog.names[2]]
+
+    def test_no_conflict_returns_index(self):
+        """Test the index itself is returned when nothing is blocked."""
+        catalog = _catalog("Samsung Galaxy A54 128GB", "Samsung Galaxy A54")
+
+        assert catalog.blocked({"storage_gb": 128}) is catalog
+        assert catalog.blocked({}) is catalog
+
+    def test_disabled(self):
+        """Test an index without blocking attributes never blocks."""
+        catalog = ProductIndex([Product(uuid4(), "Samsung Galaxy A54 256GB")])
+
+        assert catalog.blocked({"storage_gb": 128}) is catalog
+
+    def test_products_added_after_first_use(self):
+        """Test drafts added during the batch are blocked too."""
+        catalog = _catalog("Samsung Galaxy A54 128GB")
+        catalog.blocked({"storage_gb": 128})
+
+        catalog.add(Product(uuid4(), "Samsung Galaxy A54 256GB"))
+
+        assert set(catalog.blocked({"storage_gb": 128}).excluded) == {1}
+
+    def test_product_attributes_reused_across_batches(self):
+        """Test a later batch's index does not re-extract product names."""
+        products = [
+            Product(uuid4(), "Samsung Galaxy A54 128GB"),
+            Product(uuid4(), "Samsung Galaxy A54 256GB"),
+        ]
+        ProductIndex(products, blocking_attributes=KEYS).blocked({"storage_gb": 128})
+
+        with patch(
+            "src.services.matching.attributes.name_attributes", wraps=name_attributes,
+        ) as extract:
+            blocked = ProductIndex(products, blocking_attributes=KEYS).blocked({"storage_gb": 128})
+
+        assert extract.call_count == 0
+        assert set(blocked.excluded) == {1}
+        assert 1 in blocked.excluded and 0 not in blocked.excluded
+
+    def test_renamed_product_is_re_extracted(self):
+        """Test cached attributes follow a product's new name."""
+        product = Product(uuid4(), "Samsung Galaxy A54 128GB")
+        _ = ProductIndex([product], blocking_attributes=KEYS).blocked({"storage_gb": 256})
+
+        product.name = "Samsung Galaxy A54 256GB"
+        catalog = ProductIndex([product], blocking_attributes=KEYS)
+
+        assert catalog.blocked({"storage_gb": 256}) is catalog
+
+
+@pytest.mark.parametrize("matcher", [
+    RapidFuzzMatcher(),
+    TwoStageMatcher(),
+    EmbeddingMatcher(shortlist_size=5),
+], ids=["rapidfuzz", "hybrid", "embedding"])
+class TestMatchersWithBlocking:
+    """Matchers must not return blocked products."""
+
+    def test_other_variant_not_auto_matched(self, matcher):
+        """Test a 128GB item never matches the 256GB product."""
+        catalog = _catalog(
+            "Samsung Galaxy A54 256GB Black",
+            "Apple iPhone 15 Pro 256GB",
+            "Makita Drill 750W",
+        )
+        item_name = "Samsung Galaxy A54 128GB Black"
+
+        unblocked = matcher.find_matches(item_name, uuid4(), catalog)
+        blocked = matcher.find_matches(
+            item_name, uuid4(), catalog.blocked(name_attributes(item_name, KEYS))
+        )
+
+        assert unblocked.best_match.product_name == "Samsung Galaxy A54 256GB Black"
+        assert blocked.match_status == MatchStatusEnum.UNMATCHED
+        assert blocked.candidates == []
+
+    def test_same_variant_matches(self, matcher):
+        """Test the matching variant is still found in a blocked view."""
+        catalog = _catalog(
+            "Samsung Galaxy A54 256GB Black",
+            "Samsung Galaxy A54 128GB Black",
+        )
+        item_name = "Samsung Galaxy A54 128GB Black"
+
+        result = matcher.find_matches(
+            item_name, uuid4(), catalog.blocked(name_attributes(item_name, KEYS))
+        )
+
+        assert result.match_status == MatchStatusEnum.AUTO_MATCHED
+        assert [c.product_name for c in result.candidates] == ["Samsung Galaxy A54 128GB Black"]
@@ -0,0 +1,110 @@
+"""Unit tests for the batch product catalog and near-duplicate clustering.
+
+Tests cover:
+    - ProductIndex incremental insertion, id lookup and cached names
+    - Matchers reading cached names from a ProductIndex
+    - cluster_names greedy leader clustering
+"""
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+from src.services.matching import (
+    ProductIndex,
+    RapidFuzzMatcher,
+    MatchStatusEnum,
+    cluster_names,
+    normalize_name,
+)
+
+
+@dataclass
+class Product:
+    id: UUID
+    name: str
+    category_id: Optional[UUID] = None
+    normalized_name: Optional[str] = None
+
+
+class TestProductIndex:
+    """Tests for ProductIndex."""
+
+    def test_add_caches_scored_name(self):
+        """Test names are computed once, on insertion."""
+        catalog = ProductIndex([Product(uuid4(), "Samsung Galaxy A54 128GB")])
+        draft = Product(uuid4(), "iPhone 15 Pro", normalized_name="iphone 15 pro")
+
+        catalog.add(draft)
+
+        assert len(catalog) == 2
+        assert catalog[1] is draft
+        assert catalog.names == [normalize_name("Samsung Galaxy A54 128GB"), "iphone 15 pro"]
+        assert catalog.get(draft.id) is draft
+        assert catalog.get(None) is None
+
+    def test_raw_names_without_preprocessing(self):
+        """Test raw names are cached when preprocessing is disabled."""
+        catalog = ProductIndex([Product(uuid4(), "Samsung  A54")], use_preprocessing=False)
+
+        assert catalog.names == ["Samsung  A54"]
+
+    def test_matcher_uses_cached_names(self):
+        """Test find_matches does not re-derive names from a ProductIndex."""
+        product = Product(uuid4(), "Samsung Galaxy A54 128GB")
+        catalog = ProductIndex([product])
+        matcher = RapidFuzzMatcher()
+
+        with patch("src.services.matching.matcher.scored_name") as scored:
+            result = matcher.find_matches(
+                item_name="Samsung Galaxy A54 128GB",
+                item_id=uuid4(),
+                products=catalog,
+            )
+
+        scored.assert_not_called()
+        assert result.match_status == MatchStatusEnum.AUTO_MATCHED
+        assert result.best_match.product_id == product.id
+
+    def test_added_products_are_matchable(self):
+        """Test a draft added mid-batch is matched by later items."""
+        catalog = ProductIndex([Product(uuid4(), "Apple iPhone 15")])
+        draft = Product(uuid4(), "Xiaomi Redmi Note 13 Pro 256GB")
+        matcher = RapidFuzzMatcher()
+
+        catalog.add(draft)
+        result = matcher.find_matches("Xiaomi Redmi Note 13 Pro 256GB", uuid4(), catalog)
+
+        assert result.best_match.product_id == draft.id
+
+
+class TestClusterNames:
+    """Tests for cluster_names()."""
+
+    def test_near_duplicates_share_leader(self):
+        """Test near-duplicates point to the first item of their group."""
+        names = [
+            "xiaomi redmi note 13 pro 256gb",
+            "apple iphone 15",
+            "xiaomi redmi note 13 pro 256gb black",
+            "xiaomi redmi note 13 pro 256gb",
+        ]
+
+        clusters = cluster_names(names, threshold=90.0)
+
+        assert [leader for leader, _ in clusters] == [0, 1, 0, 0]
+        assert clusters[0] == (0, 100.0)
+        assert clusters[3] == (0, 100.0)
+        assert 90.0 <= clusters[2][1] < 100.0
+
+    def test_distinct_names_are_leaders(self):
+        """Test names below the threshold form their own clusters."""
+        clusters = cluster_names(["samsung a54", "samsung a34"], threshold=99.0)
+
+        assert [leader for leader, _ in clusters] == [0, 1]
+
+    def test_empty_names_never_cluster(self):
+        """Test empty names are not grouped together."""
+        assert cluster_names(["", "", "x"], threshold=50.0) == [
+            (0, 100.0), (1, 100.0), (2, 100.0),
+        ]
@@ -70,6 +70,9 @@ def db_session():
             if isinstance(column.type, postgresql.JSONB):
                 # Replace JSONB with JSON for SQLite compatibility
                 column.type = JSON()
+            elif isinstance(column.type, postgresql.ARRAY):
+                # SQLite has no array type; store as JSON list
+                column.type = JSON()
             elif isinstance(column.type, SQLEnum):
                 # Replace PostgreSQL Enum with String for SQLite compatibility
                 # SQLite doesn't support native enums well, so we use String
@@ -0,0 +1,186 @@
+"""Unit tests for batch enrichment.
+
+Tests cover:
+    - extract_characteristics_batch parity with extract_all_features
+    - merge_characteristics preserve_existing semantics
+    - enrich_items_batch_task paging, bulk write-back and per-extractor counts
+    - _write_enriched_page SQL
+"""
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.services.extraction import (
+    extract_all_features,
+    extract_characteristics_batch,
+    merge_characteristics,
+)
+from src.tasks import matching_tasks
+from src.tasks.matching_tasks import (
+    _extract_page,
+    _write_enriched_page,
+    enrich_items_batch_task,
+)
+
+
+NAMES = [
+    "Дрель Bosch 220V 750W",
+    "Samsung Galaxy 8GB RAM 256GB",
+    "Коробка 30x20x10 см 1.5 кг",
+    "Без характеристик",
+]
+
+
+class TestExtractCharacteristicsBatch:
+    """Tests for extract_characteristics_batch()."""
+
+    def test_matches_single_item_extraction(self):
+        """Test batch output equals extract_all_features per text."""
+        results = extract_characteristics_batch(NAMES)
+
+        for name, (characteristics, _) in zip(NAMES, results):
+            assert characteristics == extract_all_features(name).to_characteristics()
+
+    def test_sources_name_extractor_per_key(self):
+        """Test each characteristic is attributed to its extractor."""
+        (_, sources), = extract_characteristics_batch(["Дрель 220V 1.5 кг"])
+
+        assert sources == {"voltage": "electronics", "weight_kg": "dimensions"}
+
+    @pytest.mark.asyncio
+    async def test_process_pool_split(self):
+        """Test a page split across processes keeps the item order."""
+        with patch("src.tasks.matching_tasks.matching_settings") as settings, \
+             patch("src.tasks.matching_tasks._extraction_pool", new=None):
+            settings.enrich_processes = 2
+            try:
+                results = await _extract_page(NAMES, ["electronics", "dimensions"])
+            finally:
+                matching_tasks._extraction_pool.shutdown()
+
+        assert results == extract_characteristics_batch(NAMES, ["electronics", "dimensions"])
+
+
+class TestMergeCharacteristics:
+    """Tests for merge_characteristics()."""
+
+    def test_preserve_existing_only_fills_gaps(self):
+        """Test existing values win, None values are filled."""
+        merged, added = merge_characteristics(
+            {"voltage": 110, "power_watts": None},
+            {"voltage": 220, "power_watts": 750},
+            preserve_existing=True,
+        )
+
+        assert merged == {"voltage": 110, "power_watts": 750}
+        assert added == ["power_watts"]
+
+    def test_overwrite(self):
+        """Test extracted values overwrite when not preserving."""
+        merged, added = merge_characteristics({"voltage": 110}, {"voltage": 220}, False)
+
+        assert merged == {"voltage": 220}
+        assert added == ["voltage"]
+
+
+class TestEnrichItemsBatchTask:
+    """Tests for enrich_items_batch_task()."""
+
+    @staticmethod
+    def row(name, characteristics=None):
+        return SimpleNamespace(
+            id=uuid4(),
+            name=name,
+            characteristics=characteristics or {},
+            updated_at=datetime.now(timezone.utc),
+        )
+
+    @pytest.fixture
+    def db(self):
+        """Session maker whose reads return the queued pages."""
+        session = MagicMock()
+        session.begin = MagicMock(return_value=AsyncMock())
+        pages = []
+
+        async def execute(stmt):
+            result = MagicMock()
+            result.all.return_value = pages.pop(0) if pages else []
+            return result
+
+        session.execute = execute
+
+        @asynccontextmanager
+        async def maker():
+            yield session
+
+        with patch("src.tasks.matching_tasks.async_session_maker", new=maker), \
+             patch("src.tasks.matching_tasks.matching_settings") as settings:
+            settings.enrich_page_size = 2
+            settings.enrich_processes = 0
+            yield pages
+
+    @pytest.mark.asyncio
+    async def test_pages_and_counts_per_extractor(self, db):
+        """Test pages are written in bulk and features counted per extractor."""
+        drill = self.row("Дрель 220V 750W")
+        box = self.row("Коробка 1.5 кг", {"weight_kg": 2.0})
+        plain = self.row("Без характеристик")
+        db.extend([[drill, box], [plain]])
+        writes = []
+
+        async def write(session, updates):
+            writes.append(updates)
+            return {item_id for item_id, _, _ in updates}
+
+        with patch("src.tasks.matching_tasks._write_enriched_page", new=write):
+            result = await enrich_items_batch_task({}, task_id="enrich-1", supplier_id=str(uuid4()))
+
+        assert result["status"] == "success"
+        assert result["pages"] == 2
+        assert result["items_scanned"] == 3
+        # The box keeps its weight (preserve_existing) and needs no write
+        assert [[u[0] for u in page] for page in writes] == [[drill.id]]
+        assert result["features_by_extractor"] == {"electronics": 2}
+        assert result["features_extracted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrently_changed_rows_are_skipped(self, db):
+        """Test rows whose updated_at changed are reported as skipped."""
+        db.append([self.row("Дрель 220V")])
+
+        with patch("src.tasks.matching_tasks._write_enriched_page", new=AsyncMock(return_value=set())):
+            result = await enrich_items_batch_task({}, task_id="enrich-2")
+
+        assert result["items_updated"] == 0
+        assert result["items_skipped"] == 1
+        assert result["features_by_extractor"] == {}
+
+    @pytest.mark.asyncio
+    async def test_invalid_filter(self, db):
+        """Test a malformed filter fails without touching the database."""
+        result = await enrich_items_batch_task({}, task_id="enrich-3", since="yesterday")
+
+        assert result["status"] == "error"
+
+
+class TestWriteEnrichedPage:
+    """Tests for _write_enriched_page()."""
+
+    @pytest.mark.asyncio
+    async def test_single_update_guarded_by_updated_at(self):
+        """Test the page is written with one UPDATE ... FROM (VALUES)."""
+        session = AsyncMock()
+        session.execute.return_value.scalars = MagicMock()
+
+        await _write_enriched_page(session, [(uuid4(), datetime.now(timezone.utc), {"voltage": 220})])
+
+        sql = str(session.execute.call_args.args[0].compile(dialect=asyncpg.dialect()))
+        assert sql.startswith("UPDATE supplier_items SET characteristics=CAST(enriched.characteristics AS")
+        assert "FROM (VALUES" in sql
+        assert "supplier_items.updated_at = enriched.read_at" in sql
+        assert "RETURNING supplier_items.id" in sql
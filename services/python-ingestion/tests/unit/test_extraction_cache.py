@@ -0,0 +1,170 @@
+"""Unit tests for memoized feature extraction.
+
+Tests cover:
+    - ExtractionCache LRU eviction and counters
+    - extract_characteristics caching per name
+    - extract_characteristics_many deduplication and Redis sharing
+    - extractor_fingerprint invalidation on pattern changes
+"""
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.extraction import (
+    ElectronicsExtractor,
+    ExtractionCache,
+    extract_characteristics,
+    extract_characteristics_batch,
+    extract_characteristics_many,
+    extractor_fingerprint,
+)
+from src.services.extraction.cache import extraction_key
+
+EXTRACTORS = ["electronics", "dimensions"]
+
+
+@pytest.fixture
+def cache():
+    """Fresh worker-wide cache."""
+    fresh = ExtractionCache(maxsize=100)
+    with patch("src.services.extraction.cache._cache", new=fresh):
+        yield fresh
+
+
+class FakeRedis:
+    """Minimal Redis: MGET and pipelined SET."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        redis = self
+        pipe = MagicMock()
+        pipe.set = lambda key, value, ex=None: redis.data.__setitem__(key, value)
+
+        async def execute():
+            return []
+
+        pipe.execute = execute
+        return pipe
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unused entry is evicted when full."""
+        cache = ExtractionCache(maxsize=2)
+        cache.put(EXTRACTORS, "a", ({}, {}))
+        cache.put(EXTRACTORS, "b", ({}, {}))
+        cache.get(EXTRACTORS, "a")
+        cache.put(EXTRACTORS, "c", ({}, {}))
+
+        assert cache.get(EXTRACTORS, "b") is None
+        assert cache.get(EXTRACTORS, "a") is not None
+        assert len(cache) == 2
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_keyed_by_extractors(self):
+        """Test results for different extractor lists are separate."""
+        cache = ExtractionCache(maxsize=10)
+        cache.put(["electronics"], "a", ({"voltage": 220}, {"voltage": "electronics"}))
+
+        assert cache.get(["dimensions"], "a") is None
+
+    def test_disabled(self):
+        """Test maxsize 0 caches nothing."""
+        cache = ExtractionCache(maxsize=0)
+        cache.put(EXTRACTORS, "a", ({}, {}))
+
+        assert len(cache) == 0
+
+
+class TestExtractCharacteristics:
+    """Tests for extract_characteristics()."""
+
+    def test_extracts_once_per_name(self, cache):
+        """Test repeated names are answered from the cache."""
+        with patch(
+            "src.services.extraction.cache.extract_characteristics_batch",
+            wraps=extract_characteristics_batch,
+        ) as batch:
+            first = extract_characteristics("Дрель 220V 750W", EXTRACTORS)
+            second = extract_characteristics("Дрель 220V 750W", EXTRACTORS)
+
+        assert batch.call_count == 1
+        assert first == second == extract_characteristics_batch(["Дрель 220V 750W"], EXTRACTORS)[0]
+
+
+class TestExtractCharacteristicsMany:
+    """Tests for extract_characteristics_many()."""
+
+    @staticmethod
+    def extractor(calls):
+        async def extract(names):
+            calls.append(list(names))
+            return extract_characteristics_batch(names, EXTRACTORS)
+        return extract
+
+    @pytest.mark.asyncio
+    async def test_extracts_distinct_uncached_names(self, cache):
+        """Test each distinct name is extracted once, in one call."""
+        calls = []
+        names = ["Дрель 220V", "Коробка 1.5 кг", "Дрель 220V"]
+
+        results = await extract_characteristics_many(names, EXTRACTORS, self.extractor(calls))
+        again = await extract_characteristics_many(names, EXTRACTORS, self.extractor(calls))
+
+        assert calls == [["Дрель 220V", "Коробка 1.5 кг"]]
+        assert results == again == extract_characteristics_batch(names, EXTRACTORS)
+
+    @pytest.mark.asyncio
+    async def test_shared_through_redis(self, cache):
+        """Test a worker reuses results another worker stored in Redis."""
+        redis = FakeRedis()
+        calls = []
+        names = ["Дрель 220V", "Коробка 30x20x10 см"]
+
+        with patch("src.services.extraction.cache.matching_settings") as settings:
+            settings.extraction_cache_redis = True
+            settings.extraction_cache_ttl_seconds = 60
+            await extract_characteristics_many(names, EXTRACTORS, self.extractor(calls), redis=redis)
+            cache.clear()  # another worker: empty LRU
+            results = await extract_characteristics_many(names, EXTRACTORS, self.extractor(calls), redis=redis)
+
+        assert calls == [names]
+        assert results == extract_characteristics_batch(names, EXTRACTORS)
+        stored = json.loads(redis.data[extraction_key(EXTRACTORS, names[1])])
+        assert stored[0]["dimensions_cm"] == {"length": 30.0, "width": 20.0, "height": 10.0}
+
+    @pytest.mark.asyncio
+    async def test_redis_disabled_by_default(self, cache):
+        """Test nothing is written to Redis unless enabled."""
+        redis = FakeRedis()
+
+        await extract_characteristics_many(["Дрель 220V"], EXTRACTORS, self.extractor([]), redis=redis)
+
+        assert redis.data == {}
+
+
+class TestExtractorFingerprint:
+    """Tests for extractor_fingerprint()."""
+
+    def test_changes_with_patterns(self):
+        """Test a pattern change yields a new fingerprint (and cache keys)."""
+        extractor_fingerprint.cache_clear()
+        before = extractor_fingerprint()
+        key = extraction_key(EXTRACTORS, "Дрель 220V")
+        try:
+            with patch.object(ElectronicsExtractor, "VOLTAGE_PATTERNS", [r"(\d+)\s*v"]):
+                extractor_fingerprint.cache_clear()
+                assert extractor_fingerprint() != before
+                assert extraction_key(EXTRACTORS, "Дрель 220V") != key
+        finally:
+            extractor_fingerprint.cache_clear()
+
+        assert extractor_fingerprint() == before
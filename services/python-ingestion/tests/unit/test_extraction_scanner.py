@@ -0,0 +1,137 @@
+"""Unit tests for the single-pass extraction pattern scanner.
+
+Tests cover:
+    - PatternScanner: leftmost matches identical to per-pattern search()
+    - Extractors: features identical to the per-pattern search() extraction
+      (differential test over a generated corpus of product names)
+    - Anchor validation
+"""
+import random
+import re
+
+import pytest
+
+from src.services.extraction import DimensionsExtractor, ElectronicsExtractor, PatternScanner
+
+# Fragments of product names, including the awkward cases for a tokenizer:
+# numbers starting mid-run, decimal chains, units that start keywords,
+# overlapping keywords and Cyrillic units
+FRAGMENTS = [
+    "Samsung", "Galaxy", "Дрель", "ударная", "Black", "Pro", "Max", "x", "-", ",", ".",
+    "220V", "110 V", "220 volt", "220вольт", "220-240V", "220 – 240 В", "AC 220", "AC220V",
+    "750W", "1500Вт", "750 watt", "1.5kW", "2,2 кВт", "HP 2", "2 HP", "1.5hp",
+    "128GB", "1TB", "2 ТБ", "512 GB SSD", "SSD 512GB", "HDD 1000 GB", "NVMe 256GB", "512 HDD",
+    "8GB RAM", "16 GB DDR4", "DDR4 16GB", "RAM 32GB", "ОЗУ 8ГБ", "ramemory 8gb", "memory 4 gb",
+    "2.5kg", "2,5 кг", "2500g", "500 г", "5.5 lbs", "3 pounds", "вес: 2кг", "weight 1.2",
+    "масса 300г", "30x20x10cm", "30 x 20 x 10 см", "300*200*100 mm", "12x8x4 in",
+    "30×20×10", "L30 W20 H10", "Д30 Ш20 В10", "l: 5 w: 4 h: 3",
+    "12345V", "123456GB", "1.5.3kg", "1,2,3x4x5", "99999W", "0V", "00GB", "3.kg",
+    "Kelvin 5KG", "2 x", "10", "2024", "v2", "GB", "кг", "вт",
+]
+
+
+def _corpus(size: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(size):
+        parts = rng.choices(FRAGMENTS, k=rng.randint(1, 8))
+        separator = rng.choice([" ", "", "  ", ", "])
+        yield separator.join(parts)
+
+
+CORPUS = list(_corpus(5000, seed=41))
+
+
+class SearchScanner:
+    """Reference scanner: one search() per pattern (the previous extraction)."""
+
+    def __init__(self, slots):
+        self._slots = {
+            slot: [re.compile(pattern, re.IGNORECASE) for pattern, _ in patterns]
+            for slot, patterns in slots.items()
+        }
+
+    def scan(self, text):
+        return {
+            slot: [pattern.search(text) for pattern in patterns]
+            for slot, patterns in self._slots.items()
+        }
+
+
+def _slots(extractor):
+    if isinstance(extractor, ElectronicsExtractor):
+        return {
+            "voltage": list(zip(extractor.VOLTAGE_PATTERNS, extractor.VOLTAGE_ANCHORS)),
+            "power": list(zip(extractor.POWER_PATTERNS, extractor.POWER_ANCHORS)),
+            "storage": list(zip(extractor.STORAGE_PATTERNS, extractor.STORAGE_ANCHORS)),
+            "memory": list(zip(extractor.MEMORY_PATTERNS, extractor.MEMORY_ANCHORS)),
+        }
+    return {
+        "weight": list(zip(extractor.WEIGHT_PATTERNS, extractor.WEIGHT_ANCHORS)),
+        "dimensions": list(zip(extractor.DIMENSION_PATTERNS, extractor.DIMENSION_ANCHORS)),
+    }
+
+
+def _spans(scan):
+    return {
+        slot: [(m.span(), m.groups()) if m else None for m in matches]
+        for slot, matches in scan.items()
+    }
+
+
+@pytest.mark.parametrize("extractor_class", [ElectronicsExtractor, DimensionsExtractor])
+class TestPatternScannerDifferential:
+    """The single scan must find exactly what per-pattern search() finds."""
+
+    def test_matches_equal_search(self, extractor_class):
+        """Every pattern's match (span and groups) equals its search() result."""
+        slots = _slots(extractor_class())
+        scanner = PatternScanner(slots)
+        reference = SearchScanner(slots)
+
+        for text in CORPUS:
+            assert _spans(scanner.scan(text)) == _spans(reference.scan(text)), text
+
+    def test_features_equal_search_extraction(self, extractor_class):
+        """Extracted features equal the per-pattern search() extraction."""
+        extractor = extractor_class()
+        legacy = extractor_class()
+        legacy._scanner = SearchScanner(_slots(legacy))
+
+        for text in CORPUS:
+            assert extractor.extract(text) == legacy.extract(text), text
+
+
+class TestPatternScanner:
+    """Tests for PatternScanner."""
+
+    def test_match_inside_number_run(self):
+        """A bounded number may start inside a longer digit run."""
+        scanner = PatternScanner({"voltage": [(r"(\d{2,4})\s*[vв]", ["v", "ve"])]})
+        match, = scanner.scan("Motor 12345V")["voltage"]
+        assert match.group(1) == "2345"
+
+    def test_match_across_decimal_chain(self):
+        """A decimal number ending several runs later is found at its start."""
+        scanner = PatternScanner({"weight": [(r"(\d+(?:[.,]\d+)?)\s*kg", ["k"])]})
+        match, = scanner.scan("Box 1.5.3kg")["weight"]
+        assert match.group(1) == "5.3"
+
+    def test_unit_starting_keyword(self):
+        """A unit that starts a keyword does not hide the keyword."""
+        scanner = PatternScanner({
+            "power": [(r"(\d+)\s*HP", ["h"])],
+            "storage": [(r"HDD\s*(\d+)\s*GB", ["disk"])],
+        })
+        matches = scanner.scan("512 HDD 500GB")
+        assert matches["power"] == [None]
+        assert matches["storage"][0].group(1) == "500"
+
+    def test_no_anchors_in_text(self):
+        """Text without numbers or keywords has no matches."""
+        scanner = PatternScanner({"voltage": [(r"(\d+)\s*v", ["v"])]})
+        assert scanner.scan("Simple Power Tool") == {"voltage": [None]}
+
+    def test_unknown_anchor_rejected(self):
+        """Patterns must declare known anchors."""
+        with pytest.raises(ValueError, match="Unknown anchor"):
+            PatternScanner({"voltage": [(r"(\d+)\s*v", ["volts"])]})
@@ -3,11 +3,13 @@
 Tests cover:
     - ElectronicsExtractor: voltage, power, storage, memory extraction
     - DimensionsExtractor: weight, dimensions extraction
-    - EXTRACTOR_REGISTRY lookup
+    - EXTRACTOR_REGISTRY lookup and shared instances (get_extractor)
     - extract_all_features merging
     - Edge cases and invalid values
 """
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 from src.services.extraction import (
     FeatureExtractor,
@@ -15,6 +17,8 @@ from src.services.extraction import (
     DimensionsExtractor,
     EXTRACTOR_REGISTRY,
     create_extractor,
+    get_extractor,
+    warm_extractors,
     extract_all_features,
 )
 from src.models.extraction import ExtractedFeatures, DimensionsCm
@@ -197,6 +201,33 @@ class TestExtractorRegistry:
         """Test factory raises on unknown name."""
         with pytest.raises(ValueError, match="Unknown extractor"):
             create_extractor("unknown")
+    
+    def test_get_extractor_shared_instance(self):
+        """Test get_extractor returns one instance per name."""
+        extractor = get_extractor("electronics")
+        
+        assert isinstance(extractor, ElectronicsExtractor)
+        assert get_extractor("electronics") is extractor
+        assert create_extractor("electronics") is not extractor
+    
+    def test_get_extractor_concurrent_first_use(self):
+        """Test concurrent first calls create a single instance."""
+        with patch.dict("src.services.extraction.extractors._instances", clear=True), \
+             ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(lambda _: get_extractor("dimensions"), range(32)))
+        
+        assert len({id(instance) for instance in instances}) == 1
+    
+    def test_get_extractor_unknown(self):
+        """Test unknown names raise like the factory."""
+        with pytest.raises(ValueError, match="Unknown extractor"):
+            get_extractor("unknown")
+    
+    def test_warm_extractors(self):
+        """Test warming creates every registered extractor."""
+        with patch.dict("src.services.extraction.extractors._instances", clear=True) as instances:
+            assert warm_extractors() == list(EXTRACTOR_REGISTRY)
+            assert set(instances) == set(EXTRACTOR_REGISTRY)
 
 
 class TestExtractAllFeatures:
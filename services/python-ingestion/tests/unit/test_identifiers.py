@@ -0,0 +1,146 @@
+"""Unit tests for exact identifier matching.
+
+Tests cover:
+    - GTIN check-digit validation and normalization
+    - Identifier extraction from characteristics and names
+    - IdentifierIndex lookups and ambiguity handling
+    - Loading the index for a matching batch
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from src.services.matching import (
+    IdentifierIndex,
+    extract_identifiers,
+    is_valid_gtin,
+)
+from src.tasks.matching_tasks import _load_identifier_index
+
+
+class TestIsValidGtin:
+    """Tests for is_valid_gtin()."""
+
+    @pytest.mark.parametrize("code", [
+        "4006381333931",   # EAN-13
+        "036000291452",    # UPC-A
+        "96385074",        # EAN-8
+        "00036000291452",  # GTIN-14
+    ])
+    def test_valid_codes(self, code):
+        """Test codes with correct check digits."""
+        assert is_valid_gtin(code)
+
+    @pytest.mark.parametrize("code", [
+        "4006381333932",   # wrong check digit
+        "400638133393",    # wrong check digit for length
+        "12345",           # not a GTIN length
+        "0000000000000",   # all zeros
+        "40063813339A1",   # non-digit
+    ])
+    def test_invalid_codes(self, code):
+        """Test codes that must be rejected."""
+        assert not is_valid_gtin(code)
+
+
+class TestExtractIdentifiers:
+    """Tests for extract_identifiers()."""
+
+    def test_gtin_from_characteristics(self):
+        """Test barcode columns produce zero-padded GTIN-14 keys."""
+        assert extract_identifiers("Drill", {"ean": "4006381333931"}) == ["gtin:04006381333931"]
+
+    def test_gtin_stored_as_number_without_leading_zero(self):
+        """Test UPC codes that lost their leading zero in a spreadsheet."""
+        assert extract_identifiers("Soda", {"barcode": 36000291452}) == ["gtin:00036000291452"]
+
+    def test_invalid_gtin_ignored(self):
+        """Test barcodes with a bad check digit are ignored."""
+        assert extract_identifiers("Drill", {"ean": "4006381333932"}) == []
+
+    def test_mpn_from_characteristics(self):
+        """Test part number columns are normalized to uppercase alphanumerics."""
+        assert extract_identifiers("Phone", {"Part Number": "sm-a546e/ds"}) == ["mpn:SMA546EDS"]
+
+    def test_short_mpn_ignored(self):
+        """Test too-short part numbers are ignored."""
+        assert extract_identifiers("Phone", {"mpn": "A54"}) == []
+
+    def test_identifiers_from_name(self):
+        """Test barcodes and marked part numbers embedded in names."""
+        result = extract_identifiers("Дрель Bosch P/N: GSB-13RE, 4006381333931")
+        assert result == ["gtin:04006381333931", "mpn:GSB13RE"]
+
+    def test_unmarked_model_numbers_in_name_ignored(self):
+        """Test model tokens without a part-number marker are not identifiers."""
+        assert extract_identifiers("Samsung Galaxy A54 5G SM-A546E 128GB") == []
+
+    def test_unrelated_characteristics_ignored(self):
+        """Test other characteristics keys are not identifiers."""
+        assert extract_identifiers("Phone", {"color": "black", "артикул": "12345"}) == []
+
+
+class TestIdentifierIndex:
+    """Tests for IdentifierIndex."""
+
+    def test_lookup_hit(self):
+        """Test a known identifier returns its product."""
+        product_id = uuid4()
+        index = IdentifierIndex()
+        index.add(["gtin:04006381333931"], product_id)
+
+        assert index.lookup(["mpn:OTHER1", "gtin:04006381333931"]) == product_id
+
+    def test_lookup_miss(self):
+        """Test unknown and empty identifiers miss."""
+        index = IdentifierIndex()
+        index.add(["gtin:04006381333931"], uuid4())
+
+        assert index.lookup(["mpn:OTHER1"]) is None
+        assert index.lookup(None) is None
+
+    def test_ambiguous_identifier_never_matches(self):
+        """Test an identifier linked to two products is dropped."""
+        index = IdentifierIndex()
+        index.add(["gtin:04006381333931"], uuid4())
+        index.add(["gtin:04006381333931"], uuid4())
+
+        assert index.lookup(["gtin:04006381333931"]) is None
+
+    def test_conflicting_identifiers_never_match(self):
+        """Test identifiers pointing at different products miss."""
+        index = IdentifierIndex()
+        index.add(["gtin:04006381333931"], uuid4())
+        index.add(["mpn:GSB13RE"], uuid4())
+
+        assert index.lookup(["gtin:04006381333931", "mpn:GSB13RE"]) is None
+
+
+class TestLoadIdentifierIndex:
+    """Tests for _load_identifier_index()."""
+
+    @pytest.mark.asyncio
+    async def test_no_identifiers_skips_query(self):
+        """Test batches without identifiers do not hit the database."""
+        session = AsyncMock()
+        items = [MagicMock(identifiers=None), MagicMock(identifiers=[])]
+
+        index = await _load_identifier_index(session, items)
+
+        assert len(index) == 0
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_loads_linked_items(self):
+        """Test linked items sharing identifiers populate the index."""
+        product_id = uuid4()
+        result = MagicMock()
+        result.all.return_value = [(["gtin:04006381333931", "mpn:GSB13RE"], product_id)]
+        session = AsyncMock()
+        session.execute.return_value = result
+        items = [MagicMock(identifiers=["gtin:04006381333931"])]
+
+        index = await _load_identifier_index(session, items)
+
+        assert index.lookup(["gtin:04006381333931"]) == product_id
+        session.execute.assert_awaited_once()
@@ -0,0 +1,242 @@
+"""Unit tests for priority-ordered dequeue of arq jobs.
+
+Tests cover:
+    - priority_score ordering across and within priority levels
+    - enqueue_jobs writing all arq jobs in one transaction
+    - promote_aged_jobs bounding the wait of lower levels
+    - get_queue_depth_by_priority score ranges
+    - get_oldest_job_age_by_priority
+    - Upload and master sync parse jobs enqueued at their priority
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from arq.constants import default_queue_name, expires_extra_ms, job_key_prefix
+from arq.jobs import deserialize_job
+
+from src.services.job_priority import (
+    PRIORITY_MAX_WAIT_MS,
+    PRIORITY_SCORE_OFFSET_MS,
+    PROMOTE_AGED_JOBS_SCRIPT,
+    _aged_ranges,
+    enqueue_jobs,
+    get_oldest_job_age_by_priority,
+    get_queue_depth_by_priority,
+    priority_score,
+    promote_aged_jobs,
+)
+from src.tasks.sync_tasks import poll_parse_triggers
+
+NOW_MS = 1_790_000_000_000
+
+
+def make_redis(results=None):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results or [])
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+    redis.job_serializer = None
+    redis.expires_extra_ms = expires_extra_ms
+    redis.default_queue_name = default_queue_name
+    return redis, pipe
+
+
+class TestPriorityScore:
+    """Tests for priority_score()."""
+
+    def test_levels_never_interleave(self):
+        """Test a new high job ranks before a normal job queued a year ago."""
+        year_ms = 365 * 24 * 3600 * 1000
+
+        assert priority_score("high", NOW_MS) < priority_score("normal", NOW_MS - year_ms)
+        assert priority_score("normal", NOW_MS) < priority_score("low", NOW_MS - year_ms)
+
+    def test_fifo_within_level(self):
+        """Test older jobs of a level rank first."""
+        assert priority_score("high", NOW_MS - 1) < priority_score("high", NOW_MS)
+
+    def test_low_keeps_arq_score(self):
+        """Test low jobs rank with jobs enqueued through enqueue_job."""
+        assert priority_score("low", NOW_MS) == NOW_MS
+
+    def test_shifted_scores_are_runnable(self):
+        """Test shifted scores are in the past and never 0."""
+        assert priority_score("normal", NOW_MS) < 0
+        assert priority_score("high", NOW_MS) < priority_score("normal", NOW_MS)
+
+    def test_unknown_priority(self):
+        """Test unknown priorities are rejected."""
+        with pytest.raises(ValueError, match="Unknown priority"):
+            priority_score("urgent", NOW_MS)
+
+
+class TestEnqueueJobs:
+    """Tests for enqueue_jobs()."""
+
+    @pytest.mark.asyncio
+    async def test_one_transaction(self):
+        """Test every job is written in a single MULTI/EXEC."""
+        redis, pipe = make_redis()
+
+        with patch("src.services.job_priority.timestamp_ms", return_value=NOW_MS):
+            job_ids = await enqueue_jobs(redis, "parse_task", [{"task_id": "a"}, {"task_id": "b"}], "high")
+
+        redis.pipeline.assert_called_once_with(transaction=True)
+        pipe.execute.assert_awaited_once()
+        assert len(set(job_ids)) == 2
+        assert [c.args[0] for c in pipe.psetex.call_args_list] == [
+            job_key_prefix + job_id for job_id in job_ids
+        ]
+        assert [c.args for c in pipe.zadd.call_args_list] == [
+            (default_queue_name, {job_id: priority_score("high", NOW_MS)}) for job_id in job_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_jobs_readable_by_arq(self):
+        """Test the stored payload is a regular arq job."""
+        redis, pipe = make_redis()
+
+        await enqueue_jobs(redis, "parse_task", [{"task_id": "a", "priority": "low"}], "low")
+
+        job_def = deserialize_job(pipe.psetex.call_args.args[2])
+        assert job_def.function == "parse_task"
+        assert job_def.args == ()
+        assert job_def.kwargs == {"task_id": "a", "priority": "low"}
+        assert pipe.psetex.call_args.args[1] == expires_extra_ms
+
+
+def in_range(score, lower, upper):
+    """Whether score is within ZRANGEBYSCORE bounds (an int or "(" exclusive string)."""
+    lower_ok = float(lower[1:]) < score if str(lower).startswith("(") else float(lower) <= score
+    return lower_ok and score <= float(upper)
+
+
+class TestPromoteAgedJobs:
+    """Tests for promote_aged_jobs()."""
+
+    @pytest.mark.parametrize("priority,waited_ms,promoted", [
+        ("low", PRIORITY_MAX_WAIT_MS, True),
+        ("low", PRIORITY_MAX_WAIT_MS - 1, False),
+        ("normal", PRIORITY_MAX_WAIT_MS + 60_000, True),
+        ("normal", 0, False),
+    ])
+    def test_aged_ranges(self, priority, waited_ms, promoted):
+        """Test only jobs that waited the limit fall in their level's aged range."""
+        normal_range, low_range = _aged_ranges(NOW_MS, PRIORITY_MAX_WAIT_MS)
+        aged_range = normal_range if priority == "normal" else low_range
+        score = priority_score(priority, NOW_MS - waited_ms)
+
+        assert in_range(score, *aged_range) is promoted
+
+    def test_high_and_deferred_never_aged(self):
+        """Test high jobs and jobs deferred to the future are not promoted."""
+        for lower, upper in _aged_ranges(NOW_MS, PRIORITY_MAX_WAIT_MS):
+            assert not in_range(priority_score("high", NOW_MS - 10 * PRIORITY_MAX_WAIT_MS), lower, upper)
+            assert not in_range(NOW_MS + 60_000, lower, upper)
+
+    def test_promoted_low_job_outranks_new_normal_jobs(self):
+        """Test a promoted job keeps its enqueue time in its new level."""
+        queued_ms = NOW_MS - PRIORITY_MAX_WAIT_MS
+        promoted_score = priority_score("low", queued_ms) - PRIORITY_SCORE_OFFSET_MS
+
+        assert promoted_score == priority_score("normal", queued_ms)
+        assert promoted_score < priority_score("normal", NOW_MS)
+
+    @pytest.mark.asyncio
+    async def test_runs_script(self):
+        """Test normal then low ranges are promoted in one script call."""
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=[2, 5])
+
+        with patch("src.services.job_priority.timestamp_ms", return_value=NOW_MS):
+            promoted = await promote_aged_jobs(redis, "queue")
+
+        assert promoted == {"normal": 2, "low": 5}
+        (normal_min, normal_max), (low_min, low_max) = _aged_ranges(NOW_MS, PRIORITY_MAX_WAIT_MS)
+        redis.eval.assert_awaited_once_with(
+            PROMOTE_AGED_JOBS_SCRIPT, 1, "queue", str(PRIORITY_SCORE_OFFSET_MS),
+            str(normal_min), str(normal_max), str(low_min), str(low_max),
+        )
+
+
+class TestQueueDepthByPriority:
+    """Tests for get_queue_depth_by_priority()."""
+
+    @pytest.mark.asyncio
+    async def test_counts_score_ranges(self):
+        """Test each level is counted on its own score range."""
+        redis, pipe = make_redis(results=[1, 2, 30])
+        half = PRIORITY_SCORE_OFFSET_MS // 2
+
+        with patch("src.services.job_priority.timestamp_ms", return_value=NOW_MS):
+            depths = await get_queue_depth_by_priority(redis, "queue")
+
+        assert depths == {"high": 1, "normal": 2, "low": 30}
+        assert [c.args for c in pipe.zcount.call_args_list] == [
+            ("queue", "-inf", NOW_MS - 3 * half),
+            ("queue", f"({NOW_MS - 3 * half}", NOW_MS - half),
+            ("queue", f"({NOW_MS - half}", "+inf"),
+        ]
+
+    def test_ranges_contain_their_level(self):
+        """Test jobs queued long ago still fall in their level's range."""
+        half = PRIORITY_SCORE_OFFSET_MS // 2
+        queued_ms = NOW_MS - 30 * 24 * 3600 * 1000
+
+        assert priority_score("high", queued_ms) <= NOW_MS - 3 * half
+        assert NOW_MS - 3 * half < priority_score("normal", queued_ms) <= NOW_MS - half
+        assert NOW_MS - half < priority_score("low", queued_ms)
+
+
+class TestOldestJobAge:
+    """Tests for get_oldest_job_age_by_priority()."""
+
+    @pytest.mark.asyncio
+    async def test_ages_per_level(self):
+        """Test ages are measured from the enqueue time, whatever the level."""
+        redis, pipe = make_redis(results=[
+            [],
+            [(b"a", float(priority_score("normal", NOW_MS - 90_000)))],
+            [(b"b", float(NOW_MS + 5_000))],  # deferred
+        ])
+
+        with patch("src.services.job_priority.timestamp_ms", return_value=NOW_MS):
+            ages = await get_oldest_job_age_by_priority(redis, "queue")
+
+        assert ages == {"high": 0.0, "normal": 90.0, "low": 0.0}
+        assert all(c.kwargs == {"start": 0, "num": 1, "withscores": True}
+                   for c in pipe.zrangebyscore.call_args_list)
+
+
+class TestParsePriorities:
+    """Tests for the priority of enqueued parse jobs."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_are_high(self):
+        """Test upload triggers enqueue high-priority parse jobs."""
+        trigger = {"task_id": "upload-1", "parser_type": "csv", "supplier_name": "Acme"}
+
+        with patch("src.tasks.sync_tasks.get_pending_parse_triggers", AsyncMock(return_value=[trigger])), \
+                patch("src.tasks.sync_tasks.enqueue_jobs", AsyncMock(return_value=["j1"])) as enqueue:
+            result = await poll_parse_triggers({"redis": MagicMock()})
+
+        assert result["results"] == [{"task_id": "upload-1", "status": "enqueued"}]
+        redis, function, jobs, priority = enqueue.await_args.args
+        assert function == "parse_task"
+        assert priority == "high"
+        assert jobs[0]["priority"] == "high"
+        assert jobs[0]["task_id"] == "upload-1"
+
+    @pytest.mark.asyncio
+    async def test_trigger_priority_override(self):
+        """Test a trigger may set its own priority."""
+        trigger = {"task_id": "upload-1", "priority": "normal"}
+
+        with patch("src.tasks.sync_tasks.get_pending_parse_triggers", AsyncMock(return_value=[trigger])), \
+                patch("src.tasks.sync_tasks.enqueue_jobs", AsyncMock(return_value=["j1"])) as enqueue:
+            await poll_parse_triggers({"redis": MagicMock()})
+
+        assert enqueue.await_args.args[3] == "normal"
@@ -0,0 +1,173 @@
+"""Unit tests for bulk review actions.
+
+Tests cover:
+    - _parse_review_events validation (last event per item wins)
+    - handle_manual_match_events_batch: set-based writes, per-event errors
+      and one coalesced aggregate update
+"""
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.db.models import MatchStatus, ReviewStatus
+from src.services.matching import MatchWriteBack
+from src.tasks.matching_tasks import _parse_review_events, handle_manual_match_events_batch
+
+
+def supplier_item(name, product_id=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        supplier_id=uuid4(),
+        name=name,
+        normalized_name=None,
+        product_id=product_id,
+        match_score=Decimal("82.00"),
+        match_candidates=[{"score": 82.0}],
+        current_price=Decimal("10.00"),
+        characteristics={},
+    )
+
+
+class TestParseReviewEvents:
+    """Tests for _parse_review_events()."""
+
+    def test_invalid_events_are_reported(self):
+        """Test malformed ids, unknown actions and missing products are errors."""
+        parsed, errors = _parse_review_events([
+            {"supplier_item_id": "nope", "action": "approve_match", "product_id": str(uuid4())},
+            {"supplier_item_id": str(uuid4()), "action": "unlink"},
+            {"supplier_item_id": str(uuid4()), "action": "approve_match"},
+        ])
+
+        assert parsed == {}
+        assert [e["error"].split(":")[0] for e in errors] == [
+            "Invalid supplier_item_id",
+            "Invalid action",
+            "product_id is required for action 'approve_match'",
+        ]
+
+    def test_last_event_per_item_wins(self):
+        """Test an item is decided once with its final event."""
+        item_id = uuid4()
+
+        parsed, errors = _parse_review_events([
+            {"supplier_item_id": str(item_id), "action": "approve_match", "product_id": str(uuid4())},
+            {"supplier_item_id": str(item_id), "action": "reject_match", "new_product_name": "New"},
+        ])
+
+        assert not errors
+        assert parsed[item_id]["action"] == "reject_match"
+        assert parsed[item_id]["new_product_name"] == "New"
+
+
+class TestHandleManualMatchEventsBatch:
+    """Tests for handle_manual_match_events_batch()."""
+
+    @pytest.fixture
+    def db(self):
+        """Session maker whose reads return the queued results."""
+        session = MagicMock()
+        session.begin = MagicMock(return_value=AsyncMock())
+        results = []
+
+        async def execute(stmt):
+            return results.pop(0)
+
+        session.execute = execute
+
+        @asynccontextmanager
+        async def maker():
+            yield session
+
+        with patch("src.tasks.matching_tasks.async_session_maker", new=maker):
+            yield results
+
+    @staticmethod
+    def queue_reads(db, items, products):
+        items_result = MagicMock()
+        items_result.scalars.return_value.all.return_value = items
+        products_result = MagicMock()
+        products_result.all.return_value = products
+        db.extend([items_result, products_result])
+
+    @pytest.mark.asyncio
+    async def test_applies_batch_set_based(self, db):
+        """Test approvals and rejections are written in one flush and one recalc."""
+        product_id, category_id, old_product_id = uuid4(), uuid4(), uuid4()
+        approve = supplier_item("Samsung Galaxy A54 128GB", product_id=old_product_id)
+        reject = supplier_item("Makita HP1630 710W")
+        self.queue_reads(db, [approve, reject], [(product_id, category_id)])
+        flushed = {}
+
+        async def flush(writeback, session):
+            flushed["items"] = dict(writeback.items)
+            flushed["products"] = list(writeback.products)
+
+        redis = AsyncMock()
+        with patch.object(MatchWriteBack, "flush", new=flush), \
+             patch("src.tasks.matching_tasks.resolve_reviews", new=AsyncMock(return_value=2)) as resolve, \
+             patch("src.tasks.matching_tasks.record_affinities", new=AsyncMock()) as record, \
+             patch("src.tasks.matching_tasks._enqueue_recalc_task", new=AsyncMock()) as enqueue:
+            result = await handle_manual_match_events_batch(
+                {"redis": redis},
+                task_id="review-1",
+                events=[
+                    {"supplier_item_id": str(approve.id), "action": "approve_match", "product_id": str(product_id)},
+                    {"supplier_item_id": str(reject.id), "action": "reject_match"},
+                ],
+                user_id=str(uuid4()),
+            )
+
+        assert result["status"] == "success"
+        assert (result["approved"], result["rejected"], result["reviews_resolved"]) == (1, 1, 2)
+        assert result["errors"] == []
+
+        new_product, = flushed["products"]
+        assert new_product.name == "Makita HP1630 710W"
+        assert flushed["items"][approve.id].product_id == product_id
+        assert flushed["items"][approve.id].match_score == Decimal("82.00")
+        assert flushed["items"][reject.id].product_id == new_product.id
+        assert flushed["items"][reject.id].match_candidates == []
+        assert {d.match_status for d in flushed["items"].values()} == {MatchStatus.VERIFIED_MATCH}
+
+        resolutions = resolve.await_args.args[1]
+        assert [(r.status, r.category_id) for r in resolutions] == [
+            (ReviewStatus.APPROVED, category_id),
+            (ReviewStatus.REJECTED, None),
+        ]
+        assert len(record.await_args.args[1]) == 2
+
+        enqueue.assert_awaited_once()
+        deltas = enqueue.await_args.kwargs["deltas"]
+        assert len(deltas) == 3  # two links and the unlink of the old product
+
+    @pytest.mark.asyncio
+    async def test_missing_items_and_products_are_skipped(self, db):
+        """Test unknown items and products are reported without failing the batch."""
+        item = supplier_item("Samsung Galaxy A54 128GB")
+        missing_id = uuid4()
+        self.queue_reads(db, [item], [])
+
+        with patch.object(MatchWriteBack, "flush", new=AsyncMock()), \
+             patch("src.tasks.matching_tasks.resolve_reviews", new=AsyncMock(return_value=0)), \
+             patch("src.tasks.matching_tasks.record_affinities", new=AsyncMock()), \
+             patch("src.tasks.matching_tasks._enqueue_recalc_task", new=AsyncMock()) as enqueue:
+            result = await handle_manual_match_events_batch(
+                {"redis": AsyncMock()},
+                task_id="review-2",
+                events=[
+                    {"supplier_item_id": str(item.id), "action": "approve_match", "product_id": str(uuid4())},
+                    {"supplier_item_id": str(missing_id), "action": "reject_match"},
+                ],
+            )
+
+        assert result["approved"] == result["rejected"] == 0
+        assert sorted(e["error"].split(":")[0] for e in result["errors"]) == [
+            "Product not found",
+            "Supplier item not found",
+        ]
+        enqueue.assert_not_called()
@@ -0,0 +1,313 @@
+"""Unit tests for match drain mode.
+
+Tests cover:
+    - Drain coordinator state in Redis (progress, throughput, completion)
+    - _advance_drain fan-out, lane re-enqueue and termination
+    - A single active run when first jobs race
+    - Lanes ending when their job fails
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.models.matching import MatchDrainProgress
+from src.services.match_drain import (
+    MATCH_DRAIN_ACTIVE_KEY,
+    MATCH_DRAIN_LATEST_KEY,
+    RELEASE_ACTIVE_DRAIN_SCRIPT,
+    claim_match_drain,
+    start_match_drain,
+    record_match_drain_batch,
+    finish_match_drain_lane,
+    get_match_drain_progress,
+)
+from src.tasks.matching_tasks import MatchingMetrics, _advance_drain, match_items_task
+
+
+def make_redis(hash_data=None):
+    """Redis mock with a pipeline and a stored drain hash."""
+    redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
+    redis.hgetall.return_value = hash_data or {}
+    return redis, pipe
+
+
+class TestMatchDrainProgress:
+    """Tests for MatchDrainProgress derived values."""
+
+    def test_throughput_and_percentage(self):
+        """Test items/second and backlog share."""
+        progress = MatchDrainProgress(
+            drain_id="d",
+            started_at=datetime.now(timezone.utc).isoformat(),
+            backlog_total=1000,
+            items_processed=250,
+            elapsed_seconds=10.0,
+        )
+
+        assert progress.items_per_second == 25.0
+        assert progress.progress_percentage == 25.0
+
+    def test_zero_elapsed_has_no_throughput(self):
+        """Test no division by zero at start."""
+        progress = MatchDrainProgress(drain_id="d", started_at="2026-01-01T00:00:00+00:00")
+
+        assert progress.items_per_second == 0.0
+
+
+class TestDrainCoordinator:
+    """Tests for the Redis drain coordinator."""
+
+    @pytest.mark.asyncio
+    async def test_start_stores_state_and_latest_run(self):
+        """Test run state is created with all lanes active."""
+        redis, pipe = make_redis()
+
+        assert await start_match_drain(redis, "match-1", backlog_total=5000, lanes=4)
+
+        mapping = pipe.hset.call_args.kwargs["mapping"]
+        assert mapping["backlog_total"] == 5000
+        assert mapping["active_lanes"] == 4
+        pipe.set.assert_called_once()
+        assert pipe.set.call_args.args[:2] == (MATCH_DRAIN_LATEST_KEY, "match-1")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_record_batch_increments_counters(self):
+        """Test batch metrics are added atomically with HINCRBY."""
+        redis, pipe = make_redis()
+
+        await record_match_drain_batch(
+            redis, "match-1", {"items_processed": 100, "auto_matched": 60, "errors": 0}
+        )
+
+        increments = {c.args[1]: c.args[2] for c in pipe.hincrby.call_args_list}
+        assert increments == {"batches": 1, "items_processed": 100, "auto_matched": 60}
+
+    @pytest.mark.asyncio
+    async def test_last_lane_completes_run(self):
+        """Test the run is stamped finished when no lanes remain."""
+        started = datetime.now(timezone.utc) - timedelta(seconds=20)
+        finished = datetime.now(timezone.utc)
+        redis, _ = make_redis({
+            b"started_at": started.isoformat().encode(),
+            b"finished_at": finished.isoformat().encode(),
+            b"backlog_total": b"1000",
+            b"lanes": b"2",
+            b"active_lanes": b"0",
+            b"batches": b"10",
+            b"items_processed": b"1000",
+        })
+        redis.hincrby.return_value = 0
+
+        progress = await finish_match_drain_lane(redis, "match-1")
+
+        redis.hsetnx.assert_awaited_once()
+        redis.eval.assert_awaited_once_with(
+            RELEASE_ACTIVE_DRAIN_SCRIPT, 1, MATCH_DRAIN_ACTIVE_KEY, "match-1"
+        )
+        assert progress.state == "completed"
+        assert progress.progress_percentage == 100.0
+        assert progress.items_per_second == pytest.approx(50.0, rel=0.01)
+
+    @pytest.mark.asyncio
+    async def test_running_lane_does_not_complete_run(self):
+        """Test other active lanes keep the run running."""
+        redis, _ = make_redis({
+            b"started_at": datetime.now(timezone.utc).isoformat().encode(),
+            b"active_lanes": b"1",
+        })
+        redis.hincrby.return_value = 1
+
+        progress = await finish_match_drain_lane(redis, "match-1")
+
+        redis.hsetnx.assert_not_called()
+        redis.eval.assert_not_called()
+        assert progress.state == "running"
+
+    @pytest.mark.asyncio
+    async def test_claim_active_run(self):
+        """Test the active-run key is claimed atomically with an expiry."""
+        redis, _ = make_redis()
+        redis.set.return_value = True
+
+        assert await claim_match_drain(redis, "match-1") == "match-1"
+        assert redis.set.call_args.args == (MATCH_DRAIN_ACTIVE_KEY, "match-1")
+        assert redis.set.call_args.kwargs["nx"] is True
+        assert redis.set.call_args.kwargs["ex"] > 0
+
+    @pytest.mark.asyncio
+    async def test_claim_returns_run_already_active(self):
+        """Test a second claim gets the active run instead."""
+        redis, _ = make_redis()
+        redis.set.return_value = None
+        redis.get.return_value = b"match-1"
+
+        assert await claim_match_drain(redis, "match-2") == "match-1"
+
+    @pytest.mark.asyncio
+    async def test_progress_of_unknown_run(self):
+        """Test missing latest run returns None."""
+        redis, _ = make_redis()
+        redis.get.return_value = None
+
+        assert await get_match_drain_progress(redis) is None
+
+
+class TestAdvanceDrain:
+    """Tests for _advance_drain()."""
+
+    @pytest.fixture
+    def coordinator(self):
+        with patch("src.tasks.matching_tasks.start_match_drain", new=AsyncMock()) as start, \
+             patch("src.tasks.matching_tasks.record_match_drain_batch", new=AsyncMock()) as record, \
+             patch("src.tasks.matching_tasks.finish_match_drain_lane", new=AsyncMock()) as finish:
+            yield start, record, finish
+
+    @staticmethod
+    async def advance(
+        redis, claimed, processed, drain_id=None, batch_size=100, remaining=0, task_id="match-1"
+    ):
+        with patch(
+            "src.tasks.matching_tasks._count_unmatched_items",
+            new=AsyncMock(return_value=remaining),
+        ):
+            return await _advance_drain(
+                redis=redis,
+                task_id=task_id,
+                category_id=None,
+                batch_size=batch_size,
+                claimed=claimed,
+                metrics=MatchingMetrics(items_processed=processed),
+                drain_id=drain_id,
+                drain_lane=2,
+                drain_step=5,
+                log=MagicMock(),
+            )
+
+    @pytest.mark.asyncio
+    async def test_partial_first_batch_starts_no_run(self, coordinator):
+        """Test a backlog that fits one batch needs no drain run."""
+        redis = AsyncMock()
+
+        assert await self.advance(redis, claimed=40, processed=40) is None
+        redis.enqueue_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_first_batch_fans_out_lanes(self, coordinator):
+        """Test lanes are sized from the remaining backlog and capped."""
+        start, record, _ = coordinator
+        redis = AsyncMock()
+
+        with patch("src.tasks.matching_tasks.matching_settings") as settings:
+            settings.drain_max_parallel = 4
+            drain_id = await self.advance(redis, claimed=100, processed=100, remaining=49_900)
+
+        assert drain_id == "match-1"
+        start.assert_awaited_once_with(redis, "match-1", backlog_total=50_000, lanes=4)
+        record.assert_awaited_once()
+        job_ids = [c.kwargs["_job_id"] for c in redis.enqueue_job.call_args_list]
+        assert job_ids == ["match-1:0:1", "match-1:1:1", "match-1:2:1", "match-1:3:1"]
+        assert all(c.kwargs["drain"] for c in redis.enqueue_job.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_racing_first_jobs_start_one_run(self, coordinator):
+        """Test only the first job to claim the active run fans out."""
+        start, _, _ = coordinator
+        redis = AsyncMock()
+        redis.set.side_effect = [True, None]
+        redis.get.return_value = b"match-1"
+
+        with patch("src.tasks.matching_tasks.matching_settings") as settings:
+            settings.drain_max_parallel = 4
+            first = await self.advance(redis, claimed=100, processed=100, remaining=49_900)
+            second = await self.advance(
+                redis, claimed=100, processed=100, remaining=49_800, task_id="match-2"
+            )
+
+        assert first == second == "match-1"
+        start.assert_awaited_once()
+        job_ids = [c.kwargs["_job_id"] for c in redis.enqueue_job.call_args_list]
+        assert job_ids == ["match-1:0:1", "match-1:1:1", "match-1:2:1", "match-1:3:1"]
+
+    @pytest.mark.asyncio
+    async def test_small_backlog_uses_fewer_lanes(self, coordinator):
+        """Test no more lanes than remaining batches."""
+        start, _, _ = coordinator
+        redis = AsyncMock()
+
+        with patch("src.tasks.matching_tasks.matching_settings") as settings:
+            settings.drain_max_parallel = 8
+            await self.advance(redis, claimed=100, processed=100, remaining=150)
+
+        assert start.call_args.kwargs["lanes"] == 2
+        assert redis.enqueue_job.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_full_lane_batch_enqueues_successor(self, coordinator):
+        """Test a lane continues after a full batch."""
+        _, record, finish = coordinator
+        redis = AsyncMock()
+
+        await self.advance(redis, claimed=100, processed=100, drain_id="match-1")
+
+        record.assert_awaited_once()
+        assert redis.enqueue_job.call_args.kwargs["_job_id"] == "match-1:2:6"
+        finish.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("claimed,processed", [(30, 30), (0, 0), (100, 0)])
+    async def test_lane_finishes(self, coordinator, claimed, processed):
+        """Test a lane ends on a partial, empty or fully failed batch."""
+        _, _, finish = coordinator
+        redis = AsyncMock()
+
+        await self.advance(redis, claimed=claimed, processed=processed, drain_id="match-1")
+
+        redis.enqueue_job.assert_not_called()
+        finish.assert_awaited_once_with(redis, "match-1")
+
+    @pytest.mark.asyncio
+    async def test_failed_enqueue_finishes_lane(self, coordinator):
+        """Test a lane that cannot enqueue its successor is not left active."""
+        _, _, finish = coordinator
+        redis = AsyncMock()
+        redis.enqueue_job.side_effect = ConnectionError("down")
+
+        await self.advance(redis, claimed=100, processed=100, drain_id="match-1")
+
+        finish.assert_awaited_once_with(redis, "match-1")
+
+
+class TestFailedLaneJob:
+    """Tests for match_items_task failures in drain mode."""
+
+    @pytest.mark.asyncio
+    async def test_failed_lane_job_finishes_lane(self):
+        """Test a lane whose job raises is ended so the run can complete."""
+        redis = AsyncMock()
+        session_maker = MagicMock(side_effect=ConnectionError("db down"))
+
+        with patch("src.tasks.matching_tasks.async_session_maker", session_maker), \
+             patch("src.tasks.matching_tasks.finish_match_drain_lane", new=AsyncMock()) as finish:
+            with pytest.raises(ConnectionError):
+                await match_items_task(
+                    {"redis": redis}, task_id="match-1:2:6",
+                    drain=True, drain_id="match-1", drain_lane=2, drain_step=6,
+                )
+
+        finish.assert_awaited_once_with(redis, "match-1")
+
+    @pytest.mark.asyncio
+    async def test_failed_first_job_has_no_lane(self):
+        """Test a failing job outside a drain run touches no run state."""
+        session_maker = MagicMock(side_effect=ConnectionError("db down"))
+
+        with patch("src.tasks.matching_tasks.async_session_maker", session_maker), \
+             patch("src.tasks.matching_tasks.finish_match_drain_lane", new=AsyncMock()) as finish:
+            with pytest.raises(ConnectionError):
+                await match_items_task({"redis": AsyncMock()}, task_id="match-1", drain=True)
+
+        finish.assert_not_called()
@@ -0,0 +1,102 @@
+"""Unit tests for match batch claim leases.
+
+Tests cover:
+    - Claiming skips locked rows and items with a live lease
+    - Leases are only released for the owning job
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from src.tasks.matching_tasks import (
+    _claim_unmatched_items,
+    _lease_owner,
+    _lock_leased_items,
+    _release_leases,
+)
+
+
+def compiled(session, index):
+    """SQL of the index-th statement executed on a mock session."""
+    stmt = session.execute.call_args_list[index].args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def session_returning(rows):
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
+class TestClaimUnmatchedItems:
+    """Tests for _claim_unmatched_items()."""
+
+    @pytest.mark.asyncio
+    async def test_claim_leases_selected_items(self):
+        """Test expired leases are claimable and claimed items are leased."""
+        items = [MagicMock(id=uuid4()), MagicMock(id=uuid4())]
+        session = session_returning(items)
+
+        claimed = await _claim_unmatched_items(session, 100, "worker-1", 600)
+
+        assert claimed == items
+        select_sql = compiled(session, 0)
+        assert "FOR UPDATE SKIP LOCKED" in select_sql
+        assert "match_lease_expires_at IS NULL OR supplier_items.match_lease_expires_at < now()" in select_sql
+        update_sql = compiled(session, 1)
+        assert update_sql.startswith("UPDATE supplier_items SET match_lease_owner=")
+        assert "updated_at=supplier_items.updated_at" in update_sql
+
+    @pytest.mark.asyncio
+    async def test_empty_claim_writes_nothing(self):
+        """Test no lease update when nothing is claimable."""
+        session = session_returning([])
+
+        assert await _claim_unmatched_items(session, 100, "worker-1", 600) == []
+        assert session.execute.await_count == 1
+
+
+class TestLeaseOwnership:
+    """Tests for lease verification and release."""
+
+    def test_owner_identifies_task(self):
+        """Test the owner carries the task id and fits the column."""
+        assert _lease_owner("match-1").endswith(":match-1")
+        assert len(_lease_owner("x" * 500)) == 255
+
+    @pytest.mark.asyncio
+    async def test_lock_only_items_still_leased_and_unmatched(self):
+        """Test decisions are only written for items the job still holds."""
+        held = uuid4()
+        session = session_returning([held])
+
+        assert await _lock_leased_items(session, [held, uuid4()], "worker-1") == {held}
+        sql = compiled(session, 0)
+        assert "supplier_items.match_lease_owner = %(match_lease_owner_1)s" in sql
+        assert "supplier_items.product_id IS NULL" in sql
+        assert sql.endswith("FOR UPDATE")
+
+    @pytest.mark.asyncio
+    async def test_release_is_scoped_to_owner(self):
+        """Test a job never clears another job's lease."""
+        session = AsyncMock()
+
+        await _release_leases(session, {uuid4()}, "worker-1")
+
+        sql = compiled(session, 0)
+        assert "match_lease_owner=%(match_lease_owner)s" in sql
+        assert "WHERE supplier_items.id IN" in sql
+        assert "supplier_items.match_lease_owner = %(match_lease_owner_1)s" in sql
+
+    @pytest.mark.asyncio
+    async def test_release_nothing(self):
+        """Test no statement without items."""
+        session = AsyncMock()
+
+        await _release_leases(session, set(), "worker-1")
+
+        session.execute.assert_not_called()
@@ -7,6 +7,7 @@ Tests cover:
     - Threshold logic: auto-match, potential-match, no-match
     - Empty products list handling
     - search_match_candidates utility function
+    - EmbeddingMatcher: ANN shortlist + WRatio re-rank
 """
 import pytest
 from uuid import uuid4
@@ -16,6 +17,10 @@ from decimal import Decimal
 
 from src.services.matching import (
     RapidFuzzMatcher,
+    TwoStageMatcher,
+    EmbeddingMatcher,
+    HashedNgramVectorizer,
+    IVFIndex,
     MatchCandidate,
     MatchResult,
     MatchStatusEnum,
@@ -215,12 +220,221 @@ class TestCreateMatcher:
         matcher = create_matcher("rapidfuzz")
         assert isinstance(matcher, RapidFuzzMatcher)
     
+    def test_create_hybrid_matcher(self):
+        """Test creating hybrid matcher with options."""
+        matcher = create_matcher("hybrid", prefilter_scorer="jaro_winkler", prefilter_top_n=10)
+        assert isinstance(matcher, TwoStageMatcher)
+        assert matcher.prefilter_top_n == 10
+        assert matcher.get_strategy_name() == "two_stage_jaro_winkler_wratio"
+    
+    def test_create_embedding_matcher(self):
+        """Test creating embedding matcher with options."""
+        matcher = create_matcher("embedding", shortlist_size=10)
+        assert isinstance(matcher, EmbeddingMatcher)
+        assert matcher.shortlist_size == 10
+    
     def test_create_unknown_matcher(self):
         """Test error on unknown matcher type."""
         with pytest.raises(ValueError, match="Unknown matching strategy"):
             create_matcher("unknown_strategy")
 
 
+class TestTwoStageMatcher:
+    """Tests for TwoStageMatcher (cheap prefilter + WRatio re-rank)."""
+    
+    @pytest.fixture
+    def sample_products(self):
+        """Create sample products for matching tests."""
+        return [
+            MockProduct(id=uuid4(), name="Samsung Galaxy A54 5G 128GB Black"),
+            MockProduct(id=uuid4(), name="Samsung Galaxy A54 5G 256GB Black"),
+            MockProduct(id=uuid4(), name="iPhone 15 Pro 256GB Silver"),
+            MockProduct(id=uuid4(), name="Xiaomi Redmi Note 12 Pro 128GB"),
+        ]
+    
+    def test_unknown_prefilter_scorer(self):
+        """Test error on unknown prefilter scorer."""
+        with pytest.raises(ValueError, match="Unknown prefilter scorer"):
+            TwoStageMatcher(prefilter_scorer="unknown")
+    
+    @pytest.mark.parametrize("scorer", ["ratio", "token_sort_ratio", "jaro_winkler"])
+    def test_agrees_with_rapidfuzz(self, sample_products, scorer):
+        """Test status, best match and WRatio score match the full scan."""
+        hybrid = TwoStageMatcher(prefilter_scorer=scorer, prefilter_top_n=2)
+        rapidfuzz = RapidFuzzMatcher()
+        
+        for item_name in [
+            "iPhone 15 Pro 256GB Silver",
+            "Samsung Galaxy A54 128GB",
+            "Redmi Note 12 Pro 128GB",
+        ]:
+            expected = rapidfuzz.find_matches(item_name, uuid4(), sample_products)
+            actual = hybrid.find_matches(item_name, uuid4(), sample_products)
+            assert actual.match_status == expected.match_status
+            assert actual.best_match.product_id == expected.best_match.product_id
+            assert actual.best_match.score == expected.best_match.score
+    
+    def test_prefilter_cutoff_drops_candidates(self, sample_products):
+        """Test products below the prefilter cutoff never reach WRatio."""
+        matcher = TwoStageMatcher(prefilter_cutoff=99.0)
+        
+        result = matcher.find_matches("Samsung Galaxy A54", uuid4(), sample_products)
+        
+        assert result.match_status == MatchStatusEnum.UNMATCHED
+    
+    def test_empty_products(self):
+        """Test handling empty products list."""
+        result = TwoStageMatcher().find_matches("Test", uuid4(), [])
+        assert result.match_status == MatchStatusEnum.UNMATCHED
+
+
+class TestHashedNgramVectorizer:
+    """Tests for the hashed character n-gram vectorizer."""
+    
+    def test_vectors_are_normalized(self):
+        """Test that rows are L2-normalized float32 vectors."""
+        vectorizer = HashedNgramVectorizer(dimensions=64)
+        vectors = vectorizer.fit_transform(["Samsung Galaxy A54", "iPhone 15 Pro"])
+        
+        assert vectors.shape == (2, 64)
+        assert vectors.dtype.name == "float32"
+        for row in vectors:
+            assert abs(float((row ** 2).sum()) - 1.0) < 1e-5
+    
+    def test_similar_names_are_closer(self):
+        """Test that near-duplicate names have higher cosine similarity."""
+        vectorizer = HashedNgramVectorizer(dimensions=256)
+        vectors = vectorizer.fit_transform([
+            "Samsung Galaxy A54 5G 128GB Black",
+            "Samsung Galaxy A54 5G 128GB Black - New",
+            "Bosch Hammer Drill 750W Professional",
+        ])
+        
+        assert float(vectors[0] @ vectors[1]) > float(vectors[0] @ vectors[2])
+
+
+class TestIVFIndex:
+    """Tests for the IVF approximate nearest neighbour index."""
+    
+    @staticmethod
+    def _random_vectors(n, d=32, seed=1):
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        vectors = rng.standard_normal((n, d)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    
+    def test_brute_force_returns_exact_neighbour(self):
+        """Test small collections are searched exhaustively."""
+        vectors = self._random_vectors(100)
+        index = IVFIndex(brute_force_below=1000)
+        index.build(vectors)
+        
+        assert index.centroids is None
+        assert index.search(vectors[42], k=1)[0] == 42
+    
+    def test_clustered_index_finds_self(self):
+        """Test clustered search finds a stored vector as its own neighbour."""
+        vectors = self._random_vectors(3000)
+        index = IVFIndex(brute_force_below=100, n_probe=4)
+        index.build(vectors)
+        
+        assert index.centroids is not None
+        for row in (0, 1234, 2999):
+            assert index.search(vectors[row], k=5)[0] == row
+    
+    def test_added_vectors_are_searchable(self):
+        """Test incremental inserts land in the overflow buffer."""
+        vectors = self._random_vectors(500)
+        index = IVFIndex(brute_force_below=100)
+        index.build(vectors[:400])
+        index.add(vectors[400:])
+        
+        assert len(index) == 500
+        assert index.search(vectors[450], k=1)[0] == 450
+    
+    def test_excluded_rows_do_not_take_top_k_slots(self):
+        """Test excluded rows are dropped before the top-k cut."""
+        vectors = self._random_vectors(200)
+        index = IVFIndex(brute_force_below=1000)
+        index.build(vectors)
+        
+        nearest = index.search(vectors[42], k=6)
+        rows = index.search(vectors[42], k=5, excluded={42})
+        
+        assert len(rows) == 5
+        assert 42 not in rows
+        assert list(rows) == list(nearest[1:])
+    
+    def test_memory_mapped_storage(self, tmp_path):
+        """Test base matrix can be backed by a memory-mapped file."""
+        vectors = self._random_vectors(50)
+        path = tmp_path / "vectors.f32"
+        index = IVFIndex(storage_path=str(path))
+        index.build(vectors)
+        
+        assert path.exists()
+        assert index.search(vectors[7], k=1)[0] == 7
+
+
+class TestEmbeddingMatcher:
+    """Tests for EmbeddingMatcher (ANN shortlist + WRatio re-rank)."""
+    
+    @pytest.fixture
+    def sample_products(self):
+        """Create sample products for matching tests."""
+        return [
+            MockProduct(id=uuid4(), name="Samsung Galaxy A54 5G 128GB Black"),
+            MockProduct(id=uuid4(), name="Samsung Galaxy A54 5G 256GB Black"),
+            MockProduct(id=uuid4(), name="iPhone 15 Pro 256GB Silver"),
+            MockProduct(id=uuid4(), name="Xiaomi Redmi Note 12 Pro 128GB"),
+        ]
+    
+    def test_get_strategy_name(self):
+        """Test strategy name."""
+        assert EmbeddingMatcher().get_strategy_name() == "embedding_ivf_wratio"
+    
+    def test_exact_match_auto_matches(self, sample_products):
+        """Test exact name is shortlisted and auto-matched."""
+        matcher = EmbeddingMatcher(shortlist_size=2)
+        item_name = "iPhone 15 Pro 256GB Silver"
+        
+        result = matcher.find_matches(
+            item_name=item_name,
+            item_id=uuid4(),
+            products=sample_products,
+        )
+        
+        assert result.match_status == MatchStatusEnum.AUTO_MATCHED
+        assert result.best_match.product_name == item_name
+    
+    def test_agrees_with_rapidfuzz_on_best_match(self, sample_products):
+        """Test WRatio re-ranking yields the same best match as the full scan."""
+        embedding = EmbeddingMatcher(shortlist_size=3)
+        rapidfuzz = RapidFuzzMatcher()
+        
+        for item_name in ["Samsung Galaxy A54 128GB", "Redmi Note 12 Pro 128GB"]:
+            expected = rapidfuzz.find_matches(item_name, uuid4(), sample_products)
+            actual = embedding.find_matches(item_name, uuid4(), sample_products)
+            assert actual.best_match.product_id == expected.best_match.product_id
+    
+    def test_products_appended_between_calls_are_indexed(self, sample_products):
+        """Test products appended to the same list are inserted incrementally."""
+        matcher = EmbeddingMatcher()
+        products = list(sample_products)
+        matcher.find_matches("Samsung", uuid4(), products)
+        
+        new_product = MockProduct(id=uuid4(), name="Bosch Hammer Drill 750W")
+        products.append(new_product)
+        result = matcher.find_matches("Bosch Hammer Drill 750W", uuid4(), products)
+        
+        assert result.best_match.product_id == new_product.id
+    
+    def test_empty_products(self):
+        """Test handling empty products list."""
+        result = EmbeddingMatcher().find_matches("Test", uuid4(), [])
+        assert result.match_status == MatchStatusEnum.UNMATCHED
+
+
 class TestSearchMatchCandidates:
     """Tests for search_match_candidates utility function."""
     
@@ -0,0 +1,159 @@
+"""Unit tests for matching name normalization.
+
+Tests cover:
+    - Cyrillic transliteration and look-alike letters
+    - Unit canonicalization
+    - Stop-token and punctuation removal
+    - Normalized names longer than the 500-char name limit
+    - Matchers consuming stored normalized names
+"""
+import pytest
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+from uuid import uuid4
+
+from src.db.models import Product, SupplierItem
+from src.models.parsed_item import ParsedSupplierItem
+
+from src.services.matching import (
+    RapidFuzzMatcher,
+    MatchStatusEnum,
+    normalize_name,
+)
+from src.services.matching.normalization import transliterate
+
+
+@dataclass
+class MockProduct:
+    """Mock product carrying a stored normalized name."""
+    id: any
+    name: str
+    category_id: Optional[any] = None
+    normalized_name: Optional[str] = None
+
+
+class TestTransliterate:
+    """Tests for transliterate()."""
+
+    def test_latin_token_unchanged(self):
+        """Test Latin tokens pass through."""
+        assert transliterate("samsung") == "samsung"
+
+    def test_cyrillic_token_transliterated(self):
+        """Test purely Cyrillic tokens are transliterated phonetically."""
+        assert transliterate("щетка") == "shchetka"
+
+    def test_mixed_token_uses_look_alikes(self):
+        """Test Cyrillic look-alikes inside Latin words map to Latin letters."""
+        # "с" and "а" below are Cyrillic
+        assert transliterate("сanon") == "canon"
+        assert transliterate("sаmsung") == "samsung"
+
+
+class TestNormalizeName:
+    """Tests for normalize_name()."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Samsung 128 ГБ", "samsung 128gb"),
+        ("Samsung 128GB", "samsung 128gb"),
+        ("Дрель 750 Вт", "drel 750w"),
+        ("Обогреватель 1,5 кВт", "obogrevatel 1.5kw"),
+        ("Гантель 2 кг", "gantel 2kg"),
+        ("Блок питания 220 В", "blok pitaniya 220v"),
+        ("Аккумулятор 5000 мАч", "akkumulyator 5000mah"),
+        ('Телевизор 55"', "televizor 55in"),
+    ])
+    def test_units_canonicalized(self, name, expected):
+        """Test unit spellings are joined to the number and canonicalized."""
+        assert normalize_name(name) == expected
+
+    def test_two_in_one_is_not_voltage(self):
+        """Test "2 в 1" keeps "в" as a word, not volts."""
+        assert normalize_name("Кабель 2 в 1") == "kabel 2 v 1"
+
+    def test_stop_tokens_and_punctuation_removed(self):
+        """Test marketing tokens and punctuation are dropped."""
+        assert normalize_name("iPhone 15 Pro - New!") == "iphone 15 pro"
+        assert normalize_name("Смартфон (новинка) акция") == "smartfon"
+
+    def test_model_numbers_kept(self):
+        """Test alphanumeric model tokens are preserved."""
+        assert normalize_name("Galaxy A54 5G") == "galaxy a54 5g"
+
+    def test_cross_script_names_converge(self):
+        """Test Cyrillic-unit and Latin-unit spellings normalize identically."""
+        assert normalize_name("Samsung Galaxy A54 128 ГБ") == normalize_name("SAMSUNG Galaxy A54 128gb")
+
+    def test_idempotent(self):
+        """Test normalizing a normalized name is a no-op."""
+        normalized = normalize_name("Дрель Bosch 750 Вт, 2,5 кг")
+        assert normalize_name(normalized) == normalized
+
+    @pytest.mark.parametrize("name", ["", None, "!!!"])
+    def test_empty_input(self, name):
+        """Test empty or punctuation-only input yields empty string."""
+        assert normalize_name(name) == ""
+
+    def test_longest_cyrillic_name_fits_column(self):
+        """Test a 500-char Cyrillic name's normalized form is stored untruncated."""
+        name = ("Щётка жёсткая для чистки " * 21)[:500]
+        ParsedSupplierItem(supplier_sku="SKU-1", name=name, price=Decimal("1"))
+
+        normalized = normalize_name(name)
+
+        assert len(normalized) > 500
+        for model in (Product, SupplierItem):
+            column_type = model.__table__.c.normalized_name.type
+            assert getattr(column_type, "length", None) is None
+
+
+class TestMatcherUsesNormalizedNames:
+    """Tests for matchers consuming normalized names."""
+
+    def test_cyrillic_units_auto_match(self):
+        """Test unit spelling differences no longer block auto-matching."""
+        product = MockProduct(id=uuid4(), name="Samsung Galaxy A54 128GB Black")
+
+        result = RapidFuzzMatcher().find_matches(
+            "Samsung Galaxy A54 128 ГБ Black", uuid4(), [product]
+        )
+
+        assert result.match_status == MatchStatusEnum.AUTO_MATCHED
+        assert result.match_score == 100
+
+    def test_stored_normalized_name_is_used(self):
+        """Test the stored normalized_name is scored instead of the raw name."""
+        product = MockProduct(
+            id=uuid4(),
+            name="Unrelated display name",
+            normalized_name="bosch drill 750w",
+        )
+
+        result = RapidFuzzMatcher().find_matches(
+            "Bosch drill 750 W", uuid4(), [product], normalized_name="bosch drill 750w"
+        )
+
+        assert result.match_score == 100
+        assert result.best_match.product_name == "Unrelated display name"
+
+    def test_duplicate_normalized_names_keep_all_products(self):
+        """Test products that normalize identically are all candidates."""
+        products = [
+            MockProduct(id=uuid4(), name="Kettle 2L!"),
+            MockProduct(id=uuid4(), name="Kettle 2 L"),
+        ]
+
+        result = RapidFuzzMatcher().find_matches("Kettle 2L", uuid4(), products)
+
+        assert {c.product_id for c in result.candidates} == {p.id for p in products}
+
+    def test_preprocessing_disabled_uses_raw_names(self):
+        """Test use_preprocessing=False scores raw names."""
+        product = MockProduct(id=uuid4(), name="Samsung 128GB")
+
+        result = RapidFuzzMatcher(use_preprocessing=False).find_matches(
+            "Samsung 128 ГБ", uuid4(), [product]
+        )
+
+        assert result.match_status != MatchStatusEnum.AUTO_MATCHED
@@ -0,0 +1,208 @@
+"""Unit tests for the debounced aggregate recalculation buffer.
+
+Tests cover:
+    - mark_products_dirty (SADD, one flush job id per debounce window)
+    - push/pop_aggregate_deltas round trip
+    - pop_dirty_products decoding
+    - flush_dirty_aggregates_task chunked draining and failure recovery
+      (restored products and a later flush job)
+"""
+import pytest
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from src.services.aggregation import AggregateDelta
+from src.services.recalc_buffer import (
+    RECALC_DELTAS_KEY,
+    RECALC_DIRTY_KEY,
+    mark_products_dirty,
+    pop_aggregate_deltas,
+    pop_dirty_products,
+    push_aggregate_deltas,
+)
+from src.config import matching_settings
+from src.tasks.matching_tasks import flush_dirty_aggregates_task
+
+
+class TestMarkProductsDirty:
+    """Tests for mark_products_dirty()."""
+
+    @pytest.mark.asyncio
+    async def test_adds_products_and_defers_flush_to_window_end(self):
+        """Test products are buffered and the flush runs after the window."""
+        redis = AsyncMock()
+        product_ids = [uuid4(), uuid4()]
+
+        with patch("src.services.recalc_buffer.time.time", return_value=1003.0):
+            job_id = await mark_products_dirty(redis, product_ids, debounce_seconds=5)
+
+        assert job_id == "recalc-flush:200"
+        redis.sadd.assert_awaited_once_with(RECALC_DIRTY_KEY, *(str(p) for p in product_ids))
+        kwargs = redis.enqueue_job.call_args.kwargs
+        assert kwargs["_job_id"] == "recalc-flush:200"
+        assert kwargs["_defer_until"].timestamp() == 1005.0
+
+    @pytest.mark.asyncio
+    async def test_same_window_shares_one_job(self):
+        """Test producers within a window request the same job id."""
+        redis = AsyncMock()
+
+        with patch("src.services.recalc_buffer.time.time", side_effect=[1000.5, 1004.9, 1005.0]):
+            ids = [await mark_products_dirty(redis, [uuid4()], 5) for _ in range(3)]
+
+        assert ids[0] == ids[1] != ids[2]
+
+    @pytest.mark.asyncio
+    async def test_no_products_schedules_nothing(self):
+        """Test empty input touches nothing."""
+        redis = AsyncMock()
+
+        assert await mark_products_dirty(redis, [], 5) is None
+        redis.sadd.assert_not_called()
+        redis.enqueue_job.assert_not_called()
+
+
+class TestAggregateDeltaBuffer:
+    """Tests for push_aggregate_deltas() / pop_aggregate_deltas()."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test deltas survive serialization in order."""
+        redis = AsyncMock()
+        deltas = [
+            AggregateDelta.link(uuid4(), Decimal("19.90"), {"in_stock": True}),
+            AggregateDelta.unlink(uuid4()),
+        ]
+
+        job_id = await push_aggregate_deltas(redis, deltas, debounce_seconds=5)
+
+        assert job_id.startswith("recalc-flush:")
+        key, *entries = redis.rpush.call_args.args
+        assert key == RECALC_DELTAS_KEY
+        redis.lpop.return_value = [e.encode() for e in entries] + [b"{broken"]
+        assert await pop_aggregate_deltas(redis, 100) == deltas
+
+
+class TestPopDirtyProducts:
+    """Tests for pop_dirty_products()."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_and_skips_invalid_members(self):
+        """Test members are parsed as UUIDs."""
+        product_id = uuid4()
+        redis = AsyncMock()
+        redis.spop.return_value = [str(product_id).encode(), b"garbage"]
+
+        assert await pop_dirty_products(redis, 100) == [product_id]
+        redis.spop.assert_awaited_once_with(RECALC_DIRTY_KEY, 100)
+
+
+class TestFlushDirtyAggregatesTask:
+    """Tests for flush_dirty_aggregates_task()."""
+
+    @pytest.fixture
+    def session_maker(self):
+        session = MagicMock()
+        session.begin = MagicMock(return_value=AsyncMock())
+
+        @asynccontextmanager
+        async def maker():
+            yield session
+
+        with patch("src.tasks.matching_tasks.async_session_maker", new=maker):
+            yield session
+
+    @staticmethod
+    def deltas_queue(*chunks):
+        return patch(
+            "src.tasks.matching_tasks.pop_aggregate_deltas",
+            new=AsyncMock(side_effect=[*chunks, [], [], []]),
+        )
+
+    @pytest.mark.asyncio
+    async def test_drains_set_in_chunks(self, session_maker):
+        """Test each popped chunk is recalculated until the set is empty."""
+        chunks = [[uuid4(), uuid4()], [uuid4()], []]
+        redis = AsyncMock()
+
+        async def recalc(session, product_ids, trigger):
+            return [{"product_id": pid} for pid in product_ids]
+
+        with self.deltas_queue(), \
+             patch("src.tasks.matching_tasks.pop_dirty_products", new=AsyncMock(side_effect=chunks)), \
+             patch("src.services.aggregation.calculate_product_aggregates_batch", new=recalc):
+            result = await flush_dirty_aggregates_task({"redis": redis, "job_id": "recalc-flush:1"})
+
+        assert result["chunks"] == 2
+        assert result["products_updated"] == 3
+
+    @pytest.mark.asyncio
+    async def test_applies_deltas_before_dirty_set(self, session_maker):
+        """Test buffered deltas are applied incrementally first."""
+        delta = AggregateDelta.link(uuid4(), Decimal("10.00"))
+        redis = AsyncMock()
+        apply = AsyncMock(return_value=[{"product_id": delta.product_id}])
+
+        with self.deltas_queue([delta]), \
+             patch("src.tasks.matching_tasks.pop_dirty_products", new=AsyncMock(return_value=[])), \
+             patch("src.services.aggregation.apply_aggregate_deltas", new=apply):
+            result = await flush_dirty_aggregates_task({"redis": redis})
+
+        assert apply.call_args.kwargs["deltas"] == [delta]
+        assert result["chunks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_restored(self, session_maker):
+        """Test products of a failed chunk go back into the set."""
+        chunk = [uuid4(), uuid4()]
+        redis = AsyncMock()
+        failing = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with self.deltas_queue(), \
+             patch("src.tasks.matching_tasks.pop_dirty_products", new=AsyncMock(return_value=chunk)), \
+             patch("src.tasks.matching_tasks.restore_dirty_products", new=AsyncMock()) as restore, \
+             patch("src.services.aggregation.calculate_product_aggregates_batch", new=failing):
+            with pytest.raises(RuntimeError):
+                await flush_dirty_aggregates_task({"redis": redis})
+
+        restore.assert_awaited_once_with(redis, chunk, matching_settings.recalc_debounce_seconds)
+
+    @pytest.mark.asyncio
+    async def test_failed_delta_chunk_marks_products_dirty(self, session_maker):
+        """Test products of failed deltas fall back to a full recalculation."""
+        delta = AggregateDelta.link(uuid4(), Decimal("10.00"))
+        redis = AsyncMock()
+
+        with self.deltas_queue([delta]), \
+             patch("src.tasks.matching_tasks.restore_dirty_products", new=AsyncMock()) as restore, \
+             patch("src.services.aggregation.apply_aggregate_deltas", new=AsyncMock(side_effect=RuntimeError)):
+            with pytest.raises(RuntimeError):
+                await flush_dirty_aggregates_task({"redis": redis})
+
+        restore.assert_awaited_once_with(
+            redis, [delta.product_id], matching_settings.recalc_debounce_seconds
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_schedules_later_flush(self, session_maker):
+        """Test a failed flush leaves a flush job queued for its products."""
+        chunk = [uuid4()]
+        redis = AsyncMock()
+
+        with self.deltas_queue(), \
+             patch("src.tasks.matching_tasks.pop_dirty_products", new=AsyncMock(return_value=chunk)), \
+             patch("src.services.aggregation.calculate_product_aggregates_batch",
+                   new=AsyncMock(side_effect=RuntimeError("db down"))), \
+             patch("src.tasks.matching_tasks.matching_settings") as settings, \
+             patch("src.services.recalc_buffer.time.time", return_value=1003.0):
+            settings.recalc_chunk_size = 100
+            settings.recalc_debounce_seconds = 5
+            with pytest.raises(RuntimeError):
+                await flush_dirty_aggregates_task({"redis": redis, "job_id": "recalc-flush:199"})
+
+        redis.sadd.assert_awaited_once_with(RECALC_DIRTY_KEY, str(chunk[0]))
+        kwargs = redis.enqueue_job.call_args.kwargs
+        assert kwargs["_job_id"] == "recalc-flush:200"
+        assert kwargs["_defer_until"].timestamp() == 1005.0
@@ -0,0 +1,324 @@
+"""Unit tests for materialized review queue stats and keyset listing.
+
+Tests cover:
+    - ReviewStatsDelta aggregation and stable row order
+    - apply_review_stats_delta upsert SQL
+    - Keyset cursor round-trip and validation
+    - list_review_queue ordering, keyset condition and next_cursor
+    - resolve_reviews set-based entry updates
+    - expire_review_chunk and the expiration run progress in Redis
+    - expire_review_queue_task chunk loop
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.db.models import ReviewStatus
+from src.services.review_queue import (
+    REVIEW_EXPIRATION_KEY,
+    ReviewResolution,
+    ReviewStatsDelta,
+    apply_review_stats_delta,
+    decode_review_cursor,
+    encode_review_cursor,
+    expire_review_chunk,
+    get_review_expiration_progress,
+    list_review_queue,
+    resolve_reviews,
+    start_review_expiration,
+)
+from src.tasks.matching_tasks import expire_review_queue_task
+
+
+def compiled(session, index=0):
+    """SQL of the index-th statement executed on a mock session."""
+    stmt = session.execute.call_args_list[index].args[0]
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+def entry_row(score, entry_id=None):
+    now = datetime.now(timezone.utc)
+    return MagicMock(
+        id=entry_id or uuid4(),
+        supplier_item_id=uuid4(),
+        supplier_item_name="Samsung Galaxy A54 128GB",
+        supplier_id=uuid4(),
+        category_id=None,
+        match_score=Decimal(score),
+        candidate_products=[],
+        status=ReviewStatus.PENDING,
+        created_at=now,
+        expires_at=now,
+    )
+
+
+def listing_session(rows):
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute.return_value = result
+    return session
+
+
+class TestReviewStatsDelta:
+    """Tests for ReviewStatsDelta."""
+
+    def test_move_nets_out(self):
+        """Test moves between keys are summed and zero changes dropped."""
+        supplier_id = uuid4()
+        delta = ReviewStatsDelta()
+
+        delta.move(supplier_id, (None, ReviewStatus.PENDING), (None, ReviewStatus.EXPIRED))
+        delta.move(supplier_id, (None, ReviewStatus.EXPIRED), (None, ReviewStatus.PENDING))
+
+        assert not delta
+        assert delta.rows() == []
+
+    def test_rows_are_sorted(self):
+        """Test rows come in a stable key order regardless of insertion order."""
+        first = UUID(int=1)
+        second = UUID(int=2)
+        delta = ReviewStatsDelta()
+
+        delta.add(second, None, ReviewStatus.PENDING)
+        delta.add(first, uuid4(), ReviewStatus.PENDING, count=3)
+        delta.add(first, None, ReviewStatus.EXPIRED, count=-2)
+
+        assert [(key[0], count) for key, count in delta.rows()] == [
+            (first, -2),
+            (first, 3),
+            (second, 1),
+        ]
+
+
+class TestApplyReviewStatsDelta:
+    """Tests for apply_review_stats_delta()."""
+
+    @pytest.mark.asyncio
+    async def test_empty_delta_skips_query(self):
+        """Test nothing is executed without changes."""
+        session = AsyncMock()
+
+        assert await apply_review_stats_delta(session, ReviewStatsDelta()) == 0
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upserts_counts_in_one_statement(self):
+        """Test all keys are changed by one INSERT ... ON CONFLICT adding counts."""
+        session = AsyncMock()
+        delta = ReviewStatsDelta()
+        delta.move(uuid4(), (None, ReviewStatus.PENDING), (uuid4(), ReviewStatus.APPROVED))
+
+        assert await apply_review_stats_delta(session, delta) == 2
+
+        session.execute.assert_awaited_once()
+        sql = compiled(session)
+        assert sql.startswith("INSERT INTO review_queue_stats")
+        assert "ON CONFLICT (supplier_id, category_id, status) DO UPDATE" in sql
+        assert "count = (review_queue_stats.count + excluded.count)" in sql
+
+
+class TestReviewCursor:
+    """Tests for encode_review_cursor() / decode_review_cursor()."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the encoded position."""
+        entry_id = uuid4()
+
+        cursor = encode_review_cursor(Decimal("87.50"), entry_id)
+
+        assert decode_review_cursor(cursor) == (Decimal("87.50"), entry_id)
+
+    @pytest.mark.parametrize("cursor", ["", "87.5", "abc:def", f"x:{uuid4()}"])
+    def test_invalid(self, cursor):
+        """Test malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid review queue cursor"):
+            decode_review_cursor(cursor)
+
+
+class TestListReviewQueue:
+    """Tests for list_review_queue()."""
+
+    @pytest.mark.asyncio
+    async def test_first_page(self):
+        """Test entries are ordered by score then id and one extra row is fetched."""
+        rows = [entry_row("95"), entry_row("90"), entry_row("80")]
+        session = listing_session(rows)
+
+        page = await list_review_queue(session, limit=2)
+
+        sql = compiled(session)
+        assert "ORDER BY match_review_queue.match_score DESC, match_review_queue.id" in sql
+        assert "LIMIT $" in sql
+        assert [item["match_score"] for item in page["items"]] == [95.0, 90.0]
+        assert page["next_cursor"] == encode_review_cursor(Decimal("90"), rows[1].id)
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self):
+        """Test next_cursor is None when no more entries follow."""
+        session = listing_session([entry_row("70")])
+
+        page = await list_review_queue(session, limit=2)
+
+        assert len(page["items"]) == 1
+        assert page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_continues_after_position(self):
+        """Test the cursor adds the keyset condition instead of an offset."""
+        session = listing_session([])
+        cursor = encode_review_cursor(Decimal("90"), uuid4())
+
+        await list_review_queue(session, supplier_id=uuid4(), cursor=cursor)
+
+        sql = compiled(session)
+        assert "match_review_queue.match_score <= $" in sql
+        assert "match_review_queue.match_score < $" in sql
+        assert "match_review_queue.id > $" in sql
+        assert "supplier_items.supplier_id = $" in sql
+        assert "OFFSET" not in sql
+
+
+class TestResolveReviews:
+    """Tests for resolve_reviews()."""
+
+    @pytest.mark.asyncio
+    async def test_updates_entries_and_moves_counts(self):
+        """Test entries are locked, updated from a VALUES list and recounted."""
+        supplier_id, category_id = uuid4(), uuid4()
+        with_entry, without_entry = uuid4(), uuid4()
+        session = listing_session([(with_entry, None, ReviewStatus.PENDING)])
+
+        resolved = await resolve_reviews(session, [
+            ReviewResolution(with_entry, supplier_id, ReviewStatus.APPROVED, category_id),
+            ReviewResolution(without_entry, supplier_id, ReviewStatus.REJECTED, None),
+        ])
+
+        assert resolved == 1
+        assert session.execute.await_count == 3
+        assert compiled(session, 0).endswith("FOR UPDATE")
+        update_sql = compiled(session, 1)
+        assert update_sql.startswith("UPDATE match_review_queue SET")
+        assert "status=CAST(resolved.status AS " in update_sql
+        assert "FROM (VALUES" in update_sql
+        assert compiled(session, 2).startswith("INSERT INTO review_queue_stats")
+
+    @pytest.mark.asyncio
+    async def test_no_entries_writes_nothing(self):
+        """Test items without a review entry are skipped."""
+        session = listing_session([])
+
+        assert await resolve_reviews(session, [
+            ReviewResolution(uuid4(), uuid4(), ReviewStatus.APPROVED, None),
+        ]) == 0
+        assert session.execute.await_count == 1
+
+
+def make_redis(hash_data=None):
+    """Redis mock with a pipeline and a stored expiration hash."""
+    redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
+    redis.hgetall.return_value = hash_data or {}
+    return redis, pipe
+
+
+class TestExpireReviewChunk:
+    """Tests for expire_review_chunk()."""
+
+    @pytest.mark.asyncio
+    async def test_expires_bounded_chunk_skipping_locked_rows(self):
+        """Test one bounded UPDATE over SKIP LOCKED ids and a stats move."""
+        supplier_id = uuid4()
+        session = listing_session([(supplier_id, None), (supplier_id, None)])
+
+        expired = await expire_review_chunk(session, datetime.now(timezone.utc), 500)
+
+        assert expired == 2
+        sql = compiled(session, 0)
+        assert sql.startswith("UPDATE match_review_queue SET status=")
+        assert "ORDER BY match_review_queue.expires_at" in sql
+        assert "LIMIT $" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING supplier_items.supplier_id, match_review_queue.category_id" in sql
+        assert compiled(session, 1).startswith("INSERT INTO review_queue_stats")
+
+
+class TestReviewExpirationProgress:
+    """Tests for the expiration run progress in Redis."""
+
+    @pytest.mark.asyncio
+    async def test_new_run_resets_counters(self):
+        """Test a run after a finished one starts from zero."""
+        redis, pipe = make_redis({
+            b"task_id": b"old", b"started_at": b"2026-01-01T00:00:00+00:00",
+            b"finished_at": b"2026-01-01T00:01:00+00:00", b"expired": b"40",
+        })
+
+        assert await start_review_expiration(redis, "new") is False
+
+        pipe.delete.assert_called_once_with(REVIEW_EXPIRATION_KEY)
+        assert pipe.hset.call_args.kwargs["mapping"]["expired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_is_resumed(self):
+        """Test an unfinished run keeps its counters and start time."""
+        redis, pipe = make_redis({
+            b"task_id": b"old", b"started_at": b"2026-01-01T00:00:00+00:00",
+            b"chunks": b"3", b"expired": b"3000",
+        })
+
+        assert await start_review_expiration(redis, "new") is True
+
+        pipe.delete.assert_not_called()
+        assert set(pipe.hset.call_args.kwargs["mapping"]) == {"task_id", "updated_at"}
+
+    @pytest.mark.asyncio
+    async def test_progress(self):
+        """Test the hash is decoded into counters."""
+        redis, _ = make_redis({
+            b"task_id": b"t", b"started_at": b"2026-01-01T00:00:00+00:00",
+            b"chunks": b"2", b"expired": b"1500",
+        })
+
+        progress = await get_review_expiration_progress(redis)
+
+        assert progress["chunks"] == 2
+        assert progress["expired"] == 1500
+        assert progress["finished_at"] is None
+
+
+class TestExpireReviewQueueTask:
+    """Tests for the chunked expire_review_queue_task loop."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_until_short_chunk(self):
+        """Test chunks are committed separately until a short one, with pauses between."""
+        session = MagicMock()
+        session.begin = MagicMock(return_value=AsyncMock())
+
+        @asynccontextmanager
+        async def maker():
+            yield session
+
+        redis, _ = make_redis()
+        with patch("src.tasks.matching_tasks.async_session_maker", new=maker), \
+             patch("src.tasks.matching_tasks.matching_settings") as settings, \
+             patch("src.tasks.matching_tasks.expire_review_chunk",
+                   new=AsyncMock(side_effect=[2, 2, 1])) as chunk, \
+             patch("src.tasks.matching_tasks.asyncio.sleep", new=AsyncMock()) as sleep:
+            settings.review_expire_chunk_size = 2
+            settings.review_expire_pause_seconds = 0.5
+            result = await expire_review_queue_task({"redis": redis})
+
+        assert result["task_id"].startswith("expire-reviews-")
+        assert (result["expired_count"], result["chunks"]) == (5, 3)
+        assert chunk.await_count == 3
+        assert sleep.await_count == 2
+        assert redis.hset.await_count == 1  # finished_at
@@ -0,0 +1,77 @@
+"""Unit tests for block-reserved internal SKU allocation.
+
+Tests cover:
+    - SKU formatting
+    - Block reservation (one round trip per allocation, reuse of reserved blocks)
+    - Uniqueness across blocks
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.sku_allocator import SkuAllocator, format_sku
+
+
+def make_session(*block_starts):
+    """Session mock whose nextval() query returns the given block starts."""
+    session = AsyncMock()
+    results = []
+    for starts in block_starts:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(starts)
+        results.append(result)
+    session.execute.side_effect = results
+    return session
+
+
+class TestSkuAllocator:
+    """Tests for SkuAllocator."""
+
+    def test_format_sku(self):
+        """Test SKUs are zero-padded sequence numbers."""
+        assert format_sku(1001) == "PROD-000001001"
+
+    @pytest.mark.asyncio
+    async def test_batch_reserves_blocks_in_one_round_trip(self):
+        """Test a batch larger than a block reserves all blocks at once."""
+        allocator = SkuAllocator(block_size=10)
+        session = make_session([1, 11, 21])
+
+        skus = await allocator.allocate(session, 25)
+
+        assert session.execute.await_count == 1
+        assert session.execute.call_args.args[1] == {"blocks": 3}
+        assert skus[0] == format_sku(1) and skus[-1] == format_sku(25)
+        assert allocator.available == 5
+
+    @pytest.mark.asyncio
+    async def test_reserved_numbers_are_used_before_reserving(self):
+        """Test allocations are served from the current block."""
+        allocator = SkuAllocator(block_size=10)
+        session = make_session([1])
+
+        first = await allocator.allocate(session, 4)
+        second = await allocator.allocate(session, 6)
+
+        assert session.execute.await_count == 1
+        assert second[0] == format_sku(5)
+        assert len(set(first + second)) == 10
+
+    @pytest.mark.asyncio
+    async def test_non_contiguous_blocks(self):
+        """Test blocks taken by other workers are skipped."""
+        allocator = SkuAllocator(block_size=10)
+        session = make_session([1], [41])
+
+        await allocator.allocate(session, 8)
+        skus = await allocator.allocate(session, 4)
+
+        assert skus == [format_sku(n) for n in (9, 10, 41, 42)]
+        assert session.execute.call_args.args[1] == {"blocks": 1}
+
+    @pytest.mark.asyncio
+    async def test_zero_count_skips_query(self):
+        """Test nothing is reserved for an empty request."""
+        session = AsyncMock()
+
+        assert await SkuAllocator().allocate(session, 0) == []
+        session.execute.assert_not_called()
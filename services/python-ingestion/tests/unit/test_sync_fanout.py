@@ -0,0 +1,190 @@
+"""Unit tests for the master sync parse fan-out.
+
+Tests cover:
+    - _supplier_parse_job arguments (sync_task_id for progress tracking)
+    - record_sync_parse_completed script call and stale-run handling
+    - Progress timeout of a run whose parse jobs never finish
+    - parse_task counting completion on success and final failure only
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from arq.worker import Retry
+from redis.exceptions import RedisError
+
+from src.models.sync_messages import SyncState
+from src.services.sync_state import (
+    SYNC_PARSE_COMPLETED_SCRIPT,
+    SYNC_PROGRESS_TIMEOUT_SECONDS,
+    SYNC_STATUS_KEY,
+    get_sync_status,
+    record_sync_parse_completed,
+    set_sync_processing_suppliers,
+)
+from src.tasks.sync_tasks import _supplier_parse_job
+from src.worker import parse_task
+
+
+def make_supplier(name="Acme Parts", source_type="csv", meta=None):
+    supplier = MagicMock()
+    supplier.name = name
+    supplier.source_type = source_type
+    supplier.meta = {"source_url": "https://example.com/prices.csv"} if meta is None else meta
+    return supplier
+
+
+class TestSupplierParseJob:
+    """Tests for _supplier_parse_job()."""
+
+    def test_builds_parse_task_kwargs(self):
+        """Test the job carries the sync task ID and source config."""
+        job = _supplier_parse_job(make_supplier(), "sync-1", "low")
+
+        assert job["sync_task_id"] == "sync-1"
+        assert job["priority"] == "low"
+        assert job["parser_type"] == "csv"
+        assert job["supplier_name"] == "Acme Parts"
+        assert job["task_id"].startswith("parse-acme-parts-")
+        assert job["source_config"] == {"sheet_url": "https://example.com/prices.csv"}
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_copies_inline_enrichment(self, enabled):
+        """Test the supplier's inline_enrichment switch reaches parse_task."""
+        supplier = make_supplier(meta={
+            "source_url": "https://example.com/prices.csv",
+            "inline_enrichment": enabled,
+        })
+
+        job = _supplier_parse_job(supplier, "sync-1")
+
+        assert job["source_config"]["inline_enrichment"] is enabled
+
+    def test_missing_source_url(self):
+        """Test suppliers without source_url are rejected."""
+        with pytest.raises(ValueError, match="no source_url"):
+            _supplier_parse_job(make_supplier(meta={}), "sync-1")
+
+
+class TestRecordSyncParseCompleted:
+    """Tests for record_sync_parse_completed()."""
+
+    @pytest.mark.asyncio
+    async def test_runs_script(self):
+        """Test the counter script is run on the status key."""
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=3)
+
+        assert await record_sync_parse_completed(redis, "sync-1") == 3
+        redis.eval.assert_awaited_once_with(
+            SYNC_PARSE_COMPLETED_SCRIPT, 1, SYNC_STATUS_KEY, "sync-1", str(SYNC_PROGRESS_TIMEOUT_SECONDS)
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_run(self):
+        """Test jobs of a finished or replaced run are ignored."""
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=-1)
+
+        assert await record_sync_parse_completed(redis, "sync-old") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_error(self):
+        """Test Redis errors do not fail the parse job."""
+        redis = MagicMock()
+        redis.eval = AsyncMock(side_effect=RedisError("down"))
+
+        assert await record_sync_parse_completed(redis, "sync-1") is None
+
+
+class TestSyncProgressTimeout:
+    """Tests for runs whose parse jobs never finish."""
+
+    @pytest.mark.asyncio
+    async def test_processing_status_expires(self):
+        """Test processing_suppliers is written with the progress timeout."""
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=None)
+        redis.set = AsyncMock()
+
+        await set_sync_processing_suppliers(redis, "sync-1", 3, timeout_seconds=60)
+
+        key, raw = redis.set.await_args.args
+        assert key == SYNC_STATUS_KEY
+        assert '"processing_suppliers"' in raw
+        assert redis.set.await_args.kwargs["ex"] == 60
+
+    def test_each_completion_restarts_timeout(self):
+        """Test progress writes renew the expiry and the final idle write drops it."""
+        writes = [
+            line.strip() for line in SYNC_PARSE_COMPLETED_SCRIPT.splitlines()
+            if "redis.call('SET'" in line
+        ]
+
+        assert writes == [
+            "redis.call('SET', KEYS[1], cjson.encode(status))",  # last job: idle
+            "redis.call('SET', KEYS[1], cjson.encode(status), 'EX', ARGV[2])",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_job_never_completes(self):
+        """Test the status reads idle once the run's timeout passed without progress."""
+        redis = MagicMock()
+        # The status key expired: GET finds nothing and the script ignores late jobs
+        redis.get = AsyncMock(return_value=None)
+        redis.eval = AsyncMock(return_value=-1)
+
+        status = await get_sync_status(redis)
+
+        assert status.state == SyncState.IDLE
+        assert status.task_id is None
+        assert await record_sync_parse_completed(redis, "sync-1") is None
+
+
+class TestParseTaskSyncProgress:
+    """Tests for parse_task counting sync progress."""
+
+    @pytest.mark.asyncio
+    async def test_counts_success(self):
+        """Test a finished job counts towards its sync run."""
+        ctx = {"redis": MagicMock()}
+
+        with patch("src.worker._run_parse_task", AsyncMock(return_value={"status": "success"})), \
+                patch("src.worker.record_sync_parse_completed", AsyncMock()) as record:
+            await parse_task(ctx, sync_task_id="sync-1", task_id="parse-1")
+
+        record.assert_awaited_once_with(ctx["redis"], "sync-1")
+
+    @pytest.mark.asyncio
+    async def test_counts_final_failure(self):
+        """Test a job failing for good still counts."""
+        ctx = {"redis": MagicMock()}
+
+        with patch("src.worker._run_parse_task", AsyncMock(side_effect=RuntimeError("boom"))), \
+                patch("src.worker.record_sync_parse_completed", AsyncMock()) as record:
+            with pytest.raises(RuntimeError):
+                await parse_task(ctx, {"sync_task_id": "sync-1", "task_id": "parse-1"})
+
+        record.assert_awaited_once_with(ctx["redis"], "sync-1")
+
+    @pytest.mark.asyncio
+    async def test_retry_not_counted(self):
+        """Test a job scheduled for retry does not count yet."""
+        ctx = {"redis": MagicMock()}
+
+        with patch("src.worker._run_parse_task", AsyncMock(side_effect=Retry(defer=1))), \
+                patch("src.worker.record_sync_parse_completed", AsyncMock()) as record:
+            with pytest.raises(Retry):
+                await parse_task(ctx, sync_task_id="sync-1", task_id="parse-1")
+
+        record.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_without_sync_task_id(self):
+        """Test jobs not enqueued by a master sync are not counted."""
+        ctx = {"redis": MagicMock()}
+
+        with patch("src.worker._run_parse_task", AsyncMock(return_value={"status": "success"})), \
+                patch("src.worker.record_sync_parse_completed", AsyncMock()) as record:
+            await parse_task(ctx, task_id="parse-1")
+
+        record.assert_not_awaited()
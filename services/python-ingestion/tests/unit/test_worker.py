@@ -27,7 +27,9 @@ from src.worker import (
     _handle_retry,
     _move_to_dlq,
     monitor_queue_depth,
+    promote_aged_queue_jobs,
     on_job_end,
+    on_startup,
 )
 from src.errors.exceptions import ParserError, ValidationError, DatabaseError
 from src.parsers.parser_registry import create_parser_instance
@@ -532,6 +534,167 @@ class TestParseTaskDatabaseOperations:
         assert result["status"] == "partial_success"
         assert result["items_parsed"] == 2  # Two items succeeded
         assert result.get("items_failed", 0) == 1 or len(result.get("errors", [])) > 0
+    
+    @pytest.mark.asyncio
+    async def test_parse_task_pushes_aggregate_deltas(self):
+        """Test price changes of linked items are buffered after the commit."""
+        from decimal import Decimal
+        from src.models.parsed_item import ParsedSupplierItem
+        from src.services.aggregation import AggregateDelta
+        
+        ctx = {"redis": MagicMock()}
+        message = {
+            "task_id": "test-task",
+            "parser_type": "stub",
+            "supplier_name": "Test Supplier",
+            "source_config": {},
+        }
+        mock_parser = Mock()
+        mock_parser.validate_config.return_value = True
+        mock_parser.parse = AsyncMock(return_value=[
+            ParsedSupplierItem(supplier_sku="SKU001", name="Item", price=Decimal("8.00")),
+        ])
+        mock_parser.get_parser_name.return_value = "stub"
+        
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_begin = AsyncMock()
+        mock_begin.__aenter__ = AsyncMock(return_value=None)
+        mock_begin.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin = Mock(return_value=mock_begin)
+        
+        delta = AggregateDelta(uuid4(), Decimal("8.00"), Decimal("10.00"))
+        
+        async def upsert(session, supplier_id, parsed_item, aggregate_deltas):
+            aggregate_deltas.append(delta)
+            return Mock(id=uuid4()), True, False
+        
+        with patch('src.worker.create_parser_instance', return_value=mock_parser), \
+             patch('src.worker.async_session_maker', return_value=mock_session), \
+             patch('src.worker.get_or_create_supplier', return_value=Mock(id=uuid4())), \
+             patch('src.worker.upsert_supplier_item', side_effect=upsert), \
+             patch('src.worker.create_price_history_entry', return_value=None), \
+             patch('src.worker.push_aggregate_deltas', new=AsyncMock()) as push:
+            result = await parse_task(ctx, message)
+        
+        assert result["status"] == "success"
+        assert push.await_args.args[:2] == (ctx["redis"], [delta])
+        mock_begin.__aexit__.assert_awaited_once()
+
+
+class TestParseTaskInlineEnrichment:
+    """Test the optional inline enrichment stage of parse_task."""
+
+    @staticmethod
+    async def _run(source_config, items, inline_enrichment=False, extract=None):
+        """Run parse_task on items; return (result, items passed to upsert)."""
+        message = {
+            "task_id": "test-task",
+            "parser_type": "stub",
+            "supplier_name": "Test Supplier",
+            "source_config": source_config,
+        }
+
+        mock_parser = Mock()
+        mock_parser.validate_config.return_value = True
+        mock_parser.parse = AsyncMock(return_value=items)
+        mock_parser.get_parser_name.return_value = "stub"
+
+        mock_supplier = Mock()
+        mock_supplier.id = uuid4()
+        mock_supplier_item = Mock()
+        mock_supplier_item.id = uuid4()
+
+        mock_session = AsyncMock()
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_begin = AsyncMock()
+        mock_begin.__aenter__ = AsyncMock(return_value=None)
+        mock_begin.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin = Mock(return_value=mock_begin)
+
+        upserted = []
+
+        async def upsert(session, supplier_id, parsed_item, **kwargs):
+            upserted.append(parsed_item.model_copy(deep=True))
+            return mock_supplier_item, False, False
+
+        extract_patch = (
+            patch('src.worker.extract_item_names', side_effect=extract)
+            if extract else patch('src.tasks.matching_tasks._get_extraction_pool', return_value=None)
+        )
+        with patch('src.worker.create_parser_instance', return_value=mock_parser), \
+             patch('src.worker.async_session_maker', return_value=mock_session), \
+             patch('src.worker.get_or_create_supplier', return_value=mock_supplier), \
+             patch('src.worker.upsert_supplier_item', side_effect=upsert), \
+             patch('src.worker.matching_settings.inline_enrichment', inline_enrichment), \
+             patch('src.services.extraction.cache._cache', new=None), \
+             extract_patch:
+            result = await parse_task({}, message)
+
+        return result, upserted
+
+    @staticmethod
+    def _items():
+        from src.models.parsed_item import ParsedSupplierItem
+        from decimal import Decimal
+
+        return [
+            ParsedSupplierItem(
+                supplier_sku="SKU001",
+                name="Дрель 220V 750W",
+                price=Decimal("10.00"),
+                characteristics={"power_watts": 800, "color": "black"},
+            ),
+            ParsedSupplierItem(
+                supplier_sku="SKU002",
+                name="Коробка 1.5 кг",
+                price=Decimal("5.00"),
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Test items are persisted as parsed unless enabled."""
+        items = self._items()
+
+        result, upserted = await self._run({}, items)
+
+        assert result["features_extracted"] == 0
+        assert [item.characteristics for item in upserted] == [item.characteristics for item in self._items()]
+
+    @pytest.mark.asyncio
+    async def test_supplier_flag_enriches_before_upsert(self):
+        """Test extracted features reach the upsert; parsed values win."""
+        result, upserted = await self._run({"inline_enrichment": True}, self._items())
+
+        assert result["status"] == "success"
+        assert result["features_extracted"] == 2
+        assert upserted[0].characteristics == {"power_watts": 800, "color": "black", "voltage": 220}
+        assert upserted[1].characteristics == {"weight_kg": 1.5}
+
+    @pytest.mark.asyncio
+    async def test_supplier_flag_overrides_setting(self):
+        """Test a supplier can opt out of globally enabled inline enrichment."""
+        result, upserted = await self._run(
+            {"inline_enrichment": False}, self._items(), inline_enrichment=True
+        )
+
+        assert result["features_extracted"] == 0
+        assert upserted[1].characteristics == {}
+
+    @pytest.mark.asyncio
+    async def test_extraction_failure_does_not_fail_ingestion(self):
+        """Test items are persisted unenriched if extraction fails."""
+        result, upserted = await self._run(
+            {}, self._items(), inline_enrichment=True, extract=RuntimeError("pool broken")
+        )
+
+        assert result["status"] == "success"
+        assert result["items_parsed"] == 2
+        assert result["features_extracted"] == 0
+        assert upserted[1].characteristics == {}
 
 
 class TestRetryLogic:
@@ -626,18 +789,43 @@ class TestQueueMonitoring:
     async def test_monitor_queue_depth_success(self):
         """Test successful queue depth monitoring."""
         mock_redis = AsyncMock()
-        mock_redis.llen = AsyncMock(side_effect=[10, 2])  # queue_depth, dlq_depth
+        mock_redis.scard = AsyncMock(return_value=2)  # dlq_depth
+        depths = {"high": 1, "normal": 0, "low": 9}
+        ages = {"high": 2.0, "normal": 0.0, "low": 840.0}
         
         ctx = {"redis": mock_redis}
         
         with patch('src.worker.settings') as mock_settings, \
+             patch('src.worker.get_queue_depth_by_priority', AsyncMock(return_value=depths)) as mock_depths, \
+             patch('src.worker.get_oldest_job_age_by_priority', AsyncMock(return_value=ages)), \
+             patch('src.worker.emit_metric') as mock_emit, \
              patch('src.worker.logger') as mock_logger:
             mock_settings.queue_name = "test_queue"
             mock_settings.dlq_name = "test_dlq"
             await monitor_queue_depth(ctx)
         
-        assert mock_redis.llen.call_count == 2
+        mock_depths.assert_awaited_once_with(mock_redis, "test_queue")
+        mock_redis.scard.assert_awaited_once_with("arq:dlq:test_dlq")
+        assert [(c.args[0], c.args[2]["priority"]) for c in mock_emit.call_args_list] == [
+            (name, priority)
+            for priority in ("high", "normal", "low")
+            for name in ("queue_depth", "queue_oldest_job_age_seconds")
+        ]
+        assert mock_emit.call_args_list[-1].args[1] == 840.0
         mock_logger.info.assert_called_once()
+        assert mock_logger.info.call_args.kwargs["queue_depth"] == 10
+    
+    @pytest.mark.asyncio
+    async def test_promote_aged_queue_jobs(self):
+        """Test the aging cron promotes jobs of the worker's queue."""
+        mock_redis = AsyncMock()
+        
+        with patch('src.worker.settings') as mock_settings, \
+             patch('src.worker.promote_aged_jobs', AsyncMock()) as mock_promote:
+            mock_settings.queue_name = "test_queue"
+            await promote_aged_queue_jobs({"redis": mock_redis})
+        
+        mock_promote.assert_awaited_once_with(mock_redis, "test_queue")
     
     @pytest.mark.asyncio
     async def test_monitor_queue_depth_no_redis(self):
@@ -653,11 +841,11 @@ class TestQueueMonitoring:
     async def test_monitor_queue_depth_error(self):
         """Test queue monitoring when Redis operation fails."""
         mock_redis = AsyncMock()
-        mock_redis.llen = AsyncMock(side_effect=Exception("Redis error"))
         
         ctx = {"redis": mock_redis}
         
         with patch('src.worker.settings') as mock_settings, \
+             patch('src.worker.get_queue_depth_by_priority', AsyncMock(side_effect=Exception("Redis error"))), \
              patch('src.worker.logger') as mock_logger:
             mock_settings.queue_name = "test_queue"
             mock_settings.dlq_name = "test_dlq"
@@ -669,6 +857,15 @@ class TestQueueMonitoring:
 class TestJobLifecycleHooks:
     """Test job lifecycle hooks."""
     
+    @pytest.mark.asyncio
+    async def test_on_startup_warms_extractors(self):
+        """Test the worker compiles the extractors at startup."""
+        with patch('src.worker.warm_extractors', return_value=["electronics"]) as warm:
+            await on_startup({})
+        
+        warm.assert_called_once_with()
+        assert WorkerSettings.on_startup is on_startup
+    
     @pytest.mark.asyncio
     async def test_on_job_end_failed_job_exceeded_retries(self):
         """Test on_job_end when job failed and exceeded retries."""
@@ -0,0 +1,191 @@
+"""Unit tests for bulk write-back of match decisions.
+
+Tests cover:
+    - MatchWriteBack accumulation (client-side product ids, last decision wins)
+    - flush() statement count and order
+    - SKU allocation for products created without one
+    - Generated SQL for the bulk UPDATE ... FROM (VALUES) and review upsert
+    - review_queue_stats count changes of review upserts
+"""
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from src.db.models import MatchStatus, Product, ProductStatus, ReviewStatus
+from src.services.matching import ItemDecision, MatchWriteBack, ReviewDecision
+
+
+def compiled(session, index):
+    """SQL of the index-th statement executed on a mock session."""
+    stmt = session.execute.call_args_list[index].args[0]
+    return str(stmt.compile(dialect=asyncpg.dialect()))
+
+
+def mock_session(*existing_reviews):
+    """Session whose statements return existing (item_id, category_id, status) rows."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = list(existing_reviews)
+    session.execute.return_value = result
+    return session
+
+
+def review(item_id, supplier_id=None, score="80"):
+    return ReviewDecision(
+        item_id, [], datetime.now(timezone.utc), supplier_id or uuid4(), Decimal(score)
+    )
+
+
+def draft(name="Samsung Galaxy A54"):
+    return Product(internal_sku=f"PROD-{uuid4().hex[:6]}", name=name, status=ProductStatus.DRAFT)
+
+
+class TestMatchWriteBack:
+    """Tests for MatchWriteBack."""
+
+    def test_add_product_assigns_id(self):
+        """Test new products get an id before insert so items can link to them."""
+        writeback = MatchWriteBack()
+
+        product = writeback.add_product(draft())
+
+        assert product.id is not None
+        assert writeback.products == [product]
+
+    def test_last_decision_per_item_wins(self):
+        """Test an item is updated once with its final decision."""
+        writeback = MatchWriteBack()
+        item_id = uuid4()
+
+        writeback.decide(ItemDecision(item_id, MatchStatus.POTENTIAL_MATCH, None, Decimal("80")))
+        writeback.decide(ItemDecision(item_id, MatchStatus.AUTO_MATCHED, uuid4(), Decimal("97")))
+
+        assert len(writeback) == 1
+        assert writeback.items[item_id].match_status == MatchStatus.AUTO_MATCHED
+
+    @pytest.mark.asyncio
+    async def test_empty_flush_skips_queries(self):
+        """Test nothing is executed without decisions."""
+        session = AsyncMock()
+
+        counts = await MatchWriteBack().flush(session)
+
+        assert counts == {"products": 0, "items": 0, "reviews": 0}
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_batch_in_fixed_statements(self):
+        """Test products, items and reviews are written once each, in FK order."""
+        writeback = MatchWriteBack()
+        session = mock_session()
+        new_product = writeback.add_product(draft())
+        potential_id = uuid4()
+        for _ in range(50):
+            writeback.decide(ItemDecision(uuid4(), MatchStatus.AUTO_MATCHED, new_product.id, Decimal("100")))
+        writeback.decide(ItemDecision(potential_id, MatchStatus.POTENTIAL_MATCH, None, Decimal("82.5"), [{"score": 82.5}]))
+        writeback.add_review(ReviewDecision(
+            potential_id, [{"score": 82.5}], datetime.now(timezone.utc), uuid4(), Decimal("82.5")
+        ))
+
+        counts = await writeback.flush(session)
+
+        assert counts == {"products": 1, "items": 51, "reviews": 1}
+        assert session.execute.await_count == 5
+        assert compiled(session, 0).startswith("INSERT INTO products")
+        assert compiled(session, 1).startswith("UPDATE supplier_items")
+        assert compiled(session, 2).startswith("SELECT match_review_queue.supplier_item_id")
+        assert compiled(session, 3).startswith("INSERT INTO match_review_queue")
+        assert compiled(session, 4).startswith("INSERT INTO review_queue_stats")
+        assert len(writeback) == 0 and not writeback.products and not writeback.reviews
+
+    @pytest.mark.asyncio
+    async def test_flush_allocates_missing_skus_for_batch(self):
+        """Test products without a SKU get one from a single allocation."""
+        writeback = MatchWriteBack()
+        session = AsyncMock()
+        numbered = writeback.add_product(draft())
+        sku = numbered.internal_sku
+        unnumbered = [
+            writeback.add_product(Product(name=f"item {i}", status=ProductStatus.DRAFT))
+            for i in range(3)
+        ]
+
+        with patch(
+            "src.services.matching.writeback.allocate_skus",
+            new=AsyncMock(return_value=["PROD-1", "PROD-2", "PROD-3"]),
+        ) as allocate:
+            await writeback.flush(session)
+
+        allocate.assert_awaited_once_with(session, 3)
+        assert [p.internal_sku for p in unnumbered] == ["PROD-1", "PROD-2", "PROD-3"]
+        assert numbered.internal_sku == sku
+
+    @pytest.mark.asyncio
+    async def test_item_update_uses_values_list(self):
+        """Test the item update joins a VALUES list with typed columns."""
+        writeback = MatchWriteBack()
+        session = AsyncMock()
+        writeback.decide(ItemDecision(uuid4(), MatchStatus.POTENTIAL_MATCH, None, Decimal("75")))
+
+        await writeback.flush(session)
+
+        sql = compiled(session, 0)
+        assert "FROM (VALUES" in sql
+        assert "match_status=CAST(decided.match_status AS" in sql
+        assert "WHERE supplier_items.id = decided.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_reviews_upsert_resets_to_pending(self):
+        """Test existing review entries are reset by the upsert."""
+        writeback = MatchWriteBack()
+        session = mock_session()
+        writeback.add_review(review(uuid4()))
+
+        await writeback.flush(session)
+
+        assert "FOR UPDATE" in compiled(session, 0)
+        sql = compiled(session, 1)
+        assert "ON CONFLICT (supplier_item_id) DO UPDATE" in sql
+        assert "status = excluded.status" in sql
+        assert "match_score = excluded.match_score" in sql
+
+    @pytest.mark.asyncio
+    async def test_reviews_move_stats_counts_to_pending(self):
+        """Test existing entries leave their stats key and all entries count as pending."""
+        supplier_id, category_id = uuid4(), uuid4()
+        reset_id, new_id = uuid4(), uuid4()
+        writeback = MatchWriteBack()
+        session = mock_session((reset_id, category_id, ReviewStatus.APPROVED))
+        writeback.add_review(review(reset_id, supplier_id))
+        writeback.add_review(review(new_id, supplier_id))
+
+        with patch(
+            "src.services.matching.writeback.apply_review_stats_delta", new=AsyncMock()
+        ) as apply:
+            await writeback.flush(session)
+
+        delta = apply.await_args.args[1]
+        assert dict(delta.rows()) == {
+            (supplier_id, category_id, ReviewStatus.APPROVED): -1,
+            (supplier_id, None, ReviewStatus.PENDING): 2,
+        }
+
+    def test_retain_drops_lost_items_and_their_products(self):
+        """Test decisions of items whose lease was lost are not written."""
+        writeback = MatchWriteBack()
+        kept_id, lost_id = uuid4(), uuid4()
+        shared = writeback.add_product(draft("shared"))
+        orphan = writeback.add_product(draft("orphan"))
+        writeback.decide(ItemDecision(kept_id, MatchStatus.AUTO_MATCHED, shared.id, Decimal("100")))
+        writeback.decide(ItemDecision(lost_id, MatchStatus.AUTO_MATCHED, orphan.id, Decimal("100")))
+        writeback.add_review(review(lost_id))
+
+        assert writeback.retain({kept_id}) == {lost_id}
+
+        assert list(writeback.items) == [kept_id]
+        assert writeback.products == [shared]
+        assert not writeback.reviews